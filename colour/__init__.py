@@ -71,12 +71,14 @@ from .blindness import (
 from .appearance import (
     ATD95_Specification, CAM16_Specification, CAM16_VIEWING_CONDITIONS,
     CAM16_to_XYZ, CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS,
-    CIECAM02_to_XYZ, HUNT_VIEWING_CONDITIONS, Hunt_Specification,
-    LLAB_Specification, LLAB_VIEWING_CONDITIONS, Nayatani95_Specification,
+    CIECAM02_to_XYZ, HUNT_VIEWING_CONDITIONS, Hunt_Specification, Hunt_to_XYZ,
+    LLAB_Specification, LLAB_VIEWING_CONDITIONS, LLAB_to_XYZ,
+    Nayatani95_Specification,
     RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
     XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
     XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
+from .difference import (DELTA_E_METHODS, delta_E, delta_E_nearest,
+                         delta_E_pairwise)
 from .characterisation import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
                                COLOURCHECKERS, COLOURCHECKERS_SPDS,
                                DISPLAYS_RGB_PRIMARIES, first_order_colour_fit)
@@ -178,13 +180,16 @@ __all__ += [
     'ATD95_Specification', 'CAM16_Specification', 'CAM16_VIEWING_CONDITIONS',
     'CAM16_to_XYZ', 'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS',
     'CIECAM02_to_XYZ', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
-    'LLAB_Specification', 'LLAB_VIEWING_CONDITIONS',
+    'Hunt_to_XYZ', 'LLAB_Specification', 'LLAB_VIEWING_CONDITIONS',
+    'LLAB_to_XYZ',
     'Nayatani95_Specification', 'RLAB_D_FACTOR', 'RLAB_Specification',
     'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
     'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
     'XYZ_to_RLAB'
 ]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
+__all__ += [
+    'DELTA_E_METHODS', 'delta_E', 'delta_E_nearest', 'delta_E_pairwise'
+]
 __all__ += [
     'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
     'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES', 'first_order_colour_fit'
@@ -14,7 +14,8 @@ from .interpolation import (
     SpragueInterpolator, CubicSplineInterpolator, PchipInterpolator,
     NullInterpolator, lagrange_coefficients)
 from .matrix import is_identity
-from .random import random_triplet_generator
+from .random import (random_triplet_generator, stratified_random_triplets,
+                     quasi_random_triplets_Halton, quasi_random_triplets_Sobol)
 
 __all__ = []
 __all__ += coordinates.__all__
@@ -30,4 +31,7 @@ __all__ += [
     'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients'
 ]
 __all__ += ['is_identity']
-__all__ += ['random_triplet_generator']
+__all__ += [
+    'random_triplet_generator', 'stratified_random_triplets',
+    'quasi_random_triplets_Halton', 'quasi_random_triplets_Sobol'
+]
@@ -6,13 +6,22 @@ Random Numbers Utilities
 Defines random numbers generator objects:
 
 -   :func:`colour.algebra.random_triplet_generator`
+-   :func:`colour.algebra.stratified_random_triplets`
+-   :func:`colour.algebra.quasi_random_triplets_Halton`
+-   :func:`colour.algebra.quasi_random_triplets_Sobol`
+
+References
+----------
+-   :cite:`Joe2008` : Joe, S., & Kuo, F. Y. (2008). Constructing Sobol
+    Sequences with Better Two-Dimensional Projections. SIAM Journal on
+    Scientific Computing, 30(5), 2635-2654. doi:10.1137/070709359
 """
 
 from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import warning
+from colour.utilities import tstack, warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -21,10 +30,26 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['RANDOM_STATE', 'random_triplet_generator']
+__all__ = [
+    'RANDOM_STATE', 'random_triplet_generator', 'stratified_random_triplets',
+    'quasi_random_triplets_Halton', 'quasi_random_triplets_Sobol'
+]
 
 RANDOM_STATE = np.random.RandomState()
 
+_SOBOL_DIRECTION_NUMBERS = ((1, 0, (1, )), (2, 1, (1, 3)))
+"""
+*Sobol* sequence direction numbers for the second and third dimensions as
+(degree :math:`s`, coefficients :math:`a`, initial direction numbers
+:math:`m_k`) tuples, the first dimension being the *van der Corput* sequence.
+
+References
+----------
+-   :cite:`Joe2008`
+
+_SOBOL_DIRECTION_NUMBERS : tuple
+"""
+
 
 def random_triplet_generator(size,
                              limits=np.array([[0, 1], [0, 1], [0, 1]]),
@@ -75,13 +100,238 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
      array([ 0.1679721...,  0.7333801...,  0.4084438...]))
     """
 
-    integer_size = int(size)
-    if integer_size != size:
-        warning(('"size" has been cast to integer: {0}'.format(integer_size)))
-
-    for _ in range(integer_size):
+    for _ in range(_integer_size(size)):
         yield np.array([
             random_state.uniform(*limits[0]),
             random_state.uniform(*limits[1]),
             random_state.uniform(*limits[2])
         ])
+
+
+def _integer_size(size):
+    """
+    Casts given size to integer and warns if it is not an integer.
+
+    Parameters
+    ----------
+    size : numeric
+        Size.
+
+    Returns
+    -------
+    integer
+        Integer size.
+    """
+
+    integer_size = int(size)
+    if integer_size != size:
+        warning(('"size" has been cast to integer: {0}'.format(integer_size)))
+
+    return integer_size
+
+
+def _scale_triplets(triplets, limits, random_state):
+    """
+    Scales given triplets in domain [0, 1] to given limits, applying first a
+    random shift modulo 1, i.e. *Cranley-Patterson* rotation, if a random
+    number generator is given.
+
+    Parameters
+    ----------
+    triplets : array_like
+        Triplets in domain [0, 1].
+    limits : array_like, (3, 2)
+        Values limits on each triplet axis.
+    random_state : RandomState
+        Mersenne Twister pseudo-random number generator.
+
+    Returns
+    -------
+    ndarray
+        Scaled triplets.
+    """
+
+    if random_state is not None:
+        triplets = (triplets + random_state.uniform(size=3)) % 1
+
+    limits = np.asarray(limits)
+
+    return limits[..., 0] + triplets * (limits[..., 1] - limits[..., 0])
+
+
+def stratified_random_triplets(size,
+                               limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                               random_state=RANDOM_STATE):
+    """
+    Returns an array of stratified random triplets.
+
+    The volume defined by the limits is divided in :math:`k^3` cells, with
+    :math:`k` the smallest integer such as :math:`k^3 \\geq size`, and a
+    random triplet is drawn in each of *size* randomly chosen cells.
+
+    Parameters
+    ----------
+    size : integer
+        Triplets count.
+    limits : array_like, (3, 2)
+        Random values limits on each triplet axis.
+    random_state : RandomState
+         Mersenne Twister pseudo-random number generator.
+
+    Returns
+    -------
+    ndarray, (size, 3)
+        Stratified random triplets.
+
+    Notes
+    -----
+    -   The doctest is assuming that :func:`np.random.RandomState` definition
+        will return the same sequence no matter which *OS* or *Python*
+        version is used. There is however no formal promise about the *prng*
+        sequence reproducibility of either *Python* or *Numpy*
+        implementations: Laurent. (2012). Reproducibility of python
+        pseudo-random numbers across systems and versions? Retrieved January
+        20, 2015, from http://stackoverflow.com/questions/8786084/\
+reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
+
+    Examples
+    --------
+    >>> prng = np.random.RandomState(4)
+    >>> stratified_random_triplets(4, random_state=prng)  # doctest: +ELLIPSIS
+    array([[ 0.7987781...,  0.0707320...,  0.1122529...],
+           [ 0.8492101...,  0.9515892...,  0.8164815...],
+           [ 0.0025795...,  0.7861782...,  0.6807481...],
+           [ 0.3020659...,  0.1958831...,  0.4059738...]])
+    """
+
+    size = _integer_size(size)
+
+    k = int(np.round(size ** (1 / 3)))
+    if k ** 3 < size:
+        k += 1
+
+    cells = random_state.permutation(k ** 3)[:size]
+    triplets = (tstack(np.unravel_index(cells, (k, k, k))) +
+                random_state.uniform(size=(size, 3))) / k
+
+    return _scale_triplets(triplets, limits, None)
+
+
+def quasi_random_triplets_Halton(size,
+                                 limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                                 random_state=None):
+    """
+    Returns an array of quasi-random triplets from the *Halton* low-discrepancy
+    sequence, using bases 2, 3 and 5.
+
+    Parameters
+    ----------
+    size : integer
+        Triplets count.
+    limits : array_like, (3, 2)
+        Quasi-random values limits on each triplet axis.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator used to randomly shift
+        the sequence modulo 1, i.e. *Cranley-Patterson* rotation, the
+        sequence is deterministic if not given.
+
+    Returns
+    -------
+    ndarray, (size, 3)
+        Quasi-random triplets.
+
+    Notes
+    -----
+    -   The sequence starts at index 1, thus excluding the origin.
+
+    Examples
+    --------
+    >>> quasi_random_triplets_Halton(4)  # doctest: +ELLIPSIS
+    array([[ 0.5       ,  0.3333333...,  0.2       ],
+           [ 0.25      ,  0.6666666...,  0.4       ],
+           [ 0.75      ,  0.1111111...,  0.6       ],
+           [ 0.125     ,  0.4444444...,  0.8       ]])
+    """
+
+    size = _integer_size(size)
+
+    indexes = np.arange(1, size + 1)
+
+    triplets = []
+    for base in (2, 3, 5):
+        i = np.copy(indexes)
+        radical_inverse = np.zeros(size)
+        f = 1 / base
+        while np.any(i > 0):
+            radical_inverse += f * (i % base)
+            i //= base
+            f /= base
+        triplets.append(radical_inverse)
+
+    return _scale_triplets(tstack(triplets), limits, random_state)
+
+
+def quasi_random_triplets_Sobol(size,
+                                limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                                random_state=None):
+    """
+    Returns an array of quasi-random triplets from the *Sobol* low-discrepancy
+    sequence.
+
+    Parameters
+    ----------
+    size : integer
+        Triplets count.
+    limits : array_like, (3, 2)
+        Quasi-random values limits on each triplet axis.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator used to randomly shift
+        the sequence modulo 1, i.e. *Cranley-Patterson* rotation, the
+        sequence is deterministic if not given.
+
+    Returns
+    -------
+    ndarray, (size, 3)
+        Quasi-random triplets.
+
+    Notes
+    -----
+    -   The sequence starts at index 0, i.e. the origin, the sequence balance
+        properties being best for sizes that are powers of 2.
+
+    References
+    ----------
+    -   :cite:`Joe2008`
+
+    Examples
+    --------
+    >>> quasi_random_triplets_Sobol(4)
+    array([[ 0.  ,  0.  ,  0.  ],
+           [ 0.5 ,  0.5 ,  0.5 ],
+           [ 0.25,  0.75,  0.75],
+           [ 0.75,  0.25,  0.25]])
+    """
+
+    size = _integer_size(size)
+
+    bits = 32
+
+    directions = [[1 << (bits - 1 - j) for j in range(bits)]]
+    for s, a, m in _SOBOL_DIRECTION_NUMBERS:
+        v = [m_k << (bits - 1 - k) for k, m_k in enumerate(m)]
+        for j in range(s, bits):
+            v_j = v[j - s] ^ (v[j - s] >> s)
+            for k in range(1, s):
+                v_j ^= ((a >> (s - 1 - k)) & 1) * v[j - k]
+            v.append(v_j)
+        directions.append(v)
+    directions = np.array(directions, dtype=np.uint64)
+
+    indexes = np.arange(size, dtype=np.uint64)
+
+    integers = np.zeros((size, 3), dtype=np.uint64)
+    for j in range(bits):
+        bit = (indexes >> np.uint64(j)) & np.uint64(1)
+        integers ^= bit[..., np.newaxis] * directions[..., j]
+
+    return _scale_triplets(integers / 2 ** bits, limits, random_state)
@@ -8,7 +8,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.algebra import random_triplet_generator
+from colour.algebra import (
+    random_triplet_generator, stratified_random_triplets,
+    quasi_random_triplets_Halton, quasi_random_triplets_Sobol)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +19,11 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['RANDOM_TRIPLETS', 'TestRandomTripletGenerator']
+__all__ = [
+    'RANDOM_TRIPLETS', 'TestRandomTripletGenerator',
+    'TestStratifiedRandomTriplets', 'TestQuasiRandomTripletsHalton',
+    'TestQuasiRandomTripletsSobol'
+]
 
 RANDOM_TRIPLETS = np.array([
     [0.96702984, 0.54723225, 0.97268436],
@@ -63,5 +69,123 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
             decimal=7)
 
 
+class TestStratifiedRandomTriplets(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.stratified_random_triplets`
+    definition unit tests methods.
+    """
+
+    def test_stratified_random_triplets(self):
+        """
+        Tests :func:`colour.algebra.random.stratified_random_triplets`
+        definition.
+        """
+
+        prng = np.random.RandomState(4)
+        np.testing.assert_almost_equal(
+            stratified_random_triplets(8, random_state=prng),
+            np.array([
+                [0.79877810, 0.07073209, 0.11225296],
+                [0.84921012, 0.95158926, 0.81648155],
+                [0.00257957, 0.78617825, 0.68074817],
+                [0.30206597, 0.19588310, 0.40597387],
+                [0.30626267, 0.13323689, 0.82195713],
+                [0.90553105, 0.00951237, 0.51989018],
+                [0.97250193, 0.72317460, 0.22067427],
+                [0.03285477, 0.58793062, 0.43294138],
+            ]),
+            decimal=7)
+
+        prng = np.random.RandomState(4)
+        triplets = stratified_random_triplets(
+            1000,
+            np.array([[0, 100], [-150, 150], [-150, 150]]),
+            random_state=prng)
+        self.assertTupleEqual(triplets.shape, (1000, 3))
+        cells = np.floor(
+            (triplets - np.array([0, -150, -150])) /
+            np.array([10, 30, 30])).astype(int)
+        self.assertEqual(len(set(map(tuple, cells))), 1000)
+
+
+class TestQuasiRandomTripletsHalton(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.quasi_random_triplets_Halton`
+    definition unit tests methods.
+    """
+
+    def test_quasi_random_triplets_Halton(self):
+        """
+        Tests :func:`colour.algebra.random.quasi_random_triplets_Halton`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            quasi_random_triplets_Halton(8),
+            np.array([
+                [0.50000000, 0.33333333, 0.20000000],
+                [0.25000000, 0.66666667, 0.40000000],
+                [0.75000000, 0.11111111, 0.60000000],
+                [0.12500000, 0.44444444, 0.80000000],
+                [0.62500000, 0.77777778, 0.04000000],
+                [0.37500000, 0.22222222, 0.24000000],
+                [0.87500000, 0.55555556, 0.44000000],
+                [0.06250000, 0.88888889, 0.64000000],
+            ]),
+            decimal=7)
+
+        limits = np.array([[0, 100], [-150, 150], [-150, 150]])
+        np.testing.assert_almost_equal(
+            quasi_random_triplets_Halton(8, limits),
+            limits[..., 0] + quasi_random_triplets_Halton(8) *
+            (limits[..., 1] - limits[..., 0]),
+            decimal=7)
+
+        prng = np.random.RandomState(4)
+        shift = np.random.RandomState(4).uniform(size=3)
+        np.testing.assert_almost_equal(
+            quasi_random_triplets_Halton(8, random_state=prng),
+            (quasi_random_triplets_Halton(8) + shift) % 1,
+            decimal=7)
+
+
+class TestQuasiRandomTripletsSobol(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.quasi_random_triplets_Sobol`
+    definition unit tests methods.
+    """
+
+    def test_quasi_random_triplets_Sobol(self):
+        """
+        Tests :func:`colour.algebra.random.quasi_random_triplets_Sobol`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            quasi_random_triplets_Sobol(8),
+            np.array([
+                [0.000, 0.000, 0.000],
+                [0.500, 0.500, 0.500],
+                [0.250, 0.750, 0.750],
+                [0.750, 0.250, 0.250],
+                [0.125, 0.625, 0.375],
+                [0.625, 0.125, 0.875],
+                [0.375, 0.375, 0.625],
+                [0.875, 0.875, 0.125],
+            ]),
+            decimal=7)
+
+        triplets = quasi_random_triplets_Sobol(4096)
+        cells = np.floor(triplets * 16).astype(int)
+        self.assertEqual(len(set(map(tuple, cells))), 4096)
+
+        prng = np.random.RandomState(4)
+        shift = np.random.RandomState(4).uniform(size=3)
+        np.testing.assert_almost_equal(
+            quasi_random_triplets_Sobol(8, random_state=prng),
+            (quasi_random_triplets_Sobol(8) + shift) % 1,
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
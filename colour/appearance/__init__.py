@@ -3,35 +3,39 @@
 from __future__ import absolute_import
 
 from .hunt import (Hunt_InductionFactors, HUNT_VIEWING_CONDITIONS,
-                   Hunt_Specification, XYZ_to_Hunt)
+                   Hunt_Specification, XYZ_to_Hunt, Hunt_to_XYZ)
 from .atd95 import ATD95_Specification, XYZ_to_ATD95
 from .ciecam02 import (CIECAM02_InductionFactors, CIECAM02_VIEWING_CONDITIONS,
-                       CIECAM02_Specification, XYZ_to_CIECAM02,
-                       CIECAM02_to_XYZ)
+                       CIECAM02_Specification, CIECAM02_ViewingConditionsModel,
+                       XYZ_to_CIECAM02, CIECAM02_to_XYZ,
+                       CIECAM02_viewing_conditions_model)
 from .cam16 import (CAM16_InductionFactors, CAM16_VIEWING_CONDITIONS,
-                    CAM16_Specification, XYZ_to_CAM16, CAM16_to_XYZ)
+                    CAM16_Specification, CAM16_ViewingConditionsModel,
+                    XYZ_to_CAM16, CAM16_to_XYZ, CAM16_viewing_conditions_model)
 from .llab import (LLAB_InductionFactors, LLAB_VIEWING_CONDITIONS,
-                   LLAB_Specification, XYZ_to_LLAB)
+                   LLAB_Specification, XYZ_to_LLAB, LLAB_to_XYZ)
 from .nayatani95 import Nayatani95_Specification, XYZ_to_Nayatani95
 from .rlab import (RLAB_VIEWING_CONDITIONS, RLAB_D_FACTOR, RLAB_Specification,
                    XYZ_to_RLAB)
 
 __all__ = [
     'Hunt_InductionFactors', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
-    'XYZ_to_Hunt'
+    'XYZ_to_Hunt', 'Hunt_to_XYZ'
 ]
 __all__ += ['ATD95_Specification', 'XYZ_to_ATD95']
 __all__ += [
     'CIECAM02_InductionFactors', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ'
+    'CIECAM02_Specification', 'CIECAM02_ViewingConditionsModel',
+    'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ', 'CIECAM02_viewing_conditions_model'
 ]
 __all__ += [
     'CAM16_InductionFactors', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_Specification', 'XYZ_to_CAM16', 'CAM16_to_XYZ'
+    'CAM16_Specification', 'CAM16_ViewingConditionsModel', 'XYZ_to_CAM16',
+    'CAM16_to_XYZ', 'CAM16_viewing_conditions_model'
 ]
 __all__ += [
     'LLAB_InductionFactors', 'LLAB_VIEWING_CONDITIONS', 'LLAB_Specification',
-    'XYZ_to_LLAB'
+    'XYZ_to_LLAB', 'LLAB_to_XYZ'
 ]
 __all__ += ['Nayatani95_Specification', 'XYZ_to_Nayatani95']
 __all__ += [
@@ -36,7 +36,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities.array import dot_vector, tsplit, tstack
+from colour.utilities.array import dot_vector, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -51,6 +51,25 @@ __all__ = [
     'opponent_colour_dimensions', 'final_response'
 ]
 
+_XYZ_TO_LMS_ATD95_MATRIX = np.array([
+    [0.2435, 0.8524, -0.0516],
+    [-0.3954, 1.1642, 0.0837],
+    [0.0000, 0.0400, 0.6225],
+])
+
+_LMS_TO_OPPONENT_COLOUR_DIMENSIONS_MATRIX = np.array([
+    [3.57, 2.64, 0],
+    [7.18, -6.21, 0],
+    [-0.7, 0.085, 1],
+    [0.09 * 3.57, 0.09 * 2.64, 0],
+    [0.43 * 7.18 + 0.76 * -0.7, 0.43 * -6.21 + 0.76 * 0.085, 0.76],
+])
+"""
+Matrix computing the :math:`A_1`, :math:`T_1`, :math:`D_1`, :math:`A_2` and
+:math:`T_2` initial opponent colour dimensions from post adaptation cone
+signals, :math:`D_2` being equal to :math:`D_1`.
+"""
+
 
 class ATD95_ReferenceSpecification(
         namedtuple('ATD95_ReferenceSpecification',
@@ -280,11 +299,7 @@ def XYZ_to_LMS_ATD95(XYZ):
     array([ 6.2283272...,  7.4780666...,  3.8859772...])
     """
 
-    LMS = dot_vector([
-        [0.2435, 0.8524, -0.0516],
-        [-0.3954, 1.1642, 0.0837],
-        [0.0000, 0.0400, 0.6225],
-    ], XYZ)
+    LMS = dot_vector(_XYZ_TO_LMS_ATD95_MATRIX, XYZ)
 
     LMS *= np.array([0.66, 1.0, 0.43])
     LMS = np.sign(LMS) * np.abs(LMS) ** 0.7
@@ -314,23 +329,13 @@ def opponent_colour_dimensions(LMS_g):
     array([ 0.1787931...,  0.0286942...,  0.0107584...,  0.0192182..., ...])
     """
 
-    L_g, M_g, S_g = tsplit(LMS_g)
-
-    A_1i = 3.57 * L_g + 2.64 * M_g
-    T_1i = 7.18 * L_g - 6.21 * M_g
-    D_1i = -0.7 * L_g + 0.085 * M_g + S_g
-    A_2i = 0.09 * A_1i
-    T_2i = 0.43 * T_1i + 0.76 * D_1i
-    D_2i = D_1i
-
-    A_1 = final_response(A_1i)
-    T_1 = final_response(T_1i)
-    D_1 = final_response(D_1i)
-    A_2 = final_response(A_2i)
-    T_2 = final_response(T_2i)
-    D_2 = final_response(D_2i)
+    # Computing the final responses of :math:`A_1`, :math:`T_1`,
+    # :math:`D_1`, :math:`A_2` and :math:`T_2` at once, :math:`D_2` is equal
+    # to :math:`D_1`.
+    ATD = final_response(
+        dot_vector(_LMS_TO_OPPONENT_COLOUR_DIMENSIONS_MATRIX, LMS_g))
 
-    return tstack((A_1, T_1, D_1, A_2, T_2, D_2))
+    return np.concatenate([ATD, ATD[..., 2:3]], axis=-1)
 
 
 def final_response(value):
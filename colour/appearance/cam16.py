@@ -10,6 +10,8 @@ Defines *CAM16* colour appearance model objects:
 -   :class:`colour.CAM16_Specification`
 -   :func:`colour.XYZ_to_CAM16`
 -   :func:`colour.CAM16_to_XYZ`
+-   :class:`colour.appearance.CAM16_ViewingConditionsModel`
+-   :func:`colour.appearance.CAM16_viewing_conditions_model`
 
 See Also
 --------
@@ -31,9 +33,10 @@ import numpy as np
 from collections import namedtuple
 
 from colour.appearance.ciecam02 import (
-    CIECAM02_VIEWING_CONDITIONS, P, achromatic_response_forward,
-    achromatic_response_reverse, brightness_correlate, chroma_correlate,
-    colourfulness_correlate, degree_of_adaptation, eccentricity_factor,
+    CIECAM02_VIEWING_CONDITIONS, FUSED_KERNEL_TILE_SIZE, P,
+    achromatic_response_forward, achromatic_response_reverse,
+    brightness_correlate, chroma_correlate, colourfulness_correlate,
+    degree_of_adaptation, eccentricity_factor, fused_appearance_correlates,
     hue_angle, hue_quadrature, lightness_correlate,
     opponent_colour_dimensions_forward, opponent_colour_dimensions_reverse,
     post_adaptation_non_linear_response_compression_forward,
@@ -53,8 +56,9 @@ __status__ = 'Production'
 
 __all__ = [
     'M_16', 'M_16_INVERSE', 'CAM16_InductionFactors',
-    'CAM16_VIEWING_CONDITIONS', 'CAM16_Specification', 'XYZ_to_CAM16',
-    'CAM16_to_XYZ'
+    'CAM16_VIEWING_CONDITIONS', 'CAM16_Specification',
+    'CAM16_ViewingConditionsModel', 'XYZ_to_CAM16', 'CAM16_to_XYZ',
+    'CAM16_viewing_conditions_model'
 ]
 
 M_16 = np.array([
@@ -157,6 +161,239 @@ class CAM16_Specification(
                                                        H, HC)
 
 
+class CAM16_ViewingConditionsModel(
+        namedtuple('CAM16_ViewingConditionsModel',
+                   ('surround', 'n', 'F_L', 'N_bb', 'N_cb', 'z', 'D_RGB',
+                    'A_w'))):
+    """
+    Defines the *CAM16* colour appearance model for given viewing conditions,
+    storing the terms depending on the reference white and the viewing
+    conditions.
+
+    Instances are returned by the
+    :func:`colour.appearance.CAM16_viewing_conditions_model` definition.
+
+    Parameters
+    ----------
+    surround : CAM16_InductionFactors
+        Surround viewing conditions induction factors.
+    n : numeric or array_like
+        Background induction factor :math:`n`.
+    F_L : numeric or array_like
+        Luminance level adaptation factor :math:`F_L`.
+    N_bb : numeric or array_like
+        Brightness background induction factor :math:`N_{bb}`.
+    N_cb : numeric or array_like
+        Chromatic background induction factor :math:`N_{cb}`.
+    z : numeric or array_like
+        Base exponential non linearity :math:`z`.
+    D_RGB : array_like
+        Full chromatic adaptation gains of the sharpened *RGB* values.
+    A_w : numeric or array_like
+        Achromatic response :math:`A_w` for the whitepoint.
+
+    Methods
+    -------
+    forward
+    reverse
+
+    References
+    ----------
+    -   :cite:`Li2017`
+    """
+
+    def forward(self, XYZ):
+        """
+        Computes the *CAM16* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus normalised
+            to domain [0, 100].
+
+        Returns
+        -------
+        CAM16_Specification
+            *CAM16* colour appearance model specification.
+        """
+
+        surround, n, F_L, N_bb, N_cb, z, D_RGB, A_w = self
+
+        # Step 1
+        # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
+        RGB = dot_vector(M_16, XYZ)
+
+        # Step 2
+        RGB_c = D_RGB * RGB
+
+        # Step 3
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_c, F_L)
+
+        # Step 4
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Step 5
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
+
+        # Step 6
+        # Computing achromatic responses for the stimulus.
+        A = achromatic_response_forward(RGB_a, N_bb)
+
+        # Step 7
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, A_w, surround.c, z)
+
+        # Step 8
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(surround.c, J, A_w, F_L)
+
+        # Step 9
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
+
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, F_L)
+
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+        return CAM16_Specification(J, C, h, s, Q, M, H, None)
+
+    def forward_fused(self, XYZ, tile_size=FUSED_KERNEL_TILE_SIZE):
+        """
+        Computes the *CAM16* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values using the fused kernel.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus normalised
+            to domain [0, 100].
+        tile_size : int, optional
+            Number of stimuli processed at once.
+
+        Returns
+        -------
+        CAM16_Specification
+            *CAM16* colour appearance model specification.
+
+        Notes
+        -----
+        -   The :math:`M_{16}` adaptation matrix and the full chromatic
+            adaptation are collapsed into a single matrix, the stimuli are
+            processed by tiles in preallocated buffers, see
+            :func:`colour.appearance.ciecam02.fused_appearance_correlates`
+            definition.
+        -   The viewing conditions must be the same for all the stimuli,
+            the :meth:`CAM16_ViewingConditionsModel.forward` method is used
+            otherwise.
+        -   *Hue* :math:`h` is not set to 0 for *nan* stimuli.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> model = CAM16_viewing_conditions_model(XYZ_w, 318.31, 20.0)
+        >>> XYZ = np.array([19.01, 20.00, 21.78])
+        >>> model.forward_fused(XYZ)  # doctest: +ELLIPSIS
+        CAM16_Specification(J=41.7312079..., C=0.1033557..., \
+h=217.0679597..., s=2.3450150..., Q=195.3717089..., M=0.1074367..., \
+H=275.5949861..., HC=None)
+        """
+
+        if np.asarray(self.D_RGB).ndim != 1:
+            return self.forward(XYZ)
+
+        M_f = self.D_RGB[..., np.newaxis] * M_16
+
+        return CAM16_Specification(*fused_appearance_correlates(
+            XYZ, M_f, self, tile_size) + (None, ))
+
+    def reverse(self, CAM16_specification):
+        """
+        Converts given *CAM16* specification to *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        CAM16_specification : CAM16_Specification
+            *CAM16* colour appearance model specification. Correlate of
+            *Lightness* :math:`J`, correlate of *chroma* :math:`C` or
+            correlate of *colourfulness* :math:`M` and *hue* angle :math:`h`
+            in degrees must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values normalised to range [0, 100].
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``CAM16_specification`` argument.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CAM16_specification,
+                                                    CAM16_Specification)
+
+        surround, n, F_L, N_bb, N_cb, z, D_RGB, A_w = self
+
+        # Step 1
+        if C is None and M is not None:
+            C = M / F_L ** 0.25
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "CAM16_specification" argument!')
+
+        # Step 2
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_reverse(C, J, n)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_reverse(A_w, J, surround.c, z)
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Step 3
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+
+        # Step 4
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+
+        # Step 5
+        # Applying reverse post-adaptation non linear response compression.
+        RGB_c = post_adaptation_non_linear_response_compression_reverse(
+            RGB_a, F_L)
+
+        # Step 6
+        RGB = RGB_c / D_RGB
+
+        # Step 7
+        XYZ = dot_vector(M_16_INVERSE, RGB)
+
+        return XYZ
+
+
 def XYZ_to_CAM16(XYZ,
                  XYZ_w,
                  L_A,
@@ -217,81 +454,8 @@ def XYZ_to_CAM16(XYZ,
 s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., HC=None)
     """
 
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
-
-    # Step 0
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB_w = dot_vector(M_16, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else np.ones(L_A.shape))
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
-             D[..., np.newaxis])
-    RGB_wc = D_RGB * RGB_w
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_wc, F_L)
-
-    # Computing achromatic responses for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Step 1
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB = dot_vector(M_16, XYZ)
-
-    # Step 2
-    RGB_c = D_RGB * RGB
-
-    # Step 3
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_c, F_L)
-
-    # Step 4
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Step 5
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Step 6
-    # Computing achromatic responses for the stimulus.
-    A = achromatic_response_forward(RGB_a, N_bb)
-
-    # Step 7
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Step 8
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Step 9
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM16_Specification(J, C, h, s, Q, M, H, None)
+    return CAM16_viewing_conditions_model(
+        XYZ_w, L_A, Y_b, surround, discount_illuminant).forward(XYZ)
 
 
 def CAM16_to_XYZ(CAM16_specification,
@@ -362,10 +526,69 @@ def CAM16_to_XYZ(CAM16_specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CAM16_specification,
-                                                CAM16_Specification)
+    return CAM16_viewing_conditions_model(
+        XYZ_w, L_A, Y_b, surround,
+        discount_illuminant).reverse(CAM16_specification)
+
 
-    _X_w, Y_w, _Zw = tsplit(XYZ_w)
+def CAM16_viewing_conditions_model(
+        XYZ_w,
+        L_A,
+        Y_b,
+        surround=CAM16_VIEWING_CONDITIONS['Average'],
+        discount_illuminant=False):
+    """
+    Returns the *CAM16* colour appearance model for given viewing conditions,
+    i.e. with all the terms depending on the reference white and the viewing
+    conditions precomputed.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CAM16_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Returns
+    -------
+    CAM16_ViewingConditionsModel
+        *CAM16* colour appearance model for given viewing conditions.
+
+    Notes
+    -----
+    -   Input *CIE XYZ_w* tristimulus values are normalised to domain [0, 100].
+    -   The returned model can be reused to convert any number of stimuli
+        seen under the same viewing conditions with its
+        :meth:`CAM16_ViewingConditionsModel.forward` and
+        :meth:`CAM16_ViewingConditionsModel.reverse` methods.
+
+    References
+    ----------
+    -   :cite:`Li2017`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> model = CAM16_viewing_conditions_model(XYZ_w, L_A, Y_b)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> model.forward(XYZ)  # doctest: +ELLIPSIS
+    CAM16_Specification(J=41.7312079..., C=0.1033557..., h=217.0679597..., \
+s=2.3450150..., Q=195.3717089..., M=0.1074367..., H=275.5949861..., HC=None)
+    """
+
+    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
+    L_A = np.asarray(L_A)
+    Y_b = np.asarray(Y_b)
 
     # Step 0
     # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
@@ -389,43 +612,5 @@ def CAM16_to_XYZ(CAM16_specification,
     # Computing achromatic responses for the whitepoint.
     A_w = achromatic_response_forward(RGB_aw, N_bb)
 
-    # Step 1
-    if C is None and M is not None:
-        C = M / F_L ** 0.25
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CAM16_specification" argument!')
-
-    # Step 2
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_reverse(C, J, n)
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_reverse(A_w, J, surround.c, z)
-
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
-
-    # Step 3
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
-
-    # Step 4
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = post_adaptation_non_linear_response_compression_matrix(P_2, a, b)
-
-    # Step 5
-    # Applying reverse post-adaptation non linear response compression.
-    RGB_c = post_adaptation_non_linear_response_compression_reverse(RGB_a, F_L)
-
-    # Step 6
-    RGB = RGB_c / D_RGB
-
-    # Step 7
-    XYZ = dot_vector(M_16_INVERSE, RGB)
-
-    return XYZ
+    return CAM16_ViewingConditionsModel(surround, n, F_L, N_bb, N_cb, z,
+                                        D_RGB, A_w)
@@ -10,6 +10,8 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.CIECAM02_Specification`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
+-   :class:`colour.appearance.CIECAM02_ViewingConditionsModel`
+-   :func:`colour.appearance.CIECAM02_viewing_conditions_model`
 
 See Also
 --------
@@ -57,7 +59,10 @@ __status__ = 'Production'
 __all__ = [
     'CAT02_INVERSE_CAT', 'CIECAM02_InductionFactors',
     'CIECAM02_VIEWING_CONDITIONS', 'HUE_DATA_FOR_HUE_QUADRATURE',
-    'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
+    'CIECAM02_Specification', 'CIECAM02_ViewingConditionsModel',
+    'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ', 'CIECAM02_viewing_conditions_model',
+    'FUSED_KERNEL_TILE_SIZE', 'OPPONENT_ACHROMATIC_MATRIX',
+    'HUE_QUADRATURE_SEGMENTS', 'fused_appearance_correlates',
     'chromatic_induction_factors', 'base_exponential_non_linearity',
     'viewing_condition_dependent_parameters', 'degree_of_adaptation',
     'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_reverse',
@@ -81,6 +86,30 @@ Inverse CAT02 chromatic adaptation transform.
 CAT02_INVERSE_CAT : array_like, (3, 3)
 """
 
+FUSED_KERNEL_TILE_SIZE = 2 ** 14
+"""
+Number of stimuli processed at once by the fused *CIECAM02* and *CAM16*
+colour appearance models kernel, chosen so that the kernel buffers fit in the
+processor cache.
+
+FUSED_KERNEL_TILE_SIZE : int
+"""
+
+OPPONENT_ACHROMATIC_MATRIX = np.array([
+    [1, -12 / 11, 1 / 11],
+    [1 / 9, 1 / 9, -2 / 9],
+    [2, 1, 1 / 20],
+    [1, 1, 21 / 20],
+])
+"""
+Matrix converting the compressed *CMCCAT2000* transform sharpened *RGB*
+array to the opponent colour dimensions :math:`a` and :math:`b`, the
+achromatic response :math:`A` before its offset and scaling and the
+temporary magnitude quantity :math:`t` denominator at once.
+
+OPPONENT_ACHROMATIC_MATRIX : array_like, (4, 3)
+"""
+
 
 class CIECAM02_InductionFactors(
         namedtuple('CIECAM02_InductionFactors', ('F', 'c', 'N_c'))):
@@ -130,6 +159,24 @@ HUE_DATA_FOR_HUE_QUADRATURE = {
     'H_i': np.array([0.0, 100.0, 200.0, 300.0, 400.0])
 }
 
+HUE_QUADRATURE_SEGMENTS = np.array([
+    [385.9, 14.1, 0.0, 0.856, 20.14, 0.8],
+    [0.0, 100.0, 20.14, 0.8, 90.00, 0.7],
+    [100.0, 100.0, 90.00, 0.7, 164.25, 1.0],
+    [200.0, 100.0, 164.25, 1.0, 237.53, 1.2],
+    [300.0, 85.9, 237.53, 1.2, 360.0, 0.856],
+])
+"""
+Hue quadrature segments coefficients :math:`H_i`, :math:`S_i`,
+:math:`h_i`, :math:`e_i`, :math:`h_{i+1}` and :math:`e_{i+1}` such as
+:math:`H=H_i+S_i\\cfrac{x}{x+y}` with :math:`x=(h-h_i)/e_i` and
+:math:`y=(h_{i+1}-h)/e_{i+1}`, i.e. :func:`colour.appearance.hue_quadrature`
+definition expressed for the segments starting at 0, 20.14, 90, 164.25 and
+237.53 degrees.
+
+HUE_QUADRATURE_SEGMENTS : ndarray, (5, 6)
+"""
+
 
 class CIECAM02_Specification(
         namedtuple('CIECAM02_Specification', ('J', 'C', 'h', 's', 'Q', 'M',
@@ -182,6 +229,242 @@ class CIECAM02_Specification(
             cls, J, C, h, s, Q, M, H, HC)
 
 
+class CIECAM02_ViewingConditionsModel(
+        namedtuple('CIECAM02_ViewingConditionsModel',
+                   ('surround', 'n', 'F_L', 'N_bb', 'N_cb', 'z', 'D_RGB',
+                    'A_w'))):
+    """
+    Defines the *CIECAM02* colour appearance model for given viewing
+    conditions, storing the terms depending on the reference white and the
+    viewing conditions.
+
+    Instances are returned by the
+    :func:`colour.appearance.CIECAM02_viewing_conditions_model` definition.
+
+    Parameters
+    ----------
+    surround : CIECAM02_InductionFactors
+        Surround viewing conditions induction factors.
+    n : numeric or array_like
+        Background induction factor :math:`n`.
+    F_L : numeric or array_like
+        Luminance level adaptation factor :math:`F_L`.
+    N_bb : numeric or array_like
+        Brightness background induction factor :math:`N_{bb}`.
+    N_cb : numeric or array_like
+        Chromatic background induction factor :math:`N_{cb}`.
+    z : numeric or array_like
+        Base exponential non linearity :math:`z`.
+    D_RGB : array_like
+        Full chromatic adaptation gains of the *CMCCAT2000* transform
+        sharpened *RGB* values.
+    A_w : numeric or array_like
+        Achromatic response :math:`A_w` for the whitepoint.
+
+    Methods
+    -------
+    forward
+    reverse
+
+    References
+    ----------
+    -   :cite:`Fairchild2004c`
+    -   :cite:`Luo2013`
+    -   :cite:`Moroneya`
+    -   :cite:`Wikipediach`
+    """
+
+    def forward(self, XYZ):
+        """
+        Computes the *CIECAM02* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus normalised
+            to domain [0, 100].
+
+        Returns
+        -------
+        CIECAM02_Specification
+            *CIECAM02* colour appearance model specification.
+        """
+
+        surround, n, F_L, N_bb, N_cb, z, D_RGB, A_w = self
+
+        # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
+        # sharpened *RGB* values.
+        RGB = dot_vector(CAT02_CAT, XYZ)
+
+        # Computing full chromatic adaptation.
+        RGB_c = D_RGB * RGB
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_p = RGB_to_rgb(RGB_c)
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_p, F_L)
+
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic responses for the stimulus.
+        A = achromatic_response_forward(RGB_a, N_bb)
+
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, A_w, surround.c, z)
+
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(surround.c, J, A_w, F_L)
+
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
+
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, F_L)
+
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+        return CIECAM02_Specification(J, C, h, s, Q, M, H, None)
+
+    def forward_fused(self, XYZ, tile_size=FUSED_KERNEL_TILE_SIZE):
+        """
+        Computes the *CIECAM02* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values using the fused kernel.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus normalised
+            to domain [0, 100].
+        tile_size : int, optional
+            Number of stimuli processed at once.
+
+        Returns
+        -------
+        CIECAM02_Specification
+            *CIECAM02* colour appearance model specification.
+
+        Notes
+        -----
+        -   The *CAT02* transform, the full chromatic adaptation and the
+            conversion to *Hunt-Pointer-Estevez* colourspace are collapsed
+            into a single matrix, the stimuli are processed by tiles in
+            preallocated buffers, see
+            :func:`colour.appearance.ciecam02.fused_appearance_correlates`
+            definition.
+        -   The viewing conditions must be the same for all the stimuli,
+            the :meth:`CIECAM02_ViewingConditionsModel.forward` method is
+            used otherwise.
+        -   *Hue* :math:`h` is not set to 0 for *nan* stimuli.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> model = CIECAM02_viewing_conditions_model(XYZ_w, 318.31, 20.0)
+        >>> XYZ = np.array([19.01, 20.00, 21.78])
+        >>> model.forward_fused(XYZ)  # doctest: +ELLIPSIS
+        CIECAM02_Specification(J=41.7310911..., C=0.1047077..., \
+h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
+H=278.0607358..., HC=None)
+        """
+
+        if np.asarray(self.D_RGB).ndim != 1:
+            return self.forward(XYZ)
+
+        M_f = np.dot(
+            dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT) * self.D_RGB,
+            CAT02_CAT)
+
+        return CIECAM02_Specification(*fused_appearance_correlates(
+            XYZ, M_f, self, tile_size) + (None, ))
+
+    def reverse(self, CIECAM02_specification):
+        """
+        Converts given *CIECAM02* specification to *CIE XYZ* tristimulus
+        values.
+
+        Parameters
+        ----------
+        CIECAM02_specification : CIECAM02_Specification
+            *CIECAM02* colour appearance model specification. Correlate of
+            *Lightness* :math:`J`, correlate of *chroma* :math:`C` or
+            correlate of *colourfulness* :math:`M` and *hue* angle :math:`h`
+            in degrees must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values normalised to range [0, 100].
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``CIECAM02_specification`` argument.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CIECAM02_specification,
+                                                    CIECAM02_Specification)
+
+        surround, n, F_L, N_bb, N_cb, z, D_RGB, A_w = self
+
+        if C is None and M is not None:
+            C = M / F_L ** 0.25
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "CIECAM02_specification" argument!')
+
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_reverse(C, J, n)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_reverse(A_w, J, surround.c, z)
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+
+        # Applying reverse post-adaptation non linear response compression.
+        RGB_p = post_adaptation_non_linear_response_compression_reverse(
+            RGB_a, F_L)
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_c = rgb_to_RGB(RGB_p)
+
+        # Applying reverse full chromatic adaptation.
+        RGB = RGB_c / D_RGB
+
+        # Converting *CMCCAT2000* transform sharpened *RGB* values to *CIE XYZ*
+        # tristimulus values.
+        XYZ = dot_vector(CAT02_INVERSE_CAT, RGB)
+
+        return XYZ
+
+
 def XYZ_to_CIECAM02(XYZ,
                     XYZ_w,
                     L_A,
@@ -245,67 +528,8 @@ def XYZ_to_CIECAM02(XYZ,
 s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
     """
 
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB = dot_vector(CAT02_CAT, XYZ)
-    RGB_w = dot_vector(CAT02_CAT, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
-
-    # Computing full chromatic adaptation.
-    RGB_c = full_chromatic_adaptation_forward(RGB, RGB_w, Y_w, D)
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_p = RGB_to_rgb(RGB_c)
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_p, F_L)
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A = achromatic_response_forward(RGB_a, N_bb)
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CIECAM02_Specification(J, C, h, s, Q, M, H, None)
+    return CIECAM02_viewing_conditions_model(
+        XYZ_w, L_A, Y_b, surround, discount_illuminant).forward(XYZ)
 
 
 def CIECAM02_to_XYZ(CIECAM02_specification,
@@ -379,73 +603,264 @@ def CIECAM02_to_XYZ(CIECAM02_specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CIECAM02_specification,
-                                                CIECAM02_Specification)
+    return CIECAM02_viewing_conditions_model(
+        XYZ_w, L_A, Y_b, surround,
+        discount_illuminant).reverse(CIECAM02_specification)
+
+
+def CIECAM02_viewing_conditions_model(
+        XYZ_w,
+        L_A,
+        Y_b,
+        surround=CIECAM02_VIEWING_CONDITIONS['Average'],
+        discount_illuminant=False):
+    """
+    Returns the *CIECAM02* colour appearance model for given viewing
+    conditions, i.e. with all the terms depending on the reference white and
+    the viewing conditions precomputed.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CIECAM02_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
 
-    _X_w, Y_w, _Zw = tsplit(XYZ_w)
+    Returns
+    -------
+    CIECAM02_ViewingConditionsModel
+        *CIECAM02* colour appearance model for given viewing conditions.
+
+    Notes
+    -----
+    -   Input *CIE XYZ_w* tristimulus values are normalised to domain [0, 100].
+    -   The returned model can be reused to convert any number of stimuli
+        seen under the same viewing conditions with its
+        :meth:`CIECAM02_ViewingConditionsModel.forward` and
+        :meth:`CIECAM02_ViewingConditionsModel.reverse` methods.
+
+    References
+    ----------
+    -   :cite:`Fairchild2004c`
+    -   :cite:`Luo2013`
+    -   :cite:`Moroneya`
+    -   :cite:`Wikipediach`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> model = CIECAM02_viewing_conditions_model(XYZ_w, L_A, Y_b)
+    >>> model.A_w  # doctest: +ELLIPSIS
+    46.1882087...
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> model.forward(XYZ)  # doctest: +ELLIPSIS
+    CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
+s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
+    """
+
+    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
+    L_A = np.asarray(L_A)
+    Y_b = np.asarray(Y_b)
 
     n, F_L, N_bb, N_cb, z = tsplit(
         viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
 
-    if C is None and M is not None:
-        C = M / F_L ** 0.25
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CIECAM02_specification" argument!')
-
     # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
     # sharpened *RGB* values.
     RGB_w = dot_vector(CAT02_CAT, XYZ_w)
 
     # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
+    D = np.asarray(
+        degree_of_adaptation(surround.F, L_A)
+        if not discount_illuminant else 1)
 
-    # Computing full chromatic adaptation.
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
+    # Computing full chromatic adaptation gains.
+    D_RGB = (Y_w[..., np.newaxis] * D[..., np.newaxis] / RGB_w + 1 -
+             D[..., np.newaxis])
+    RGB_wc = D_RGB * RGB_w
 
     # Converting to *Hunt-Pointer-Estevez* colourspace.
     RGB_pw = RGB_to_rgb(RGB_wc)
 
-    # Applying post-adaptation non linear response compression.
+    # Applying forward post-adaptation non linear response compression.
     RGB_aw = post_adaptation_non_linear_response_compression_forward(
         RGB_pw, F_L)
 
     # Computing achromatic response for the whitepoint.
     A_w = achromatic_response_forward(RGB_aw, N_bb)
 
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_reverse(C, J, n)
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_reverse(A_w, J, surround.c, z)
+    return CIECAM02_ViewingConditionsModel(surround, n, F_L, N_bb, N_cb, z,
+                                           D_RGB, A_w)
 
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
 
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
-
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = post_adaptation_non_linear_response_compression_matrix(P_2, a, b)
+def fused_appearance_correlates(XYZ,
+                                M_f,
+                                model,
+                                tile_size=FUSED_KERNEL_TILE_SIZE):
+    """
+    Computes the *CIECAM02* or *CAM16* colour appearance model correlates from
+    given *CIE XYZ* tristimulus values in a single pass.
 
-    # Applying reverse post-adaptation non linear response compression.
-    RGB_p = post_adaptation_non_linear_response_compression_reverse(RGB_a, F_L)
+    The stimuli are processed by tiles of given size, each tile going through
+    a single matrix product converting the *CIE XYZ* tristimulus values to
+    adapted responses, the post-adaptation non linear response compression
+    performed in-place, a second matrix product yielding the opponent colour
+    dimensions and achromatic response at once and the correlates computed
+    into preallocated buffers and output arrays.
 
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_c = rgb_to_RGB(RGB_p)
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values of test sample / stimulus normalised to
+        domain [0, 100].
+    M_f : array_like, (3, 3)
+        Matrix converting the *CIE XYZ* tristimulus values to the adapted
+        responses before the post-adaptation non linear response compression,
+        i.e. to the *Hunt-Pointer-Estevez* colourspace for *CIECAM02* and to
+        the adapted sharpened *RGB* values for *CAM16*.
+    model : CIECAM02_ViewingConditionsModel or CAM16_ViewingConditionsModel
+        Colour appearance model for given viewing conditions, its parameters
+        must be scalars.
+    tile_size : int, optional
+        Number of stimuli processed at once.
 
-    # Applying reverse full chromatic adaptation.
-    RGB = full_chromatic_adaptation_reverse(RGB_c, RGB_w, Y_w, D)
+    Returns
+    -------
+    tuple
+        Correlate of *Lightness* :math:`J`, correlate of *chroma* :math:`C`,
+        *hue* angle :math:`h` in degrees, correlate of *saturation*
+        :math:`s`, correlate of *brightness* :math:`Q`, correlate of
+        *colourfulness* :math:`M` and *hue* :math:`h` quadrature :math:`H`.
 
-    # Converting *CMCCAT2000* transform sharpened *RGB* values to *CIE XYZ*
-    # tristimulus values.
-    XYZ = dot_vector(CAT02_INVERSE_CAT, RGB)
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> model = CIECAM02_viewing_conditions_model(XYZ_w, 318.31, 20.0)
+    >>> M_f = np.dot(
+    ...     dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT) * model.D_RGB,
+    ...     CAT02_CAT)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> fused_appearance_correlates(XYZ, M_f, model)[0]  # doctest: +ELLIPSIS
+    41.7310911...
+    """
 
-    return XYZ
+    XYZ = np.asarray(XYZ)
+    shape = XYZ.shape[:-1]
+    XYZ = np.ascontiguousarray(np.reshape(XYZ, (-1, 3)), dtype=np.float_)
+    M_f = np.transpose(np.asarray(M_f, dtype=np.float_))
+
+    surround, n, F_L, N_bb, N_cb, z, _D_RGB, A_w = model
+    c = float(surround.c)
+    F_L_4 = float(F_L) ** 0.25
+
+    count = XYZ.shape[0]
+    J, C, h, s, Q, M, H = [np.empty(count) for _ in range(7)]
+
+    size = max(min(tile_size, count), 1)
+    RGB = np.empty([size, 3])
+    RGB_t = np.empty([size, 3])
+    O_b = np.empty([size, 4])
+    T_1 = np.empty(size)
+    T_2 = np.empty(size)
+
+    O_T = np.transpose(OPPONENT_ACHROMATIC_MATRIX)
+    edges = HUE_QUADRATURE_SEGMENTS[1:, 2]
+    # Columns :math:`H_i`, :math:`S_i`, :math:`h_i`, :math:`1/e_i`,
+    # :math:`1/e_{i+1}` and :math:`h_{i+1}`.
+    segments = np.transpose(HUE_QUADRATURE_SEGMENTS[:, [0, 1, 2, 3, 5, 4]])
+    segments[3:5] = 1 / segments[3:5]
+    segments = np.ascontiguousarray(segments)
+    for i in range(0, count, size):
+        j = min(i + size, count)
+        k = j - i
+        RGB_a, R_t, O_k, t, T = RGB[:k], RGB_t[:k], O_b[:k], T_1[:k], T_2[:k]
+        J_k, C_k, h_k, s_k, Q_k, M_k, H_k = [
+            x[i:j] for x in (J, C, h, s, Q, M, H)
+        ]
+
+        # Adapted responses and post-adaptation non linear response
+        # compression.
+        np.dot(XYZ[i:j], M_f, out=RGB_a)
+        np.absolute(RGB_a, out=R_t)
+        R_t *= F_L / 100
+        np.power(R_t, 0.42, out=R_t)
+        np.sign(RGB_a, out=RGB_a)
+        RGB_a *= R_t
+        RGB_a *= 400
+        R_t += 27.13
+        RGB_a /= R_t
+        RGB_a += 0.1
+
+        # Opponent colour dimensions, achromatic response and temporary
+        # magnitude quantity denominator.
+        np.dot(RGB_a, O_T, out=O_k)
+        a, b, A, d = O_k[:, 0], O_k[:, 1], O_k[:, 2], O_k[:, 3]
+
+        # *Hue* angle.
+        np.arctan2(b, a, out=h_k)
+        np.degrees(h_k, out=h_k)
+        np.mod(h_k, 360, out=h_k)
+
+        # Temporary magnitude quantity, the eccentricity factor
+        # e_t = (cos(2 + h) + 3.8) / 4 multiplied by sqrt(a ** 2 + b ** 2) is
+        # expanded with the angle addition formula, i.e.
+        # (a * cos(2) - b * sin(2) + 3.8 * sqrt(a ** 2 + b ** 2)) / 4.
+        np.hypot(a, b, out=t)
+        t *= 3.8
+        np.multiply(a, np.cos(2), out=T)
+        t += T
+        np.multiply(b, np.sin(2), out=T)
+        t -= T
+        t *= (50000 / 13) * surround.N_c * N_cb / 4
+        t /= d
+
+        # *Lightness* and *brightness*.
+        np.subtract(A, 0.305, out=T)
+        T *= N_bb / A_w
+        np.power(T, c * z, out=J_k)
+        J_k *= 100
+        np.multiply(J_k, 1 / 100, out=T)
+        np.sqrt(T, out=T)
+        np.multiply(T, (4 / c) * (A_w + 4) * F_L_4, out=Q_k)
+
+        # *Chroma*, *colourfulness* and *saturation*.
+        np.power(t, 0.9, out=C_k)
+        C_k *= T
+        C_k *= (1.64 - 0.29 ** n) ** 0.73
+        np.multiply(C_k, F_L_4, out=M_k)
+        np.divide(M_k, Q_k, out=s_k)
+        np.sqrt(s_k, out=s_k)
+        s_k *= 100
+
+        # *Hue* quadrature.
+        i_s = np.searchsorted(edges, h_k, side='right')
+        np.take(segments[3], i_s, out=t)
+        np.take(segments[2], i_s, out=T)
+        np.subtract(h_k, T, out=H_k)
+        t *= H_k
+        np.take(segments[5], i_s, out=T)
+        np.subtract(T, h_k, out=H_k)
+        np.take(segments[4], i_s, out=T)
+        H_k *= T
+        H_k += t
+        np.divide(t, H_k, out=H_k)
+        np.take(segments[1], i_s, out=T)
+        H_k *= T
+        np.take(segments[0], i_s, out=T)
+        H_k += T
+
+    return tuple(
+        as_numeric(np.reshape(x, shape)) for x in (J, C, h, s, Q, M, H))
 
 
 def chromatic_induction_factors(n):
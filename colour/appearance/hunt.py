@@ -9,6 +9,7 @@ Defines *Hunt* colour appearance model objects:
 -   :attr:`colour.HUNT_VIEWING_CONDITIONS`
 -   :class:`colour.Hunt_Specification`
 -   :func:`colour.XYZ_to_Hunt`
+-   :func:`colour.Hunt_to_XYZ`
 
 See Also
 --------
@@ -29,7 +30,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import (CaseInsensitiveMapping, dot_vector, tsplit,
+from colour.utilities import (CaseInsensitiveMapping, as_namedtuple,
+                              dot_vector, tsplit,
                               tstack, warning)
 
 __author__ = 'Colour Developers'
@@ -43,13 +45,15 @@ __all__ = [
     'Hunt_InductionFactors', 'HUNT_VIEWING_CONDITIONS',
     'HUE_DATA_FOR_HUE_QUADRATURE', 'XYZ_TO_HPE_MATRIX', 'HPE_TO_XYZ_MATRIX',
     'Hunt_ReferenceSpecification', 'Hunt_Specification', 'XYZ_to_Hunt',
-    'luminance_level_adaptation_factor', 'illuminant_scotopic_luminance',
-    'XYZ_to_rgb', 'f_n', 'chromatic_adaptation',
+    'Hunt_to_XYZ', 'luminance_level_adaptation_factor',
+    'illuminant_scotopic_luminance', 'XYZ_to_rgb', 'f_n', 'f_n_reverse',
+    'chromatic_adaptation', 'chromatic_adaptation_reverse',
     'adjusted_reference_white_signals', 'achromatic_post_adaptation_signal',
     'colour_difference_signals', 'hue_angle', 'eccentricity_factor',
     'low_luminance_tritanopia_factor', 'yellowness_blueness_response',
     'redness_greenness_response', 'overall_chromatic_response',
-    'saturation_correlate', 'achromatic_signal', 'brightness_correlate',
+    'saturation_correlate', 'achromatic_signal', 'achromatic_signal_reverse',
+    'brightness_correlate',
     'lightness_correlate', 'chroma_correlate', 'colourfulness_correlate'
 ]
 
@@ -161,6 +165,30 @@ colourspace to *CIE XYZ* tristimulus values matrix.
 HPE_TO_XYZ_MATRIX : array_like, (3, 3)
 """
 
+_OPPONENT_SIGNALS_TO_RGB_A_MATRIX = np.linalg.inv([
+    [2, 1, 1 / 20],
+    [1, -12 / 11, 1 / 11],
+    [1 / 9, 1 / 9, -2 / 9],
+])
+"""
+Matrix converting the achromatic post adaptation signal :math:`A_a` offset by
+2.05 and the :math:`C_1 - C_2 / 11` and :math:`(C_2 - C_3) / 9` colour
+difference signals combinations to the adapted cone responses.
+"""
+
+_HUNT_TO_XYZ_ITERATIONS = 20
+"""
+Maximum iterations count of the *Newton-Raphson* solver used by
+:func:`colour.Hunt_to_XYZ` definition when the scotopic response :math:`S` to
+the stimulus is approximated.
+"""
+
+_HUNT_TO_XYZ_TOLERANCE = 1e-10
+"""
+Relative tolerance of the *Newton-Raphson* solver used by
+:func:`colour.Hunt_to_XYZ` definition.
+"""
+
 
 class Hunt_ReferenceSpecification(
         namedtuple('Hunt_ReferenceSpecification', ('J', 'C_94', 'h_S', 's',
@@ -236,6 +264,23 @@ class Hunt_Specification(
     -   :cite:`Hunt2004b`
     """
 
+    def __new__(cls,
+                J=None,
+                C=None,
+                h=None,
+                s=None,
+                Q=None,
+                M=None,
+                H=None,
+                HC=None):
+        """
+        Returns a new instance of the :class:`colour.Hunt_Specification`
+        class.
+        """
+
+        return super(Hunt_Specification, cls).__new__(cls, J, C, h, s, Q, M,
+                                                      H, HC)
+
 
 def XYZ_to_Hunt(XYZ,
                 XYZ_w,
@@ -333,25 +378,27 @@ def XYZ_to_Hunt(XYZ,
 s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     """
 
-    _X, Y, _Z = tsplit(XYZ)
-    X_b, Y_b, _Z_b = tsplit(XYZ_b)
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
+    XYZ = np.asarray(XYZ)
+    XYZ_w = np.asarray(XYZ_w)
+    XYZ_b = np.asarray(XYZ_b)
+    L_A = np.asarray(L_A)
+
+    Y = XYZ[..., 1]
+    Y_b = XYZ_b[..., 1]
+    Y_w = XYZ_w[..., 1]
 
     # Arguments handling.
-    if XYZ_p is not None:
-        X_p, Y_p, Z_p = tsplit(XYZ_p)
-    else:
-        X_p = X_b
-        Y_p = Y_b
-        Z_p = Y_b
+    if XYZ_p is None:
+        XYZ_p = XYZ_b
         warning('Unspecified proximal field "XYZ_p" argument, using '
                 'background "XYZ_b" as approximation!')
 
-    if surround.N_cb is None:
+    N_cb, N_bb = surround.N_cb, surround.N_bb
+    if N_cb is None:
         N_cb = 0.725 * (Y_w / Y_b) ** 0.2
         warning('Unspecified "N_cb" argument, using approximation: '
                 '"{0}"'.format(N_cb))
-    if surround.N_bb is None:
+    if N_bb is None:
         N_bb = 0.725 * (Y_w / Y_b) ** 0.2
         warning('Unspecified "N_bb" argument, using approximation: '
                 '"{0}"'.format(N_bb))
@@ -381,8 +428,6 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
                 'argument, model will not account for simultaneous chromatic '
                 'contrast!')
 
-    XYZ_p = tstack((X_p, Y_p, Z_p))
-
     # Computing luminance level adaptation factor :math:`F_L`.
     F_L = luminance_level_adaptation_factor(L_A)
 
@@ -459,6 +504,289 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
     return Hunt_Specification(J, C_94, h, s, Q, M_94, None, None)
 
 
+def Hunt_to_XYZ(Hunt_specification,
+                XYZ_w,
+                XYZ_b,
+                L_A,
+                surround=HUNT_VIEWING_CONDITIONS['Normal Scenes'],
+                L_AS=None,
+                CCT_w=None,
+                XYZ_p=None,
+                p=None,
+                S=None,
+                S_w=None,
+                helson_judd_effect=False,
+                discount_illuminant=True):
+    """
+    Converts *Hunt* specification to *CIE XYZ* tristimulus values.
+
+    This is the *reverse* implementation.
+
+    Parameters
+    ----------
+    Hunt_specification : Hunt_Specification
+        *Hunt* colour appearance model specification. Correlate of
+        *Lightness* :math:`J`, correlate of *chroma* :math:`C_94` or correlate
+        of *colourfulness* :math:`M_94` and *hue* angle :math:`h_S` in degrees
+        must be specified, e.g. :math:`JCh` or :math:`JMh`.
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    XYZ_b : array_like
+        *CIE XYZ* tristimulus values of background normalised to domain
+        [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+    surround : Hunt_InductionFactors, optional
+         Surround viewing conditions induction factors.
+    L_AS : numeric or array_like, optional
+        Scotopic luminance :math:`L_{AS}` of the illuminant, approximated if
+        not specified.
+    CCT_w : numeric or array_like, optional
+        Correlated color temperature :math:`T_{cp}`: of the illuminant, needed
+        to approximate :math:`L_{AS}`.
+    XYZ_p : array_like, optional
+        *CIE XYZ* tristimulus values of proximal field normalised to domain
+        [0, 100],
+        assumed to be equal to background if not specified.
+    p : numeric or array_like, optional
+        Simultaneous contrast / assimilation factor :math:`p` with value
+        normalised to domain [-1, 0] when simultaneous contrast occurs and
+        normalised to domain [0, 1] when assimilation occurs.
+    S : numeric or array_like, optional
+        Scotopic response :math:`S` to the stimulus, approximated using
+        tristimulus values :math:`Y` of the stimulus if not specified.
+    S_w : numeric or array_like, optional
+        Scotopic response :math:`S_w` for the reference white, approximated
+        using the tristimulus values :math:`Y_w` of the reference white if not
+        specified.
+    helson_judd_effect : bool, optional
+        Truth value indicating whether the *Helson-Judd* effect should be
+        accounted for.
+    discount_illuminant : bool, optional
+       Truth value indicating if the illuminant should be discounted.
+
+    Returns
+    -------
+    XYZ : ndarray
+        *CIE XYZ* tristimulus values.
+
+    Raises
+    ------
+    ValueError
+        If an illegal arguments combination is specified or if neither *C* or
+        *M* correlates have been defined in the ``Hunt_specification``
+        argument.
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   ``Hunt_specification`` can also be passed as a compatible argument
+        :func:`colour.utilities.as_namedtuple` definition.
+    -   Input *CIE XYZ_b*, *CIE XYZ_w* and *CIE XYZ_p* tristimulus values are
+        normalised to domain [0, 100].
+    -   Output *CIE XYZ* tristimulus values are normalised to range [0, 100].
+    -   The model is reversed analytically when the scotopic response
+        :math:`S` to the stimulus is specified. Otherwise, :math:`S` is
+        approximated using the tristimulus value :math:`Y` of the stimulus,
+        which is solved for all the stimuli at once with a vectorised
+        *Newton-Raphson* method.
+
+    References
+    ----------
+    -   :cite:`Fairchild2013u`
+    -   :cite:`Hunt2004b`
+
+    Examples
+    --------
+    >>> specification = Hunt_Specification(J=30.046267861960700,
+    ...                                    C=0.121050839936176,
+    ...                                    h=269.273759446144600)
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> XYZ_b = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> surround = HUNT_VIEWING_CONDITIONS['Normal Scenes']
+    >>> CCT_w = 6504.0
+    >>> Hunt_to_XYZ(specification, XYZ_w, XYZ_b, L_A, surround, CCT_w=CCT_w)
+    ... # doctest: +ELLIPSIS
+    array([ 19.01...,  20...,  21.78...])
+    """
+
+    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(Hunt_specification,
+                                                Hunt_Specification)
+
+    J = np.asarray(J)
+    h = np.asarray(h)
+    XYZ_w = np.asarray(XYZ_w)
+    XYZ_b = np.asarray(XYZ_b)
+    L_A = np.asarray(L_A)
+
+    Y_b = XYZ_b[..., 1]
+    Y_w = XYZ_w[..., 1]
+
+    # Arguments handling.
+    if XYZ_p is None:
+        XYZ_p = XYZ_b
+        warning('Unspecified proximal field "XYZ_p" argument, using '
+                'background "XYZ_b" as approximation!')
+
+    N_cb, N_bb = surround.N_cb, surround.N_bb
+    if N_cb is None:
+        N_cb = 0.725 * (Y_w / Y_b) ** 0.2
+        warning('Unspecified "N_cb" argument, using approximation: '
+                '"{0}"'.format(N_cb))
+    if N_bb is None:
+        N_bb = 0.725 * (Y_w / Y_b) ** 0.2
+        warning('Unspecified "N_bb" argument, using approximation: '
+                '"{0}"'.format(N_bb))
+
+    if L_AS is None and CCT_w is None:
+        raise ValueError('Either the scotopic luminance "L_AS" of the '
+                         'illuminant or its correlated colour temperature '
+                         '"CCT_w" must be specified!')
+    if L_AS is None:
+        L_AS = illuminant_scotopic_luminance(L_A, CCT_w)
+        warning('Unspecified "L_AS" argument, using approximation from "CCT": '
+                '"{0}"'.format(L_AS))
+
+    if (S is None and S_w is not None) or (S is not None and S_w is None):
+        raise ValueError('Either both stimulus scotopic response "S" and '
+                         'reference white scotopic response "S_w" arguments '
+                         'need to be specified or none of them!')
+    elif S is None and S_w is None:
+        S_w = Y_w
+        warning('Unspecified stimulus scotopic response "S" and reference '
+                'white scotopic response "S_w" arguments, using '
+                'approximation: "Y", "{0}"'.format(S_w))
+
+    if p is None:
+        warning('Unspecified simultaneous contrast / assimilation "p" '
+                'argument, model will not account for simultaneous chromatic '
+                'contrast!')
+
+    # Computing luminance level adaptation factor :math:`F_L`.
+    F_L = luminance_level_adaptation_factor(L_A)
+
+    if C is None and M is not None:
+        C = M / F_L ** 0.15
+    elif C is None:
+        raise ValueError('Either "C" or "M" correlate must be defined in '
+                         'the "Hunt_specification" argument!')
+
+    # Computing reference white chromatic adaptation.
+    rgb_aw = chromatic_adaptation(XYZ_w, XYZ_w, XYZ_b, L_A, F_L, XYZ_p, p,
+                                  helson_judd_effect, discount_illuminant)
+
+    A_aw = achromatic_post_adaptation_signal(rgb_aw)
+    C_w = colour_difference_signals(rgb_aw)
+
+    # Computing eccentricity factors.
+    e_s = eccentricity_factor(h)
+
+    # Computing low luminance tritanopia factor :math:`F_t`.
+    F_t = low_luminance_tritanopia_factor(L_A)
+
+    M_yb_w = yellowness_blueness_response(C_w, e_s, surround.N_c, N_cb, F_t)
+    M_rg_w = redness_greenness_response(C_w, e_s, surround.N_c, N_cb)
+    M_w = overall_chromatic_response(M_yb_w, M_rg_w)
+
+    A_w = achromatic_signal(L_AS, S_w, S_w, N_bb, A_aw)
+    Q_w = brightness_correlate(A_w, A_w, M_w, surround.N_b)
+
+    # -------------------------------------------------------------------------
+    # Computing the correlate of *brightness* :math:`Q`.
+    # -------------------------------------------------------------------------
+    Q = Q_w * (J / 100) ** (1 / (1 + (Y_b / Y_w) ** 0.5))
+
+    # -------------------------------------------------------------------------
+    # Computing the correlate of *saturation* :math:`s`.
+    # -------------------------------------------------------------------------
+    s = (C / (2.44 * ((Q / Q_w) ** (Y_b / Y_w)) *
+              (1.64 - 0.29 ** (Y_b / Y_w)))) ** (1 / 0.69)
+
+    # Computing the sum :math:`A + M / 100` of the achromatic signal and
+    # overall chromatic response.
+    N_1 = ((7 * A_w) ** 0.5) / (5.33 * surround.N_b ** 0.13)
+    N_2 = (7 * A_w * surround.N_b ** 0.362) / 200
+    A_M = (((Q + N_2) / N_1) ** (1 / 0.6)) / 7
+
+    # Computing the :math:`C_1 - C_2 / 11` and :math:`(C_2 - C_3) / 9`
+    # colour difference signals combinations per unit of overall chromatic
+    # response :math:`M`.
+    h_r = np.radians(h)
+    cos_h, sin_h = np.cos(h_r), np.sin(h_r)
+    k = (100 * e_s * (10 / 13) * surround.N_c * N_cb *
+         (cos_h ** 2 + (F_t * sin_h) ** 2) ** 0.5)
+    rg_M = cos_h / k
+    yb_M = sin_h / k
+
+    sigma_A, sigma_rg, sigma_yb = tsplit(
+        np.sum(_OPPONENT_SIGNALS_TO_RGB_A_MATRIX, axis=0))
+
+    def XYZ_from_scotopic_response(S):
+        """
+        Returns the *CIE XYZ* tristimulus values of the stimulus for given
+        scotopic response :math:`S` to the stimulus.
+        """
+
+        # Offset achromatic post adaptation signal :math:`A_a` for
+        # :math:`M = 0`.
+        A_a_0 = A_M / N_bb - achromatic_signal(L_AS, S, S_w, 1, 0) + 2.05
+
+        # Computing the overall chromatic response :math:`M` from the
+        # saturation :math:`s = 50 M / (\rho_a + \gamma_a + \beta_a)`, the
+        # sum of the adapted cone responses being linear in :math:`M`.
+        M = (s * sigma_A * A_a_0 /
+             (50 + s * sigma_A / (100 * N_bb) - s *
+              (sigma_rg * rg_M + sigma_yb * yb_M)))
+
+        rgb_a = dot_vector(
+            _OPPONENT_SIGNALS_TO_RGB_A_MATRIX,
+            tstack((A_a_0 - M / (100 * N_bb), M * rg_M, M * yb_M)))
+
+        return chromatic_adaptation_reverse(rgb_a, XYZ_w, XYZ_b, L_A, F_L,
+                                            XYZ_p, p, helson_judd_effect,
+                                            discount_illuminant)
+
+    if S is not None:
+        return XYZ_from_scotopic_response(S)
+
+    # Solving for the tristimulus value :math:`Y` of the stimulus
+    # approximating its scotopic response :math:`S`.
+    Y = Y_w * (J / 100) ** 2
+    XYZ = XYZ_from_scotopic_response(Y)
+    error = XYZ[..., 1] - Y
+    for _i in range(_HUNT_TO_XYZ_ITERATIONS):
+        if not np.any(
+                np.abs(error) > _HUNT_TO_XYZ_TOLERANCE * np.maximum(
+                    np.abs(Y), 1)):
+            break
+
+        delta = 1e-6 * np.maximum(np.abs(Y), 1e-3)
+        derivative = (XYZ_from_scotopic_response(Y + delta)[..., 1] -
+                      (Y + delta) - error) / delta
+
+        # Halving the steps leaving the domain of the model.
+        step = error / derivative
+        for _j in range(_HUNT_TO_XYZ_ITERATIONS):
+            Y_n = Y - step
+            XYZ_n = XYZ_from_scotopic_response(Y_n)
+            error_n = XYZ_n[..., 1] - Y_n
+
+            invalid = np.logical_and(np.isnan(error_n), ~np.isnan(error))
+            if not np.any(invalid):
+                break
+
+            step = np.where(invalid, step / 2, step)
+
+        Y, XYZ, error = Y_n, XYZ_n, error_n
+
+    return XYZ
+
+
 def luminance_level_adaptation_factor(L_A):
     """
     Returns the *luminance* level adaptation factor :math:`F_L`.
@@ -569,11 +897,41 @@ def f_n(x):
 
     x = np.asarray(x)
 
-    x_m = 40 * ((x ** 0.73) / (x ** 0.73 + 2))
+    x_p = x ** 0.73
+    x_m = 40 * (x_p / (x_p + 2))
 
     return x_m
 
 
+def f_n_reverse(x_m):
+    """
+    Defines the reverse nonlinear response function of the *Hunt* colour
+    appearance model.
+
+    Parameters
+    ----------
+    x_m : numeric or array_like or array_like
+        Modeled visual response variable :math:`x`.
+
+    Returns
+    -------
+    numeric or array_like
+        Visual response variable :math:`x`.
+
+    Examples
+    --------
+    >>> x_m = np.array([5.89685921, 5.89695211, 5.89759271])
+    >>> f_n_reverse(x_m)  # doctest: +ELLIPSIS
+    array([ 0.2335051...,  0.2335110...,  0.2335517...])
+    """
+
+    x_m = np.asarray(x_m)
+
+    x = (2 * x_m / (40 - x_m)) ** (1 / 0.73)
+
+    return x
+
+
 def chromatic_adaptation(XYZ,
                          XYZ_w,
                          XYZ_b,
@@ -630,12 +988,142 @@ def chromatic_adaptation(XYZ,
     array([ 6.8959454...,  6.8959991...,  6.8965708...])
     """
 
+    F_L = np.asarray(F_L)
+
+    rgb = XYZ_to_rgb(XYZ)
+    rgb_w, F_rgb, B_rgb, D_rgb = _chromatic_adaptation_factors(
+        XYZ_w, XYZ_b, L_A, F_L, XYZ_p, p, helson_judd_effect,
+        discount_illuminant)
+
+    # Computing adapted cone responses.
+    rgb_a = 1 + B_rgb * (
+        f_n(F_L[..., np.newaxis] * F_rgb * rgb / rgb_w) + D_rgb)
+
+    return rgb_a
+
+
+def chromatic_adaptation_reverse(rgb_a,
+                                 XYZ_w,
+                                 XYZ_b,
+                                 L_A,
+                                 F_L,
+                                 XYZ_p=None,
+                                 p=None,
+                                 helson_judd_effect=False,
+                                 discount_illuminant=True):
+    """
+    Reverses the chromatic adaptation of given adapted cone responses.
+
+    Parameters
+    ----------
+    rgb_a : array_like
+        Adapted cone responses of test sample.
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    XYZ_b : array_like
+        *CIE XYZ* tristimulus values of background normalised to domain
+        [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+    F_L : numeric or array_like
+        Luminance adaptation factor :math:`F_L`.
+    XYZ_p : array_like, optional
+        *CIE XYZ* tristimulus values of proximal field normalised to domain
+        [0, 100], assumed to be equal to background if not specified.
+    p : numeric or array_like, optional
+        Simultaneous contrast / assimilation factor :math:`p` with value
+        normalised to  domain [-1, 0] when simultaneous contrast occurs and
+        normalised to domain [0, 1] when assimilation occurs.
+    helson_judd_effect : bool, optional
+        Truth value indicating whether the *Helson-Judd* effect should be
+        accounted for.
+    discount_illuminant : bool, optional
+       Truth value indicating if the illuminant should be discounted.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values of test sample normalised to range
+        [0, 100].
+
+    Examples
+    --------
+    >>> rgb_a = np.array([6.89594549, 6.89599915, 6.89657085])
+    >>> XYZ_b = np.array([95.05, 100.00, 108.88])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> F_L = 1.16754446415
+    >>> chromatic_adaptation_reverse(rgb_a, XYZ_w, XYZ_b, L_A, F_L)
+    ... # doctest: +ELLIPSIS
+    array([ 19.01...,  20...,  21.78...])
+    """
+
+    rgb_a = np.asarray(rgb_a)
+    F_L = np.asarray(F_L)
+
+    rgb_w, F_rgb, B_rgb, D_rgb = _chromatic_adaptation_factors(
+        XYZ_w, XYZ_b, L_A, F_L, XYZ_p, p, helson_judd_effect,
+        discount_illuminant)
+
+    # Computing cone responses.
+    rgb = (f_n_reverse((rgb_a - 1) / B_rgb - D_rgb) * rgb_w /
+           (F_L[..., np.newaxis] * F_rgb))
+
+    return dot_vector(HPE_TO_XYZ_MATRIX, rgb)
+
+
+def _chromatic_adaptation_factors(XYZ_w,
+                                  XYZ_b,
+                                  L_A,
+                                  F_L,
+                                  XYZ_p=None,
+                                  p=None,
+                                  helson_judd_effect=False,
+                                  discount_illuminant=True):
+    """
+    Returns the terms of the chromatic adaptation that do not depend on the
+    test sample, i.e. the reference white signals :math:`\\rho_w\\gamma_w
+    \\beta_w` adjusted for simultaneous chromatic contrast, the chromatic
+    adaptation factors :math:`F_{\\rho\\gamma\\beta}`, the cone bleach
+    factors :math:`B_{\\rho\\gamma\\beta}` and the *Helson-Judd* effect
+    parameters :math:`D_{\\rho\\gamma\\beta}`.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    XYZ_b : array_like
+        *CIE XYZ* tristimulus values of background normalised to domain
+        [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+    F_L : numeric or array_like
+        Luminance adaptation factor :math:`F_L`.
+    XYZ_p : array_like, optional
+        *CIE XYZ* tristimulus values of proximal field normalised to domain
+        [0, 100].
+    p : numeric or array_like, optional
+        Simultaneous contrast / assimilation factor :math:`p`.
+    helson_judd_effect : bool, optional
+        Truth value indicating whether the *Helson-Judd* effect should be
+        accounted for.
+    discount_illuminant : bool, optional
+       Truth value indicating if the illuminant should be discounted.
+
+    Returns
+    -------
+    tuple
+        Reference white signals, chromatic adaptation factors, cone bleach
+        factors and *Helson-Judd* effect parameters.
+    """
+
     XYZ_w = np.asarray(XYZ_w)
     XYZ_b = np.asarray(XYZ_b)
     L_A = np.asarray(L_A)
     F_L = np.asarray(F_L)
 
-    rgb = XYZ_to_rgb(XYZ)
     rgb_w = XYZ_to_rgb(XYZ_w)
     Y_w = XYZ_w[..., 1]
     Y_b = XYZ_b[..., 1]
@@ -644,17 +1132,17 @@ def chromatic_adaptation(XYZ,
 
     # Computing chromatic adaptation factors.
     if not discount_illuminant:
-        F_rgb = ((1 + (L_A ** (1 / 3)) + h_rgb) / (1 + (L_A ** (1 / 3)) +
-                                                   (1 / h_rgb)))
+        L_A_p = (L_A ** (1 / 3))[..., np.newaxis]
+        F_rgb = (1 + L_A_p + h_rgb) / (1 + L_A_p + (1 / h_rgb))
     else:
         F_rgb = np.ones(h_rgb.shape)
 
     # Computing Helson-Judd effect parameters.
     if helson_judd_effect:
-        D_rgb = (f_n((Y_b / Y_w) * F_L * F_rgb[..., 1]) - f_n(
-            (Y_b / Y_w) * F_L * F_rgb))
+        F_L_rgb = ((Y_b / Y_w) * F_L)[..., np.newaxis] * F_rgb
+        D_rgb = f_n(F_L_rgb[..., 1:2]) - f_n(F_L_rgb)
     else:
-        D_rgb = np.zeros(F_rgb.shape)
+        D_rgb = 0
 
     # Computing cone bleach factors.
     B_rgb = (10 ** 7) / ((10 ** 7) + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
@@ -664,11 +1152,7 @@ def chromatic_adaptation(XYZ,
         rgb_p = XYZ_to_rgb(XYZ_p)
         rgb_w = adjusted_reference_white_signals(rgb_p, B_rgb, rgb_w, p)
 
-    # Computing adapted cone responses.
-    rgb_a = 1
-    rgb_a += B_rgb * (f_n(F_L[..., np.newaxis] * F_rgb * rgb / rgb_w) + D_rgb)
-
-    return rgb_a
+    return rgb_w, F_rgb, B_rgb, D_rgb
 
 
 def adjusted_reference_white_signals(rgb_p, rgb_b, rgb_w, p):
@@ -711,7 +1195,7 @@ def adjusted_reference_white_signals(rgb_p, rgb_b, rgb_w, p):
     rgb_p = np.asarray(rgb_p)
     rgb_b = np.asarray(rgb_b)
     rgb_w = np.asarray(rgb_w)
-    p = np.asarray(p)
+    p = np.asarray(p)[..., np.newaxis]
 
     p_rgb = rgb_p / rgb_b
     rgb_w = (rgb_w * (((1 - p) * p_rgb + (1 + p) / p_rgb) ** 0.5) /
@@ -1075,18 +1559,22 @@ def achromatic_signal(L_AS, S, S_w, N_bb, A_a):
     N_bb = np.asarray(N_bb)
     A_a = np.asarray(A_a)
 
-    j = 0.00001 / ((5 * L_AS / 2.26) + 0.00001)
+    L_AS_226 = 5 * L_AS / 2.26
+    S_S_w = S / S_w
+
+    j = 0.00001 / (L_AS_226 + 0.00001)
+    j_2 = j ** 2
 
     # Computing scotopic luminance level adaptation factor :math:`F_{LS}`.
-    F_LS = 3800 * (j ** 2) * (5 * L_AS / 2.26)
-    F_LS += 0.2 * ((1 - (j ** 2)) ** 0.4) * ((5 * L_AS / 2.26) ** (1 / 6))
+    F_LS = 3800 * j_2 * L_AS_226
+    F_LS += 0.2 * ((1 - j_2) ** 0.4) * (L_AS_226 ** (1 / 6))
 
     # Computing cone bleach factors :math:`B_S`.
-    B_S = 0.5 / (1 + 0.3 * ((5 * L_AS / 2.26) * (S / S_w)) ** 0.3)
-    B_S += 0.5 / (1 + 5 * (5 * L_AS / 2.26))
+    B_S = 0.5 / (1 + 0.3 * (L_AS_226 * S_S_w) ** 0.3)
+    B_S += 0.5 / (1 + 5 * L_AS_226)
 
     # Computing adapted scotopic signal :math:`A_S`.
-    A_S = (f_n(F_LS * S / S_w) * 3.05 * B_S) + 0.3
+    A_S = (f_n(F_LS * S_S_w) * 3.05 * B_S) + 0.3
 
     # Computing achromatic signal :math:`A`.
     A = N_bb * (A_a - 1 + A_S - 0.3 + np.sqrt((1 + (0.3 ** 2))))
@@ -1094,6 +1582,48 @@ def achromatic_signal(L_AS, S, S_w, N_bb, A_a):
     return A
 
 
+def achromatic_signal_reverse(L_AS, S, S_w, N_bb, A):
+    """
+    Returns the achromatic post adaptation signal :math:`A_a` from given
+    achromatic signal :math:`A`.
+
+    Parameters
+    ----------
+    L_AS : numeric or array_like
+        Scotopic luminance :math:`L_{AS}` of the illuminant.
+    S : numeric or array_like
+        Scotopic response :math:`S` to the stimulus.
+    S_w : numeric or array_like
+        Scotopic response :math:`S_w` for the reference white.
+    N_bb : numeric or array_like
+        Brightness background induction factor :math:`N_{bb}`.
+    A : numeric or array_like
+        Achromatic signal :math:`A`.
+
+    Returns
+    -------
+    numeric or ndarray
+        Achromatic post adaptation signal of the stimulus :math:`A_a`.
+
+    Examples
+    --------
+    >>> L_AS = 769.9376286541402
+    >>> S = 20.0
+    >>> S_w = 100.0
+    >>> N_bb = 0.725000000000000
+    >>> A = 15.506854623621885
+    >>> achromatic_signal_reverse(L_AS, S, S_w, N_bb, A)  # doctest: +ELLIPSIS
+    18.9827186...
+    """
+
+    N_bb = np.asarray(N_bb)
+    A = np.asarray(A)
+
+    A_a = A / N_bb - achromatic_signal(L_AS, S, S_w, 1, 0)
+
+    return A_a
+
+
 def brightness_correlate(A, A_w, M, N_b):
     """
     Returns the *brightness* correlate :math:`Q`.
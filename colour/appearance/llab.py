@@ -9,6 +9,7 @@ Defines *LLAB(l:c)* colour appearance model objects:
 -   :attr:`colour.LLAB_VIEWING_CONDITIONS`
 -   :class:`colour.LLAB_Specification`
 -   :func:`colour.XYZ_to_LLAB`
+-   :func:`colour.LLAB_to_XYZ`
 
 See Also
 --------
@@ -37,7 +38,8 @@ import numpy as np
 from collections import namedtuple
 
 from colour.algebra import polar_to_cartesian
-from colour.utilities import CaseInsensitiveMapping, dot_vector, tsplit, tstack
+from colour.utilities import (CaseInsensitiveMapping, as_namedtuple,
+                              dot_vector, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -50,8 +52,10 @@ __all__ = [
     'LLAB_InductionFactors', 'LLAB_VIEWING_CONDITIONS',
     'LLAB_XYZ_TO_RGB_MATRIX', 'LLAB_RGB_TO_XYZ_MATRIX',
     'LLAB_ReferenceSpecification', 'LLAB_Specification', 'XYZ_to_LLAB',
-    'XYZ_to_RGB_LLAB', 'chromatic_adaptation', 'f',
-    'opponent_colour_dimensions', 'hue_angle', 'chroma_correlate',
+    'LLAB_to_XYZ', 'XYZ_to_RGB_LLAB', 'chromatic_adaptation',
+    'chromatic_adaptation_reverse', 'f', 'f_reverse',
+    'opponent_colour_dimensions', 'opponent_colour_dimensions_reverse',
+    'hue_angle', 'chroma_correlate',
     'colourfulness_correlate', 'saturation_correlate', 'final_opponent_signals'
 ]
 
@@ -152,6 +156,18 @@ tristimulus values matrix.
 LLAB_RGB_TO_XYZ_MATRIX : array_like, (3, 3)
 """
 
+_LLAB_TO_XYZ_ITERATIONS = 20
+"""
+Maximum iterations count of the *Newton-Raphson* solver used by
+:func:`colour.appearance.llab.chromatic_adaptation_reverse` definition.
+"""
+
+_LLAB_TO_XYZ_TOLERANCE = 1e-12
+"""
+Relative tolerance of the *Newton-Raphson* solver used by
+:func:`colour.appearance.llab.chromatic_adaptation_reverse` definition.
+"""
+
 
 class LLAB_ReferenceSpecification(
         namedtuple('LLAB_ReferenceSpecification',
@@ -229,6 +245,23 @@ class LLAB_Specification(
     -   :cite:`Luo1996c`
     """
 
+    def __new__(cls,
+                J=None,
+                C=None,
+                h=None,
+                s=None,
+                M=None,
+                HC=None,
+                a=None,
+                b=None):
+        """
+        Returns a new instance of the :class:`colour.LLAB_Specification`
+        class.
+        """
+
+        return super(LLAB_Specification, cls).__new__(cls, J, C, h, s, M, HC,
+                                                      a, b)
+
 
 def XYZ_to_LLAB(
         XYZ,
@@ -335,6 +368,111 @@ s=0.0002395..., M=0.0190185..., HC=None, a=..., b=-0.0190185...)
     return LLAB_Specification(L_L, Ch_L, h_L, s_L, C_L, None, A_L, B_L)
 
 
+def LLAB_to_XYZ(
+        LLAB_specification,
+        XYZ_0,
+        Y_b,
+        L,
+        surround=LLAB_VIEWING_CONDITIONS[
+            'Reference Samples & Images, Average Surround, Subtending < 4']):
+    """
+    Converts *LLAB(l:c)* specification to *CIE XYZ* tristimulus values.
+
+    This is the *reverse* implementation.
+
+    Parameters
+    ----------
+    LLAB_specification : LLAB_Specification
+        *LLAB(l:c)* colour appearance model specification. Correlate of
+        *Lightness* :math:`L_L`, correlate of *chroma* :math:`Ch_L` or
+        correlate of *colourfulness* :math:`C_L` and *hue* angle :math:`h_L`
+        in degrees must be specified, e.g. :math:`JCh` or :math:`JMh`.
+    XYZ_0 : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    Y_b : numeric or array_like
+        Luminance factor of the background in :math:`cd/m^2`.
+    L : numeric or array_like
+        Absolute luminance :math:`L` of reference white in :math:`cd/m^2`.
+    surround : LLAB_InductionFactors, optional
+         Surround viewing conditions induction factors.
+
+    Returns
+    -------
+    XYZ : ndarray
+        *CIE XYZ* tristimulus values.
+
+    Raises
+    ------
+    ValueError
+        If neither *C* or *M* correlates have been defined in the
+        ``LLAB_specification`` argument.
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   ``LLAB_specification`` can also be passed as a compatible argument
+        :func:`colour.utilities.as_namedtuple` definition.
+    -   Input *CIE XYZ_0* tristimulus values are normalised to domain [0, 100].
+    -   Output *CIE XYZ* tristimulus values are normalised to range [0, 100].
+
+    References
+    ----------
+    -   :cite:`Fairchild2013x`
+    -   :cite:`Luo1996b`
+    -   :cite:`Luo1996c`
+
+    Examples
+    --------
+    >>> specification = LLAB_Specification(J=37.366865036765027,
+    ...                                    C=0.008949655292164,
+    ...                                    h=270.000000000444170)
+    >>> XYZ_0 = np.array([95.05, 100.00, 108.88])
+    >>> Y_b = 20.0
+    >>> L = 318.31
+    >>> surround = LLAB_VIEWING_CONDITIONS['ref_average_4_minus']
+    >>> LLAB_to_XYZ(specification, XYZ_0, Y_b, L, surround)
+    ... # doctest: +ELLIPSIS
+    array([ 19.01...,  20...,  21.78...])
+    """
+
+    L_L, Ch_L, h_L, _s_L, C_L, _HC, _A_L, _B_L = as_namedtuple(
+        LLAB_specification, LLAB_Specification)
+
+    L_L = np.asarray(L_L)
+    h_L = np.asarray(h_L)
+    L = np.asarray(L)
+
+    if Ch_L is None and C_L is not None:
+        S_C = 1 + 0.47 * np.log10(L) - 0.057 * np.log10(L) ** 2
+        S_M = 0.7 + 0.02 * L_L - 0.0002 * L_L ** 2
+        Ch_L = np.asarray(C_L) / (S_M * S_C * np.asarray(surround.F_C))
+    elif Ch_L is None:
+        raise ValueError('Either "C" or "M" correlate must be defined in '
+                         'the "LLAB_specification" argument!')
+
+    RGB_0 = XYZ_to_RGB_LLAB(XYZ_0)
+
+    # Reference illuminant *CIE Standard Illuminant D Series* *D65*.
+    XYZ_0r = np.array([95.05, 100.00, 108.88])
+    RGB_0r = XYZ_to_RGB_LLAB(XYZ_0r)
+
+    # Computing opponent colour dimensions.
+    c = (np.exp(np.asarray(Ch_L) / 25) - 1) / 0.05
+    a, b = tsplit(polar_to_cartesian(tstack((c, np.radians(h_L)))))
+
+    XYZ_r = opponent_colour_dimensions_reverse(
+        tstack((L_L, a, b)), Y_b, surround.F_S, surround.F_L)
+
+    # Reversing chromatic adaptation.
+    XYZ = chromatic_adaptation_reverse(XYZ_r, RGB_0, RGB_0r, surround.D)
+
+    return XYZ
+
+
 def XYZ_to_RGB_LLAB(XYZ):
     """
     Converts from *CIE XYZ* tristimulus values to normalised cone responses.
@@ -356,10 +494,9 @@ def XYZ_to_RGB_LLAB(XYZ):
     array([ 0.9414279...,  1.0404012...,  1.0897088...])
     """
 
-    _X, Y, _Z = tsplit(XYZ)
+    XYZ = np.asarray(XYZ)
 
-    Y = tstack((Y, Y, Y))
-    XYZ_n = XYZ / Y
+    XYZ_n = XYZ / XYZ[..., 1:2]
 
     return dot_vector(LLAB_XYZ_TO_RGB_MATRIX, XYZ_n)
 
@@ -411,13 +548,87 @@ def chromatic_adaptation(RGB, RGB_0, RGB_0r, Y, D=1):
 
     RGB_r = tstack((R_r, G_r, B_r))
 
-    Y = tstack((Y, Y, Y))
-
-    XYZ_r = dot_vector(LLAB_RGB_TO_XYZ_MATRIX, RGB_r * Y)
+    XYZ_r = dot_vector(LLAB_RGB_TO_XYZ_MATRIX, RGB_r * Y[..., np.newaxis])
 
     return XYZ_r
 
 
+def chromatic_adaptation_reverse(XYZ_r, RGB_0, RGB_0r, D=1):
+    """
+    Reverses the chromatic adaptation of given adapted *CIE XYZ* tristimulus
+    values.
+
+    Parameters
+    ----------
+    XYZ_r : array_like
+        Adapted *CIE XYZ* tristimulus values.
+    RGB_0 : array_like
+        *RGB* normalised cone responses array of reference white.
+    RGB_0r : array_like
+        *RGB* normalised cone responses array of reference illuminant
+        *CIE Standard Illuminant D Series* *D65*.
+    D : numeric or array_like, optional
+         *Discounting-the-Illuminant* factor normalised to domain [0, 1].
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values of test sample / stimulus.
+
+    Notes
+    -----
+    -   The tristimulus value :math:`Y` of the stimulus normalising the cone
+        responses is not separable from the exponent :math:`\\beta` applied
+        to the *B* cone response, it is solved for all the stimuli at once
+        with a vectorised *Newton-Raphson* method.
+
+    Examples
+    --------
+    >>> XYZ_r = np.array([19.01, 20.00, 21.78])
+    >>> RGB_0 = np.array([0.94146023, 1.04039386, 1.08950293])
+    >>> RGB_0r = np.array([0.94146023, 1.04039386, 1.08950293])
+    >>> chromatic_adaptation_reverse(XYZ_r, RGB_0, RGB_0r)
+    ... # doctest: +ELLIPSIS
+    array([ 19.01...,  20...,  21.78...])
+    """
+
+    R_0, G_0, B_0 = tsplit(RGB_0)
+    R_0r, G_0r, B_0r = tsplit(RGB_0r)
+    D = np.asarray(D)
+
+    beta = (B_0 / B_0r) ** 0.0834
+
+    # Cone responses scaled by the tristimulus value :math:`Y`.
+    R_rY, G_rY, B_rY = tsplit(dot_vector(LLAB_XYZ_TO_RGB_MATRIX, XYZ_r))
+
+    R_Y = R_rY / (D * (R_0r / R_0) + 1 - D)
+    G_Y = G_rY / (D * (G_0r / G_0) + 1 - D)
+    B_Y = np.abs(B_rY / (D * (B_0r / (B_0 ** beta)) + 1 - D))
+
+    # Solving for :math:`u = 1 / Y` so that the normalised cone responses
+    # :math:`R = u R_Y`, :math:`G = u G_Y` and
+    # :math:`B = (u B_Y) ^ {1 / \\beta}` have an unit tristimulus value
+    # :math:`Y`, i.e. :math:`\\alpha u + \\gamma u ^ {1 / \\beta} = 1`.
+    m_R, m_G, m_B = LLAB_RGB_TO_XYZ_MATRIX[1]
+    alpha = m_R * R_Y + m_G * G_Y
+    gamma = m_B * B_Y ** (1 / beta)
+
+    # Exact solution for :math:`\\beta = 1`.
+    u = 1 / (alpha + gamma)
+    for _i in range(_LLAB_TO_XYZ_ITERATIONS):
+        u_beta = u ** (1 / beta)
+        error = alpha * u + gamma * u_beta - 1
+
+        if not np.any(np.abs(error) > _LLAB_TO_XYZ_TOLERANCE):
+            break
+
+        u = u - error / (alpha + gamma * u_beta / (beta * u))
+
+    RGB = tstack((u * R_Y, u * G_Y, (u * B_Y) ** (1 / beta)))
+
+    return dot_vector(LLAB_RGB_TO_XYZ_MATRIX, RGB) / u[..., np.newaxis]
+
+
 def f(x, F_S):
     """
     Defines the nonlinear response function of the *LLAB(l:c)* colour
@@ -454,6 +665,41 @@ def f(x, F_S):
     return x_m
 
 
+def f_reverse(x_m, F_S):
+    """
+    Defines the reverse nonlinear response function of the *LLAB(l:c)* colour
+    appearance model.
+
+    Parameters
+    ----------
+    x_m : numeric or array_like or array_like
+        Modeled visual response variable :math:`x`.
+    F_S : numeric or array_like
+        Surround induction factor :math:`F_S`.
+
+    Returns
+    -------
+    numeric or array_like
+        Visual response variable :math:`x`.
+
+    Examples
+    --------
+    >>> f_reverse(0.584812501075882, 3)  # doctest: +ELLIPSIS
+    array(0.2000091...)
+    """
+
+    x_m = np.asarray(x_m)
+    F_S = np.asarray(F_S)
+
+    x_t = 0.008856 ** (1 / F_S)
+
+    x = np.where(x_m > x_t,
+                 x_m ** F_S,
+                 (x_m - (16 / 116)) * 0.008856 / (x_t - (16 / 116)))
+
+    return x
+
+
 def opponent_colour_dimensions(XYZ, Y_b, F_S, F_L):
     """
     Returns opponent colour dimensions from given adapted *CIE XYZ* tristimulus
@@ -488,7 +734,7 @@ def opponent_colour_dimensions(XYZ, Y_b, F_S, F_L):
     array([  3.7368047...e+01,  -4.4986443...e-03,  -5.2604647...e-03])
     """
 
-    X, Y, Z = tsplit(XYZ)
+    XYZ = np.asarray(XYZ)
     Y_b = np.asarray(Y_b)
     F_S = np.asarray(F_S)
     F_L = np.asarray(F_L)
@@ -497,15 +743,68 @@ def opponent_colour_dimensions(XYZ, Y_b, F_S, F_L):
     z = 1 + F_L * ((Y_b / 100) ** 0.5)
 
     # Computing modified *CIE L\*a\*b\** colourspace array.
-    L = 116 * (f(Y / 100, F_S) ** z) - 16
-    a = 500 * (f(X / 95.05, F_S) - f(Y / 100, F_S))
-    b = 200 * (f(Y / 100, F_S) - f(Z / 108.88, F_S))
+    f_X, f_Y, f_Z = tsplit(
+        f(XYZ / np.array([95.05, 100.00, 108.88]), F_S[..., np.newaxis]))
+    L = 116 * (f_Y ** z) - 16
+    a = 500 * (f_X - f_Y)
+    b = 200 * (f_Y - f_Z)
 
     Lab = tstack((L, a, b))
 
     return Lab
 
 
+def opponent_colour_dimensions_reverse(Lab, Y_b, F_S, F_L):
+    """
+    Returns adapted *CIE XYZ* tristimulus values from given opponent colour
+    dimensions.
+
+    Parameters
+    ----------
+    Lab : array_like
+        Opponent colour dimensions.
+    Y_b : numeric or array_like
+        Luminance factor of the background in :math:`cd/m^2`.
+    F_S : numeric or array_like
+        Surround induction factor :math:`F_S`.
+    F_L : numeric or array_like
+        Lightness induction factor :math:`F_L`.
+
+    Returns
+    -------
+    ndarray
+        Adapted *CIE XYZ* tristimulus values.
+
+    Examples
+    --------
+    >>> Lab = np.array([37.368047489551756, -0.004498644319728,
+    ...                 -0.005260464783330])
+    >>> Y_b = 20.0
+    >>> F_S = 3.0
+    >>> F_L = 1.0
+    >>> opponent_colour_dimensions_reverse(Lab, Y_b, F_S, F_L)
+    ... # doctest: +ELLIPSIS
+    array([ 19.0099957...,  20.0009186...,  21.7799386...])
+    """
+
+    L, a, b = tsplit(Lab)
+    Y_b = np.asarray(Y_b)
+    F_S = np.asarray(F_S)
+    F_L = np.asarray(F_L)
+
+    # Account for background lightness contrast.
+    z = 1 + F_L * ((Y_b / 100) ** 0.5)
+
+    f_Y = ((L + 16) / 116) ** (1 / z)
+    f_X = a / 500 + f_Y
+    f_Z = f_Y - b / 200
+
+    XYZ = (f_reverse(tstack((f_X, f_Y, f_Z)), F_S[..., np.newaxis]) *
+           np.array([95.05, 100.00, 108.88]))
+
+    return XYZ
+
+
 def hue_angle(a, b):
     """
     Returns the *hue* angle :math:`h_L` in degrees.
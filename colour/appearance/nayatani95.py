@@ -230,15 +230,11 @@ HC=None, Lstar_N=50.0039154...)
     eR = scaling_coefficient(R, xi)
     eG = scaling_coefficient(G, eta)
 
-    # Computing opponent colour dimensions.
-    # Computing achromatic response :math:`Q`:
-    Q_response = achromatic_response(RGB, bRGB_o, xez, bL_or, eR, eG, n)
-
-    # Computing tritanopic response :math:`t`:
-    t_response = tritanopic_response(RGB, bRGB_o, xez, n)
-
-    # Computing protanopic response :math:`p`:
-    p_response = protanopic_response(RGB, bRGB_o, xez, n)
+    # Computing opponent colour dimensions, i.e. achromatic response
+    # :math:`Q`, tritanopic response :math:`t` and protanopic response
+    # :math:`p`.
+    Q_response, t_response, p_response = _opponent_colour_responses(
+        RGB, bRGB_o, xez, bL_or, eR, eG, n)
 
     # Computing the correlate of *brightness* :math:`B_r`.
     B_r = brightness_correlate(bRGB_o, bL_or, Q_response)
@@ -361,6 +357,54 @@ def scaling_coefficient(x, y):
     return np.where(x >= (20 * y), 1.758, 1)
 
 
+def _opponent_colour_responses(RGB, bRGB_o, xez, bL_or, eR, eG, n=1):
+    """
+    Returns the achromatic response :math:`Q`, the tritanopic response
+    :math:`t` and the protanopic response :math:`p` from given stimulus cone
+    responses, the logarithms of the cone responses are computed once for the
+    three responses.
+
+    Parameters
+    ----------
+    RGB: ndarray
+         Stimulus cone responses.
+    bRGB_o: ndarray
+         Chromatic adaptation exponential factors :math:`\\beta_1(R_o)`,
+         :math:`\\beta_1(G_o)` and :math:`\\beta_2(B_o)`.
+    xez: ndarray
+        Intermediate values :math:`\\xi`, :math:`\eta`, :math:`\zeta`.
+    bL_or: numeric or array_like
+         Normalising chromatic adaptation exponential factor
+         :math:`\\beta_1(B_or)`.
+    eR: numeric or array_like
+         Scaling coefficient :math:`e(R)`.
+    eG: numeric or array_like
+         Scaling coefficient :math:`e(G)`.
+    n : numeric or array_like, optional
+        Noise term used in the non linear chromatic adaptation model.
+
+    Returns
+    -------
+    tuple
+        Achromatic response :math:`Q`, tritanopic response :math:`t` and
+        protanopic response :math:`p`.
+    """
+
+    RGB = np.asarray(RGB)
+    xez = np.asarray(xez)
+    n = np.asarray(n)[..., np.newaxis]
+
+    bR, bG, bB = tsplit(bRGB_o * np.log10((RGB + n) / (20 * xez + n)))
+
+    Q = (2 / 3) * eR * bR + (1 / 3) * eG * bG
+    Q *= 41.69 / bL_or
+
+    t = bR - (12 / 11) * bG + (1 / 11) * bB
+    p = (1 / 9) * bR + (1 / 9) * bG - (2 / 9) * bB
+
+    return Q, t, p
+
+
 def achromatic_response(RGB, bRGB_o, xez, bL_or, eR, eG, n=1):
     """
     Returns the achromatic response :math:`Q` from given stimulus cone
@@ -701,15 +745,22 @@ def chromatic_strength_function(theta):
 
     theta = np.radians(theta)
 
+    # Computing the harmonics with the multiple-angle formulas.
+    sin_1, cos_1 = np.sin(theta), np.cos(theta)
+    sin_2, cos_2 = 2 * sin_1 * cos_1, cos_1 ** 2 - sin_1 ** 2
+    sin_3 = sin_2 * cos_1 + cos_2 * sin_1
+    cos_3 = cos_2 * cos_1 - sin_2 * sin_1
+    sin_4, cos_4 = 2 * sin_2 * cos_2, cos_2 ** 2 - sin_2 ** 2
+
     E_s = 0.9394
-    E_s += -0.2478 * np.sin(1 * theta)
-    E_s += -0.0743 * np.sin(2 * theta)
-    E_s += +0.0666 * np.sin(3 * theta)
-    E_s += -0.0186 * np.sin(4 * theta)
-    E_s += -0.0055 * np.cos(1 * theta)
-    E_s += -0.0521 * np.cos(2 * theta)
-    E_s += -0.0573 * np.cos(3 * theta)
-    E_s += -0.0061 * np.cos(4 * theta)
+    E_s += -0.2478 * sin_1
+    E_s += -0.0743 * sin_2
+    E_s += +0.0666 * sin_3
+    E_s += -0.0186 * sin_4
+    E_s += -0.0055 * cos_1
+    E_s += -0.0521 * cos_2
+    E_s += -0.0573 * cos_3
+    E_s += -0.0061 * cos_4
 
     return E_s
 
@@ -30,9 +30,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.appearance.hunt import XYZ_TO_HPE_MATRIX, XYZ_to_rgb
-from colour.utilities import (CaseInsensitiveMapping, dot_matrix, dot_vector,
-                              tsplit, row_as_diagonal)
+from colour.appearance.hunt import XYZ_to_rgb
+from colour.utilities import CaseInsensitiveMapping, dot_vector, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -238,23 +237,23 @@ s=1.1010410..., HC=None, a=15.5711021..., b=-52.6142956...)
     LMS_n = XYZ_to_rgb(XYZ_n)
 
     # Computing the :math:`A` matrix.
-    LMS_l_E = (3 * LMS_n) / (LMS_n[0] + LMS_n[1] + LMS_n[2])
+    LMS_l_E = (3 * LMS_n) / np.sum(LMS_n, axis=-1)[..., np.newaxis]
     LMS_p_L = ((1 + (Y_n[..., np.newaxis] ** (1 / 3)) + LMS_l_E) /
                (1 + (Y_n[..., np.newaxis] ** (1 / 3)) + (1 / LMS_l_E)))
     LMS_a_L = (LMS_p_L + D[..., np.newaxis] * (1 - LMS_p_L)) / LMS_n
 
-    aR = row_as_diagonal(LMS_a_L)
-    M = dot_matrix(dot_matrix(R_MATRIX, aR), XYZ_TO_HPE_MATRIX)
-    XYZ_ref = dot_vector(M, XYZ)
+    # Applying the :math:`A` matrix to the cone responses instead of building
+    # the per-stimulus :math:`RAM` matrices.
+    XYZ_ref = dot_vector(R_MATRIX, LMS_a_L * XYZ_to_rgb(XYZ))
 
-    X_ref, Y_ref, Z_ref = tsplit(XYZ_ref)
+    X_ref, Y_ref, Z_ref = tsplit(XYZ_ref ** sigma[..., np.newaxis])
 
     # Computing the correlate of *Lightness* :math:`L^R`.
-    LR = 100 * (Y_ref ** sigma)
+    LR = 100 * Y_ref
 
     # Computing opponent colour dimensions :math:`a^R` and :math:`b^R`.
-    aR = 430 * ((X_ref ** sigma) - (Y_ref ** sigma))
-    bR = 170 * ((Y_ref ** sigma) - (Z_ref ** sigma))
+    aR = 430 * (X_ref - Y_ref)
+    bR = 170 * (Y_ref - Z_ref)
 
     # Computing the *hue* angle :math:`h^R`.
     hR = np.degrees(np.arctan2(bR, aR)) % 360
@@ -83,3 +83,32 @@ class TestATD95ColourAppearanceModel(ColourAppearanceModelTest):
             k_1 = np.array(case[0])
             k_2 = np.array(case[0])
             XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2)
+
+    def test_n_dimensional_XYZ_to_ATD95(self):
+        """
+        Tests :func:`colour.appearance.atd95.XYZ_to_ATD95` definition
+        n-dimensional arrays support with shared and per-pixel viewing
+        conditions.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_0 = np.array([[95.05, 100.00, 108.88], [109.85, 100.00, 35.58]])
+        Y_0 = np.array([318.31, 31.83])
+        k_1 = np.array([0.0, 1.0])
+        k_2 = np.array([50.0, 5.0])
+        sigma = np.array([300.0, 200.0])
+
+        specification = XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2, sigma)
+        for i in range(2):
+            specification_i = XYZ_to_ATD95(XYZ[i], XYZ_0[i], Y_0[i], k_1[i],
+                                           k_2[i], sigma[i])
+
+            for value, value_i in zip(specification, specification_i):
+                np.testing.assert_almost_equal(value[i], value_i, decimal=7)
+
+        specification = XYZ_to_ATD95(XYZ, XYZ_0[0], Y_0[0], k_1[0], k_2[0])
+        specification_t = XYZ_to_ATD95(
+            np.tile(XYZ, (3, 1, 1)), XYZ_0[0], Y_0[0], k_1[0], k_2[0])
+        for value, value_t in zip(specification, specification_t):
+            np.testing.assert_almost_equal(
+                value_t, np.tile(value, (3, 1)), decimal=7)
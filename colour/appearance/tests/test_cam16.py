@@ -7,10 +7,13 @@ Defines unit tests for :mod:`colour.appearance.cam16` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (CAM16_InductionFactors, CAM16_Specification,
-                               XYZ_to_CAM16, CAM16_to_XYZ)
+                               XYZ_to_CAM16, CAM16_to_XYZ,
+                               CAM16_VIEWING_CONDITIONS,
+                               CAM16_viewing_conditions_model)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import as_namedtuple, ignore_numpy_errors, tsplit, tstack
 
@@ -23,7 +26,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCAM16ColourAppearanceModelForward',
-    'TestCAM16ColourAppearanceModelReverse'
+    'TestCAM16ColourAppearanceModelReverse',
+    'TestCAM16ViewingConditionsModel'
 ]
 
 
@@ -214,3 +218,115 @@ class TestCAM16ColourAppearanceModelReverse(ColourAppearanceModelTest):
             surround = CAM16_InductionFactors(case[0], case[0], case[0])
             CAM16_to_XYZ(
                 CAM16_Specification(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestCAM16ViewingConditionsModel(unittest.TestCase):
+    """
+    Defines
+    :func:`colour.appearance.cam16.CAM16_viewing_conditions_model`
+    definition units tests methods.
+    """
+
+    def test_CAM16_viewing_conditions_model(self):
+        """
+        Tests
+        :func:`colour.appearance.cam16.CAM16_viewing_conditions_model`
+        definition.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96],
+                        [3.53, 6.56, 2.14], [19.01, 20.00, 21.78]])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        L_A = 318.31
+        Y_b = 20.0
+
+        for surround in CAM16_VIEWING_CONDITIONS.values():
+            for discount_illuminant in (False, True):
+                model = CAM16_viewing_conditions_model(
+                    XYZ_w, L_A, Y_b, surround, discount_illuminant)
+
+                specification = model.forward(XYZ)
+                for i in range(XYZ.shape[0]):
+                    np.testing.assert_almost_equal(
+                        [x[i] for x in specification[:-1]],
+                        XYZ_to_CAM16(XYZ[i], XYZ_w, L_A, Y_b, surround,
+                                     discount_illuminant)[:-1],
+                        decimal=7)
+
+                np.testing.assert_almost_equal(
+                    model.reverse(specification), XYZ, decimal=7)
+                np.testing.assert_almost_equal(
+                    model.reverse(
+                        CAM16_Specification(
+                            J=specification.J,
+                            M=specification.M,
+                            h=specification.h)),
+                    XYZ,
+                    decimal=7)
+
+    def test_n_dimensional_CAM16_viewing_conditions_model(self):
+        """
+        Tests
+        :func:`colour.appearance.cam16.CAM16_viewing_conditions_model`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_w = np.array([[95.05, 100.00, 108.88], [109.85, 100.00, 35.58]])
+        L_A = np.array([318.31, 31.83])
+        Y_b = np.array([20.0, 20.0])
+
+        model = CAM16_viewing_conditions_model(XYZ_w, L_A, Y_b)
+        np.testing.assert_almost_equal(
+            model.forward(XYZ).J,
+            XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b).J,
+            decimal=7)
+
+        model = CAM16_viewing_conditions_model(XYZ_w[0], L_A[0], Y_b[0])
+        XYZ = np.tile(XYZ, (6, 1, 1))
+        np.testing.assert_almost_equal(
+            model.reverse(model.forward(XYZ)), XYZ, decimal=7)
+
+    def test_forward_fused(self):
+        """
+        Tests :meth:`colour.appearance.cam16.CAM16_ViewingConditionsModel.\
+forward_fused` method.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 100, (7, 11, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+
+        for surround in CAM16_VIEWING_CONDITIONS.values():
+            for discount_illuminant in (False, True):
+                model = CAM16_viewing_conditions_model(
+                    XYZ_w, 318.31, 20.0, surround, discount_illuminant)
+
+                specification = model.forward(XYZ)
+                for tile_size in (1, 10, 1000):
+                    specification_f = model.forward_fused(XYZ, tile_size)
+                    for value, value_f in zip(specification[:-1],
+                                              specification_f[:-1]):
+                        np.testing.assert_allclose(
+                            value_f, value, rtol=1e-10, atol=1e-10)
+
+        specification = model.forward_fused(XYZ[0, 0])
+        self.assertIsInstance(specification.J, float)
+
+        model = CAM16_viewing_conditions_model(
+            np.tile(XYZ_w, (7, 11, 1)), np.full((7, 11), 318.31),
+            np.full((7, 11), 20.0))
+        np.testing.assert_almost_equal(
+            model.forward_fused(XYZ).J, model.forward(XYZ).J, decimal=7)
+
+    def test_raise_exception_CAM16_viewing_conditions_model(self):
+        """
+        Tests
+        :func:`colour.appearance.cam16.CAM16_viewing_conditions_model`
+        definition raised exception.
+        """
+
+        model = CAM16_viewing_conditions_model(
+            np.array([95.05, 100.00, 108.88]), 318.31, 20.0)
+
+        self.assertRaises(ValueError, model.reverse,
+                          CAM16_Specification(J=41.73, h=219.04))
@@ -7,9 +7,11 @@ Defines unit tests for :mod:`colour.appearance.hunt` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
-from colour.appearance import Hunt_InductionFactors, XYZ_to_Hunt
+from colour.appearance import (Hunt_InductionFactors, Hunt_Specification,
+                               XYZ_to_Hunt, Hunt_to_XYZ)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors, tstack
 
@@ -20,7 +22,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestHuntColourAppearanceModel']
+__all__ = ['TestHuntColourAppearanceModel', 'TestHunt_to_XYZ']
 
 
 class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
@@ -87,3 +89,228 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
             surround = Hunt_InductionFactors(case[0], case[0])
             CCT_w = case[0]
             XYZ_to_Hunt(XYZ, XYZ_w, XYZ_b, L_A, surround, CCT_w=CCT_w)
+
+    def test_n_dimensional_XYZ_to_Hunt(self):
+        """
+        Tests :func:`colour.appearance.hunt.XYZ_to_Hunt` definition
+        n-dimensional arrays support with shared and per-pixel viewing
+        conditions.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_w = np.array([[95.05, 100.00, 108.88], [109.85, 100.00, 35.58]])
+        XYZ_b = np.array([[95.05, 20.00, 108.88], [109.85, 20.00, 35.58]])
+        L_A = np.array([318.31, 31.83])
+        CCT_w = np.array([6504.0, 2856.0])
+
+        def case(value, i):
+            """
+            Returns the value of given per-pixel argument for given case.
+            """
+
+            if isinstance(value, Hunt_InductionFactors):
+                return Hunt_InductionFactors(*[case(v, i) for v in value])
+
+            return value[i] if isinstance(value, np.ndarray) else value
+
+        for kwargs in ({}, {
+                'helson_judd_effect': True
+        }, {
+                'discount_illuminant': False
+        }, {
+                'XYZ_p': np.array([[95.05, 100.00, 108.88],
+                                   [95.05, 40.00, 108.88]]),
+                'p': np.array([0.5, -0.25])
+        }, {
+                'surround':
+                Hunt_InductionFactors(
+                    np.array([1.0, 0.9]), np.array([75.0, 25.0]),
+                    np.array([0.75, 1.0]), np.array([0.75, 1.0]))
+        }):
+            specification = XYZ_to_Hunt(
+                XYZ, XYZ_w, XYZ_b, L_A, CCT_w=CCT_w, **kwargs)
+
+            for i in range(2):
+                specification_i = XYZ_to_Hunt(
+                    XYZ[i],
+                    XYZ_w[i],
+                    XYZ_b[i],
+                    L_A[i],
+                    CCT_w=CCT_w[i],
+                    **dict((key, case(value, i))
+                           for key, value in kwargs.items()))
+
+                for value, value_i in zip(specification, specification_i):
+                    if value_i is not None:
+                        np.testing.assert_almost_equal(
+                            value[i], value_i, decimal=7)
+
+        specification = XYZ_to_Hunt(XYZ, XYZ_w[0], XYZ_b[0], L_A[0],
+                                    CCT_w=CCT_w[0])
+        specification_t = XYZ_to_Hunt(
+            np.tile(XYZ, (3, 1, 1)), XYZ_w[0], XYZ_b[0], L_A[0],
+            CCT_w=CCT_w[0])
+        for value, value_t in zip(specification, specification_t):
+            if value is not None:
+                np.testing.assert_almost_equal(
+                    value_t, np.tile(value, (3, 1)), decimal=7)
+
+
+class TestHunt_to_XYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.hunt.Hunt_to_XYZ` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+            [19.01, 20.00, 21.78],
+        ])
+        self._XYZ_w = np.array([
+            [95.05, 100.00, 108.88],
+            [95.05, 100.00, 108.88],
+            [109.85, 100.00, 35.58],
+            [109.85, 100.00, 35.58],
+        ])
+        self._XYZ_b = np.array([
+            [95.05, 20.00, 108.88],
+            [95.05, 20.00, 108.88],
+            [109.85, 20.00, 35.58],
+            [109.85, 20.00, 35.58],
+        ])
+        self._L_A = np.array([318.31, 31.83, 318.31, 31.83])
+        self._CCT_w = np.array([6504.0, 6504.0, 2856.0, 2856.0])
+
+    def test_Hunt_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.hunt.Hunt_to_XYZ` definition.
+        """
+
+        for kwargs in ({}, {
+                'helson_judd_effect': True,
+                'discount_illuminant': False
+        }, {
+                'XYZ_p': np.array([50.00, 40.00, 30.00]),
+                'p': -0.5
+        }, {
+                'L_AS': 1000.0,
+                'S': 15.0,
+                'S_w': 100.0
+        }):
+            for i in range(self._XYZ.shape[0]):
+                XYZ_w, XYZ_b = self._XYZ_w[i], self._XYZ_b[i]
+                L_A, CCT_w = self._L_A[i], self._CCT_w[i]
+
+                specification = XYZ_to_Hunt(
+                    self._XYZ[i], XYZ_w, XYZ_b, L_A, CCT_w=CCT_w, **kwargs)
+
+                np.testing.assert_almost_equal(
+                    Hunt_to_XYZ(specification, XYZ_w, XYZ_b, L_A,
+                                CCT_w=CCT_w, **kwargs),
+                    self._XYZ[i],
+                    decimal=7)
+
+                np.testing.assert_almost_equal(
+                    Hunt_to_XYZ(
+                        Hunt_Specification(
+                            J=specification.J,
+                            M=specification.M,
+                            h=specification.h),
+                        XYZ_w,
+                        XYZ_b,
+                        L_A,
+                        CCT_w=CCT_w,
+                        **kwargs),
+                    self._XYZ[i],
+                    decimal=7)
+
+    def test_n_dimensional_Hunt_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.hunt.Hunt_to_XYZ` definition
+        n-dimensional arrays support with shared and per-pixel viewing
+        conditions.
+        """
+
+        specification = XYZ_to_Hunt(
+            self._XYZ, self._XYZ_w, self._XYZ_b, self._L_A, CCT_w=self._CCT_w)
+        np.testing.assert_almost_equal(
+            Hunt_to_XYZ(
+                specification,
+                self._XYZ_w,
+                self._XYZ_b,
+                self._L_A,
+                CCT_w=self._CCT_w),
+            self._XYZ,
+            decimal=7)
+
+        XYZ = np.reshape(self._XYZ, (2, 2, 3))
+        specification = XYZ_to_Hunt(XYZ, self._XYZ_w[0], self._XYZ_b[0],
+                                    self._L_A[0], CCT_w=self._CCT_w[0])
+        np.testing.assert_almost_equal(
+            Hunt_to_XYZ(
+                specification,
+                self._XYZ_w[0],
+                self._XYZ_b[0],
+                self._L_A[0],
+                CCT_w=self._CCT_w[0]),
+            XYZ,
+            decimal=7)
+
+    def test_raise_exception_Hunt_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.hunt.Hunt_to_XYZ` definition raised
+        exception.
+        """
+
+        specification = Hunt_Specification(J=30.0, h=270.0)
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        XYZ_b = np.array([95.05, 20.00, 108.88])
+
+        self.assertRaises(ValueError, Hunt_to_XYZ, specification, XYZ_w,
+                          XYZ_b, 318.31, CCT_w=6504.0)
+
+        specification = Hunt_Specification(J=30.0, C=0.1, h=270.0)
+        self.assertRaises(ValueError, Hunt_to_XYZ, specification, XYZ_w,
+                          XYZ_b, 318.31)
+        self.assertRaises(
+            ValueError,
+            Hunt_to_XYZ,
+            specification,
+            XYZ_w,
+            XYZ_b,
+            318.31,
+            CCT_w=6504.0,
+            S=20.0)
+
+    @ignore_numpy_errors
+    def test_nan_Hunt_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.hunt.Hunt_to_XYZ` definition nan
+        support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            J = case[0]
+            C = case[0]
+            h = case[0]
+            XYZ_w = np.array(case)
+            XYZ_b = np.array(case)
+            L_A = case[0]
+            surround = Hunt_InductionFactors(case[0], case[0])
+            CCT_w = case[0]
+            Hunt_to_XYZ(
+                Hunt_Specification(J, C, h),
+                XYZ_w,
+                XYZ_b,
+                L_A,
+                surround,
+                CCT_w=CCT_w)
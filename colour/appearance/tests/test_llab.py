@@ -8,6 +8,7 @@ from __future__ import division, unicode_literals
 from colour.utilities.array import tstack
 
 import numpy as np
+import unittest
 
 try:
     from unittest import mock
@@ -15,7 +16,9 @@ except ImportError:
     import mock
 from itertools import permutations
 
-from colour.appearance import LLAB_InductionFactors, XYZ_to_LLAB, llab
+from colour.appearance import (LLAB_InductionFactors, LLAB_Specification,
+                               LLAB_VIEWING_CONDITIONS, XYZ_to_LLAB,
+                               LLAB_to_XYZ, llab)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors
 
@@ -26,7 +29,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestLLABColourAppearanceModel']
+__all__ = ['TestLLABColourAppearanceModel', 'TestLLAB_to_XYZ']
 
 
 class TestLLABColourAppearanceModel(ColourAppearanceModelTest):
@@ -150,3 +153,147 @@ class TestLLABColourAppearanceModel(ColourAppearanceModelTest):
             L = case[0]
             surround = LLAB_InductionFactors(1, case[0], case[0], case[0])
             XYZ_to_LLAB(XYZ, XYZ_0, Y_b, L, surround)
+
+    def test_n_dimensional_XYZ_to_LLAB(self):
+        """
+        Tests :func:`colour.appearance.llab.XYZ_to_LLAB` definition
+        n-dimensional arrays support with shared and per-pixel viewing
+        conditions.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_0 = np.array([[95.05, 100.00, 108.88], [109.85, 100.00, 35.58]])
+        Y_b = np.array([20.0, 40.0])
+        L = np.array([318.31, 31.83])
+        surround = LLAB_InductionFactors(
+            np.array([1.0, 0.7]), np.array([3.0, 3.5]), np.array([0.0, 1.0]),
+            np.array([1.0, 1.0]))
+
+        specification = XYZ_to_LLAB(XYZ, XYZ_0, Y_b, L, surround)
+        for i in range(2):
+            specification_i = XYZ_to_LLAB(
+                XYZ[i], XYZ_0[i], Y_b[i], L[i],
+                LLAB_InductionFactors(*[value[i] for value in surround]))
+
+            for value, value_i in zip(specification, specification_i):
+                if value_i is not None:
+                    np.testing.assert_almost_equal(
+                        value[i], value_i, decimal=7)
+
+        specification = XYZ_to_LLAB(XYZ, XYZ_0[0], Y_b[0], L[0])
+        specification_t = XYZ_to_LLAB(
+            np.tile(XYZ, (3, 1, 1)), XYZ_0[0], Y_b[0], L[0])
+        for value, value_t in zip(specification, specification_t):
+            if value is not None:
+                np.testing.assert_almost_equal(
+                    value_t, np.tile(value, (3, 1)), decimal=7)
+
+
+class TestLLAB_to_XYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.llab.LLAB_to_XYZ` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ = np.array([
+            [19.01, 20.00, 21.78],
+            [57.06, 43.06, 31.96],
+            [3.53, 6.56, 2.14],
+            [19.01, 20.00, 21.78],
+        ])
+        self._XYZ_0 = np.array([
+            [95.05, 100.00, 108.88],
+            [95.05, 100.00, 108.88],
+            [109.85, 100.00, 35.58],
+            [109.85, 100.00, 35.58],
+        ])
+        self._Y_b = np.array([20.0, 20.0, 10.0, 40.0])
+        self._L = np.array([318.31, 31.83, 318.31, 31.83])
+
+    def test_LLAB_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.llab.LLAB_to_XYZ` definition.
+        """
+
+        for surround in LLAB_VIEWING_CONDITIONS.values():
+            for i in range(self._XYZ.shape[0]):
+                XYZ_0, Y_b, L = self._XYZ_0[i], self._Y_b[i], self._L[i]
+
+                specification = XYZ_to_LLAB(self._XYZ[i], XYZ_0, Y_b, L,
+                                            surround)
+
+                np.testing.assert_almost_equal(
+                    LLAB_to_XYZ(specification, XYZ_0, Y_b, L, surround),
+                    self._XYZ[i],
+                    decimal=7)
+
+                np.testing.assert_almost_equal(
+                    LLAB_to_XYZ(
+                        LLAB_Specification(
+                            J=specification.J,
+                            M=specification.M,
+                            h=specification.h), XYZ_0, Y_b, L, surround),
+                    self._XYZ[i],
+                    decimal=7)
+
+    def test_n_dimensional_LLAB_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.llab.LLAB_to_XYZ` definition
+        n-dimensional arrays support with shared and per-pixel viewing
+        conditions.
+        """
+
+        surround = LLAB_InductionFactors(
+            np.array([1.0, 0.7, 1.0, 0.0]), np.array([3.0, 3.5, 5.0, 3.0]),
+            np.array([0.0, 1.0, 1.0, 0.5]), np.array([1.0, 1.0, 1.1, 0.9]))
+
+        specification = XYZ_to_LLAB(self._XYZ, self._XYZ_0, self._Y_b, self._L,
+                                    surround)
+        np.testing.assert_almost_equal(
+            LLAB_to_XYZ(specification, self._XYZ_0, self._Y_b, self._L,
+                        surround),
+            self._XYZ,
+            decimal=7)
+
+        XYZ = np.reshape(self._XYZ, (2, 2, 3))
+        specification = XYZ_to_LLAB(XYZ, self._XYZ_0[2], self._Y_b[2],
+                                    self._L[2])
+        np.testing.assert_almost_equal(
+            LLAB_to_XYZ(specification, self._XYZ_0[2], self._Y_b[2],
+                        self._L[2]),
+            XYZ,
+            decimal=7)
+
+    def test_raise_exception_LLAB_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.llab.LLAB_to_XYZ` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, LLAB_to_XYZ,
+                          LLAB_Specification(J=37.0, h=270.0),
+                          np.array([95.05, 100.00, 108.88]), 20.0, 318.31)
+
+    @ignore_numpy_errors
+    def test_nan_LLAB_to_XYZ(self):
+        """
+        Tests :func:`colour.appearance.llab.LLAB_to_XYZ` definition nan
+        support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            J = case[0]
+            C = case[0]
+            h = case[0]
+            XYZ_0 = np.array(case)
+            Y_b = case[0]
+            L = case[0]
+            surround = LLAB_InductionFactors(1, case[0], case[0], case[0])
+            LLAB_to_XYZ(LLAB_Specification(J, C, h), XYZ_0, Y_b, L, surround)
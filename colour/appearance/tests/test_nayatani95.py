@@ -81,3 +81,36 @@ class TestNayatani95ColourAppearanceModel(ColourAppearanceModelTest):
             E_o = case[0]
             E_or = case[0]
             XYZ_to_Nayatani95(XYZ, XYZ_n, Y_o, E_o, E_or)
+
+    def test_n_dimensional_XYZ_to_Nayatani95(self):
+        """
+        Tests :func:`colour.appearance.nayatani95.XYZ_to_Nayatani95`
+        definition n-dimensional arrays support with shared and per-pixel
+        viewing conditions.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_n = np.array([[95.05, 100.00, 108.88], [109.85, 100.00, 35.58]])
+        Y_o = np.array([20.0, 30.0])
+        E_o = np.array([5000.0, 500.0])
+        E_or = np.array([1000.0, 100.0])
+        n = np.array([1.0, 2.0])
+
+        specification = XYZ_to_Nayatani95(XYZ, XYZ_n, Y_o, E_o, E_or, n)
+        for i in range(2):
+            specification_i = XYZ_to_Nayatani95(XYZ[i], XYZ_n[i], Y_o[i],
+                                                E_o[i], E_or[i], n[i])
+
+            for value, value_i in zip(specification, specification_i):
+                if value_i is not None:
+                    np.testing.assert_almost_equal(
+                        value[i], value_i, decimal=7)
+
+        specification = XYZ_to_Nayatani95(XYZ, XYZ_n[0], Y_o[0], E_o[0],
+                                          E_or[0])
+        specification_t = XYZ_to_Nayatani95(
+            np.tile(XYZ, (3, 1, 1)), XYZ_n[0], Y_o[0], E_o[0], E_or[0])
+        for value, value_t in zip(specification, specification_t):
+            if value is not None:
+                np.testing.assert_almost_equal(
+                    value_t, np.tile(value, (3, 1)), decimal=7)
@@ -80,3 +80,34 @@ class TestRLABColourAppearanceModel(ColourAppearanceModelTest):
             sigma = case[0]
             D = case[0]
             XYZ_to_RLAB(XYZ, XYZ_n, Y_n, sigma, D)
+
+    def test_n_dimensional_XYZ_to_RLAB(self):
+        """
+        Tests :func:`colour.appearance.rlab.XYZ_to_RLAB` definition
+        n-dimensional arrays support with shared and per-pixel viewing
+        conditions.
+        """
+
+        XYZ = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+        XYZ_n = np.array([[95.05, 100.00, 108.88], [109.85, 100.00, 35.58]])
+        Y_n = np.array([318.31, 31.83])
+        sigma = np.array([1 / 2.3, 1 / 3.5])
+        D = np.array([1.0, 0.5])
+
+        specification = XYZ_to_RLAB(XYZ, XYZ_n, Y_n, sigma, D)
+        for i in range(2):
+            specification_i = XYZ_to_RLAB(XYZ[i], XYZ_n[i], Y_n[i], sigma[i],
+                                          D[i])
+
+            for value, value_i in zip(specification, specification_i):
+                if value_i is not None:
+                    np.testing.assert_almost_equal(
+                        value[i], value_i, decimal=7)
+
+        specification = XYZ_to_RLAB(XYZ, XYZ_n[0], Y_n[0])
+        specification_t = XYZ_to_RLAB(
+            np.tile(XYZ, (3, 1, 1)), XYZ_n[0], Y_n[0])
+        for value, value_t in zip(specification, specification_t):
+            if value is not None:
+                np.testing.assert_almost_equal(
+                    value_t, np.tile(value, (3, 1)), decimal=7)
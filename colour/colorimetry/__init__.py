@@ -24,8 +24,11 @@ from .tristimulus import (
 from .correction import BANDPASS_CORRECTION_METHODS
 from .correction import bandpass_correction
 from .correction import bandpass_correction_Stearns1988
-from .illuminants import (D_illuminant_relative_spd,
-                          CIE_standard_illuminant_A_function)
+from .illuminants import (
+    D_illuminant_M1_M2, D_illuminant_relative_spd_values,
+    D_illuminant_relative_spd, D_illuminant_relative_multi_spd,
+    CCT_to_D_illuminant_relative_spd_values,
+    CIE_standard_illuminant_A_function)
 from .lefs import (mesopic_luminous_efficiency_function,
                    mesopic_weighting_function)
 from .lightness import LIGHTNESS_METHODS
@@ -80,7 +83,12 @@ __all__ += [
 __all__ += ['BANDPASS_CORRECTION_METHODS']
 __all__ += ['bandpass_correction']
 __all__ += ['bandpass_correction_Stearns1988']
-__all__ += ['D_illuminant_relative_spd', 'CIE_standard_illuminant_A_function']
+__all__ += [
+    'D_illuminant_M1_M2', 'D_illuminant_relative_spd_values',
+    'D_illuminant_relative_spd', 'D_illuminant_relative_multi_spd',
+    'CCT_to_D_illuminant_relative_spd_values',
+    'CIE_standard_illuminant_A_function'
+]
 __all__ += [
     'mesopic_luminous_efficiency_function', 'mesopic_weighting_function'
 ]
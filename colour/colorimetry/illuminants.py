@@ -6,6 +6,9 @@ Illuminants
 Defines *CIE* illuminants computation related objects:
 
 -   :func:`colour.D_illuminant_relative_spd`
+-   :func:`colour.colorimetry.D_illuminant_relative_spd_values`
+-   :func:`colour.colorimetry.D_illuminant_relative_multi_spd`
+-   :func:`colour.colorimetry.CCT_to_D_illuminant_relative_spd_values`
 -   :func:`colour.CIE_standard_illuminant_A_function`
 
 See Also
@@ -30,8 +33,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import D_ILLUMINANTS_S_SPDS, SpectralPowerDistribution
-from colour.utilities import tsplit
+from colour.colorimetry import (D_ILLUMINANTS_S_SPDS,
+                                MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -40,7 +45,110 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['D_illuminant_relative_spd', 'CIE_standard_illuminant_A_function']
+__all__ = [
+    'D_illuminant_M1_M2', 'D_illuminant_relative_spd_values',
+    'D_illuminant_relative_spd', 'D_illuminant_relative_multi_spd',
+    'CCT_to_D_illuminant_relative_spd_values',
+    'CIE_standard_illuminant_A_function'
+]
+
+
+def D_illuminant_M1_M2(xy, M1_M2_rounding=True):
+    """
+    Returns the :math:`M1` and :math:`M2` weighting factors of the
+    *CIE Standard Illuminant D Series* :math:`S_1` and :math:`S_2`
+    characteristic spectral power distributions for given *xy* chromaticity
+    coordinates.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    ndarray
+        :math:`M1` and :math:`M2` weighting factors.
+
+    References
+    ----------
+    -   :cite:`Wyszecki2000z`
+
+    Examples
+    --------
+    >>> xy = np.array([0.31272660, 0.32902313])
+    >>> D_illuminant_M1_M2(xy)
+    array([-0.29 , -0.666])
+    """
+
+    x, y = tsplit(xy)
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
+    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+
+    if M1_M2_rounding:
+        M1 = np.around(M1, 3)
+        M2 = np.around(M2, 3)
+
+    return tstack((M1, M2))
+
+
+def D_illuminant_relative_spd_values(xy, M1_M2_rounding=True):
+    """
+    Returns the relative spectral power distribution values of the
+    *CIE Standard Illuminant D Series* using given *xy* chromaticity
+    coordinates array.
+
+    The values are computed for all the chromaticity coordinates at once as a
+    single matrix product between the :math:`1`, :math:`M1` and :math:`M2`
+    weighting factors and the :math:`S_0`, :math:`S_1` and :math:`S_2`
+    characteristic spectral power distributions.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates array of shape (..., 2).
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Standard Illuminant D Series* relative spectral power
+        distribution values of shape (..., bins) sampled at the
+        :attr:`colour.SpectralPowerDistribution.wavelengths` of the
+        :attr:`colour.colorimetry.D_ILLUMINANTS_S_SPDS` attribute.
+
+    References
+    ----------
+    -   :cite:`CIETC1-482004`
+    -   :cite:`Wyszecki2000z`
+
+    Examples
+    --------
+    >>> xy = np.array([
+    ...     [0.34570291, 0.35850947],
+    ...     [0.31272660, 0.32902313],
+    ... ])
+    >>> D_illuminant_relative_spd_values(xy)[..., 20]
+    array([ 49.452 ,  82.9466])
+    """
+
+    M1_M2 = D_illuminant_M1_M2(xy, M1_M2_rounding)
+
+    M = np.concatenate([np.ones(M1_M2.shape[:-1] + (1, )), M1_M2], axis=-1)
+
+    S = np.vstack([
+        D_ILLUMINANTS_S_SPDS['S0'].values, D_ILLUMINANTS_S_SPDS['S1'].values,
+        D_ILLUMINANTS_S_SPDS['S2'].values
+    ])
+
+    return np.dot(M, S)
 
 
 def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
@@ -197,24 +305,111 @@ def D_illuminant_relative_spd(xy, M1_M2_rounding=True):
                               extrapolator_args={...})
     """
 
-    x, y = tsplit(xy)
+    distribution = D_illuminant_relative_spd_values(xy, M1_M2_rounding)
 
-    M = 0.0241 + 0.2562 * x - 0.7341 * y
-    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
-    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+    return SpectralPowerDistribution(
+        distribution,
+        D_ILLUMINANTS_S_SPDS['S0'].wavelengths,
+        name='CIE Standard Illuminant D Series')
 
-    if M1_M2_rounding:
-        M1 = np.around(M1, 3)
-        M2 = np.around(M2, 3)
 
-    S0 = D_ILLUMINANTS_S_SPDS['S0']
-    S1 = D_ILLUMINANTS_S_SPDS['S1']
-    S2 = D_ILLUMINANTS_S_SPDS['S2']
+def D_illuminant_relative_multi_spd(xy, M1_M2_rounding=True, labels=None):
+    """
+    Returns the relative multi-spectral power distribution of the
+    *CIE Standard Illuminant D Series* using given *xy* chromaticity
+    coordinates array.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates array of shape (N, 2).
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+    labels : array_like, optional
+        Names to use for the :class:`colour.SpectralPowerDistribution` class
+        instances, default to the *xy* chromaticity coordinates indexes.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        *CIE Standard Illuminant D Series* relative multi-spectral power
+        distribution.
 
-    distribution = S0.values + M1 * S1.values + M2 * S2.values
+    Notes
+    -----
+    -   :class:`colour.MultiSpectralPowerDistribution` class instantiation
+        cost grows linearly with the number of *xy* chromaticity coordinates,
+        :func:`colour.colorimetry.D_illuminant_relative_spd_values`
+        definition should be preferred for large arrays.
 
-    return SpectralPowerDistribution(
-        distribution, S0.wavelengths, name='CIE Standard Illuminant D Series')
+    References
+    ----------
+    -   :cite:`CIETC1-482004`
+    -   :cite:`Wyszecki2000z`
+
+    Examples
+    --------
+    >>> xy = np.array([
+    ...     [0.34570291, 0.35850947],
+    ...     [0.31272660, 0.32902313],
+    ... ])
+    >>> D_illuminant_relative_multi_spd(xy)[400]
+    array([ 49.452 ,  82.9466])
+    """
+
+    xy = np.reshape(xy, (-1, 2))
+
+    values = D_illuminant_relative_spd_values(xy, M1_M2_rounding)
+
+    return MultiSpectralPowerDistribution(
+        np.transpose(values),
+        D_ILLUMINANTS_S_SPDS['S0'].wavelengths,
+        labels=labels,
+        name='CIE Standard Illuminant D Series')
+
+
+def CCT_to_D_illuminant_relative_spd_values(CCT, M1_M2_rounding=True):
+    """
+    Returns the relative spectral power distribution values of the
+    *CIE Standard Illuminant D Series* using given correlated colour
+    temperatures :math:`T_{cp}` array.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}` array.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Standard Illuminant D Series* relative spectral power
+        distribution values of shape (..., bins).
+
+    Notes
+    -----
+    -   The nominal correlated colour temperatures must be given according to
+        *CIE 015:2004* recommendation and thus multiplied by 1.4388 / 1.4380.
+
+    References
+    ----------
+    -   :cite:`CIETC1-482004`
+    -   :cite:`Wyszecki2000z`
+
+    Examples
+    --------
+    >>> CCT = np.array([5000, 6500]) * 1.4388 / 1.4380
+    >>> CCT_to_D_illuminant_relative_spd_values(CCT)[..., 20]
+    array([ 49.3081,  82.7549])
+    """
+
+    from colour.temperature import CCT_to_xy_CIE_D
+
+    return D_illuminant_relative_spd_values(
+        CCT_to_xy_CIE_D(CCT), M1_M2_rounding)
 
 
 def CIE_standard_illuminant_A_function(wl):
@@ -8,9 +8,11 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.colorimetry import (D_illuminant_relative_spd,
-                                CIE_standard_illuminant_A_function,
-                                ILLUMINANTS_SPDS)
+from colour.colorimetry import (
+    D_illuminant_M1_M2, D_illuminant_relative_spd_values,
+    D_illuminant_relative_spd, D_illuminant_relative_multi_spd,
+    CCT_to_D_illuminant_relative_spd_values,
+    CIE_standard_illuminant_A_function, ILLUMINANTS_SPDS)
 from colour.temperature import CCT_to_xy_CIE_D
 
 __author__ = 'Colour Developers'
@@ -21,7 +23,9 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'A_DATA', 'TestD_illuminantRelativeSpd',
+    'A_DATA', 'TestD_illuminantM1M2', 'TestD_illuminantRelativeSpdValues',
+    'TestD_illuminantRelativeSpd', 'TestD_illuminantRelativeMultiSpd',
+    'TestCCT_to_D_illuminantRelativeSpdValues',
     'TestCIEStandardIlluminantAFunction'
 ]
 
@@ -123,6 +127,101 @@ A_DATA = np.array([
 ])
 
 
+class TestD_illuminantM1M2(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.D_illuminant_M1_M2`
+    definition unit tests methods.
+    """
+
+    def test_D_illuminant_M1_M2(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_M1_M2`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            D_illuminant_M1_M2(np.array([0.34570291, 0.35850947])),
+            np.array([-1.035, 0.390]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            D_illuminant_M1_M2(
+                np.array([0.31272660, 0.32902313]), M1_M2_rounding=False),
+            np.array([-0.29033490, -0.66569417]),
+            decimal=7)
+
+    def test_n_dimensional_D_illuminant_M1_M2(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_M1_M2`
+        definition n-dimensional arrays support.
+        """
+
+        xy = np.array([0.31272660, 0.32902313])
+        M1_M2 = D_illuminant_M1_M2(xy)
+
+        xy = np.tile(xy, (6, 1))
+        M1_M2 = np.tile(M1_M2, (6, 1))
+        np.testing.assert_almost_equal(
+            D_illuminant_M1_M2(xy), M1_M2, decimal=7)
+
+        xy = np.reshape(xy, (2, 3, 2))
+        M1_M2 = np.reshape(M1_M2, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            D_illuminant_M1_M2(xy), M1_M2, decimal=7)
+
+
+class TestD_illuminantRelativeSpdValues(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.\
+D_illuminant_relative_spd_values` definition unit tests methods.
+    """
+
+    def test_D_illuminant_relative_spd_values(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.\
+D_illuminant_relative_spd_values` definition.
+        """
+
+        names = ('D50', 'D55', 'D65', 'D75')
+        CCT = np.array([5000, 5500, 6500, 7500]) * 1.4388 / 1.4380
+        values = D_illuminant_relative_spd_values(CCT_to_xy_CIE_D(CCT))
+
+        self.assertTupleEqual(values.shape, (4, 107))
+
+        for i, name in enumerate(names):
+            spd_r = ILLUMINANTS_SPDS[name]
+            spd_t = D_illuminant_relative_spd(CCT_to_xy_CIE_D(CCT[i]))
+
+            np.testing.assert_almost_equal(
+                values[i], spd_t.values, decimal=7)
+
+            np.testing.assert_allclose(
+                spd_r.values,
+                values[i][np.searchsorted(spd_t.wavelengths,
+                                          spd_r.wavelengths)],
+                rtol=0.001,
+                atol=0.001)
+
+    def test_n_dimensional_D_illuminant_relative_spd_values(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.\
+D_illuminant_relative_spd_values` definition n-dimensional arrays support.
+        """
+
+        xy = np.array([0.31272660, 0.32902313])
+        values = D_illuminant_relative_spd_values(xy)
+
+        xy = np.tile(xy, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            D_illuminant_relative_spd_values(xy), values, decimal=7)
+
+        xy = np.reshape(xy, (2, 3, 2))
+        values = np.reshape(values, (2, 3, 107))
+        np.testing.assert_almost_equal(
+            D_illuminant_relative_spd_values(xy), values, decimal=7)
+
+
 class TestD_illuminantRelativeSpd(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.illuminants.D_illuminant_relative_spd`
@@ -153,6 +252,55 @@ class TestD_illuminantRelativeSpd(unittest.TestCase):
                 atol=tolerance)
 
 
+class TestD_illuminantRelativeMultiSpd(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.\
+D_illuminant_relative_multi_spd` definition unit tests methods.
+    """
+
+    def test_D_illuminant_relative_multi_spd(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.\
+D_illuminant_relative_multi_spd` definition.
+        """
+
+        xy = np.array([
+            [0.34570291, 0.35850947],
+            [0.31272660, 0.32902313],
+        ])
+        multi_spd = D_illuminant_relative_multi_spd(xy, labels=('a', 'b'))
+
+        self.assertListEqual(multi_spd.labels, ['a', 'b'])
+
+        for i, label in enumerate(multi_spd.labels):
+            spd_t = D_illuminant_relative_spd(xy[i])
+
+            np.testing.assert_almost_equal(
+                multi_spd.signals[label].values, spd_t.values, decimal=7)
+            np.testing.assert_almost_equal(
+                multi_spd.wavelengths, spd_t.wavelengths, decimal=7)
+
+
+class TestCCT_to_D_illuminantRelativeSpdValues(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.\
+CCT_to_D_illuminant_relative_spd_values` definition unit tests methods.
+    """
+
+    def test_CCT_to_D_illuminant_relative_spd_values(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.\
+CCT_to_D_illuminant_relative_spd_values` definition.
+        """
+
+        CCT = np.array([5000, 5500, 6500, 7500]) * 1.4388 / 1.4380
+
+        np.testing.assert_almost_equal(
+            CCT_to_D_illuminant_relative_spd_values(CCT),
+            D_illuminant_relative_spd_values(CCT_to_xy_CIE_D(CCT)),
+            decimal=7)
+
+
 class TestCIEStandardIlluminantAFunction(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.illuminants.\
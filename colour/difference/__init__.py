@@ -40,6 +40,8 @@ from .cam16_ucs import (delta_E_CAM16LCD, delta_E_CAM16SCD, delta_E_CAM16UCS)
 from .delta_e import (delta_E_CIE1976, delta_E_CIE1994, delta_E_CIE2000,
                       delta_E_CMC)
 from .din99 import delta_E_DIN99
+from .search import (DELTA_E_SEARCH_CHUNK_SIZE, delta_E_pairwise,
+                     delta_E_nearest)
 
 __all__ = ['delta_E_CAM02LCD', 'delta_E_CAM02SCD', 'delta_E_CAM02UCS']
 __all__ += ['delta_E_CAM16LCD', 'delta_E_CAM16SCD', 'delta_E_CAM16UCS']
@@ -47,6 +49,9 @@ __all__ += [
     'delta_E_CIE1976', 'delta_E_CIE1994', 'delta_E_CIE2000', 'delta_E_CMC'
 ]
 __all__ += ['delta_E_DIN99']
+__all__ += [
+    'DELTA_E_SEARCH_CHUNK_SIZE', 'delta_E_pairwise', 'delta_E_nearest'
+]
 
 DELTA_E_METHODS = CaseInsensitiveMapping({
     'CIE 1976': delta_E_CIE1976,
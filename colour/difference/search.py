@@ -0,0 +1,757 @@
+# -*- coding: utf-8 -*-
+"""
+:math:`\Delta E` - Colour Difference Search
+============================================
+
+Defines the pairwise and nearest neighbours colour difference search objects:
+
+-   :attr:`colour.difference.DELTA_E_SEARCH_CHUNK_SIZE`
+-   :func:`colour.difference.delta_E_pairwise`
+-   :func:`colour.difference.delta_E_nearest`
+
+The nearest neighbours search prunes the reference colours with a
+:class:`scipy.spatial.cKDTree` class instance built in the colourspace of the
+colour difference method, e.g. *CIE L\*a\*b\** or :math:`J'a'b'`, whose axes
+may be scaled, e.g. the lightness axis for the *CIE 2000* method: for a given
+query colour, the colour difference method is bounded from below by the
+euclidean distance, i.e. :math:`\Delta E_{76}`, scaled by a factor depending
+only on the query colour and the euclidean distance. The colour difference
+method is thus only evaluated on the reference colours whose euclidean
+distance is lower than the radius enclosing the current :math:`k` nearest
+neighbours.
+
+References
+----------
+-   :cite:`Lindbloom2009e` : Lindbloom, B. (2009). Delta E (CIE 2000).
+    Retrieved February 24, 2014, from
+    http://brucelindbloom.com/Eqn_DeltaE_CIE2000.html
+-   :cite:`Lindbloom2009f` : Lindbloom, B. (2009). Delta E (CMC). Retrieved
+    February 24, 2014, from http://brucelindbloom.com/Eqn_DeltaE_CMC.html
+-   :cite:`Lindbloom2011a` : Lindbloom, B. (2011). Delta E (CIE 1994).
+    Retrieved February 24, 2014, from
+    http://brucelindbloom.com/Eqn_DeltaE_CIE94.html
+-   :cite:`Luo2006b` : Luo, M. R., Cui, G., & Li, C. (2006). Uniform colour
+    spaces based on CIECAM02 colour appearance model. Color Research &
+    Application, 31(4), 320-330. doi:10.1002/col.20227
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from colour.models.cam02_ucs import COEFFICIENTS_UCS_LUO2006
+from colour.utilities import CaseInsensitiveMapping, filter_kwargs, tsplit
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'DELTA_E_SEARCH_CHUNK_SIZE', 'delta_E_pairwise', 'delta_E_nearest'
+]
+
+DELTA_E_SEARCH_CHUNK_SIZE = 2 ** 18
+"""
+Default maximum count of colour differences evaluated at once by the colour
+difference search definitions.
+
+DELTA_E_SEARCH_CHUNK_SIZE : integer
+"""
+
+_DELTA_E_SEARCH_OVERSAMPLING = 8
+"""
+Ratio of the initial count of reference colours evaluated per query colour to
+the count :math:`k` of nearest neighbours, the count is then extrapolated
+from the euclidean density of the evaluated colours until the search radius
+is reached.
+
+_DELTA_E_SEARCH_OVERSAMPLING : integer
+"""
+
+_DELTA_E_SEARCH_COUNT_MARGIN = 1
+"""
+Margin applied to the extrapolated count of reference colours evaluated per
+query colour so that the search radius is usually reached on the next
+evaluation.
+
+_DELTA_E_SEARCH_COUNT_MARGIN : numeric
+"""
+
+_DELTA_E_CIE2000_T_MAXIMUM = 1.58
+"""
+Upper bound of the *CIE 2000* hue weighting function :math:`T`, whose maximum
+is approximately 1.5725.
+
+_DELTA_E_CIE2000_T_MAXIMUM : numeric
+"""
+
+_DELTA_E_CIE2000_G_CHROMA_MAXIMUM = 6.38
+"""
+Upper bound of the *CIE 2000* chroma increase :math:`G \\bar{C}` due to the
+:math:`a'` scaling factor :math:`1 + G`, whose maximum is approximately 6.374.
+
+_DELTA_E_CIE2000_G_CHROMA_MAXIMUM : numeric
+"""
+
+_DELTA_E_CIE2000_G_CHROMA_ARGMAX = 16.597
+"""
+Mean chroma :math:`\\bar{C}` at which the *CIE 2000* chroma increase
+:math:`G \\bar{C}` is maximum, the chroma increase increasing below and
+decreasing above.
+
+_DELTA_E_CIE2000_G_CHROMA_ARGMAX : numeric
+"""
+
+_DELTA_E_CIE2000_LIGHTNESS_SCALE = 2
+"""
+Scale of the lightness axis of the *CIE L\\*a\\*b\\** colourspace in which the
+*CIE 2000* colour difference method nearest neighbours are searched: the
+lightness weighting function :math:`S_L` is usually smaller than the chroma
+weighting function :math:`S_C`, stretching the lightness axis makes the
+euclidean distance closer to the colour difference and the search radius
+tighter.
+
+_DELTA_E_CIE2000_LIGHTNESS_SCALE : numeric
+"""
+
+_DELTA_E_CIE2000_G_HUE_SHIFT_MAXIMUM = 11.54
+"""
+Upper bound in degrees of the *CIE 2000* hue shift due to the :math:`a'`
+scaling factor :math:`1 + G`, whose maximum is approximately 11.537.
+
+_DELTA_E_CIE2000_G_HUE_SHIFT_MAXIMUM : numeric
+"""
+
+_DELTA_E_CIE2000_RADIUS_ITERATIONS = 3
+"""
+Iterations count of the *CIE 2000* search radius refinement.
+
+_DELTA_E_CIE2000_RADIUS_ITERATIONS : integer
+"""
+
+
+def _search_radius(delta_E, a, b, c=1):
+    """
+    Returns the euclidean search radius :math:`\\rho` beyond which the colour
+    difference of a query colour is greater than given colour difference
+    :math:`\Delta E`, for a colour difference method bounded from below by
+    :math:`c \cdot d / max(a_i + b_i \cdot d)` at euclidean distance
+    :math:`d`.
+
+    Parameters
+    ----------
+    delta_E : array_like
+        Colour difference :math:`\Delta E` of the query colours.
+    a : array_like
+        Bound terms :math:`a_i` of the query colours stacked along the last
+        axis.
+    b : array_like
+        Bound terms :math:`b_i` stacked along the last axis.
+    c : numeric, optional
+        Bound factor :math:`c`.
+
+    Returns
+    -------
+    ndarray
+        Search radius :math:`\\rho`, infinite if the bound never reaches the
+        colour difference :math:`\Delta E`.
+    """
+
+    delta_E = np.asarray(delta_E, dtype=np.float_)[..., np.newaxis]
+    a = np.asarray(a, dtype=np.float_)
+    b = np.asarray(b, dtype=np.float_)
+
+    denominator = c - delta_E * b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = np.where(denominator > 0, delta_E * a / denominator, np.inf)
+
+    return np.max(rho, axis=-1)
+
+
+def _search_radius_CIE1976(Lab, delta_E):
+    """
+    Returns the euclidean search radius of given *CIE L\*a\*b\** colourspace
+    query array for the *CIE 1976* colour difference method.
+    """
+
+    return np.asarray(delta_E, dtype=np.float_)
+
+
+def _search_radius_CIE1994(Lab, delta_E, textiles=False):
+    """
+    Returns the euclidean search radius of given *CIE L\*a\*b\** colourspace
+    query array for the *CIE 1994* colour difference method.
+
+    The weighting functions depend only on the query colour, i.e. the
+    reference colour of the colour difference method, thus the bound is
+    independent of the euclidean distance.
+    """
+
+    k_1 = 0.048 if textiles else 0.045
+    k_2 = 0.014 if textiles else 0.015
+    k_L = 2 if textiles else 1
+
+    _L, a, b = tsplit(Lab)
+    C = np.hypot(a, b)
+
+    scale = np.stack([np.full(C.shape, k_L), 1 + k_1 * C, 1 + k_2 * C], -1)
+
+    return _search_radius(delta_E, scale, np.zeros(scale.shape))
+
+
+def _chroma_increase_CIE2000(C, rho):
+    """
+    Returns the upper bound of the *CIE 2000* chroma increase
+    :math:`G \\bar{C}` due to the :math:`a'` scaling factor :math:`1 + G` over
+    the colours within given euclidean distance :math:`\\rho` of given query
+    colours chroma :math:`C`.
+
+    The chroma increase increasing then decreasing with the mean chroma
+    :math:`\\bar{C}`, its maximum over the mean chroma interval
+    :math:`[C - \\rho / 2, C + \\rho / 2]` is reached at one of the interval
+    ends unless the interval encloses the global maximum.
+    """
+
+    def chroma_increase(C_bar):
+        """
+        Returns the *CIE 2000* chroma increase :math:`G \\bar{C}`.
+        """
+
+        C_bar_7 = C_bar ** 7
+
+        return 0.5 * (1 - np.sqrt(C_bar_7 / (C_bar_7 + 25 ** 7))) * C_bar
+
+    with np.errstate(invalid='ignore'):
+        C_m = np.maximum(C - rho / 2, 0)
+        C_M = C + rho / 2
+
+        return np.where(
+            np.logical_and(C_m <= _DELTA_E_CIE2000_G_CHROMA_ARGMAX,
+                           C_M >= _DELTA_E_CIE2000_G_CHROMA_ARGMAX),
+            _DELTA_E_CIE2000_G_CHROMA_MAXIMUM,
+            np.maximum(chroma_increase(C_m), chroma_increase(C_M)))
+
+
+def _rotation_factor_CIE2000(C, h, rho):
+    """
+    Returns the factor :math:`c` bounding from below the *CIE 2000* chroma and
+    hue differences quadratic form, i.e. the square root of its smallest
+    eigenvalue, over the colours within given euclidean distance
+    :math:`\\rho` of given query colours chroma :math:`C` and hue :math:`h`.
+
+    The rotation term :math:`R_T` is bounded by the mean chroma upper bound
+    and by the mean hue window enclosing the query colour: the mean hue being
+    the middle of the shorter arc between the hues, it is within half the hue
+    difference, and at most 90 degrees, of the query colour hue. The
+    :math:`a'` scaling factor :math:`1 + G \\leq 1.5` shifts the query colour
+    hue and increases the hue differences by a factor 1.5 at most.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        C_bar = C + rho / 2 + _chroma_increase_CIE2000(C, rho)
+        r_C = 1 / np.sqrt(1 + (25 / C_bar) ** 7)
+
+        w = np.where(rho < C, np.degrees(np.arcsin(rho / C)), 180)
+        w = _DELTA_E_CIE2000_G_HUE_SHIFT_MAXIMUM + np.minimum(1.5 * w,
+                                                              180) / 2
+
+    d_h = np.maximum(np.abs((h - 275 + 180) % 360 - 180) - w, 0)
+    delta_theta = 30 * np.exp(-(d_h / 25) ** 2)
+
+    r_T = 2 * r_C * np.sin(np.deg2rad(2 * delta_theta))
+
+    return np.sqrt(1 - r_T / 2)
+
+
+def _search_scale_CIE2000(textiles=False):
+    """
+    Returns the scale of the *CIE L\\*a\\*b\\** colourspace axes in which the
+    *CIE 2000* colour difference method nearest neighbours are searched.
+    """
+
+    k_L = 2 if textiles else 1
+
+    return np.array([_DELTA_E_CIE2000_LIGHTNESS_SCALE / k_L, 1, 1])
+
+
+def _search_radius_CIE2000(Lab, delta_E, textiles=False):
+    """
+    Returns the euclidean search radius of given *CIE L\\*a\\*b\\** colourspace
+    query array for the *CIE 2000* colour difference method, in the
+    colourspace scaled by the
+    :func:`colour.difference.search._search_scale_CIE2000` definition scale.
+
+    At scaled euclidean distance :math:`d`, the lightness difference is
+    bounded by :math:`d / s` where :math:`s` is the lightness scale, the chroma
+    and hue differences by :math:`d`, the mean lightness and chroma of the
+    colours are bounded by those of the query colour plus half these bounds,
+    the chroma and hue differences are not decreased by the :math:`a'`
+    scaling and their quadratic form is bounded from below using the rotation
+    term :math:`R_T` bound, thus conservatively enclosing the *CIE 2000*
+    colour difference in a scaled *CIE 1976* one. The rotation term and the
+    :math:`a'` scaling chroma increase bounds decreasing with the euclidean
+    distance, the radius is refined iteratively from the one using the global
+    :math:`|R_T| \\leq \\sqrt{3}` and chroma increase bounds.
+    """
+
+    k_L = 2 if textiles else 1
+    s = _search_scale_CIE2000(textiles)[0]
+
+    L, a, b = tsplit(Lab)
+    C = np.hypot(a, b)
+    h = np.degrees(np.arctan2(b, a)) % 360
+    L = np.abs(L - 50)
+
+    def terms(C_m):
+        """
+        Returns the bound terms for given mean chroma upper bound offset.
+        """
+
+        C_m = C + C_m
+        terms_a = np.stack([
+            s * k_L * (1 + 0.015 * L), 1 + 0.045 * C_m,
+            1 + 0.015 * _DELTA_E_CIE2000_T_MAXIMUM * C_m
+        ], -1)
+        terms_b = np.array([
+            k_L * 0.015 / 2, 0.045 / 2, 0.015 * _DELTA_E_CIE2000_T_MAXIMUM / 2
+        ])
+
+        return terms_a, terms_b
+
+    rho = _search_radius(delta_E, *terms(_DELTA_E_CIE2000_G_CHROMA_MAXIMUM),
+                         c=np.sqrt(1 - np.sqrt(3) / 2))
+    for _ in range(_DELTA_E_CIE2000_RADIUS_ITERATIONS):
+        rho = np.minimum(
+            rho,
+            _search_radius(
+                delta_E,
+                *terms(_chroma_increase_CIE2000(C, rho)),
+                c=_rotation_factor_CIE2000(C, h, rho)[..., None]))
+
+    return rho
+
+
+def _search_radius_CMC(Lab, delta_E, l=2, c=1):  # noqa
+    """
+    Returns the euclidean search radius of given *CIE L\*a\*b\** colourspace
+    query array for the *Colour Measurement Committee* colour difference
+    method.
+
+    The weighting functions depend only on the query colour, i.e. the
+    reference colour of the colour difference method, thus the bound is
+    independent of the euclidean distance.
+    """
+
+    L, a, b = tsplit(Lab)
+    C = np.hypot(a, b)
+
+    s_l = np.where(L < 16, 0.511, (0.040975 * L) / (1 + 0.01765 * L))
+    s_c = 0.0638 * C / (1 + 0.0131 * C) + 0.638
+    h = np.degrees(np.arctan2(b, a)) % 360
+
+    t = np.where(
+        np.logical_and(h >= 164, h <= 345),
+        0.56 + np.fabs(0.2 * np.cos(np.deg2rad(h + 168))),
+        0.36 + np.fabs(0.4 * np.cos(np.deg2rad(h + 35))))
+
+    C_4 = C * C * C * C
+    f = np.sqrt(C_4 / (C_4 + 1900))
+    s_h = s_c * (f * t + 1 - f)
+
+    scale = np.stack([l * s_l, c * s_c, s_h], -1)
+
+    return _search_radius(delta_E, scale, np.zeros(scale.shape))
+
+
+def _search_radius_Luo2006(Jpapbp, delta_E, coefficients):
+    """
+    Returns the euclidean search radius of given :math:`J'a'b'` colourspace
+    query array for the *Luo et alii (2006)* colour difference methods.
+    """
+
+    K_L = coefficients.K_L
+
+    return np.asarray(delta_E, dtype=np.float_) * max(K_L, 1)
+
+
+def _search_radius_CAM02LCD(Jpapbp, delta_E):
+    """
+    Returns the euclidean search radius of given :math:`J'a'b'` colourspace
+    query array for the *CAM02-LCD* colour difference method.
+    """
+
+    return _search_radius_Luo2006(Jpapbp, delta_E,
+                                  COEFFICIENTS_UCS_LUO2006['CAM02-LCD'])
+
+
+def _search_radius_CAM02SCD(Jpapbp, delta_E):
+    """
+    Returns the euclidean search radius of given :math:`J'a'b'` colourspace
+    query array for the *CAM02-SCD* colour difference method.
+    """
+
+    return _search_radius_Luo2006(Jpapbp, delta_E,
+                                  COEFFICIENTS_UCS_LUO2006['CAM02-SCD'])
+
+
+def _search_radius_CAM02UCS(Jpapbp, delta_E):
+    """
+    Returns the euclidean search radius of given :math:`J'a'b'` colourspace
+    query array for the *CAM02-UCS* colour difference method.
+    """
+
+    return _search_radius_Luo2006(Jpapbp, delta_E,
+                                  COEFFICIENTS_UCS_LUO2006['CAM02-UCS'])
+
+
+_DELTA_E_SEARCH_RADIUS_METHODS = CaseInsensitiveMapping({
+    'CIE 1976':
+        _search_radius_CIE1976,
+    'CIE 1994':
+        _search_radius_CIE1994,
+    'CIE 2000':
+        _search_radius_CIE2000,
+    'CMC':
+        _search_radius_CMC,
+    'CAM02-LCD':
+        _search_radius_CAM02LCD,
+    'CAM02-SCD':
+        _search_radius_CAM02SCD,
+    'CAM02-UCS':
+        _search_radius_CAM02UCS,
+})
+"""
+Euclidean search radius computation methods of the colour difference methods
+supporting pruning.
+
+_DELTA_E_SEARCH_RADIUS_METHODS : CaseInsensitiveMapping
+"""
+_DELTA_E_SEARCH_RADIUS_METHODS['CAM16-LCD'] = (
+    _DELTA_E_SEARCH_RADIUS_METHODS['CAM02-LCD'])
+_DELTA_E_SEARCH_RADIUS_METHODS['CAM16-SCD'] = (
+    _DELTA_E_SEARCH_RADIUS_METHODS['CAM02-SCD'])
+_DELTA_E_SEARCH_RADIUS_METHODS['CAM16-UCS'] = (
+    _DELTA_E_SEARCH_RADIUS_METHODS['CAM02-UCS'])
+_DELTA_E_SEARCH_RADIUS_METHODS['cie1976'] = (
+    _DELTA_E_SEARCH_RADIUS_METHODS['CIE 1976'])
+_DELTA_E_SEARCH_RADIUS_METHODS['cie1994'] = (
+    _DELTA_E_SEARCH_RADIUS_METHODS['CIE 1994'])
+_DELTA_E_SEARCH_RADIUS_METHODS['cie2000'] = (
+    _DELTA_E_SEARCH_RADIUS_METHODS['CIE 2000'])
+
+_DELTA_E_SEARCH_SCALE_METHODS = CaseInsensitiveMapping({
+    'CIE 2000': _search_scale_CIE2000
+})
+"""
+Colourspace axes scale computation methods of the colour difference methods
+whose nearest neighbours are searched in a scaled colourspace, the other ones
+are searched in the unscaled colourspace.
+
+_DELTA_E_SEARCH_SCALE_METHODS : CaseInsensitiveMapping
+"""
+_DELTA_E_SEARCH_SCALE_METHODS['cie2000'] = (
+    _DELTA_E_SEARCH_SCALE_METHODS['CIE 2000'])
+
+
+def _k_smallest(delta_E, k):
+    """
+    Returns the :math:`k` smallest colour differences along the last axis of
+    given 2-dimensional colour differences array and their indexes, sorted by
+    increasing colour difference.
+    """
+
+    rows = np.arange(delta_E.shape[0])[:, np.newaxis]
+
+    if k < delta_E.shape[-1]:
+        indexes = np.argpartition(delta_E, k - 1, axis=-1)[:, :k]
+    else:
+        indexes = np.tile(np.arange(delta_E.shape[-1]), (delta_E.shape[0], 1))
+
+    indexes = indexes[rows, np.argsort(delta_E[rows, indexes], axis=-1)]
+
+    return delta_E[rows, indexes], indexes
+
+
+def _search_count(count, distance, rho, M):
+    """
+    Returns the count of euclidean nearest neighbours to evaluate for the
+    query colours whose search radius :math:`\\rho` has not been reached by
+    the given count of nearest neighbours, the farthest one being at given
+    euclidean distance.
+
+    The count is extrapolated from the euclidean density of the nearest
+    neighbours, i.e. proportionally to the volume of the ball of radius
+    :math:`\\rho`, increased by a factor :math:`\\sqrt{2}` at least and
+    rounded up to a power of :math:`\\sqrt[4]{2}` times the given count so
+    that the query colours are processed in few groups.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        ratio = np.where(distance > 0, _DELTA_E_SEARCH_COUNT_MARGIN *
+                         (rho / distance) ** 3, 2)
+        ratio = 2 ** (np.ceil(4 * np.log2(np.maximum(ratio, np.sqrt(2)))) / 4)
+
+    return np.where(count * ratio < M, np.ceil(count * ratio),
+                    M).astype(np.int_)
+
+
+def delta_E_pairwise(a,
+                     b,
+                     method='CIE 2000',
+                     chunk_size=DELTA_E_SEARCH_CHUNK_SIZE,
+                     **kwargs):
+    """
+    Returns the colour differences :math:`\Delta E_{ab}` between every pair of
+    given *CIE L\*a\*b\** or :math:`J'a'b'` colourspace arrays using given
+    method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`a`, the
+        reference colours of the colour difference method.
+    b : array_like
+        *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`b`, the
+        sample colours of the colour difference method.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    chunk_size : integer, optional
+        Maximum count of colour differences evaluated at once.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`colour.delta_E` definition.
+
+    Returns
+    -------
+    ndarray
+        Colour differences :math:`\Delta E_{ab}` array of shape
+        ``a.shape[:-1] + b.shape[:-1]``.
+
+    Examples
+    --------
+    >>> a = np.array([[60.25740000, -34.00990000, 36.26770000],
+    ...               [63.01090000, -31.09610000, -5.86630000]])
+    >>> b = np.array([[60.46260000, -34.17510000, 39.43870000],
+    ...               [62.81870000, -29.79460000, -4.08640000],
+    ...               [61.29010000, 3.71960000, -5.39010000]])
+    >>> delta_E_pairwise(a, b)  # doctest: +ELLIPSIS
+    array([[  1.2644200...,  21.5154051...,  30.0911616...],
+           [ 23.8143817...,   1.2629593...,  29.3303279...]])
+    """
+
+    from colour.difference import DELTA_E_METHODS
+
+    function = DELTA_E_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+
+    a = np.asarray(a, dtype=np.float_)
+    b = np.asarray(b, dtype=np.float_)
+
+    shape = a.shape[:-1] + b.shape[:-1]
+
+    a = np.reshape(a, (-1, a.shape[-1]))
+    b = np.reshape(b, (-1, b.shape[-1]))
+
+    delta_E = np.empty((a.shape[0], b.shape[0]))
+    rows = max(1, chunk_size // max(1, b.shape[0]))
+    for i in range(0, a.shape[0], rows):
+        delta_E[i:i + rows] = function(a[i:i + rows, np.newaxis, :],
+                                       b[np.newaxis, ...], **kwargs)
+
+    return np.reshape(delta_E, shape)
+
+
+def delta_E_nearest(a,
+                    b,
+                    k=1,
+                    method='CIE 2000',
+                    chunk_size=DELTA_E_SEARCH_CHUNK_SIZE,
+                    **kwargs):
+    """
+    Returns the :math:`k` nearest colours of given *CIE L\*a\*b\** or
+    :math:`J'a'b'` colourspace array :math:`b` of each colour of given
+    *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`a` according
+    to the colour difference :math:`\Delta E_{ab}` computed with given method.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`a`, the
+        query colours, i.e. the reference colours of the colour difference
+        method.
+    b : array_like
+        *CIE L\*a\*b\** or :math:`J'a'b'` colourspace array :math:`b`, the
+        searched colours, e.g. a palette, i.e. the sample colours of the
+        colour difference method.
+    k : integer, optional
+        Count of nearest neighbours to return.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    chunk_size : integer, optional
+        Maximum count of colour differences evaluated at once.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`colour.delta_E` definition.
+
+    Returns
+    -------
+    tuple
+        Colour differences :math:`\Delta E_{ab}` of the nearest neighbours
+        sorted by increasing colour difference and their indexes in the
+        flattened colourspace array :math:`b`, both of shape
+        ``a.shape[:-1] + (k, )``.
+
+    Raises
+    ------
+    ValueError
+        If the count of nearest neighbours :math:`k` is not in domain
+        [1, ``b.size // 3``].
+
+    Notes
+    -----
+    -   The colour differences are only evaluated for the colours of array
+        :math:`b` within the euclidean search radius of each query colour,
+        the count of initial candidates, i.e. the euclidean nearest
+        neighbours, is extrapolated from their euclidean density until the
+        search radius is reached.
+    -   The *CIE 2000* method search radius bounds conservatively the
+        rotation term :math:`R_T` which is only significant for blue colours
+        but whose hue window grows with the colour difference: the pruning is
+        efficient for the nearest neighbours within a few units of colour
+        difference but weakens for large :math:`k` values or sparse colours
+        of array :math:`b`, e.g. with :math:`k = 32` nearest neighbours among
+        20000 uniformly distributed *sRGB* colours, the colour differences
+        are still evaluated for about 13% of the colours of array :math:`b`.
+    -   The *DIN99* method is not pruned, the colour differences are
+        evaluated for all the colours of array :math:`b`.
+    -   Ties in colour difference are resolved arbitrarily.
+    -   The non-finite colours of array :math:`b` are ignored, the nearest
+        neighbours that cannot be found, e.g. for non-finite query colours,
+        have *nan* colour differences and indexes equal to the colours count
+        of array :math:`b`.
+
+    References
+    ----------
+    -   :cite:`Lindbloom2009e`
+    -   :cite:`Lindbloom2009f`
+    -   :cite:`Lindbloom2011a`
+    -   :cite:`Luo2006b`
+
+    Examples
+    --------
+    >>> a = np.array([[60.25740000, -34.00990000, 36.26770000],
+    ...               [63.01090000, -31.09610000, -5.86630000]])
+    >>> b = np.array([[60.46260000, -34.17510000, 39.43870000],
+    ...               [62.81870000, -29.79460000, -4.08640000],
+    ...               [61.29010000, 3.71960000, -5.39010000]])
+    >>> delta_E, indexes = delta_E_nearest(a, b, k=2)
+    >>> delta_E  # doctest: +ELLIPSIS
+    array([[  1.2644200...,  21.5154051...],
+           [  1.2629593...,  23.8143817...]])
+    >>> indexes
+    array([[0, 1],
+           [1, 0]])
+    """
+
+    from colour.difference import DELTA_E_METHODS
+
+    function = DELTA_E_METHODS[method]
+    radius = _DELTA_E_SEARCH_RADIUS_METHODS.get(method)
+
+    a = np.asarray(a, dtype=np.float_)
+    b = np.asarray(b, dtype=np.float_)
+
+    shape = a.shape[:-1] + (k, )
+
+    a = np.reshape(a, (-1, a.shape[-1]))
+    b = np.reshape(b, (-1, b.shape[-1]))
+
+    M = b.shape[0]
+    if not 1 <= k <= M:
+        raise ValueError(
+            '"k" must be in domain [1, {0}]!'.format(M))
+
+    delta_E = np.full((a.shape[0], k), np.nan)
+    indexes = np.full((a.shape[0], k), M, dtype=np.int_)
+
+    finite_a = np.all(np.isfinite(a), axis=-1)
+    finite_b = np.all(np.isfinite(b), axis=-1)
+
+    if radius is None:
+        rows = max(1, chunk_size // M)
+        for i in range(0, a.shape[0], rows):
+            delta_E_p = delta_E_pairwise(a[i:i + rows], b, method, chunk_size,
+                                         **kwargs)
+            delta_E_p[~finite_a[i:i + rows]] = np.nan
+            delta_E_p[:, ~finite_b] = np.nan
+            delta_E[i:i + rows], indexes[i:i + rows] = _k_smallest(
+                delta_E_p, k)
+
+        indexes[np.isnan(delta_E)] = M
+
+        return np.reshape(delta_E, shape), np.reshape(indexes, shape)
+
+    radius_kwargs = filter_kwargs(radius, **kwargs)
+    scale = _DELTA_E_SEARCH_SCALE_METHODS.get(method)
+    scale = (np.ones(a.shape[-1])
+             if scale is None else scale(**filter_kwargs(scale, **kwargs)))
+    kwargs = filter_kwargs(function, **kwargs)
+
+    mapping = np.where(finite_b)[0]
+    b = b[finite_b]
+    M_f = b.shape[0]
+    k_f = min(k, M_f)
+    if k_f == 0:
+        return np.reshape(delta_E, shape), np.reshape(indexes, shape)
+
+    tree = cKDTree(b * scale)
+
+    pending = np.where(finite_a)[0]
+    counts = np.full(pending.shape,
+                     min(M_f, k_f * _DELTA_E_SEARCH_OVERSAMPLING))
+    while pending.size:
+        done = np.empty(pending.shape, dtype=bool)
+        counts_n = np.empty(pending.shape, dtype=np.int_)
+        for count in np.unique(counts):
+            group = np.where(counts == count)[0]
+            rows = max(1, chunk_size // count)
+            for i in range(0, group.size, rows):
+                group_r = group[i:i + rows]
+                query = pending[group_r]
+
+                distance, candidates = tree.query(a[query] * scale, count)
+                distance = np.reshape(distance, (query.size, count))
+                candidates = np.reshape(candidates, (query.size, count))
+
+                delta_E_c, indexes_c = _k_smallest(
+                    function(a[query][:, np.newaxis, :], b[candidates],
+                             **kwargs), k_f)
+
+                delta_E[query, :k_f] = delta_E_c
+                indexes[query, :k_f] = mapping[candidates[
+                    np.arange(query.size)[:, np.newaxis], indexes_c]]
+
+                if count == M_f:
+                    done[group_r] = True
+                else:
+                    rho = radius(a[query], delta_E_c[:, -1], **radius_kwargs)
+                    done[group_r] = distance[:, -1] >= rho
+                    counts_n[group_r] = _search_count(
+                        count, distance[:, -1], rho, M_f)
+
+        pending = pending[~done]
+        counts = counts_n[~done]
+
+    return np.reshape(delta_E, shape), np.reshape(indexes, shape)
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.search` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from itertools import permutations
+
+try:
+    from unittest import mock
+except ImportError:  # pragma: no cover
+    import mock
+
+from colour.difference import (DELTA_E_METHODS, delta_E, delta_E_nearest,
+                               delta_E_pairwise)
+from colour.models import XYZ_to_Lab, sRGB_to_XYZ
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestDelta_E_pairwise', 'TestDelta_E_nearest']
+
+
+class TestDelta_E_pairwise(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.search.delta_E_pairwise` definition unit
+    tests methods.
+    """
+
+    def test_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_pairwise` definition.
+        """
+
+        prng = np.random.RandomState(4)
+        a = XYZ_to_Lab(sRGB_to_XYZ(prng.uniform(0, 1, (7, 3))))
+        b = XYZ_to_Lab(sRGB_to_XYZ(prng.uniform(0, 1, (11, 3))))
+
+        for method in ('CIE 2000', 'CIE 1976', 'CMC', 'DIN99'):
+            for chunk_size in (1, 16, 1024):
+                np.testing.assert_almost_equal(
+                    delta_E_pairwise(a, b, method, chunk_size),
+                    delta_E(a[:, np.newaxis], b[np.newaxis], method),
+                    decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(a, b, textiles=True),
+            delta_E(a[:, np.newaxis], b[np.newaxis], textiles=True),
+            decimal=7)
+
+    def test_n_dimensional_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_pairwise` definition
+        n-dimensional arrays support.
+        """
+
+        prng = np.random.RandomState(4)
+        a = XYZ_to_Lab(sRGB_to_XYZ(prng.uniform(0, 1, (6, 3))))
+        b = XYZ_to_Lab(sRGB_to_XYZ(prng.uniform(0, 1, (4, 3))))
+        delta_E_p = delta_E_pairwise(a, b)
+
+        a = np.reshape(a, (2, 3, 3))
+        b = np.reshape(b, (2, 2, 3))
+        delta_E_p = np.reshape(delta_E_p, (2, 3, 2, 2))
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(a, b), delta_E_p, decimal=7)
+
+        a = a[0, 0]
+        delta_E_p = delta_E_p[0, 0]
+        np.testing.assert_almost_equal(
+            delta_E_pairwise(a, b), delta_E_p, decimal=7)
+
+
+class TestDelta_E_nearest(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.search.delta_E_nearest` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        prng = np.random.RandomState(4)
+
+        self._a = XYZ_to_Lab(sRGB_to_XYZ(prng.uniform(0, 1, (64, 3))))
+        self._a[:4] = np.array([
+            [50.00000000, 0.00000000, 0.00000000],
+            [32.30258667, 79.19666179, -107.86368104],
+            [0.00000000, 0.00000000, 0.00000000],
+            [100.00000000, 0.00000000, 0.00000000],
+        ])
+        self._b = XYZ_to_Lab(sRGB_to_XYZ(prng.uniform(0, 1, (512, 3))))
+
+    def test_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_nearest` definition.
+        """
+
+        for method in sorted(DELTA_E_METHODS.keys()):
+            delta_E_p = np.sort(
+                delta_E_pairwise(self._a, self._b, method), axis=-1)
+            for k in (1, 3, 512):
+                delta_E_n, indexes = delta_E_nearest(self._a, self._b, k,
+                                                     method)
+
+                np.testing.assert_almost_equal(
+                    delta_E_n, delta_E_p[:, :k], decimal=7)
+                np.testing.assert_almost_equal(
+                    delta_E(self._a[:, np.newaxis], self._b[indexes], method),
+                    delta_E_n,
+                    decimal=7)
+
+        for kwargs in ({'textiles': True}, {'l': 1, 'c': 1}):
+            for method in ('CIE 2000', 'CIE 1994', 'CMC'):
+                delta_E_p = np.sort(
+                    delta_E_pairwise(self._a, self._b, method, **kwargs),
+                    axis=-1)
+                delta_E_n, _indexes = delta_E_nearest(
+                    self._a, self._b, 2, method, chunk_size=64, **kwargs)
+
+                np.testing.assert_almost_equal(
+                    delta_E_n, delta_E_p[:, :2], decimal=7)
+
+    def test_clustered_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_nearest` definition with
+        clustered colours.
+        """
+
+        prng = np.random.RandomState(4)
+        b = np.repeat(self._b[:8], 32, axis=0)
+        b += prng.normal(0, 0.25, b.shape)
+
+        delta_E_p = np.sort(delta_E_pairwise(self._a, b), axis=-1)
+        delta_E_n, _indexes = delta_E_nearest(self._a, b, 5, chunk_size=256)
+
+        np.testing.assert_almost_equal(delta_E_n, delta_E_p[:, :5], decimal=7)
+
+        b = np.repeat(self._b[:8], 32, axis=0)
+
+        delta_E_p = np.sort(delta_E_pairwise(self._a, b), axis=-1)
+        delta_E_n, indexes = delta_E_nearest(self._a, b, 40)
+
+        np.testing.assert_almost_equal(delta_E_n, delta_E_p[:, :40], decimal=7)
+        for indexes_r in indexes:
+            self.assertEqual(np.unique(indexes_r).size, 40)
+
+    def test_pruning_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_nearest` definition
+        pruning of the *CIE 2000* colour differences evaluations.
+        """
+
+        prng = np.random.RandomState(4)
+        b = XYZ_to_Lab(sRGB_to_XYZ(prng.uniform(0, 1, (4096, 3))))
+
+        function = DELTA_E_METHODS['CIE 2000']
+        for k, ratio in ((1, 0.05), (16, 0.5)):
+            delta_E_m = mock.MagicMock(side_effect=function)
+            with mock.patch.dict(DELTA_E_METHODS, {'CIE 2000': delta_E_m}):
+                delta_E_n, _indexes = delta_E_nearest(self._a, b, k)
+
+            evaluations = sum(
+                np.broadcast(args[0][..., 0], args[1][..., 0]).size
+                for args, _kwargs in delta_E_m.call_args_list)
+            self.assertLess(evaluations, ratio * self._a.shape[0] * 4096)
+
+            np.testing.assert_almost_equal(
+                delta_E_n,
+                np.sort(delta_E_pairwise(self._a, b), axis=-1)[:, :k],
+                decimal=7)
+
+    def test_n_dimensional_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_nearest` definition
+        n-dimensional arrays support.
+        """
+
+        a = self._a[:6]
+        delta_E_n, indexes = delta_E_nearest(a, self._b, 2)
+
+        a = np.reshape(a, (2, 3, 3))
+        delta_E_n = np.reshape(delta_E_n, (2, 3, 2))
+        indexes = np.reshape(indexes, (2, 3, 2))
+        b = np.reshape(self._b, (16, 32, 3))
+        delta_E_t, indexes_t = delta_E_nearest(a, b, 2)
+        np.testing.assert_almost_equal(delta_E_t, delta_E_n, decimal=7)
+        np.testing.assert_equal(indexes_t, indexes)
+
+        a = a[0, 0]
+        delta_E_t, indexes_t = delta_E_nearest(a, b, 2)
+        np.testing.assert_almost_equal(delta_E_t, delta_E_n[0, 0], decimal=7)
+        np.testing.assert_equal(indexes_t, indexes[0, 0])
+
+    def test_raise_exception_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_nearest` definition
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, delta_E_nearest, self._a, self._b, 0)
+        self.assertRaises(ValueError, delta_E_nearest, self._a, self._b, 513)
+
+    @ignore_numpy_errors
+    def test_nan_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.search.delta_E_nearest` definition nan
+        support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        finite = np.all(np.isfinite(cases), axis=-1)
+
+        b = np.vstack([self._b[:16], cases])
+        finite_b = np.hstack([np.ones(16, dtype=bool), finite])
+        for method in ('CIE 2000', 'CIE 1976', 'CAM02-UCS', 'DIN99'):
+            delta_E_n, indexes = delta_E_nearest(cases, b, 3, method)
+
+            self.assertTrue(np.all(np.isnan(delta_E_n[~finite])))
+            np.testing.assert_equal(indexes[~finite], b.shape[0])
+            self.assertTrue(np.all(indexes[finite] < b.shape[0]))
+            self.assertTrue(np.all(finite_b[indexes[finite]]))
+
+            delta_E_n, indexes = delta_E_nearest(self._a, b, 3, method)
+            delta_E_p = np.sort(
+                delta_E_pairwise(self._a, b[finite_b], method), axis=-1)
+            np.testing.assert_almost_equal(
+                delta_E_n, delta_E_p[:, :3], decimal=7)
+
+        b = np.vstack([self._b[:2], cases[~finite]])
+        delta_E_n, indexes = delta_E_nearest(self._a, b, 3)
+        self.assertTrue(np.all(np.isnan(delta_E_n[:, 2])))
+        np.testing.assert_equal(indexes[:, 2], b.shape[0])
+        np.testing.assert_equal(np.sort(indexes[:, :2], axis=-1), [[0, 1]] *
+                                self._a.shape[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,6 +32,9 @@ from .dataset import *  # noqa
 from . import dataset
 from .rgb import *  # noqa
 from . import rgb
+from .ucs_lut import (UCS_LUT3D_SIZE, UCS_LUT3D_SHAPER_EXPONENT,
+                      UCS_LUT3D_UCS_DOMAIN, UCS_LUT3D_Error, UCS_LUT3D,
+                      UCS_LUT3D_from_viewing_conditions)
 
 __all__ = [
     'JMh_CIECAM02_to_CAM02LCD', 'CAM02LCD_to_JMh_CIECAM02',
@@ -72,3 +75,7 @@ __all__ += [
 ]
 __all__ += dataset.__all__
 __all__ += rgb.__all__
+__all__ += [
+    'UCS_LUT3D_SIZE', 'UCS_LUT3D_SHAPER_EXPONENT', 'UCS_LUT3D_UCS_DOMAIN',
+    'UCS_LUT3D_Error', 'UCS_LUT3D', 'UCS_LUT3D_from_viewing_conditions'
+]
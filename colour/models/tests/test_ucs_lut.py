@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.ucs_lut` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from itertools import permutations
+
+from colour.appearance import (CIECAM02_Specification,
+                               CAM16_viewing_conditions_model,
+                               CIECAM02_viewing_conditions_model)
+from colour.models import (JMh_CAM16_to_CAM16UCS, JMh_CIECAM02_to_CAM02UCS,
+                           JMh_CIECAM02_to_CAM02SCD, CAM02UCS_to_JMh_CIECAM02,
+                           UCS_LUT3D_from_viewing_conditions)
+from colour.utilities import (dot_vector, ignore_numpy_errors, tsplit,
+                              tstack)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XYZ_W', 'XYZ_SAMPLES', 'TestUCS_LUT3D_from_viewing_conditions',
+           'TestUCS_LUT3D']
+
+XYZ_W = np.array([95.05, 100.00, 108.88])
+
+XYZ_SAMPLES = np.array([
+    [19.01, 20.00, 21.78],
+    [57.06, 43.06, 31.96],
+    [3.53, 6.56, 2.14],
+    [12.17, 20.51, 9.99],
+    [41.24, 21.26, 1.93],
+    [35.76, 71.52, 11.92],
+    [18.05, 7.22, 95.05],
+])
+
+
+class TestUCS_LUT3D_from_viewing_conditions(unittest.TestCase):
+    """
+    Defines :func:`colour.models.ucs_lut.UCS_LUT3D_from_viewing_conditions`
+    definition unit tests methods.
+    """
+
+    def test_UCS_LUT3D_from_viewing_conditions(self):
+        """
+        Tests :func:`colour.models.ucs_lut.UCS_LUT3D_from_viewing_conditions`
+        definition.
+        """
+
+        LUT = UCS_LUT3D_from_viewing_conditions(
+            XYZ_W, 318.31, 20.0, size=17)
+
+        self.assertEqual(LUT.table.shape, (17, 17, 17, 3))
+        self.assertEqual(LUT.table_reverse.shape, (17, 17, 17, 3))
+        self.assertTrue(np.all(np.isfinite(LUT.table)))
+        self.assertTrue(np.all(np.isfinite(LUT.table_reverse)))
+        self.assertFalse(LUT.table.flags.writeable)
+
+        self.assertIs(
+            UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0, size=17),
+            LUT)
+        self.assertIsNot(
+            UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0, size=9),
+            LUT)
+
+        self.assertRaises(ValueError, UCS_LUT3D_from_viewing_conditions,
+                          XYZ_W, 318.31, 20.0, space='CAM97-UCS')
+
+    def test_error_UCS_LUT3D_from_viewing_conditions(self):
+        """
+        Tests :func:`colour.models.ucs_lut.UCS_LUT3D_from_viewing_conditions`
+        definition error quantification.
+        """
+
+        errors = [
+            UCS_LUT3D_from_viewing_conditions(
+                XYZ_W, 318.31, 20.0, size=size).error for size in (9, 17, 33)
+        ]
+
+        for error in errors:
+            self.assertGreater(error.samples, 0)
+            self.assertLessEqual(error.mean, error.percentile_99)
+            self.assertLessEqual(error.percentile_99, error.maximum)
+
+        self.assertGreater(errors[0].mean, errors[1].mean)
+        self.assertGreater(errors[1].mean, errors[2].mean)
+
+    def test_error_limits_UCS_LUT3D_from_viewing_conditions(self):
+        """
+        Tests :func:`colour.models.ucs_lut.UCS_LUT3D_from_viewing_conditions`
+        definition error limits across the default domains.
+        """
+
+        prng = np.random.RandomState(4)
+        model = CIECAM02_viewing_conditions_model(XYZ_W, 318.31, 20.0)
+
+        for space in ('CAM02-UCS', 'CAM16-UCS'):
+            LUT = UCS_LUT3D_from_viewing_conditions(
+                XYZ_W, 318.31, 20.0, space=space)
+
+            self.assertLess(LUT.error.mean, 0.1)
+            self.assertLess(LUT.error.maximum, 2.5)
+            self.assertLess(LUT.error_reverse.mean, 0.05)
+            self.assertLess(LUT.error_reverse.maximum, 1)
+
+        LUT = UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0)
+
+        RGB = prng.uniform(0, 1, (50000, 3)) ** 3 * LUT.RGB_w
+        XYZ = dot_vector(np.linalg.inv(LUT.XYZ_to_RGB_matrix), RGB)
+        specification = model.forward(XYZ)
+        Jpapbp = JMh_CIECAM02_to_CAM02UCS(
+            tstack((specification.J, specification.M, specification.h)))
+        self.assertLess(
+            np.max(np.linalg.norm(LUT.forward(XYZ) - Jpapbp, axis=-1)), 2.5)
+
+        domain_m, domain_M = LUT.UCS_domain
+        Jpapbp = domain_m + prng.uniform(0, 1, (50000, 3)) * (
+            domain_M - domain_m)
+        J, M, h = tsplit(CAM02UCS_to_JMh_CIECAM02(Jpapbp))
+        with np.errstate(invalid='ignore'):
+            RGB = dot_vector(
+                LUT.XYZ_to_RGB_matrix,
+                model.reverse(
+                    CIECAM02_Specification(J, None, h, None, None, M, None,
+                                           None)))
+            within = np.all(
+                np.logical_and(RGB >= 0, RGB <= LUT.RGB_w), axis=-1)
+        Jpapbp = Jpapbp[within]
+        specification = model.forward(LUT.reverse(Jpapbp))
+        self.assertLess(
+            np.max(
+                np.linalg.norm(
+                    JMh_CIECAM02_to_CAM02UCS(
+                        tstack((specification.J, specification.M,
+                                specification.h))) - Jpapbp,
+                    axis=-1)), 1)
+
+
+class TestUCS_LUT3D(unittest.TestCase):
+    """
+    Defines :class:`colour.models.ucs_lut.UCS_LUT3D` class unit tests
+    methods.
+    """
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.models.ucs_lut.UCS_LUT3D.forward` method.
+        """
+
+        model = CIECAM02_viewing_conditions_model(XYZ_W, 318.31, 20.0)
+        specification = model.forward(XYZ_SAMPLES)
+        Jpapbp = JMh_CIECAM02_to_CAM02UCS(
+            tstack((specification.J, specification.M, specification.h)))
+
+        LUT = UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0, size=33)
+        np.testing.assert_allclose(
+            LUT.forward(XYZ_SAMPLES), Jpapbp, atol=1.5)
+
+        LUT = UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0)
+        np.testing.assert_allclose(
+            LUT.forward(XYZ_SAMPLES), Jpapbp, atol=0.5)
+
+        specification = model.forward(XYZ_SAMPLES)
+        np.testing.assert_allclose(
+            UCS_LUT3D_from_viewing_conditions(
+                XYZ_W, 318.31, 20.0, space='CAM02-SCD').forward(XYZ_SAMPLES),
+            JMh_CIECAM02_to_CAM02SCD(
+                tstack((specification.J, specification.M, specification.h))),
+            atol=0.5)
+
+        model = CAM16_viewing_conditions_model(XYZ_W, 318.31, 20.0)
+        specification = model.forward(XYZ_SAMPLES)
+        np.testing.assert_allclose(
+            UCS_LUT3D_from_viewing_conditions(
+                XYZ_W, 318.31, 20.0, space='CAM16-UCS').forward(XYZ_SAMPLES),
+            JMh_CAM16_to_CAM16UCS(
+                tstack((specification.J, specification.M, specification.h))),
+            atol=0.5)
+
+    def test_reverse(self):
+        """
+        Tests :meth:`colour.models.ucs_lut.UCS_LUT3D.reverse` method.
+        """
+
+        model = CIECAM02_viewing_conditions_model(XYZ_W, 318.31, 20.0)
+        specification = model.forward(XYZ_SAMPLES)
+        Jpapbp = JMh_CIECAM02_to_CAM02UCS(
+            tstack((specification.J, specification.M, specification.h)))
+
+        LUT = UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0)
+        XYZ = LUT.reverse(Jpapbp)
+        np.testing.assert_allclose(XYZ, XYZ_SAMPLES, atol=0.5)
+
+        specification = model.forward(XYZ)
+        np.testing.assert_allclose(
+            JMh_CIECAM02_to_CAM02UCS(
+                tstack((specification.J, specification.M, specification.h))),
+            Jpapbp,
+            atol=0.5)
+
+        J, M, h = tsplit(CAM02UCS_to_JMh_CIECAM02(Jpapbp))
+        np.testing.assert_allclose(
+            XYZ,
+            model.reverse(
+                CIECAM02_Specification(J, None, h, None, None, M, None, None)),
+            atol=0.5)
+
+        model = CAM16_viewing_conditions_model(XYZ_W, 318.31, 20.0)
+        specification = model.forward(XYZ_SAMPLES)
+        Jpapbp = JMh_CAM16_to_CAM16UCS(
+            tstack((specification.J, specification.M, specification.h)))
+        np.testing.assert_allclose(
+            UCS_LUT3D_from_viewing_conditions(
+                XYZ_W, 318.31, 20.0, space='CAM16-UCS').reverse(Jpapbp),
+            XYZ_SAMPLES,
+            atol=1)
+
+    def test_n_dimensional_UCS_LUT3D(self):
+        """
+        Tests :class:`colour.models.ucs_lut.UCS_LUT3D` class n-dimensions
+        support.
+        """
+
+        LUT = UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0, size=17)
+
+        XYZ = XYZ_SAMPLES[0]
+        Jpapbp = LUT.forward(XYZ)
+        XYZ_r = LUT.reverse(Jpapbp)
+
+        XYZ = np.tile(XYZ, (6, 1))
+        Jpapbp = np.tile(Jpapbp, (6, 1))
+        XYZ_r = np.tile(XYZ_r, (6, 1))
+        np.testing.assert_almost_equal(LUT.forward(XYZ), Jpapbp, decimal=7)
+        np.testing.assert_almost_equal(LUT.reverse(Jpapbp), XYZ_r, decimal=7)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        Jpapbp = np.reshape(Jpapbp, (2, 3, 3))
+        XYZ_r = np.reshape(XYZ_r, (2, 3, 3))
+        np.testing.assert_almost_equal(LUT.forward(XYZ), Jpapbp, decimal=7)
+        np.testing.assert_almost_equal(LUT.reverse(Jpapbp), XYZ_r, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_UCS_LUT3D(self):
+        """
+        Tests :class:`colour.models.ucs_lut.UCS_LUT3D` class nan support.
+        """
+
+        LUT = UCS_LUT3D_from_viewing_conditions(XYZ_W, 318.31, 20.0, size=9)
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        LUT.forward(cases)
+        LUT.reverse(cases)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,705 @@
+# -*- coding: utf-8 -*-
+"""
+CAM02-UCS and CAM16-UCS Colourspaces 3D Look-Up Tables
+======================================================
+
+Defines the objects baking the *CIE XYZ* tristimulus values to
+*Luo et alii (2006)* *CAM02-LCD*, *CAM02-SCD*, and *CAM02-UCS* colourspaces or
+*Li et alii (2017)* *CAM16-LCD*, *CAM16-SCD*, and *CAM16-UCS* colourspaces
+:math:`J'a'b'` array transformations, and their inverse, into shaper plus 3D
+look-up tables for fixed viewing conditions:
+
+-   :attr:`colour.models.UCS_LUT3D_SIZE`
+-   :attr:`colour.models.UCS_LUT3D_SHAPER_EXPONENT`
+-   :attr:`colour.models.UCS_LUT3D_UCS_DOMAIN`
+-   :class:`colour.models.UCS_LUT3D_Error`
+-   :class:`colour.models.UCS_LUT3D`
+-   :func:`colour.models.UCS_LUT3D_from_viewing_conditions`
+
+The forward look-up table is indexed by the colour appearance model adapted
+cone responses, i.e. the *CIE XYZ* tristimulus values converted with the
+model chromatic adaptation and cone space matrices, normalised by the
+reference white ones and raised to the shaper exponent. The reverse look-up
+table is indexed by the :math:`J'a'b'` array, with a square root shaper on
+the :math:`J'` axis, and stores the shaped adapted cone responses: the
+per-stimulus cost is a matrix product and a single trilinear interpolation
+instead of the full colour appearance model and uniform colourspace chain.
+
+The look-up tables are approximations whose error is measured when they are
+built and stored along them, they are not a drop-in replacement for the exact
+transformations, see the
+:func:`colour.models.UCS_LUT3D_from_viewing_conditions` definition notes for
+the error limits.
+
+References
+----------
+-   :cite:`Li2017` : Li, C., Li, Z., Wang, Z., Xu, Y., Luo, M. R., Cui, G.,
+    Pointer, M. R. (2017). Comprehensive color solutions: CAM16, CAT16, and
+    CAM16-UCS. Color Research & Application, 42(6), 703-718.
+    doi:10.1002/col.22131
+-   :cite:`Luo2006b` : Luo, M. R., Cui, G., & Li, C. (2006). Uniform colour
+    spaces based on CIECAM02 colour appearance model. Color Research &
+    Application, 31(4), 320-330. doi:10.1002/col.20227
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+
+from colour.adaptation import CAT02_CAT
+from colour.appearance.cam16 import (M_16, CAM16_Specification,
+                                     CAM16_VIEWING_CONDITIONS,
+                                     CAM16_viewing_conditions_model)
+from colour.appearance.ciecam02 import (
+    CAT02_INVERSE_CAT, FUSED_KERNEL_TILE_SIZE, CIECAM02_Specification,
+    CIECAM02_VIEWING_CONDITIONS, CIECAM02_viewing_conditions_model)
+from colour.appearance.hunt import XYZ_TO_HPE_MATRIX
+from colour.models.cam02_ucs import (COEFFICIENTS_UCS_LUO2006,
+                                     JMh_CIECAM02_to_UCS_Luo2006,
+                                     UCS_Luo2006_to_JMh_CIECAM02)
+from colour.utilities import dot_matrix, dot_vector, tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'UCS_LUT3D_SIZE', 'UCS_LUT3D_SHAPER_EXPONENT', 'UCS_LUT3D_UCS_DOMAIN',
+    'UCS_LUT3D_Error', 'UCS_LUT3D', 'UCS_LUT3D_from_viewing_conditions'
+]
+
+UCS_LUT3D_SIZE = 65
+"""
+Default number of nodes per axis of the 3D look-up tables.
+
+UCS_LUT3D_SIZE : int
+"""
+
+UCS_LUT3D_SHAPER_EXPONENT = 1 / 3
+"""
+Default exponent of the adapted cone responses shaper, slightly lower than
+the exponent of the post-adaptation non linear response compression so that
+the nodes are denser near black.
+
+UCS_LUT3D_SHAPER_EXPONENT : numeric
+"""
+
+UCS_LUT3D_UCS_DOMAIN = np.array([[2, -50, -50], [100, 50, 50]])
+"""
+Default :math:`J'a'b'` array domain of the reverse 3D look-up table, starting
+at :math:`J' = 2` because the colour appearance model reverse transformation
+is singular at black.
+
+UCS_LUT3D_UCS_DOMAIN : ndarray, (2, 3)
+"""
+
+_UCS_LUT3D_LIGHTNESS_SHAPER_EXPONENT = 1 / 2
+"""
+Exponent of the reverse 3D look-up table shaper applied to the normalised
+:math:`J'` axis, concentrating the nodes near black where the colour
+appearance model reverse transformation is the most non linear.
+
+_UCS_LUT3D_LIGHTNESS_SHAPER_EXPONENT : numeric
+"""
+
+_UCS_LUT3D_CACHE = {}
+
+
+def _XYZ_to_RGB_matrix_CIECAM02(model):
+    """
+    Returns the matrix converting from *CIE XYZ* tristimulus values to
+    *CIECAM02* adapted *Hunt-Pointer-Estevez* cone responses for given
+    viewing conditions model.
+
+    Parameters
+    ----------
+    model : CIECAM02_ViewingConditionsModel
+        *CIECAM02* viewing conditions model.
+
+    Returns
+    -------
+    ndarray, (3, 3)
+        Conversion matrix.
+    """
+
+    return np.dot(
+        dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT) * model.D_RGB,
+        CAT02_CAT)
+
+
+def _XYZ_to_RGB_matrix_CAM16(model):
+    """
+    Returns the matrix converting from *CIE XYZ* tristimulus values to *CAM16*
+    adapted cone responses for given viewing conditions model.
+
+    Parameters
+    ----------
+    model : CAM16_ViewingConditionsModel
+        *CAM16* viewing conditions model.
+
+    Returns
+    -------
+    ndarray, (3, 3)
+        Conversion matrix.
+    """
+
+    return model.D_RGB[..., np.newaxis] * M_16
+
+
+_UCS_LUT3D_MODELS = {
+    'CAM02': (CIECAM02_viewing_conditions_model, CIECAM02_Specification,
+              CIECAM02_VIEWING_CONDITIONS, _XYZ_to_RGB_matrix_CIECAM02),
+    'CAM16': (CAM16_viewing_conditions_model, CAM16_Specification,
+              CAM16_VIEWING_CONDITIONS, _XYZ_to_RGB_matrix_CAM16),
+}
+
+
+class UCS_LUT3D_Error(
+        namedtuple('UCS_LUT3D_Error',
+                   ('mean', 'percentile_99', 'maximum', 'samples'))):
+    """
+    Defines the class storing the error of a 3D look-up table expressed as
+    the euclidean distance in the :math:`J'a'b'` array, i.e. the colour
+    difference :math:`\\Delta E'` of the uniform colourspace.
+
+    Parameters
+    ----------
+    mean : numeric
+        Mean error.
+    percentile_99 : numeric
+        99th percentile of the error.
+    maximum : numeric
+        Maximum error.
+    samples : int
+        Number of samples the error has been measured on.
+    """
+
+
+class UCS_LUT3D(
+        namedtuple('UCS_LUT3D',
+                   ('space', 'XYZ_w', 'XYZ_to_RGB_matrix', 'RGB_w',
+                    'shaper_exponent', 'table', 'UCS_domain', 'table_reverse',
+                    'error', 'error_reverse'))):
+    """
+    Defines the shaper plus 3D look-up tables of the *CIE XYZ* tristimulus
+    values to :math:`J'a'b'` array transformation, and its inverse, for given
+    viewing conditions.
+
+    Instances are returned by the
+    :func:`colour.models.UCS_LUT3D_from_viewing_conditions` definition.
+
+    Parameters
+    ----------
+    space : unicode
+        Uniform colourspace, e.g. *CAM02-UCS* or *CAM16-UCS*.
+    XYZ_w : ndarray
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    XYZ_to_RGB_matrix : ndarray, (3, 3)
+        Matrix converting from *CIE XYZ* tristimulus values to the colour
+        appearance model adapted cone responses.
+    RGB_w : ndarray
+        Adapted cone responses of reference white, the forward 3D look-up
+        table domain is :math:`[0, RGB_w]`.
+    shaper_exponent : numeric
+        Exponent of the adapted cone responses shaper.
+    table : ndarray, (size, size, size, 3)
+        Forward 3D look-up table, i.e. :math:`J'a'b'` array.
+    UCS_domain : ndarray, (2, 3)
+        :math:`J'a'b'` array domain of the reverse 3D look-up table.
+    table_reverse : ndarray, (size, size, size, 3)
+        Reverse 3D look-up table, i.e. shaped adapted cone responses.
+    error : UCS_LUT3D_Error
+        Forward 3D look-up table error.
+    error_reverse : UCS_LUT3D_Error
+        Reverse 3D look-up table round-trip error.
+
+    Methods
+    -------
+    forward
+    reverse
+    """
+
+    def forward(self, XYZ):
+        """
+        Converts from *CIE XYZ* tristimulus values to :math:`J'a'b'` array
+        using the forward 3D look-up table.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values normalised to domain [0, 100].
+
+        Returns
+        -------
+        ndarray
+            :math:`J'a'b'` array.
+
+        Notes
+        -----
+        -   The *CIE XYZ* tristimulus values whose adapted cone responses are
+            outside the :math:`[0, RGB_w]` domain are clipped.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> LUT = UCS_LUT3D_from_viewing_conditions(XYZ_w, 318.31, 20.0)
+        >>> XYZ = np.array([19.01, 20.00, 21.78])
+        >>> LUT.forward(XYZ)  # doctest: +ELLIPSIS
+        array([ 54.9045120...,  -0.5296654...,  -0.2270786...])
+        """
+
+        RGB = dot_vector(self.XYZ_to_RGB_matrix, XYZ)
+        V = np.clip(RGB / self.RGB_w, 0, 1) ** self.shaper_exponent
+
+        return _trilinear_interpolation(V, self.table)
+
+    def reverse(self, Jpapbp):
+        """
+        Converts from :math:`J'a'b'` array to *CIE XYZ* tristimulus values
+        using the reverse 3D look-up table.
+
+        Parameters
+        ----------
+        Jpapbp : array_like
+            :math:`J'a'b'` array.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values normalised to range [0, 100].
+
+        Notes
+        -----
+        -   The :math:`J'a'b'` arrays outside the reverse 3D look-up table
+            domain are clipped.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> LUT = UCS_LUT3D_from_viewing_conditions(XYZ_w, 318.31, 20.0)
+        >>> Jpapbp = np.array([54.90433134, -0.08442362, -0.06848314])
+        >>> LUT.reverse(Jpapbp)  # doctest: +ELLIPSIS
+        array([ 19.0084826...,  20.0013065...,  21.7866468...])
+        """
+
+        V = _UCS_shaper_forward(Jpapbp, self.UCS_domain)
+        S = _trilinear_interpolation(V, self.table_reverse)
+        RGB = np.sign(S) * np.abs(S) ** (1 / self.shaper_exponent) * self.RGB_w
+
+        return dot_vector(np.linalg.inv(self.XYZ_to_RGB_matrix), RGB)
+
+
+def _UCS_shaper_forward(Jpapbp, UCS_domain):
+    """
+    Converts from :math:`J'a'b'` array to the reverse 3D look-up table
+    normalised coordinates.
+
+    Parameters
+    ----------
+    Jpapbp : array_like
+        :math:`J'a'b'` array.
+    UCS_domain : ndarray, (2, 3)
+        :math:`J'a'b'` array domain of the reverse 3D look-up table.
+
+    Returns
+    -------
+    ndarray
+        Normalised coordinates.
+    """
+
+    domain_m, domain_M = UCS_domain
+    V = np.clip((Jpapbp - domain_m) / (domain_M - domain_m), 0, 1)
+    V[..., 0] **= _UCS_LUT3D_LIGHTNESS_SHAPER_EXPONENT
+
+    return V
+
+
+def _UCS_shaper_reverse(V, UCS_domain):
+    """
+    Converts from the reverse 3D look-up table normalised coordinates to
+    :math:`J'a'b'` array.
+
+    Parameters
+    ----------
+    V : array_like
+        Normalised coordinates.
+    UCS_domain : ndarray, (2, 3)
+        :math:`J'a'b'` array domain of the reverse 3D look-up table.
+
+    Returns
+    -------
+    ndarray
+        :math:`J'a'b'` array.
+    """
+
+    V = np.array(V, dtype=np.float_)
+    V[..., 0] **= 1 / _UCS_LUT3D_LIGHTNESS_SHAPER_EXPONENT
+
+    return UCS_domain[0] + V * (UCS_domain[1] - UCS_domain[0])
+
+
+def _trilinear_interpolation(V, table, tile_size=FUSED_KERNEL_TILE_SIZE):
+    """
+    Performs the trilinear interpolation of given 3D look-up table at given
+    normalised coordinates.
+
+    Parameters
+    ----------
+    V : array_like
+        Coordinates normalised to domain [0, 1].
+    table : ndarray, (size, size, size, 3)
+        3D look-up table.
+    tile_size : int, optional
+        Number of coordinates processed at once.
+
+    Returns
+    -------
+    ndarray
+        Interpolated values.
+    """
+
+    V = np.asarray(V, dtype=np.float_)
+    shape = V.shape
+    V = np.reshape(V, (-1, 3))
+
+    size = table.shape[0]
+    table = np.reshape(table, (-1, 3))
+    strides = np.array([size * size, size, 1])
+    corners = [(r, g, b, (r * size + g) * size + b)
+               for r, g, b in np.ndindex(2, 2, 2)]
+
+    values = np.empty(V.shape)
+    for i in range(0, V.shape[0], tile_size):
+        V_t = V[i:i + tile_size] * (size - 1)
+        index = np.floor(V_t).astype(np.int_)
+        np.clip(index, 0, size - 2, out=index)
+        t = V_t - index
+        u = 1 - t
+        index = np.dot(index, strides)
+
+        values_t = values[i:i + tile_size]
+        values_t[...] = 0
+        for r, g, b, offset in corners:
+            w = (t[:, 0] if r else u[:, 0]) * (t[:, 1] if g else u[:, 1])
+            w *= t[:, 2] if b else u[:, 2]
+            values_t += w[:, np.newaxis] * np.take(
+                table, index + offset, axis=0)
+
+    return np.reshape(values, shape)
+
+
+def _finite_cells(table):
+    """
+    Returns whether the eight nodes of the cells of given 3D look-up table are
+    finite.
+
+    Parameters
+    ----------
+    table : ndarray, (size, size, size, 3)
+        3D look-up table.
+
+    Returns
+    -------
+    ndarray, (size - 1, size - 1, size - 1)
+        Whether the cells nodes are finite.
+    """
+
+    finite = np.all(np.isfinite(table), axis=-1)
+
+    cells = np.ones([finite.shape[0] - 1] * 3, dtype=bool)
+    for r, g, b in np.ndindex(2, 2, 2):
+        cells &= finite[r:r + cells.shape[0], g:g + cells.shape[1],
+                        b:b + cells.shape[2]]
+
+    return cells
+
+
+def _fill_non_finite(table):
+    """
+    Fills in-place the non-finite nodes of given 3D look-up table with the
+    mean of their finite direct neighbours, propagating inward from the
+    finite nodes.
+
+    Parameters
+    ----------
+    table : ndarray, (size, size, size, 3)
+        3D look-up table.
+
+    Returns
+    -------
+    ndarray
+        Filled 3D look-up table.
+    """
+
+    invalid = ~np.all(np.isfinite(table), axis=-1)
+    table[invalid] = 0
+
+    while np.any(invalid):
+        valid = np.pad(~invalid, 1, 'constant')
+        values = np.pad(table, ((1, 1), (1, 1), (1, 1), (0, 0)), 'constant')
+
+        count = np.zeros(invalid.shape)
+        total = np.zeros(table.shape)
+        for axis in range(3):
+            for offset in (0, 2):
+                slices = [slice(1, -1)] * 3
+                slices[axis] = slice(offset, offset + invalid.shape[axis])
+                slices = tuple(slices)
+                count += valid[slices]
+                total += values[slices] * valid[slices][..., np.newaxis]
+
+        filled = np.logical_and(invalid, count > 0)
+        if not np.any(filled):
+            break
+
+        table[filled] = total[filled] / count[filled][..., np.newaxis]
+        invalid[filled] = False
+
+    return table
+
+
+def _UCS_LUT3D_error(Jpapbp, Jpapbp_t):
+    """
+    Computes the error in between given exact and interpolated :math:`J'a'b'`
+    arrays, ignoring the non-finite exact values.
+
+    Parameters
+    ----------
+    Jpapbp : ndarray
+        Exact :math:`J'a'b'` array.
+    Jpapbp_t : ndarray
+        Interpolated :math:`J'a'b'` array.
+
+    Returns
+    -------
+    UCS_LUT3D_Error
+        Error.
+    """
+
+    with np.errstate(invalid='ignore'):
+        delta_E = np.linalg.norm(Jpapbp - Jpapbp_t, axis=-1)
+    delta_E = delta_E[np.isfinite(delta_E)]
+
+    if delta_E.size == 0:
+        return UCS_LUT3D_Error(np.nan, np.nan, np.nan, 0)
+
+    return UCS_LUT3D_Error(
+        np.mean(delta_E), np.percentile(delta_E, 99), np.max(delta_E),
+        delta_E.size)
+
+
+def UCS_LUT3D_from_viewing_conditions(
+        XYZ_w,
+        L_A,
+        Y_b,
+        surround=None,
+        discount_illuminant=False,
+        space='CAM02-UCS',
+        size=UCS_LUT3D_SIZE,
+        shaper_exponent=UCS_LUT3D_SHAPER_EXPONENT,
+        UCS_domain=UCS_LUT3D_UCS_DOMAIN):
+    """
+    Returns the shaper plus 3D look-up tables of the *CIE XYZ* tristimulus
+    values to given uniform colourspace :math:`J'a'b'` array transformation,
+    and its inverse, for given viewing conditions.
+
+    The 3D look-up tables are computed once per viewing conditions and
+    cached.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white normalised to domain
+        [0, 100].
+    L_A : numeric
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+    Y_b : numeric
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CIECAM02_InductionFactors or CAM16_InductionFactors, optional
+        Surround viewing conditions induction factors, default to the
+        *Average* surround of the colour appearance model.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+    space : unicode, optional
+        **{'CAM02-UCS', 'CAM02-LCD', 'CAM02-SCD', 'CAM16-UCS', 'CAM16-LCD',
+        'CAM16-SCD'}**,
+        Uniform colourspace.
+    size : int, optional
+        Number of nodes per axis of the 3D look-up tables.
+    shaper_exponent : numeric, optional
+        Exponent of the adapted cone responses shaper.
+    UCS_domain : array_like, optional
+        :math:`J'a'b'` array domain of the reverse 3D look-up table.
+
+    Returns
+    -------
+    UCS_LUT3D
+        Shaper plus 3D look-up tables.
+
+    Raises
+    ------
+    ValueError
+        If the uniform colourspace is not supported.
+
+    Notes
+    -----
+    -   The forward 3D look-up table domain is the :math:`[0, RGB_w]` adapted
+        cone responses domain which encloses all the object colours under the
+        reference white and excludes the stimuli with negative cone
+        responses, for which the post-adaptation non linear response
+        compression is not differentiable.
+    -   The default reverse 3D look-up table domain starts at :math:`J' = 2`:
+        the colour appearance model reverse transformation is singular at
+        black and the :math:`J'a'b'` arrays below are clipped.
+    -   The nodes whose exact value is not finite, e.g. :math:`J'a'b'` arrays
+        outside the visible gamut, are filled with the mean of their
+        neighbours so that the stimuli near the gamut boundary are
+        interpolated from finite values.
+    -   The forward 3D look-up table error is measured at the centres of the
+        cells, the reverse 3D look-up table error is measured with a
+        round-trip to the :math:`J'a'b'` array at the centres of the cells
+        whose nodes exact values are finite and whose adapted cone responses
+        are within the forward 3D look-up table domain.
+    -   With the default size, shaper exponent and reverse domain, the
+        *CAM02-UCS* and *CAM16-UCS* forward 3D look-up table errors are
+        around :math:`\\Delta E' = 0.07` on average and below
+        :math:`\\Delta E' = 2.5` across the domain, the reverse 3D look-up
+        table round-trip errors are around :math:`\\Delta E' = 0.03` on
+        average and below :math:`\\Delta E' = 1` across the domain. The
+        look-up tables are approximations for batch processing and are not a
+        drop-in replacement for the exact transformations, the stimuli
+        outside the domains are clipped and the speedup over the colour
+        appearance model fused kernel is moderate.
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> LUT = UCS_LUT3D_from_viewing_conditions(XYZ_w, 318.31, 20.0)
+    >>> LUT.table.shape
+    (65, 65, 65, 3)
+    >>> LUT.error  # doctest: +ELLIPSIS
+    UCS_LUT3D_Error(mean=0.0716557..., percentile_99=0.6366843..., \
+maximum=1.7732329..., samples=262144)
+    >>> LUT.error_reverse  # doctest: +ELLIPSIS
+    UCS_LUT3D_Error(mean=0.0236513..., percentile_99=0.1339272..., \
+maximum=0.5720803..., samples=183040)
+    """
+
+    key = space.upper()
+    model_name, _separator, coefficients_name = key.partition('-')
+    if model_name not in _UCS_LUT3D_MODELS or coefficients_name not in (
+            'UCS', 'LCD', 'SCD'):
+        raise ValueError(
+            '"{0}" uniform colourspace is not supported, it must be one of '
+            '{1}!'.format(space, [
+                '{0}-{1}'.format(model, coefficients)
+                for model in sorted(_UCS_LUT3D_MODELS)
+                for coefficients in ('UCS', 'LCD', 'SCD')
+            ]))
+
+    (viewing_conditions_model, specification_class, surrounds,
+     XYZ_to_RGB_matrix) = _UCS_LUT3D_MODELS[model_name]
+    if surround is None:
+        surround = surrounds['Average']
+
+    XYZ_w = np.asarray(XYZ_w, dtype=np.float_)
+    UCS_domain = np.asarray(UCS_domain, dtype=np.float_)
+
+    cache_key = (key, tuple(XYZ_w), float(L_A), float(Y_b), tuple(surround),
+                 discount_illuminant, size, shaper_exponent,
+                 tuple(np.ravel(UCS_domain)))
+    LUT = _UCS_LUT3D_CACHE.get(cache_key)
+    if LUT is not None:
+        return LUT
+
+    model = viewing_conditions_model(XYZ_w, L_A, Y_b, surround,
+                                     discount_illuminant)
+    coefficients = COEFFICIENTS_UCS_LUO2006['CAM02-{0}'.format(
+        coefficients_name)]
+
+    def XYZ_to_UCS(XYZ):
+        """
+        Converts from *CIE XYZ* tristimulus values to :math:`J'a'b'` array.
+        """
+
+        specification = model.forward_fused(XYZ)
+
+        return JMh_CIECAM02_to_UCS_Luo2006(
+            tstack((specification.J, specification.M, specification.h)),
+            coefficients)
+
+    def UCS_to_XYZ(Jpapbp):
+        """
+        Converts from :math:`J'a'b'` array to *CIE XYZ* tristimulus values.
+        """
+
+        J, M, h = tsplit(UCS_Luo2006_to_JMh_CIECAM02(Jpapbp, coefficients))
+
+        return model.reverse(
+            specification_class(J, None, h, None, None, M, None, None))
+
+    M = XYZ_to_RGB_matrix(model)
+    M_i = np.linalg.inv(M)
+    RGB_w = dot_vector(M, XYZ_w)
+
+    nodes = np.linspace(0, 1, size)
+    centres = (nodes[:-1] + nodes[1:]) / 2
+    grid = tstack(np.meshgrid(nodes, nodes, nodes, indexing='ij'))
+    grid_c = tstack(np.meshgrid(centres, centres, centres, indexing='ij'))
+
+    def shaper_reverse(V):
+        """
+        Converts from normalised coordinates to *CIE XYZ* tristimulus values.
+        """
+
+        return dot_vector(M_i, V ** (1 / shaper_exponent) * RGB_w)
+
+    def shaper_forward(XYZ):
+        """
+        Converts from *CIE XYZ* tristimulus values to shaped adapted cone
+        responses.
+        """
+
+        RGB = dot_vector(M, XYZ) / RGB_w
+
+        return np.sign(RGB) * np.abs(RGB) ** shaper_exponent
+
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        table = XYZ_to_UCS(shaper_reverse(grid))
+        cells = _finite_cells(table)
+        _fill_non_finite(table)
+
+        Jpapbp_c = XYZ_to_UCS(shaper_reverse(grid_c))
+        Jpapbp_c[~cells] = np.nan
+        error = _UCS_LUT3D_error(Jpapbp_c,
+                                 _trilinear_interpolation(grid_c, table))
+
+        table_reverse = shaper_forward(
+            UCS_to_XYZ(_UCS_shaper_reverse(grid, UCS_domain)))
+        cells = _finite_cells(table_reverse)
+        _fill_non_finite(table_reverse)
+
+        Jpapbp_c = _UCS_shaper_reverse(grid_c, UCS_domain)
+        S_c = shaper_forward(UCS_to_XYZ(Jpapbp_c))
+        cells = np.logical_and(
+            cells, np.all(np.logical_and(S_c >= 0, S_c <= 1), axis=-1))
+        Jpapbp_c[~cells] = np.nan
+        error_reverse = _UCS_LUT3D_error(
+            Jpapbp_c,
+            XYZ_to_UCS(
+                shaper_reverse(
+                    _trilinear_interpolation(grid_c, table_reverse))))
+
+    for array in (M, RGB_w, table, table_reverse):
+        array.setflags(write=False)
+
+    LUT = _UCS_LUT3D_CACHE[cache_key] = UCS_LUT3D(
+        space, XYZ_w, M, RGB_w, shaper_exponent, table, UCS_domain,
+        table_reverse, error, error_reverse)
+
+    return LUT
@@ -11,6 +11,13 @@ from .munsell import (munsell_value_Priest1920, munsell_value_Munsell1933,
                       munsell_value_Ladd1955, munsell_value_McCamy1987,
                       munsell_value_ASTMD153508)
 from .munsell import munsell_colour_to_xyY, xyY_to_munsell_colour
+from .munsell import (MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS,
+                      XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS,
+                      munsell_specification_array_to_xyY,
+                      xyY_to_munsell_specification_array,
+                      nearest_specifications_from_renotation)
+from .munsell import (munsell_colours_to_munsell_specification_array,
+                      munsell_specification_array_to_munsell_colours)
 from .triplet import RGB_to_HEX, HEX_to_RGB
 
 __all__ = []
@@ -24,4 +31,14 @@ __all__ += [
     'munsell_value_ASTMD153508'
 ]
 __all__ += ['munsell_colour_to_xyY', 'xyY_to_munsell_colour']
+__all__ += [
+    'MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS',
+    'XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS',
+    'munsell_specification_array_to_xyY', 'xyY_to_munsell_specification_array',
+    'nearest_specifications_from_renotation'
+]
+__all__ += [
+    'munsell_colours_to_munsell_specification_array',
+    'munsell_specification_array_to_munsell_colours'
+]
 __all__ += ['RGB_to_HEX', 'HEX_to_RGB']
@@ -27,6 +27,11 @@ Defines various objects for *Munsell Renotation System* computations:
     *ASTM D1535-08e1* method.
 -   :func:`colour.munsell_colour_to_xyY`
 -   :func:`colour.xyY_to_munsell_colour`
+-   :func:`colour.notation.munsell_specification_array_to_xyY`
+-   :func:`colour.notation.xyY_to_munsell_specification_array`
+-   :func:`colour.notation.nearest_specifications_from_renotation`
+-   :func:`colour.notation.munsell_colours_to_munsell_specification_array`
+-   :func:`colour.notation.munsell_specification_array_to_munsell_colours`
 
 See Also
 --------
@@ -119,20 +124,23 @@ MunsellAndKubelkaMunkToolbox/MunsellAndKubelkaMunkToolbox.html
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
 import re
-from collections import OrderedDict
+from collections import namedtuple
+from scipy.spatial import cKDTree
 
 from colour.algebra import (Extrapolator, LinearInterpolator,
                             cartesian_to_cylindrical, polar_to_cartesian,
                             euclidean_distance)
 from colour.colorimetry import ILLUMINANTS, luminance_ASTMD153508
-from colour.constants import (DEFAULT_FLOAT_DTYPE, INTEGER_THRESHOLD,
+from colour.constants import (DEFAULT_FLOAT_DTYPE, EPSILON, INTEGER_THRESHOLD,
                               FLOATING_POINT_NUMBER_PATTERN)
 from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
 from colour.notation import MUNSELL_COLOURS_ALL
-from colour.utilities import (CaseInsensitiveMapping, Lookup, is_integer,
-                              is_numeric, tsplit, warning)
+from colour.utilities import (CaseInsensitiveMapping, Lookup, as_numeric,
+                              ignore_numpy_errors, is_integer, is_numeric,
+                              is_string, tsplit, tstack, warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -151,6 +159,7 @@ __all__ = [
     'MUNSELL_COLOUR_EXTENDED_FORMAT', 'MUNSELL_HUE_LETTER_CODES',
     'MUNSELL_DEFAULT_ILLUMINANT',
     'MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES',
+    'MUNSELL_GRID_CACHE_PATH',
     'munsell_value_Priest1920', 'munsell_value_Munsell1933',
     'munsell_value_Moon1943', 'munsell_value_Saunderson1944',
     'munsell_value_Ladd1955', 'munsell_value_McCamy1987',
@@ -160,12 +169,19 @@ __all__ = [
     'parse_munsell_colour', 'is_grey_munsell_colour',
     'normalize_munsell_specification',
     'munsell_colour_to_munsell_specification',
-    'munsell_specification_to_munsell_colour', 'xyY_from_renotation',
-    'is_specification_in_renotation', 'bounding_hues_from_renotation',
+    'munsell_specification_to_munsell_colour', 'parse_munsell_colours',
+    'munsell_colours_to_munsell_specification_array',
+    'munsell_specification_array_to_munsell_colours', 'xyY_from_renotation',
+    'is_specification_in_renotation',
+    'nearest_specifications_from_renotation', 'bounding_hues_from_renotation',
     'hue_to_hue_angle', 'hue_angle_to_hue', 'hue_to_ASTM_hue',
     'interpolation_method_from_renotation_ovoid', 'xy_from_renotation_ovoid',
     'LCHab_to_munsell_specification', 'maximum_chroma_from_renotation',
-    'munsell_specification_to_xy'
+    'munsell_specification_to_xy',
+    'MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS',
+    'munsell_specification_array_to_xyY',
+    'XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS',
+    'xyY_to_munsell_specification_array'
 ]
 
 MUNSELL_GRAY_PATTERN = 'N(?P<value>{0})'.format(FLOATING_POINT_NUMBER_PATTERN)
@@ -174,6 +190,11 @@ MUNSELL_COLOUR_PATTERN = ('(?P<hue>{0})\s*'
                           '(?P<value>{0})\s*\/\s*(?P<chroma>[-+]?{0})'.format(
                               FLOATING_POINT_NUMBER_PATTERN))
 
+_MUNSELL_GRAY_PATTERN_COMPILED = re.compile(
+    MUNSELL_GRAY_PATTERN, flags=re.IGNORECASE)
+_MUNSELL_COLOUR_PATTERN_COMPILED = re.compile(
+    MUNSELL_COLOUR_PATTERN, flags=re.IGNORECASE)
+
 MUNSELL_GRAY_FORMAT = 'N{0}'
 MUNSELL_COLOUR_FORMAT = '{0} {1}/{2}'
 MUNSELL_GRAY_EXTENDED_FORMAT = 'N{0:.{1}f}'
@@ -198,7 +219,69 @@ MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = (ILLUMINANTS[
 
 _MUNSELL_SPECIFICATIONS_CACHE = None
 _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_RENOTATION_INDEX_CACHE = None
+_MUNSELL_RENOTATION_TABLES_CACHE = None
+_MUNSELL_GRID_CACHE = None
+
+MUNSELL_GRID_CACHE_PATH = None
+"""
+Optional path of the file the *Munsell Renotation System* *xy* chromaticity
+coordinates grid used by the *Grid* method is persisted to, the grid is
+tabulated again when the file cannot be read. The grid is only cached in
+memory if the path is *None*, e.g. ``os.path.join(os.path.expanduser('~'),
+'.colour-science', 'munsell_grid.npz')`` persists it across sessions.
+
+MUNSELL_GRID_CACHE_PATH : unicode
+"""
+
+_MUNSELL_GRID_ASTM_HUES = np.linspace(0, 100, 1001)
+_MUNSELL_GRID_VALUES = np.arange(1, 11)
+_MUNSELL_GRID_CHROMAS = np.arange(0, 52, 2)
+
+_MunsellGrid = namedtuple('_MunsellGrid', ('xy', 'trees', 'hues_chromas'))
+
+_MunsellRenotationIndex = namedtuple(
+    '_MunsellRenotationIndex',
+    ('specifications', 'indexes', 'maximum_chromas', 'tree'))
+
+_MUNSELL_RADIAL_INTERPOLATION_HUE_RANGES = (
+    (1, ((2, 2, ((15, 30), (60, 85))), (4, 4, ((12.5, 27.5), (57.5, 80))),
+         (6, 6, ((55, 80), )), (8, 8, ((67.5, 77.5), )),
+         (10, 50, ((72.5, 77.5), )))),
+    (2, ((2, 2, ((15, 27.5), (77.5, 80))), (4, 4, ((12.5, 30), (62.5, 80))),
+         (6, 6, ((7.5, 22.5), (62.5, 80))), (8, 8, ((7.5, 15), (60, 80))),
+         (10, 50, ((65, 77.5), )))),
+    (3, ((2, 2, ((10, 37.5), (65, 85))), (4, 4, ((5, 37.5), (55, 72.5))),
+         (6, 10, ((7.5, 37.5), (57.5, 82.5))),
+         (12, 50, ((7.5, 42.5), (57.5, 80))))),
+    (4, ((2, 4, ((7.5, 42.5), (57.5, 85))), (6, 8, ((7.5, 40), (57.5, 82.5))),
+         (10, 50, ((7.5, 40), (57.5, 80))))),
+    (5, ((2, 2, ((5, 37.5), (55, 85))), (4, 8, ((2.5, 42.5), (55, 85))),
+         (10, 50, ((2.5, 42.5), (55, 82.5))))),
+    (6, ((2, 4, ((5, 37.5), (55, 87.5))), (6, 6, ((5, 42.5), (57.5, 87.5))),
+         (8, 10, ((5, 42.5), (60, 85))), (12, 14, ((5, 42.5), (60, 82.5))),
+         (16, 50, ((5, 42.5), (60, 80))))),
+    (7, ((2, 6, ((5, 42.5), (60, 85))), (8, 8, ((5, 42.5), (60, 82.5))),
+         (10, 10, ((30, 42.5), (5, 25), (60, 82.5))),
+         (12, 12, ((30, 42.5), (7.5, 27.5), (80, 82.5))),
+         (14, 50, ((32.5, 40), (7.5, 15), (80, 82.5))))),
+    (8, ((2, 12, ((5, 40), (60, 85))),
+         (14, 50, ((32.5, 40), (5, 15), (60, 85))))),
+    (9, ((2, 4, ((5, 40), (55, 80))), (6, 14, ((5, 42.5), )),
+         (16, 50, ((35, 42.5), )))),
+)
+"""
+*ASTM* hue ranges for which radial interpolation is used when drawing ovoids
+through data points in the *Munsell Renotation System* data, as
+(value, ((chroma minimum, chroma maximum, ((ASTM hue minimum, ASTM hue
+maximum), ...)), ...)) tuples.
+
+References
+----------
+-   :cite:`Centore2014l`
+
+_MUNSELL_RADIAL_INTERPOLATION_HUE_RANGES : tuple
+"""
 
 
 def _munsell_specifications():
@@ -257,32 +340,64 @@ def _munsell_value_ASTMD153508_interpolator():
     return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
 
 
-def _munsell_maximum_chromas_from_renotation():
+def _munsell_renotation_index():
     """
-    Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
-    and caches them if not existing.
+    Returns the *Munsell Renotation System* data index and caches it if not
+    existing.
+
+    The index is built once from
+    :func:`colour.notation.munsell._munsell_specifications` definition output
+    and :attr:`colour.notation.MUNSELL_COLOURS_ALL` attribute data and
+    replaces linear scans of the latter with:
+
+    -   A structured array with *hue*, *value*, *chroma*, *code* and *xyY*
+        fields storing the normalised specifications and their *CIE xyY*
+        colourspace values.
+    -   A *dict* mapping the normalised specifications to their structured
+        array row for :math:`O(1)` exact lookups.
+    -   A *dict* mapping the (hue, value, code) triplets to their maximum
+        chroma for :math:`O(1)` exact lookups.
+    -   A :class:`scipy.spatial.cKDTree` class instance built on the
+        *CIE xyY* colourspace values with the :math:`Y` luminance scaled by
+        :math:`0.975 / 100` so that it matches the domain [0, 1] of the
+        *CIE xyY* colourspace arrays used throughout the module, for
+        neighbour queries.
 
     Returns
     -------
-    tuple
-        Maximum *Munsell* chromas.
+    namedtuple
+        *Munsell Renotation System* data index.
     """
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
-        chromas = OrderedDict()
-        for munsell_colour in MUNSELL_COLOURS_ALL:
-            hue, value, chroma, code = munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))
-            index = (hue, value, code)
-            if index in chromas:
-                chroma = max(chromas[index], chroma)
+    global _MUNSELL_RENOTATION_INDEX_CACHE
+    if _MUNSELL_RENOTATION_INDEX_CACHE is None:
+        specifications = np.zeros(
+            len(MUNSELL_COLOURS_ALL),
+            dtype=[('hue', DEFAULT_FLOAT_DTYPE),
+                   ('value', DEFAULT_FLOAT_DTYPE),
+                   ('chroma', DEFAULT_FLOAT_DTYPE),
+                   ('code', DEFAULT_FLOAT_DTYPE),
+                   ('xyY', DEFAULT_FLOAT_DTYPE, (3, ))])
+
+        indexes = {}
+        maximum_chromas = {}
+        for i, (specification, munsell_colour) in enumerate(
+                zip(_munsell_specifications(), MUNSELL_COLOURS_ALL)):
+            hue, value, chroma, code = specification
+            specifications[i] = hue, value, chroma, code, munsell_colour[1]
+
+            indexes.setdefault(specification, i)
+
+            maximum_chromas[(hue, value, code)] = max(
+                maximum_chromas.get((hue, value, code), chroma), chroma)
 
-            chromas[index] = chroma
+        x, y, Y = tsplit(specifications['xyY'])
+        tree = cKDTree(tstack((x, y, Y * 0.975 / 100)))
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+        _MUNSELL_RENOTATION_INDEX_CACHE = _MunsellRenotationIndex(
+            specifications, indexes, maximum_chromas, tree)
+
+    return _MUNSELL_RENOTATION_INDEX_CACHE
 
 
 def munsell_value_Priest1920(Y):
@@ -707,18 +822,23 @@ def munsell_specification_to_xyY(specification):
     return np.array([x, y, Y / 100])
 
 
-def munsell_colour_to_xyY(munsell_colour):
+def munsell_colour_to_xyY(munsell_colour, method='Centore 2014'):
     """
     Converts given *Munsell* colour to *CIE xyY* colourspace.
 
     Parameters
     ----------
-    munsell_colour : unicode
-        *Munsell* colour.
+    munsell_colour : unicode or array_like
+        *Munsell* colour or sequence of *Munsell* colours.
+    method : unicode, optional
+        **{'Centore 2014', 'Grid'}**,
+        Computation method, see
+        :func:`colour.notation.munsell_specification_array_to_xyY`
+        definition.
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (3,) or (..., 3)
         *CIE xyY* colourspace array.
 
     Notes
@@ -736,9 +856,30 @@ def munsell_colour_to_xyY(munsell_colour):
     array([ 0.3873694...,  0.3575165...,  0.59362   ])
     >>> munsell_colour_to_xyY('N8.9')  # doctest: +ELLIPSIS
     array([ 0.31006  ,  0.31616  ,  0.746134...])
+    >>> munsell_colour_to_xyY('4.2YR 8.1/5.3', method='Grid')
+    ... # doctest: +ELLIPSIS
+    array([ 0.3873694...,  0.3575165...,  0.59362   ])
+    >>> munsell_colour_to_xyY(['4.2YR 8.1/5.3', 'N8.9'])  # doctest: +ELLIPSIS
+    array([[ 0.3873694...,  0.3575165...,  0.59362   ],
+           [ 0.31006   ,  0.31616   ,  0.7461345...]])
     """
 
+    if not is_string(munsell_colour):
+        return munsell_specification_array_to_xyY(
+            munsell_colours_to_munsell_specification_array(munsell_colour),
+            method=method)
+
+    function = MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS[method]
+
     specification = munsell_colour_to_munsell_specification(munsell_colour)
+
+    if function is _munsell_specification_array_to_xyY_Grid:
+        if is_grey_munsell_colour(specification):
+            specification = (np.nan, specification, np.nan, np.nan)
+
+        return munsell_specification_array_to_xyY(
+            specification, method='Grid')
+
     return munsell_specification_to_xyY(specification)
 
 
@@ -973,7 +1114,8 @@ def xyY_to_munsell_specification(xyY):
 def xyY_to_munsell_colour(xyY,
                           hue_decimals=1,
                           value_decimals=1,
-                          chroma_decimals=1):
+                          chroma_decimals=1,
+                          method='Centore 2014'):
     """
     Converts from *CIE xyY* colourspace to *Munsell* colour.
 
@@ -987,6 +1129,11 @@ def xyY_to_munsell_colour(xyY,
         Value formatting decimals.
     chroma_decimals : int
         Chroma formatting decimals.
+    method : unicode, optional
+        **{'Centore 2014', 'Grid'}**,
+        Computation method, see
+        :func:`colour.notation.xyY_to_munsell_specification_array`
+        definition.
 
     Returns
     -------
@@ -1008,9 +1155,25 @@ def xyY_to_munsell_colour(xyY,
     >>> # Doctests skip for Python 2.x compatibility.
     >>> xyY_to_munsell_colour(xyY)  # doctest: +SKIP
     '4.2YR 8.1/5.3'
+    >>> xyY_to_munsell_colour(xyY, method='Grid')  # doctest: +SKIP
+    '4.2YR 8.1/5.3'
     """
 
-    specification = xyY_to_munsell_specification(xyY)
+    function = XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS[method]
+
+    if function is _xyY_to_munsell_specification_array_Grid:
+        hue, value, chroma, code = xyY_to_munsell_specification_array(
+            xyY, method='Grid')
+
+        if np.isnan(value):
+            raise RuntimeError('Maximum iterations count reached without '
+                               'convergence!')
+
+        specification = (value if np.isnan(hue) else
+                         (hue, value, chroma, int(code)))
+    else:
+        specification = xyY_to_munsell_specification(xyY)
+
     return munsell_specification_to_munsell_colour(
         specification, hue_decimals, value_decimals, chroma_decimals)
 
@@ -1044,11 +1207,10 @@ def parse_munsell_colour(munsell_colour):
     (0.0, 2.0, 4.0, 6)
     """
 
-    match = re.match(MUNSELL_GRAY_PATTERN, munsell_colour, flags=re.IGNORECASE)
+    match = _MUNSELL_GRAY_PATTERN_COMPILED.match(munsell_colour)
     if match:
         return DEFAULT_FLOAT_DTYPE(match.group('value'))
-    match = re.match(
-        MUNSELL_COLOUR_PATTERN, munsell_colour, flags=re.IGNORECASE)
+    match = _MUNSELL_COLOUR_PATTERN_COMPILED.match(munsell_colour)
     if match:
         return (DEFAULT_FLOAT_DTYPE(match.group('hue')),
                 DEFAULT_FLOAT_DTYPE(match.group('value')),
@@ -1214,6 +1376,215 @@ def munsell_specification_to_munsell_colour(specification,
                 chroma_decimals)
 
 
+def parse_munsell_colours(munsell_colours):
+    """
+    Parses given *Munsell* colours and returns an intermediate *Munsell*
+    *Colorlab* specification array.
+
+    This definition is the n-dimensional counterpart of
+    :func:`colour.notation.munsell.parse_munsell_colour` definition, the
+    patterns being compiled once and each unique *Munsell* colour being
+    parsed only once. Grey colours are represented with *nan* hue, chroma
+    and code.
+
+    Parameters
+    ----------
+    munsell_colours : array_like
+        *Munsell* colours.
+
+    Returns
+    -------
+    ndarray, (..., 4)
+        Intermediate *Munsell* *Colorlab* specification array.
+
+    Raises
+    ------
+    ValueError
+        If one of the given specifications is not a valid
+        *Munsell Renotation System* colour specification.
+
+    Examples
+    --------
+    >>> parse_munsell_colours(['N5.2', '0YR 2.0/4.0'])  # doctest: +ELLIPSIS
+    array([[ nan,  5.2,  nan,  nan],
+           [ 0. ,  2. ,  4. ,  6. ]])
+    """
+
+    munsell_colours = np.asarray(munsell_colours)
+
+    gray_match = _MUNSELL_GRAY_PATTERN_COMPILED.match
+    colour_match = _MUNSELL_COLOUR_PATTERN_COMPILED.match
+    codes = dict((letter.upper(), code)
+                 for letter, code in MUNSELL_HUE_LETTER_CODES.items())
+
+    def _parse_munsell_colour(munsell_colour):
+        """
+        Parses given *Munsell* colour into a tuple of specification strings
+        and code.
+        """
+
+        match = gray_match(munsell_colour)
+        if match:
+            return np.nan, match.group('value'), np.nan, np.nan
+
+        match = colour_match(munsell_colour)
+        if match:
+            hue, letter, value, chroma = match.group('hue', 'letter', 'value',
+                                                     'chroma')
+            return hue, value, chroma, codes[letter.upper()]
+
+        raise ValueError(
+            ('"{0}" is not a valid "Munsell Renotation System" colour '
+             'specification!').format(munsell_colour))
+
+    munsell_colours_u, indexes = np.unique(
+        munsell_colours, return_inverse=True)
+
+    specification = np.array(
+        [
+            _parse_munsell_colour(munsell_colour)
+            for munsell_colour in munsell_colours_u.tolist()
+        ],
+        dtype=DEFAULT_FLOAT_DTYPE)
+
+    return np.reshape(
+        np.reshape(specification, (-1, 4))[indexes],
+        munsell_colours.shape + (4, ))
+
+
+def munsell_colours_to_munsell_specification_array(munsell_colours):
+    """
+    Convenient definition to retrieve a normalised *Munsell* *Colorlab*
+    specification array from given *Munsell* colours.
+
+    Parameters
+    ----------
+    munsell_colours : array_like
+        *Munsell* colours.
+
+    Returns
+    -------
+    ndarray, (..., 4)
+        Normalised *Munsell* *Colorlab* specification array, grey colours are
+        represented with *nan* hue, chroma and code.
+
+    Examples
+    --------
+    >>> munsell_colours_to_munsell_specification_array(['N5.2', '0YR 2.0/4.0'])
+    ... # doctest: +ELLIPSIS
+    array([[  nan,   5.2,   nan,   nan],
+           [ 10. ,   2. ,   4. ,   7. ]])
+    """
+
+    hue, value, chroma, code = tsplit(parse_munsell_colours(munsell_colours))
+
+    # 0YR is equivalent to 10R.
+    zero = hue == 0
+    hue = np.where(zero, 10, hue)
+    code = np.where(zero, code % 10 + 1, code)
+
+    grey = chroma == 0
+    hue, chroma, code = [
+        np.where(grey, np.nan, component) for component in (hue, chroma, code)
+    ]
+
+    return tstack((hue, value, chroma, code))
+
+
+def munsell_specification_array_to_munsell_colours(specification,
+                                                   hue_decimals=1,
+                                                   value_decimals=1,
+                                                   chroma_decimals=1):
+    """
+    Converts from *Munsell* *Colorlab* specification array to *Munsell*
+    colours.
+
+    This definition is the n-dimensional counterpart of
+    :func:`colour.notation.munsell.munsell_specification_to_munsell_colour`
+    definition, grey colours being represented with *nan* hue, chroma and
+    code.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specification array.
+    hue_decimals : int, optional
+        Hue formatting decimals.
+    value_decimals : int, optional
+        Value formatting decimals.
+    chroma_decimals : int, optional
+        Chroma formatting decimals.
+
+    Returns
+    -------
+    ndarray
+        *Munsell* colours.
+
+    Examples
+    --------
+    >>> spc = np.array([
+    ...     [np.nan, 5.2, np.nan, np.nan],
+    ...     [10, 2.0, 4.0, 7],
+    ... ])
+    >>> # Doctests skip for Python 2.x compatibility.
+    >>> munsell_specification_array_to_munsell_colours(spc)  # doctest: +SKIP
+    array(['N5.2', '10.0R 2.0/4.0'],
+          dtype='<U13')
+    """
+
+    specification = np.asarray(specification, dtype=DEFAULT_FLOAT_DTYPE)
+
+    hue, value, chroma, code = tsplit(specification)
+
+    grey = _is_grey_munsell_specification_array(hue, chroma)
+
+    hue = np.around(hue, hue_decimals)
+    value = np.around(value, value_decimals)
+    chroma = np.around(chroma, chroma_decimals)
+    code = np.around(code)
+
+    chromatic = ~grey
+    assert np.all(np.logical_and(hue[chromatic] >= 0,
+                                 hue[chromatic] <= 10)), (
+        'Specification hue must be normalised to domain [0, 10]!')
+    assert np.all(np.logical_and(value >= 0, value <= 10)), (
+        'Specification value must be normalised to domain [0, 10]!')
+    assert np.all(np.logical_and(chroma[chromatic] >= 2,
+                                 chroma[chromatic] <= 50)), (
+        'Specification chroma must be normalised to domain [2, 50]!')
+    assert np.all(np.logical_and(code[chromatic] >= 1,
+                                 code[chromatic] <= 10)), (
+        'Specification code must be normalised to domain [1, 10]!')
+
+    # 0YR is equivalent to 10R.
+    zero = hue == 0
+    hue = np.where(zero, 10, hue)
+    code = np.where(zero, code % 10 + 1, code)
+
+    grey = np.logical_or(grey, value == 0)
+
+    letters = [''] + [
+        MUNSELL_HUE_LETTER_CODES.first_key_from_value(code_i)
+        for code_i in range(1, 11)
+    ]
+    code = np.where(grey, 0, code).astype(np.int_)
+
+    munsell_colours = [
+        MUNSELL_GRAY_EXTENDED_FORMAT.format(value_i, value_decimals)
+        if grey_i else MUNSELL_COLOUR_EXTENDED_FORMAT.format(
+            hue_i, hue_decimals, letters[code_i], value_i, value_decimals,
+            chroma_i, chroma_decimals)
+        for grey_i, hue_i, value_i, chroma_i, code_i in zip(
+            np.ravel(grey).tolist(),
+            np.ravel(hue).tolist(),
+            np.ravel(value).tolist(),
+            np.ravel(chroma).tolist(),
+            np.ravel(code).tolist())
+    ]
+
+    return np.reshape(np.array(munsell_colours), specification.shape[:-1])
+
+
 def xyY_from_renotation(specification):
     """
     Returns given existing *Munsell* *Colorlab* specification *CIE xyY*
@@ -1243,10 +1614,11 @@ def xyY_from_renotation(specification):
 
     specification = normalize_munsell_specification(specification)
 
-    specifications = _munsell_specifications()
+    index = _munsell_renotation_index()
     try:
-        return MUNSELL_COLOURS_ALL[specifications.index(specification)][1]
-    except ValueError:
+        return np.copy(
+            index.specifications['xyY'][index.indexes[specification]])
+    except KeyError:
         # TODO: Should raise KeyError, need to check the tests.
         raise ValueError(
             ('"{0}" specification does not exists in '
@@ -1276,11 +1648,61 @@ def is_specification_in_renotation(specification):
     False
     """
 
-    try:
-        xyY_from_renotation(specification)
-        return True
-    except ValueError:
-        return False
+    return (normalize_munsell_specification(specification) in
+            _munsell_renotation_index().indexes)
+
+
+def nearest_specifications_from_renotation(xyY, k=1):
+    """
+    Returns the *k* nearest *Munsell* *Colorlab* specifications from
+    *Munsell Renotation System* data to given *CIE xyY* colourspace array
+    and their distances.
+
+    Parameters
+    ----------
+    xyY : array_like
+        *CIE xyY* colourspace array.
+    k : int, optional
+        Nearest specifications count.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications array of shape (..., 4) if
+        :math:`k = 1` or (..., k, 4) otherwise and euclidean distances array
+        in the *CIE xyY* colourspace of shape (...) or (..., k).
+
+    Notes
+    -----
+    -   Input *CIE xyY* colourspace array is in domain [0, 1].
+    -   The neighbours are queried on a cached
+        :class:`scipy.spatial.cKDTree` class instance built on the
+        *Munsell Renotation System* data *CIE xyY* colourspace values whose
+        :math:`Y` luminance is scaled by :math:`0.975` so that it matches the
+        :func:`colour.notation.munsell_value_ASTMD153508` definition
+        convention.
+
+    Examples
+    --------
+    >>> xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+    >>> specification, distance = nearest_specifications_from_renotation(xyY)
+    >>> specification
+    array([ 2.5,  8. ,  6. ,  6. ])
+    >>> distance  # doctest: +ELLIPSIS
+    0.0196215...
+    """
+
+    xyY = np.asarray(xyY)
+
+    index = _munsell_renotation_index()
+    distances, indexes = index.tree.query(xyY, k)
+
+    specifications = index.specifications[indexes]
+    specification = tstack((specifications['hue'], specifications['value'],
+                            specifications['chroma'],
+                            specifications['code']))
+
+    return specification, as_numeric(distances)
 
 
 def bounding_hues_from_renotation(hue, code):
@@ -1994,19 +2416,14 @@ def maximum_chroma_from_renotation(hue, value, code):
     hue_cw, code_cw = hue_cw
     hue_ccw, code_ccw = hue_ccw
 
-    maximum_chromas = _munsell_maximum_chromas_from_renotation()
-    spc_for_indexes = [chroma[0] for chroma in maximum_chromas]
+    maximum_chromas = _munsell_renotation_index().maximum_chromas
 
-    ma_limit_mcw = maximum_chromas[spc_for_indexes.index((hue_cw, value_minus,
-                                                          code_cw))][1]
-    ma_limit_mccw = maximum_chromas[spc_for_indexes.index((
-        hue_ccw, value_minus, code_ccw))][1]
+    ma_limit_mcw = maximum_chromas[(hue_cw, value_minus, code_cw)]
+    ma_limit_mccw = maximum_chromas[(hue_ccw, value_minus, code_ccw)]
 
     if value_plus <= 9:
-        ma_limit_pcw = maximum_chromas[spc_for_indexes.index((
-            hue_cw, value_plus, code_cw))][1]
-        ma_limit_pccw = maximum_chromas[spc_for_indexes.index((
-            hue_ccw, value_plus, code_ccw))][1]
+        ma_limit_pcw = maximum_chromas[(hue_cw, value_plus, code_cw)]
+        ma_limit_pccw = maximum_chromas[(hue_ccw, value_plus, code_ccw)]
         max_chroma = min(ma_limit_mcw, ma_limit_mccw, ma_limit_pcw,
                          ma_limit_pccw)
     else:
@@ -2096,3 +2513,1398 @@ def munsell_specification_to_xy(specification):
                                    (y_minus, y_plus))(chroma)
 
         return np.array([x, y])
+
+
+def _munsell_renotation_tables():
+    """
+    Returns the *Munsell Renotation System* data *CIE xyY* colourspace values
+    and maximum *Munsell* chromas as dense tables and caches them if not
+    existing.
+
+    The tables are built from
+    :func:`colour.notation.munsell._munsell_renotation_index` definition
+    output and are indexed by hue, integer value and chroma, the hue index
+    being given by :func:`colour.notation.munsell._munsell_hue_indexes`
+    definition and the chroma index by the chroma divided by 2. Entries not
+    existing in the *Munsell Renotation System* data are set to *nan*.
+
+    Returns
+    -------
+    tuple
+        *CIE xyY* colourspace values table of shape (40, 11, 26, 3) and
+        maximum *Munsell* chromas table of shape (40, 11).
+    """
+
+    global _MUNSELL_RENOTATION_TABLES_CACHE
+    if _MUNSELL_RENOTATION_TABLES_CACHE is None:
+        specifications = _munsell_renotation_index().specifications
+        specifications = specifications[specifications['value'] % 1 == 0]
+
+        hue_indexes = _munsell_hue_indexes(specifications['hue'],
+                                           specifications['code'])
+        value_indexes = specifications['value'].astype(np.int_)
+        chroma_indexes = (specifications['chroma'] / 2).astype(np.int_)
+
+        xyY_table = np.full((40, 11, 26, 3), np.nan)
+        xyY_table[hue_indexes, value_indexes, chroma_indexes] = (
+            specifications['xyY'])
+
+        maximum_chromas_table = np.full((40, 11), np.nan)
+        np.fmax.at(maximum_chromas_table, (hue_indexes, value_indexes),
+                   specifications['chroma'])
+
+        _MUNSELL_RENOTATION_TABLES_CACHE = xyY_table, maximum_chromas_table
+
+    return _MUNSELL_RENOTATION_TABLES_CACHE
+
+
+def _munsell_hue_indexes(hue, code):
+    """
+    Returns the :func:`colour.notation.munsell._munsell_renotation_tables`
+    definition tables hue indexes of given *Munsell Renotation System* hues,
+    i.e. hues in set {2.5, 5, 7.5, 10}, and codes.
+
+    Parameters
+    ----------
+    hue : numeric or array_like
+        *Munsell* *Colorlab* specification hue.
+    code : numeric or array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    integer or ndarray
+        Hue indexes.
+    """
+
+    return ((np.asarray(code) - 1) * 4 +
+            np.around(np.asarray(hue) / 2.5) - 1).astype(np.int_)
+
+
+def _xyY_from_renotation_array(hue, value, chroma, code):
+    """
+    Returns given *Munsell Renotation System* hues, integer values, chromas
+    and codes *CIE xyY* colourspace values, entries not existing in the
+    *Munsell Renotation System* data are set to *nan*.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        *CIE xyY* colourspace array.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(hue, value, chroma, code)
+
+    xyY_table, _maximum_chromas_table = _munsell_renotation_tables()
+
+    valid = np.logical_and.reduce([
+        hue % 2.5 == 0, hue >= 2.5, hue <= 10,
+        code % 1 == 0, code >= 1, code <= 10,
+        value % 1 == 0, value >= 0, value <= 10,
+        chroma % 2 == 0, chroma >= 2, chroma <= 50,
+    ])
+
+    xyY = np.full(hue.shape + (3, ), np.nan)
+    xyY[valid] = xyY_table[_munsell_hue_indexes(hue[valid], code[valid]),
+                           value[valid].astype(np.int_),
+                           (chroma[valid] / 2).astype(np.int_)]
+
+    return xyY
+
+
+def _bounding_hues_from_renotation_array(hue, code):
+    """
+    Returns for given hues the two bounding hues from
+    *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    tuple
+        Clockwise hue, clockwise code, counter-clockwise hue and
+        counter-clockwise code.
+    """
+
+    hue, code = np.broadcast_arrays(
+        np.asarray(hue, dtype=DEFAULT_FLOAT_DTYPE),
+        np.asarray(code, dtype=DEFAULT_FLOAT_DTYPE))
+
+    hue_cw = 2.5 * np.floor(hue / 2.5)
+    hue_ccw = np.where(hue % 2.5 == 0, hue_cw, (hue_cw + 2.5) % 10)
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
+
+    code_cw = np.where(hue_cw == 0, code % 10 + 1, code)
+    hue_cw = np.where(hue_cw == 0, 10, hue_cw)
+    code_ccw = np.where(hue % 2.5 == 0, code_cw, code)
+
+    return hue_cw, code_cw, hue_ccw, code_ccw
+
+
+def _hue_angle_to_hue_array(hue_angle):
+    """
+    Converts from hue angles in degrees to the *Munsell* *Colorlab*
+    specification hues and codes.
+
+    Parameters
+    ----------
+    hue_angle : array_like
+        Hue angle in degrees.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specification hue and *Munsell* *Colorlab*
+        specification code.
+    """
+
+    single_hue = np.interp(hue_angle, (0, 45, 70, 135, 160, 225, 255, 315,
+                                       360), (0, 2, 3, 4, 5, 6, 8, 9, 10))
+
+    code = np.asarray((7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7))[np.searchsorted(
+        (0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5), single_hue)]
+
+    hue = (10 * (single_hue % 1) + 5) % 10
+    hue = np.where(hue == 0, 10, hue)
+
+    return hue, code.astype(DEFAULT_FLOAT_DTYPE)
+
+
+def _LCHab_to_munsell_specification_array(LCHab):
+    """
+    Converts from *CIE L\*C\*Hab* colourspace array to approximate *Munsell*
+    *Colorlab* specification array.
+
+    Parameters
+    ----------
+    LCHab : array_like
+        *CIE L\*C\*Hab* colourspace array.
+
+    Returns
+    -------
+    ndarray
+        *Munsell* *Colorlab* specification array.
+    """
+
+    L, C, Hab = tsplit(LCHab)
+
+    code = np.asarray((8, 7, 6, 5, 4, 3, 2, 1, 10, 9, 8))[np.searchsorted(
+        (0, 36, 72, 108, 144, 180, 216, 252, 288, 324), Hab)]
+
+    hue = (Hab % 36) / 36 * 10
+    hue = np.where(hue == 0, 10, hue)
+
+    return tstack((hue, L / 10, C / 5, code))
+
+
+def _is_radial_interpolation_from_renotation_ovoid_array(
+        hue, value, chroma, code):
+    """
+    Returns whether to use radial interpolation rather than linear
+    interpolation when drawing ovoids through data points in the
+    *Munsell Renotation System* data from given specifications components.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value, must be an integer
+        normalised to domain [1, 9].
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma, must be an integer and
+        a multiple of 2 normalised to domain [2, 50].
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        Whether to use radial interpolation.
+    """
+
+    ASTM_hue = 10 * ((7 - np.asarray(code)) % 10) + hue
+    ASTM_hue = np.where(ASTM_hue == 0, 100, ASTM_hue)
+
+    radial = np.zeros(ASTM_hue.shape, dtype=np.bool_)
+    for value_r, chromas_ranges in _MUNSELL_RADIAL_INTERPOLATION_HUE_RANGES:
+        value_mask = value == value_r
+        for chroma_minimum, chroma_maximum, hue_ranges in chromas_ranges:
+            mask = np.logical_and.reduce([
+                value_mask, chroma >= chroma_minimum, chroma <= chroma_maximum
+            ])
+            for hue_minimum, hue_maximum in hue_ranges:
+                radial |= np.logical_and.reduce(
+                    [mask, hue_minimum < ASTM_hue, ASTM_hue < hue_maximum])
+
+    return radial
+
+
+def _xy_from_renotation_ovoid_array(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications components to *xy*
+    chromaticity coordinates on *Munsell Renotation System* ovoid.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value, must be an integer
+        normalised to domain [1, 9].
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma, must be an integer and
+        a multiple of 2 normalised to domain [2, 50].
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        *xy* chromaticity coordinates, entries outside the domain are set to
+        *nan*.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(hue, value, chroma, code)
+
+    code = np.where(hue == 0, code % 10 + 1, code)
+    hue = np.where(hue == 0, 10, hue)
+
+    value = np.where(np.logical_or(value < 1, value > 9), np.nan, value)
+
+    x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    # Renotation data is available without interpolation for hues within
+    # threshold of a standard hue.
+    threshold = 1e-7
+    hue_r = 2.5 * np.around(hue / 2.5)
+    in_renotation = np.abs(hue - hue_r) < threshold
+    code_r = np.where(hue_r == 0, code % 10 + 1, code)
+    hue_r = np.where(hue_r == 0, 10, hue_r)
+    xy_r = _xyY_from_renotation_array(hue_r, value, chroma, code_r)[..., 0:2]
+
+    hue_minus, code_minus, hue_plus, code_plus = (
+        _bounding_hues_from_renotation_array(hue, code))
+
+    x_minus, y_minus, _Y_minus = tsplit(
+        _xyY_from_renotation_array(hue_minus, value, chroma, code_minus))
+    rho_minus = np.hypot(x_minus - x_grey, y_minus - y_grey)
+    phi_minus = np.degrees(np.arctan2(y_minus - y_grey, x_minus - x_grey))
+
+    x_plus, y_plus, _Y_plus = tsplit(
+        _xyY_from_renotation_array(hue_plus, value, chroma, code_plus))
+    rho_plus = np.hypot(x_plus - x_grey, y_plus - y_grey)
+    phi_plus = np.degrees(np.arctan2(y_plus - y_grey, x_plus - x_grey))
+
+    lower_hue_angle = hue_to_hue_angle(hue_minus, code_minus)
+    hue_angle = hue_to_hue_angle(hue, code)
+    upper_hue_angle = hue_to_hue_angle(hue_plus, code_plus)
+
+    phi_plus = np.where(phi_minus - phi_plus > 180, phi_plus + 360, phi_plus)
+
+    lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
+
+    wrap = lower_hue_angle > upper_hue_angle
+    hue_angle = np.where(
+        np.logical_and(wrap, lower_hue_angle <= hue_angle), hue_angle - 360,
+        hue_angle)
+    lower_hue_angle = np.where(wrap, lower_hue_angle - 360, lower_hue_angle)
+
+    t = (hue_angle - lower_hue_angle) / (upper_hue_angle - lower_hue_angle)
+
+    x_linear = x_minus + t * (x_plus - x_minus)
+    y_linear = y_minus + t * (y_plus - y_minus)
+
+    theta = np.radians(phi_minus + t * (phi_plus - phi_minus))
+    rho = rho_minus + t * (rho_plus - rho_minus)
+    x_radial = rho * np.cos(theta) + x_grey
+    y_radial = rho * np.sin(theta) + y_grey
+
+    radial = _is_radial_interpolation_from_renotation_ovoid_array(
+        hue, value, chroma, code)
+
+    xy = np.where(radial[..., np.newaxis],
+                  tstack((x_radial, y_radial)), tstack((x_linear, y_linear)))
+
+    return np.where(in_renotation[..., np.newaxis], xy_r, xy)
+
+
+def _munsell_specification_to_xy_array(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications components with
+    integer value to *xy* chromaticity coordinates by interpolating over
+    *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value, must be an integer
+        normalised to domain [0, 10].
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        *xy* chromaticity coordinates.
+    """
+
+    hue, value, chroma, code = np.broadcast_arrays(hue, value, chroma, code)
+
+    grey = _is_grey_munsell_specification_array(hue, chroma)
+
+    value = np.around(value)
+
+    even = chroma % 2 == 0
+    chroma_minus = np.where(even, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(even, chroma, chroma_minus + 2)
+
+    xy_minus = np.where((chroma_minus == 0)[..., np.newaxis],
+                        MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES,
+                        _xy_from_renotation_ovoid_array(
+                            hue, value, chroma_minus, code))
+    xy_plus = _xy_from_renotation_ovoid_array(hue, value, chroma_plus, code)
+
+    t = np.where(even, 0, (chroma - chroma_minus) / 2)[..., np.newaxis]
+    xy = np.where(even[..., np.newaxis], xy_minus,
+                  xy_minus + t * (xy_plus - xy_minus))
+
+    return np.where(grey[..., np.newaxis],
+                    MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES, xy)
+
+
+def _maximum_chroma_from_renotation_array(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas from *Munsell Renotation System*
+    data using given *Munsell* *Colorlab* specifications hues, values and
+    codes.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        Maximum chromas, entries outside the domain are set to *nan*.
+    """
+
+    hue, value, code = np.broadcast_arrays(hue, value, code)
+
+    _xyY_table, maximum_chromas_table = _munsell_renotation_tables()
+
+    valid = np.logical_and(value >= 1, value <= 10)
+
+    value_minus = np.where(value % 1 == 0, value, np.floor(value))
+    value_plus = np.where(value % 1 == 0, value, value_minus + 1)
+    value_minus = np.where(valid, value_minus, 1).astype(np.int_)
+    value_plus = np.where(valid, value_plus, 1).astype(np.int_)
+
+    hue_cw, code_cw, hue_ccw, code_ccw = (
+        _bounding_hues_from_renotation_array(hue, code))
+
+    finite = np.isfinite(hue_cw) & np.isfinite(code_cw)
+    valid = np.logical_and(valid, finite)
+
+    hue_index_cw = np.where(finite, _munsell_hue_indexes(
+        np.where(finite, hue_cw, 2.5), np.where(finite, code_cw, 1)), 0)
+    hue_index_ccw = np.where(finite, _munsell_hue_indexes(
+        np.where(finite, hue_ccw, 2.5), np.where(finite, code_ccw, 1)), 0)
+
+    ma_limit_mcw = maximum_chromas_table[hue_index_cw, value_minus]
+    ma_limit_mccw = maximum_chromas_table[hue_index_ccw, value_minus]
+    ma_limit_pcw = maximum_chromas_table[hue_index_cw, value_plus]
+    ma_limit_pccw = maximum_chromas_table[hue_index_ccw, value_plus]
+
+    L = luminance_ASTMD153508(value)
+    L9 = luminance_ASTMD153508(9)
+    L10 = luminance_ASTMD153508(10)
+    t = (L - L9) / (L10 - L9)
+
+    maximum_chroma = np.where(
+        value_plus <= 9,
+        np.minimum.reduce(
+            [ma_limit_mcw, ma_limit_mccw, ma_limit_pcw, ma_limit_pccw]),
+        np.minimum(ma_limit_mcw * (1 - t), ma_limit_mccw * (1 - t)))
+
+    maximum_chroma = np.where(valid, maximum_chroma, np.nan)
+
+    return np.where(value >= 9.99, 0, maximum_chroma)
+
+
+def _is_grey_munsell_specification_array(hue, chroma):
+    """
+    Returns whether given *Munsell* *Colorlab* specifications components
+    represent grey colours, i.e. *nan* hue or zero or *nan* chroma.
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma.
+
+    Returns
+    -------
+    ndarray
+        Whether the specifications represent grey colours.
+    """
+
+    chroma = np.asarray(chroma)
+
+    return np.logical_or.reduce(
+        [np.isnan(hue), np.isnan(chroma), chroma == 0])
+
+
+def _ASTM_hue_to_hue_array(ASTM_hue):
+    """
+    Converts given *ASTM* hues to *Munsell* *Colorlab* specification hues and
+    codes.
+
+    Parameters
+    ----------
+    ASTM_hue : array_like
+        *ASTM* hue.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specification hue and code.
+    """
+
+    ASTM_hue = np.asarray(ASTM_hue) % 100
+
+    hue = ASTM_hue % 10
+    code = (7 - ASTM_hue // 10) % 10
+
+    zero = hue == 0
+    hue = np.where(zero, 10, hue)
+    code = np.where(zero, code % 10 + 1, np.where(code == 0, 10, code))
+
+    return hue, code
+
+
+def _hue_to_ASTM_hue_array(hue, code):
+    """
+    Converts given *Munsell* *Colorlab* specification hues and codes to
+    *ASTM* hues in domain [0, 100).
+
+    Parameters
+    ----------
+    hue : array_like
+        *Munsell* *Colorlab* specification hue.
+    code : array_like
+        *Munsell* *Colorlab* specification code.
+
+    Returns
+    -------
+    ndarray
+        *ASTM* hue.
+    """
+
+    return (10 * ((7 - np.asarray(code)) % 10) + hue) % 100
+
+
+def _tabulate_munsell_grid():
+    """
+    Tabulates the *Munsell Renotation System* *xy* chromaticity coordinates
+    grid over *ASTM* hue, integer value and even chroma.
+
+    Returns
+    -------
+    ndarray
+        *xy* chromaticity coordinates grid, entries outside the
+        *Munsell Renotation System* data domain are set to *nan*.
+    """
+
+    ASTM_hue, value, chroma = np.meshgrid(
+        _MUNSELL_GRID_ASTM_HUES,
+        _MUNSELL_GRID_VALUES,
+        _MUNSELL_GRID_CHROMAS,
+        indexing='ij')
+    hue, code = _ASTM_hue_to_hue_array(np.ravel(ASTM_hue))
+
+    xy = np.reshape(
+        _munsell_specification_to_xy_array(hue, np.ravel(value),
+                                           np.ravel(chroma), code),
+        ASTM_hue.shape + (2, ))
+
+    # The *xy* chromaticity coordinates at value 10 are the ones of the grey,
+    # consistently with the interpolation performed by
+    # :func:`colour.notation.munsell_specification_array_to_xyY` definition.
+    xy[:, -1] = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    return xy
+
+
+def _munsell_grid():
+    """
+    Returns the *Munsell Renotation System* *xy* chromaticity coordinates
+    grid and the :class:`scipy.spatial.cKDTree` class instances used to invert
+    it and caches them if not existing.
+
+    If :attr:`colour.notation.munsell.MUNSELL_GRID_CACHE_PATH` attribute is
+    not *None*, the grid is read from its file if it exists and matches the
+    grid definition, otherwise it is tabulated and written to the file.
+
+    Returns
+    -------
+    namedtuple
+        *xy* chromaticity coordinates grid, :class:`scipy.spatial.cKDTree`
+        class instances built on the grid chromatic entries *xy* chromaticity
+        coordinates of each integer value, and *ASTM* hues and chromas of
+        these entries.
+    """
+
+    global _MUNSELL_GRID_CACHE
+    if _MUNSELL_GRID_CACHE is None:
+        from colour import __version__
+
+        xy = None
+        if MUNSELL_GRID_CACHE_PATH is not None:
+            try:
+                with np.load(MUNSELL_GRID_CACHE_PATH) as data:
+                    if (str(data['version']) == __version__ and
+                            np.array_equal(data['hues'],
+                                           _MUNSELL_GRID_ASTM_HUES) and
+                            np.array_equal(data['values'],
+                                           _MUNSELL_GRID_VALUES) and
+                            np.array_equal(data['chromas'],
+                                           _MUNSELL_GRID_CHROMAS)):
+                        xy = data['xy']
+            except (IOError, OSError, KeyError, ValueError):
+                pass
+
+        if xy is None:
+            xy = _tabulate_munsell_grid()
+
+            if MUNSELL_GRID_CACHE_PATH is not None:
+                try:
+                    directory = os.path.dirname(MUNSELL_GRID_CACHE_PATH)
+                    if directory and not os.path.exists(directory):
+                        os.makedirs(directory)
+
+                    with open(MUNSELL_GRID_CACHE_PATH, 'wb') as file_handle:
+                        np.savez(
+                            file_handle,
+                            version=__version__,
+                            hues=_MUNSELL_GRID_ASTM_HUES,
+                            values=_MUNSELL_GRID_VALUES,
+                            chromas=_MUNSELL_GRID_CHROMAS,
+                            xy=xy)
+                except (IOError, OSError):
+                    warning('"Munsell" grid could not be persisted to "{0}" '
+                            'file!'.format(MUNSELL_GRID_CACHE_PATH))
+
+        ASTM_hue, chroma = np.meshgrid(
+            _MUNSELL_GRID_ASTM_HUES[:-1],
+            _MUNSELL_GRID_CHROMAS[1:],
+            indexing='ij')
+
+        # The chromatic entries of each integer value are indexed in a
+        # distinct tree so that the queries only involve the *xy*
+        # chromaticity coordinates.
+        trees, hues_chromas = [], []
+        for k in range(len(_MUNSELL_GRID_VALUES) - 1):
+            xy_chromatic = xy[:-1, k, 1:]
+            finite = np.all(np.isfinite(xy_chromatic), axis=-1)
+
+            trees.append(cKDTree(xy_chromatic[finite]))
+            hues_chromas.append(tstack((ASTM_hue[finite], chroma[finite])))
+
+        _MUNSELL_GRID_CACHE = _MunsellGrid(xy, trees, hues_chromas)
+
+    return _MUNSELL_GRID_CACHE
+
+
+def _munsell_grid_cells(ASTM_hue, value, chroma):
+    """
+    Returns the *Munsell Renotation System* *xy* chromaticity coordinates
+    grid cells containing given *ASTM* hues, values and chromas, the
+    cells corners being interpolated over value according to luminance.
+
+    Parameters
+    ----------
+    ASTM_hue : array_like
+        *ASTM* hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value in domain [1, 10).
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma in domain [0, 50].
+
+    Returns
+    -------
+    tuple
+        Cells *ASTM* hue and chroma fractional coordinates, and
+        :math:`(i, j)`, :math:`(i + 1, j)`, :math:`(i, j + 1)` and
+        :math:`(i + 1, j + 1)` corners *xy* chromaticity coordinates.
+    """
+
+    xy = _munsell_grid().xy
+
+    finite = np.logical_and(np.isfinite(ASTM_hue), np.isfinite(chroma))
+    ASTM_hue = np.where(finite, ASTM_hue, 0)
+    chroma = np.where(finite, chroma, 0)
+
+    hue_step = _MUNSELL_GRID_ASTM_HUES[1] - _MUNSELL_GRID_ASTM_HUES[0]
+    chroma_step = _MUNSELL_GRID_CHROMAS[1] - _MUNSELL_GRID_CHROMAS[0]
+
+    i = np.clip(
+        np.floor(ASTM_hue / hue_step), 0,
+        len(_MUNSELL_GRID_ASTM_HUES) - 2).astype(np.int_)
+    j = np.clip(
+        np.floor(chroma / chroma_step), 0,
+        len(_MUNSELL_GRID_CHROMAS) - 2).astype(np.int_)
+    u = (ASTM_hue / hue_step - i)[..., np.newaxis]
+    s = (chroma / chroma_step - j)[..., np.newaxis]
+
+    integer = np.abs(value - np.around(value)) <= INTEGER_THRESHOLD
+    value_minus = np.where(integer, np.around(value), np.floor(value))
+    value_plus = np.where(integer, np.around(value), value_minus + 1)
+    k_minus = value_minus.astype(np.int_) - 1
+    k_plus = value_plus.astype(np.int_) - 1
+
+    Y = luminance_ASTMD153508(value)
+    Y_minus = luminance_ASTMD153508(value_minus)
+    Y_plus = luminance_ASTMD153508(value_plus)
+    t = np.where(value_minus == value_plus, 0,
+                 (Y - Y_minus) / (Y_plus - Y_minus))[..., np.newaxis]
+
+    corners = []
+    for i_c, j_c in ((i, j), (i + 1, j), (i, j + 1), (i + 1, j + 1)):
+        xy_minus = xy[i_c, k_minus, j_c]
+        xy_plus = xy[i_c, k_plus, j_c]
+        corners.append(
+            np.where(finite[..., np.newaxis],
+                     xy_minus + t * (xy_plus - xy_minus), np.nan))
+
+    return (u, s) + tuple(corners)
+
+
+def _interpolate_munsell_grid(ASTM_hue, value, chroma):
+    """
+    Interpolates the *Munsell Renotation System* *xy* chromaticity coordinates
+    grid bilinearly at given *ASTM* hues, values and chromas.
+
+    Parameters
+    ----------
+    ASTM_hue : array_like
+        *ASTM* hue.
+    value : array_like
+        *Munsell* *Colorlab* specification value in domain [1, 10).
+    chroma : array_like
+        *Munsell* *Colorlab* specification chroma in domain [0, 50].
+
+    Returns
+    -------
+    tuple
+        Interpolated *xy* chromaticity coordinates and their partial
+        derivatives with respect to the cells *ASTM* hue and chroma
+        fractional coordinates.
+    """
+
+    u, s, xy_00, xy_10, xy_01, xy_11 = _munsell_grid_cells(
+        ASTM_hue, value, chroma)
+
+    xy = ((1 - u) * (1 - s) * xy_00 + u * (1 - s) * xy_10 +
+          (1 - u) * s * xy_01 + u * s * xy_11)
+    d_u = (xy_10 - xy_00) * (1 - s) + (xy_11 - xy_01) * s
+    d_s = (xy_01 - xy_00) * (1 - u) + (xy_11 - xy_10) * u
+
+    return xy, d_u, d_s
+
+
+def _refine_munsell_grid_inversion(xy, value, ASTM_hue, chroma):
+    """
+    Refines given initial *ASTM* hues and chromas so that the bilinear
+    interpolation of the *Munsell Renotation System* *xy* chromaticity
+    coordinates grid matches given *xy* chromaticity coordinates.
+
+    The refinement performs damped *Newton* iterations: the steps are limited
+    to a few grid cells and halved until they reduce the residual, the cells
+    with undefined corners being rejected likewise.
+
+    Parameters
+    ----------
+    xy : ndarray, (n, 2)
+        *xy* chromaticity coordinates.
+    value : ndarray, (n, )
+        *Munsell* *Colorlab* specification value in domain [1, 10).
+    ASTM_hue : ndarray, (n, )
+        Initial *ASTM* hue.
+    chroma : ndarray, (n, )
+        Initial *Munsell* *Colorlab* specification chroma.
+
+    Returns
+    -------
+    tuple
+        Refined *ASTM* hue and chroma, and whether the refinement converged.
+    """
+
+    hue_step = _MUNSELL_GRID_ASTM_HUES[1] - _MUNSELL_GRID_ASTM_HUES[0]
+    chroma_step = _MUNSELL_GRID_CHROMAS[1] - _MUNSELL_GRID_CHROMAS[0]
+
+    # The chroma is kept strictly positive as the hue derivatives vanish on
+    # the neutral axis.
+    chroma_minimum = chroma_step * 1e-6
+
+    convergence_threshold = 1e-10
+    iterations_maximum = 16
+    halvings_maximum = 6
+    step_maximum = np.array([50, 5])
+
+    ASTM_hue = np.array(ASTM_hue, dtype=DEFAULT_FLOAT_DTYPE)
+    chroma = np.clip(chroma, chroma_minimum, _MUNSELL_GRID_CHROMAS[-1])
+
+    xy_i, d_u, d_s = _interpolate_munsell_grid(ASTM_hue, value, chroma)
+    residual = xy_i - xy
+    distance = np.hypot(residual[..., 0], residual[..., 1])
+    distance[np.isnan(distance)] = np.inf
+
+    for _iteration in range(iterations_maximum):
+        pending = np.where(~(distance < convergence_threshold))[0]
+        if pending.size == 0:
+            break
+
+        r, d_u_p, d_s_p = residual[pending], d_u[pending], d_s[pending]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            determinant = (
+                d_u_p[..., 0] * d_s_p[..., 1] - d_s_p[..., 0] * d_u_p[..., 1])
+            step = tstack(
+                ((d_s_p[..., 1] * r[..., 0] - d_s_p[..., 0] * r[..., 1]) /
+                 determinant,
+                 (d_u_p[..., 0] * r[..., 1] - d_u_p[..., 1] * r[..., 0]) /
+                 determinant))
+        step[~np.isfinite(step)] = 0
+        step *= np.min(
+            np.minimum(1, step_maximum / np.maximum(np.abs(step), EPSILON)),
+            axis=-1)[..., np.newaxis]
+
+        for _halving in range(halvings_maximum):
+            ASTM_hue_p = (ASTM_hue[pending] - step[..., 0] * hue_step) % 100
+            chroma_p = np.clip(chroma[pending] - step[..., 1] * chroma_step,
+                               chroma_minimum, _MUNSELL_GRID_CHROMAS[-1])
+
+            xy_p, d_u_p, d_s_p = _interpolate_munsell_grid(
+                ASTM_hue_p, value[pending], chroma_p)
+            residual_p = xy_p - xy[pending]
+            distance_p = np.hypot(residual_p[..., 0], residual_p[..., 1])
+
+            better = distance_p < distance[pending]
+            indexes = pending[better]
+            ASTM_hue[indexes] = ASTM_hue_p[better]
+            chroma[indexes] = chroma_p[better]
+            residual[indexes] = residual_p[better]
+            distance[indexes] = distance_p[better]
+            d_u[indexes] = d_u_p[better]
+            d_s[indexes] = d_s_p[better]
+
+            pending, step = pending[~better], step[~better] / 2
+            if pending.size == 0:
+                break
+
+    return ASTM_hue, chroma, distance < convergence_threshold
+
+
+def _munsell_specification_array_to_xyY_Grid(specification):
+    """
+    Converts given *Munsell* *Colorlab* specification array to *CIE xyY*
+    colourspace by interpolating the *Munsell Renotation System* *xy*
+    chromaticity coordinates grid.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specification array.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE xyY* colourspace array.
+    """
+
+    specification = np.asarray(specification, dtype=DEFAULT_FLOAT_DTYPE)
+    shape = specification.shape
+    specification = np.reshape(specification, (-1, 4))
+
+    hue, value, chroma, code = tsplit(specification)
+
+    grey = _is_grey_munsell_specification_array(hue, chroma)
+    gridded = np.logical_and.reduce(
+        [~grey, value >= 1, value < 10, chroma <= _MUNSELL_GRID_CHROMAS[-1]])
+
+    xyY = np.full(specification.shape[:-1] + (3, ), np.nan)
+    xyY[..., 2] = luminance_ASTMD153508(value) / 100
+    xyY[grey, 0:2] = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    xyY[gridded, 0:2] = _interpolate_munsell_grid(
+        _hue_to_ASTM_hue_array(hue[gridded], code[gridded]), value[gridded],
+        chroma[gridded])[0]
+
+    fallback = np.logical_and(~grey, np.isnan(xyY[..., 0]))
+    if np.any(fallback):
+        xyY[fallback] = _munsell_specification_array_to_xyY_Centore2014(
+            specification[fallback])
+
+    return np.reshape(xyY, shape[:-1] + (3, ))
+
+
+def _xyY_to_munsell_specification_array_Grid(xyY):
+    """
+    Converts from *CIE xyY* colourspace array to *Munsell* *Colorlab*
+    specification array by inverting the *Munsell Renotation System* *xy*
+    chromaticity coordinates grid.
+
+    The initial hue and chroma are given by the nearest grid entries of the
+    bounding integer values queried on :class:`scipy.spatial.cKDTree` class
+    instances and are then refined with damped *Newton* iterations on the
+    bilinear interpolation of the grid cells. The samples whose refinement
+    does not converge are converted with
+    :func:`colour.notation.xyY_to_munsell_specification_array` definition.
+
+    Parameters
+    ----------
+    xyY : array_like, (..., 3)
+        *CIE xyY* colourspace array.
+
+    Returns
+    -------
+    ndarray, (..., 4)
+        *Munsell* *Colorlab* specification array.
+    """
+
+    xyY = np.asarray(xyY, dtype=DEFAULT_FLOAT_DTYPE)
+    shape = xyY.shape
+    xyY = np.reshape(xyY, (-1, 3))
+
+    x, y, Y = tsplit(xyY)
+
+    value = np.reshape(munsell_value_ASTMD153508(Y * 100), Y.shape)
+    value = np.where(
+        np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+        np.around(value), value)
+
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    grey = np.hypot(x - x_center, y - y_center) < 1e-7
+
+    specification = tstack((np.full(value.shape, np.nan), value,
+                            np.full(value.shape, np.nan),
+                            np.full(value.shape, np.nan)))
+
+    gridded = np.logical_and.reduce(
+        [~grey, value >= 1, value < 10,
+         np.isfinite(x), np.isfinite(y)])
+
+    grid = _munsell_grid()
+    xy_i = xyY[gridded, 0:2]
+    value_i = value[gridded]
+
+    # The initial hue and chroma are chosen among the nearest grid entries of
+    # the bounding integer values, at their chroma and halfway to the lower
+    # one, as the grid cell with the smallest residual.
+    value_minus = np.floor(value_i).astype(np.int_)
+    value_plus = np.minimum(value_minus + 1, len(_MUNSELL_GRID_VALUES) - 1)
+
+    ASTM_hue_i = np.zeros(value_i.shape)
+    chroma_i = np.zeros(value_i.shape)
+    distance_i = np.full(value_i.shape, np.inf)
+    for value_k in (value_minus, value_plus):
+        ASTM_hue_k = np.zeros(value_i.shape)
+        chroma_k = np.zeros(value_i.shape)
+        for k, (tree, hues_chromas) in enumerate(
+                zip(grid.trees, grid.hues_chromas)):
+            samples = value_k == k + 1
+            if np.any(samples):
+                _distances, indexes = tree.query(xy_i[samples])
+                ASTM_hue_k[samples], chroma_k[samples] = tsplit(
+                    hues_chromas[indexes])
+
+        for chroma_k in (chroma_k, chroma_k - 1):
+            xy_k = _interpolate_munsell_grid(ASTM_hue_k, value_i, chroma_k)[0]
+            distance_k = np.hypot(xy_k[..., 0] - xy_i[..., 0],
+                                  xy_k[..., 1] - xy_i[..., 1])
+
+            closer = distance_k < distance_i
+            ASTM_hue_i[closer] = ASTM_hue_k[closer]
+            chroma_i[closer] = chroma_k[closer]
+            distance_i[closer] = distance_k[closer]
+
+    ASTM_hue_i, chroma_i, converged = _refine_munsell_grid_inversion(
+        xy_i, value_i, ASTM_hue_i, chroma_i)
+
+    # The refinement of the samples that do not converge, typically near the
+    # neutral axis where the nearest grid entries hue can be far from the
+    # actual hue, is restarted from the other hue quadrants.
+    for offset in (25, 50, 75):
+        restart = np.where(~converged)[0]
+        if restart.size == 0:
+            break
+
+        ASTM_hue_r, chroma_r, converged_r = _refine_munsell_grid_inversion(
+            xy_i[restart], value_i[restart],
+            (ASTM_hue_i[restart] + offset) % 100,
+            np.full(restart.shape, 1.0))
+
+        restart = restart[converged_r]
+        ASTM_hue_i[restart] = ASTM_hue_r[converged_r]
+        chroma_i[restart] = chroma_r[converged_r]
+        converged[restart] = True
+
+    hue_i, code_i = _ASTM_hue_to_hue_array(ASTM_hue_i)
+
+    specification[np.where(gridded)[0][converged]] = tstack(
+        (hue_i, value_i, chroma_i, code_i))[converged]
+
+    fallback = np.logical_and(~grey, np.isnan(specification[..., 0]))
+    if np.any(fallback):
+        specification[fallback] = (
+            _xyY_to_munsell_specification_array_Centore2014(xyY[fallback]))
+
+    return np.reshape(specification, shape[:-1] + (4, ))
+
+
+def _munsell_specification_array_to_xyY_Centore2014(specification):
+    """
+    Converts given *Munsell* *Colorlab* specification array to *CIE xyY*
+    colourspace using *Centore (2014)* interpolation of the
+    *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specification array.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE xyY* colourspace array.
+    """
+
+    hue, value, chroma, code = tsplit(
+        np.asarray(specification, dtype=DEFAULT_FLOAT_DTYPE))
+
+    grey = _is_grey_munsell_specification_array(hue, chroma)
+
+    Y = luminance_ASTMD153508(value)
+
+    integer = np.abs(value - np.around(value)) <= INTEGER_THRESHOLD
+    value_minus = np.where(integer, np.around(value), np.floor(value))
+    value_plus = np.where(integer, np.around(value), value_minus + 1)
+
+    xy_minus = _munsell_specification_to_xy_array(hue, value_minus, chroma,
+                                                  code)
+
+    grey_plus = np.logical_or(grey, value_plus == 10)
+    xy_plus = _munsell_specification_to_xy_array(
+        np.where(grey_plus, np.nan, hue), value_plus, chroma, code)
+
+    Y_minus = luminance_ASTMD153508(value_minus)
+    Y_plus = luminance_ASTMD153508(value_plus)
+
+    t = np.where(value_minus == value_plus, 0,
+                 (Y - Y_minus) / (Y_plus - Y_minus))[..., np.newaxis]
+    x, y = tsplit(xy_minus + t * (xy_plus - xy_minus))
+
+    return tstack((x, y, Y / 100))
+
+
+def _xyY_to_munsell_specification_array_Centore2014(xyY):
+    """
+    Converts from *CIE xyY* colourspace array to *Munsell* *Colorlab*
+    specification array using *Centore (2014)* iterative inversion algorithm
+    run on all the samples simultaneously.
+
+    Parameters
+    ----------
+    xyY : array_like, (n, 3)
+        *CIE xyY* colourspace array.
+
+    Returns
+    -------
+    ndarray, (n, 4)
+        *Munsell* *Colorlab* specification array.
+    """
+
+    x, y, Y = tsplit(xyY)
+
+    # Scaling *Y* for algorithm needs.
+    value = np.reshape(munsell_value_ASTMD153508(Y * 100), Y.shape)
+    value = np.where(
+        np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+        np.around(value), value)
+
+    x_center, y_center, _Y_center = tsplit(
+        _munsell_specification_array_to_xyY_Centore2014(
+            tstack((np.full(value.shape, np.nan), value,
+                    np.full(value.shape, np.nan),
+                    np.full(value.shape, np.nan)))))
+    rho_input = np.hypot(x - x_center, y - y_center)
+    phi_input = np.degrees(np.arctan2(y - y_center, x - x_center))
+
+    specification = tstack((np.full(value.shape, np.nan), value,
+                            np.full(value.shape, np.nan),
+                            np.full(value.shape, np.nan)))
+
+    grey_threshold = 1e-7
+    indexes = np.where(np.logical_not(rho_input < grey_threshold))[0]
+
+    Lab = XYZ_to_Lab(
+        xyY_to_XYZ(xyY), MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES)
+    hue, _value, chroma, code = tsplit(
+        _LCHab_to_munsell_specification_array(Lab_to_LCHab(Lab)))
+    chroma = (5 / 5.5) * chroma
+
+    def _xy(hue, value, chroma, code):
+        """
+        Converts given specifications components to *xy* chromaticity
+        coordinates.
+        """
+
+        return tsplit(
+            _munsell_specification_array_to_xyY_Centore2014(
+                tstack((hue, value, chroma, code)))[..., 0:2])
+
+    def _wrap(angle):
+        """
+        Wraps given angles to domain [-180, 180].
+        """
+
+        return np.where(angle > 180, angle - 360, angle)
+
+    convergence_threshold = 1e-7
+    iterations_maximum = 64
+    iterations_maximum_inner = 16
+
+    for _iteration in range(iterations_maximum + 1):
+        if indexes.size == 0:
+            break
+
+        x_i, y_i = x[indexes], y[indexes]
+        x_c, y_c = x_center[indexes], y_center[indexes]
+        rho_i, phi_i = rho_input[indexes], phi_input[indexes]
+        value_i = value[indexes]
+        hue_i, chroma_i, code_i = hue[indexes], chroma[indexes], code[indexes]
+
+        # Hue refinement.
+        hue_angle_current = hue_to_hue_angle(hue_i, code_i)
+
+        chroma_i = np.minimum(
+            chroma_i,
+            _maximum_chroma_from_renotation_array(hue_i, value_i, code_i))
+
+        x_current, y_current = _xy(hue_i, value_i, chroma_i, code_i)
+        phi_current = np.degrees(
+            np.arctan2(y_current - y_c, x_current - x_c))
+        phi_current_difference = _wrap((360 - phi_i + phi_current) % 360)
+
+        hue_angle_inner = (hue_angle_current + (phi_i - phi_current)) % 360
+        hue_angle_difference_inner = _wrap((phi_i - phi_current) % 360)
+
+        hue_inner, code_inner = _hue_angle_to_hue_array(hue_angle_inner)
+        x_inner, y_inner = _xy(hue_inner, value_i, chroma_i, code_inner)
+        phi_inner = np.degrees(np.arctan2(y_inner - y_c, x_inner - x_c))
+        phi_inner_difference = _wrap((360 - phi_i + phi_inner) % 360)
+
+        # Linear extrapolation of the hue angle difference cancelling the
+        # phi difference.
+        phi_differences_delta = phi_inner_difference - phi_current_difference
+        hue_angle_difference_new = np.where(
+            phi_differences_delta == 0, 0,
+            -phi_current_difference * hue_angle_difference_inner /
+            phi_differences_delta) % 360
+        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
+
+        hue_i, code_i = _hue_angle_to_hue_array(hue_angle_new)
+
+        x_current, y_current = _xy(hue_i, value_i, chroma_i, code_i)
+        converged = np.hypot(x_i - x_current,
+                             y_i - y_current) < convergence_threshold
+
+        specification[indexes[converged]] = tstack(
+            (hue_i, value_i, chroma_i, code_i))[converged]
+
+        # Chroma refinement.
+        chroma_maximum = _maximum_chroma_from_renotation_array(
+            hue_i, value_i, code_i)
+        chroma_i = np.minimum(chroma_i, chroma_maximum)
+
+        x_current, y_current = _xy(hue_i, value_i, chroma_i, code_i)
+        rho_current = np.hypot(x_current - x_c, y_current - y_c)
+
+        rho_bounds = np.full((indexes.size, iterations_maximum_inner + 1),
+                             np.nan)
+        chroma_bounds = np.full((indexes.size, iterations_maximum_inner + 1),
+                                np.nan)
+        rho_bounds[:, 0] = rho_current
+        chroma_bounds[:, 0] = chroma_i
+
+        bracketed = np.zeros(indexes.size, dtype=np.bool_)
+        for iteration_inner in range(1, iterations_maximum_inner + 1):
+            inner = np.where(~np.logical_or(bracketed, converged))[0]
+            if inner.size == 0:
+                break
+
+            chroma_inner = np.minimum(
+                ((rho_i[inner] / rho_current[inner]) ** iteration_inner) *
+                chroma_i[inner], chroma_maximum[inner])
+
+            x_inner, y_inner = _xy(hue_i[inner], value_i[inner], chroma_inner,
+                                   code_i[inner])
+
+            rho_bounds[inner, iteration_inner] = np.hypot(
+                x_inner - x_c[inner], y_inner - y_c[inner])
+            chroma_bounds[inner, iteration_inner] = chroma_inner
+
+            bracketed[inner] = np.logical_and(
+                np.nanmin(rho_bounds[inner], axis=-1) < rho_i[inner],
+                rho_i[inner] < np.nanmax(rho_bounds[inner], axis=-1))
+
+        rows = np.arange(indexes.size)
+        sorting_indexes = np.argsort(rho_bounds, axis=-1)
+        rho_bounds = rho_bounds[rows[..., np.newaxis], sorting_indexes]
+        chroma_bounds = chroma_bounds[rows[..., np.newaxis], sorting_indexes]
+
+        upper = np.clip(
+            np.sum(rho_bounds < rho_i[..., np.newaxis], axis=-1), 1,
+            iterations_maximum_inner)
+        rho_0, rho_1 = rho_bounds[rows, upper - 1], rho_bounds[rows, upper]
+        chroma_0 = chroma_bounds[rows, upper - 1]
+        chroma_1 = chroma_bounds[rows, upper]
+
+        chroma_i = np.where(
+            bracketed,
+            chroma_0 + (rho_i - rho_0) * (chroma_1 - chroma_0) /
+            (rho_1 - rho_0), np.nan)
+
+        x_current, y_current = _xy(hue_i, value_i, chroma_i, code_i)
+        converged_chroma = np.logical_and(
+            ~converged,
+            np.hypot(x_i - x_current, y_i - y_current) < convergence_threshold)
+
+        specification[indexes[converged_chroma]] = tstack(
+            (hue_i, value_i, chroma_i, code_i))[converged_chroma]
+
+        hue[indexes], chroma[indexes], code[indexes] = hue_i, chroma_i, code_i
+
+        remaining = np.logical_and.reduce(
+            [~converged, ~converged_chroma, bracketed])
+
+        specification[indexes[~np.logical_or.reduce(
+            [converged, converged_chroma, remaining])]] = np.nan
+
+        indexes = indexes[remaining]
+
+    if indexes.size != 0:
+        specification[indexes] = np.nan
+
+    if np.any(np.isnan(specification[..., 1])):
+        warning('"{0}" samples did not converge to a "Munsell" '
+                'specification!'.format(
+                    np.sum(np.isnan(specification[..., 1]))))
+
+    return specification
+
+
+MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS = CaseInsensitiveMapping({
+    'Centore 2014': _munsell_specification_array_to_xyY_Centore2014,
+    'Grid': _munsell_specification_array_to_xyY_Grid
+})
+MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS.__doc__ = """
+Supported *Munsell* *Colorlab* specification array to *CIE xyY* colourspace
+conversion methods.
+
+References
+----------
+-   :cite:`Centore2014m`
+
+MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS : CaseInsensitiveMapping
+    **{'Centore 2014', 'Grid'}**
+"""
+
+XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS = CaseInsensitiveMapping({
+    'Centore 2014': _xyY_to_munsell_specification_array_Centore2014,
+    'Grid': _xyY_to_munsell_specification_array_Grid
+})
+XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS.__doc__ = """
+Supported *CIE xyY* colourspace to *Munsell* *Colorlab* specification array
+conversion methods.
+
+References
+----------
+-   :cite:`Centore2014p`
+
+XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS : CaseInsensitiveMapping
+    **{'Centore 2014', 'Grid'}**
+"""
+
+
+@ignore_numpy_errors
+def munsell_specification_array_to_xyY(specification,
+                                       method='Centore 2014'):
+    """
+    Converts given *Munsell* *Colorlab* specification array to *CIE xyY*
+    colourspace.
+
+    This definition is the n-dimensional counterpart of
+    :func:`colour.notation.munsell.munsell_specification_to_xyY` definition,
+    the *Munsell* *Colorlab* specifications being stored in an array whose
+    last dimension holds hue, value, chroma and code. Grey colours are
+    represented with *nan* hue, chroma and code, or with a zero chroma.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specification array.
+    method : unicode, optional
+        **{'Centore 2014', 'Grid'}**,
+        Computation method, *Grid* method interpolates a precomputed grid of
+        the *Munsell Renotation System* *xy* chromaticity coordinates
+        tabulated over *ASTM* hue with 0.1 steps, integer value and even
+        chroma. The interpolation over value and chroma being linear, as in
+        *Centore 2014* method, the error is only introduced by the
+        interpolation over hue. The grid is cached in memory and persisted to
+        :attr:`colour.notation.munsell.MUNSELL_GRID_CACHE_PATH` attribute
+        file.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE xyY* colourspace array.
+
+    Notes
+    -----
+    -   Input *Munsell* *Colorlab* specification hue is normalised to domain
+        [0, 10].
+    -   Input *Munsell* *Colorlab* specification value is normalised to domain
+        [0, 10].
+    -   Output *CIE xyY* colourspace array is normalised to range [0, 1].
+    -   The *CIE xyY* colourspace values of specifications outside the
+        *Munsell Renotation System* data domain are set to *nan*.
+
+    References
+    ----------
+    -   :cite:`Centore2014m`
+
+    Examples
+    --------
+    >>> spc = np.array([
+    ...     [2.1, 8.0, 17.9, 4],
+    ...     [np.nan, 8.9, np.nan, np.nan],
+    ... ])
+    >>> munsell_specification_array_to_xyY(spc)  # doctest: +ELLIPSIS
+    array([[ 0.4400632...,  0.5522428...,  0.5761962...],
+           [ 0.31006   ,  0.31616   ,  0.7461345...]])
+    >>> munsell_specification_array_to_xyY(spc, method='Grid')
+    ... # doctest: +ELLIPSIS
+    array([[ 0.4400632...,  0.5522428...,  0.5761962...],
+           [ 0.31006   ,  0.31616   ,  0.7461345...]])
+    """
+
+    return MUNSELL_SPECIFICATION_ARRAY_TO_XYY_METHODS[method](specification)
+
+
+@ignore_numpy_errors
+def xyY_to_munsell_specification_array(xyY, method='Centore 2014'):
+    """
+    Converts from *CIE xyY* colourspace array to *Munsell* *Colorlab*
+    specification array.
+
+    This definition is the n-dimensional counterpart of
+    :func:`colour.notation.munsell.xyY_to_munsell_specification` definition:
+    the iterative inversion algorithm is run on all the samples
+    simultaneously, masking the converged samples out of the subsequent
+    iterations.
+
+    Parameters
+    ----------
+    xyY : array_like, (..., 3)
+        *CIE xyY* colourspace array.
+
+    method : unicode, optional
+        **{'Centore 2014', 'Grid'}**,
+        Computation method, *Grid* method inverts a precomputed grid of the
+        *Munsell Renotation System* *xy* chromaticity coordinates, see
+        :func:`colour.notation.munsell_specification_array_to_xyY`
+        definition, with :class:`scipy.spatial.cKDTree` class instances
+        nearest neighbour queries followed by damped *Newton* iterations.
+        The samples that cannot be inverted with the grid, i.e. the samples
+        outside the grid domain and the samples whose *Newton* iterations do
+        not converge, fall back to *Centore 2014* method: the *Grid* method
+        accuracy is thus only that of the grid for the other samples.
+
+    Returns
+    -------
+    ndarray, (..., 4)
+        *Munsell* *Colorlab* specification array, grey colours are
+        represented with *nan* hue, chroma and code.
+
+    Warning
+    -------
+    A warning is issued for samples that are not within *MacAdam* limits and
+    for samples whose inversion does not converge, the *Munsell* *Colorlab*
+    specification of the latter being set to *nan*.
+
+    Notes
+    -----
+    -   Input *CIE xyY* colourspace array is normalised to domain [0, 1].
+
+    References
+    ----------
+    -   :cite:`Centore2014p`
+
+    Examples
+    --------
+    >>> xyY = np.array([
+    ...     [0.38736945, 0.35751656, 0.59362000],
+    ...     [0.31006000, 0.31616000, 0.74613450],
+    ... ])
+    >>> xyY_to_munsell_specification_array(xyY)  # doctest: +ELLIPSIS
+    array([[ 4.2000019...,  8.0999999...,  5.2999996...,  6.        ],
+           [        nan,  8.9000000...,         nan,         nan]])
+    >>> xyY_to_munsell_specification_array(xyY, method='Grid')
+    ... # doctest: +ELLIPSIS
+    array([[ 4.2000...,  8.0999999...,  5.2999...,  6.        ],
+           [        nan,  8.9000000...,         nan,         nan]])
+    """
+
+    function = XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS[method]
+
+    xyY = np.asarray(xyY, dtype=DEFAULT_FLOAT_DTYPE)
+    shape = xyY.shape
+
+    xyY = np.reshape(xyY, (-1, 3))
+
+    within_macadam_limits = is_within_macadam_limits(
+        xyY, MUNSELL_DEFAULT_ILLUMINANT)
+    if not np.all(within_macadam_limits):
+        warning('"{0}" samples are not within "MacAdam" limits for illuminant '
+                '"{1}"!'.format(
+                    np.sum(~within_macadam_limits),
+                    MUNSELL_DEFAULT_ILLUMINANT))
+
+    return np.reshape(function(xyY), shape[:-1] + (4, ))
@@ -6,15 +6,29 @@ Defines unit tests for :mod:`colour.notation.munsell` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+from itertools import permutations
+
+from colour.notation import munsell
 from colour.notation.munsell import (parse_munsell_colour,
                                      is_grey_munsell_colour,
                                      normalize_munsell_specification)
 from colour.notation.munsell import (munsell_colour_to_munsell_specification,
                                      munsell_specification_to_munsell_colour)
-from colour.notation.munsell import (xyY_from_renotation,
-                                     is_specification_in_renotation)
+from colour.notation.munsell import (
+    parse_munsell_colours, munsell_colours_to_munsell_specification_array,
+    munsell_specification_array_to_munsell_colours)
+from colour.notation.munsell import (
+    xyY_from_renotation, is_specification_in_renotation,
+    nearest_specifications_from_renotation)
 from colour.notation.munsell import bounding_hues_from_renotation
 from colour.notation.munsell import hue_to_hue_angle, hue_angle_to_hue
 from colour.notation.munsell import hue_to_ASTM_hue
@@ -25,12 +39,16 @@ from colour.notation.munsell import maximum_chroma_from_renotation
 from colour.notation.munsell import munsell_specification_to_xy
 from colour.notation.munsell import (munsell_specification_to_xyY,
                                      xyY_to_munsell_specification)
+from colour.notation.munsell import (munsell_colour_to_xyY,
+                                     xyY_to_munsell_colour)
+from colour.notation.munsell import (munsell_specification_array_to_xyY,
+                                     xyY_to_munsell_specification_array)
 from colour.notation import (munsell_value_Priest1920,
                              munsell_value_Munsell1933, munsell_value_Moon1943,
                              munsell_value_Saunderson1944,
                              munsell_value_Ladd1955, munsell_value_McCamy1987,
                              munsell_value_ASTMD153508)
-from colour.utilities import ignore_numpy_errors
+from colour.utilities import ignore_numpy_errors, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -52,12 +70,18 @@ __all__ = [
     'TestxyY_to_munsell_colour', 'TestParseMunsellColour',
     'TestIsGreyMunsellColour', 'TestNormalizeMunsellSpecification',
     'TestMunsellColourToMunsellSpecification',
-    'TestMunsellSpecificationToMunsellColour', 'Test_xyY_fromRenotation',
-    'TestIsSpecificationInRenotation', 'TestBoundingHuesFromRenotation',
+    'TestMunsellSpecificationToMunsellColour', 'TestParseMunsellColours',
+    'TestMunsellColoursToMunsellSpecificationArray',
+    'TestMunsellSpecificationArrayToMunsellColours', 'Test_xyY_fromRenotation',
+    'TestIsSpecificationInRenotation',
+    'TestNearestSpecificationsFromRenotation',
+    'TestBoundingHuesFromRenotation',
     'TestHueToHueAngle', 'TestHueAngleToHue', 'TestHueTo_ASTM_hue',
     'TestInterpolationMethodFromRenotationOvoid',
     'Test_xy_fromRenotationOvoid', 'TestLCHabToMunsellSpecification',
-    'TestMaximumChromaFromRenotation', 'TestMunsellSpecification_to_xy'
+    'TestMaximumChromaFromRenotation', 'TestMunsellSpecification_to_xy',
+    'TestMunsellSpecificationArray_to_xyY',
+    'TestxyY_to_munsell_specification_array'
 ]
 
 
@@ -1184,6 +1208,33 @@ class TestMunsellColour_to_xyY(unittest.TestCase):
 
         pass
 
+    def test_n_dimensional_munsell_colour_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_colour_to_xyY` definition
+        n-dimensional arrays support.
+        """
+
+        munsell_colour = '4.2YR 8.1/5.3'
+        xyY = munsell_colour_to_xyY(munsell_colour)
+
+        munsell_colour = [munsell_colour] * 6
+        xyY = np.tile(xyY, (6, 1))
+        np.testing.assert_almost_equal(
+            munsell_colour_to_xyY(munsell_colour), xyY, decimal=7)
+
+        munsell_colour = np.reshape(munsell_colour, (2, 3))
+        xyY = np.reshape(xyY, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            munsell_colour_to_xyY(munsell_colour), xyY, decimal=7)
+
+        np.testing.assert_almost_equal(
+            munsell_colour_to_xyY(['4.2YR 8.1/5.3', 'N8.9']),
+            np.array([
+                munsell_colour_to_xyY('4.2YR 8.1/5.3'),
+                munsell_colour_to_xyY('N8.9')
+            ]),
+            decimal=7)
+
 
 class TestxyY_to_munsell_specification(unittest.TestCase):
     """
@@ -1228,6 +1279,33 @@ class TestxyY_to_munsell_colour(unittest.TestCase):
 
         pass
 
+    def test_n_dimensional_munsell_colour_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_colour_to_xyY` definition
+        n-dimensional arrays support.
+        """
+
+        munsell_colour = '4.2YR 8.1/5.3'
+        xyY = munsell_colour_to_xyY(munsell_colour)
+
+        munsell_colour = [munsell_colour] * 6
+        xyY = np.tile(xyY, (6, 1))
+        np.testing.assert_almost_equal(
+            munsell_colour_to_xyY(munsell_colour), xyY, decimal=7)
+
+        munsell_colour = np.reshape(munsell_colour, (2, 3))
+        xyY = np.reshape(xyY, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            munsell_colour_to_xyY(munsell_colour), xyY, decimal=7)
+
+        np.testing.assert_almost_equal(
+            munsell_colour_to_xyY(['4.2YR 8.1/5.3', 'N8.9']),
+            np.array([
+                munsell_colour_to_xyY('4.2YR 8.1/5.3'),
+                munsell_colour_to_xyY('N8.9')
+            ]),
+            decimal=7)
+
 
 class TestParseMunsellColour(unittest.TestCase):
     """
@@ -1352,6 +1430,137 @@ munsell_specification_to_munsell_colour` definition.
         self.assertEqual(munsell_specification_to_munsell_colour(5.2), 'N5.2')
 
 
+class TestParseMunsellColours(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.parse_munsell_colours` definition
+    unit tests methods.
+    """
+
+    def test_parse_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.parse_munsell_colours`
+        definition.
+        """
+
+        np.testing.assert_equal(
+            parse_munsell_colours(['N5.2', '0YR 2.0/4.0', '4.2yr 8.1/5.3']),
+            np.array([
+                [np.nan, 5.2, np.nan, np.nan],
+                [0.0, 2.0, 4.0, 6],
+                [4.2, 8.1, 5.3, 6],
+            ]))
+
+        self.assertRaises(ValueError, parse_munsell_colours,
+                          ['N5.2', '4.2YR'])
+
+    def test_n_dimensional_parse_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.parse_munsell_colours`
+        definition n-dimensional arrays support.
+        """
+
+        munsell_colour = '4.2YR 8.1/5.3'
+        specification = np.array(parse_munsell_colour(munsell_colour))
+        np.testing.assert_equal(
+            parse_munsell_colours(munsell_colour), specification)
+
+        munsell_colour = [munsell_colour] * 6
+        specification = np.tile(specification, (6, 1))
+        np.testing.assert_equal(
+            parse_munsell_colours(munsell_colour), specification)
+
+        munsell_colour = np.reshape(munsell_colour, (2, 3))
+        specification = np.reshape(specification, (2, 3, 4))
+        np.testing.assert_equal(
+            parse_munsell_colours(munsell_colour), specification)
+
+
+class TestMunsellColoursToMunsellSpecificationArray(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.\
+munsell_colours_to_munsell_specification_array` definition unit tests methods.
+    """
+
+    def test_munsell_colours_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_colours_to_munsell_specification_array` definition.
+        """
+
+        np.testing.assert_equal(
+            munsell_colours_to_munsell_specification_array(
+                ['N5.2', '0YR 2.0/4.0', '0RP 2.0/4.0', '5R 2.0/0.0']),
+            np.array([
+                [np.nan, 5.2, np.nan, np.nan],
+                [10.0, 2.0, 4.0, 7],
+                [10.0, 2.0, 4.0, 9],
+                [np.nan, 2.0, np.nan, np.nan],
+            ]))
+
+
+class TestMunsellSpecificationArrayToMunsellColours(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.\
+munsell_specification_array_to_munsell_colours` definition unit tests methods.
+    """
+
+    def test_munsell_specification_array_to_munsell_colours(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_munsell_colours` definition.
+        """
+
+        specification = np.array([
+            [np.nan, 5.2, np.nan, np.nan],
+            [10.0, 2.0, 4.0, 7],
+            [0.0, 2.0, 4.0, 7],
+            [10.0, 2.0, 4.0, 1],
+            [5.2, 3.11, 6.123, 9],
+        ])
+        np.testing.assert_array_equal(
+            munsell_specification_array_to_munsell_colours(specification),
+            np.array([
+                'N5.2', '10.0R 2.0/4.0', '10.0RP 2.0/4.0', '10.0B 2.0/4.0',
+                '5.2P 3.1/6.1'
+            ]))
+
+        np.testing.assert_array_equal(
+            munsell_specification_array_to_munsell_colours(
+                specification[-1], 2, 2, 2), np.array('5.20P 3.11/6.12'))
+
+        for specification_i in specification[np.array([0, 1, 3, 4])]:
+            specification_s = (specification_i[1] if np.isnan(
+                specification_i[0]) else tuple(specification_i))
+            self.assertEqual(
+                munsell_specification_array_to_munsell_colours(
+                    specification_i),
+                munsell_specification_to_munsell_colour(specification_s))
+
+    def test_n_dimensional_munsell_specification_array_to_munsell_colours(
+            self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_munsell_colours` definition n-dimensional
+        arrays support.
+        """
+
+        specification = np.array([4.2, 8.1, 5.3, 6])
+        munsell_colour = munsell_specification_array_to_munsell_colours(
+            specification)
+
+        specification = np.tile(specification, (6, 1))
+        munsell_colour = np.tile(munsell_colour, 6)
+        np.testing.assert_array_equal(
+            munsell_specification_array_to_munsell_colours(specification),
+            munsell_colour)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        munsell_colour = np.reshape(munsell_colour, (2, 3))
+        np.testing.assert_array_equal(
+            munsell_specification_array_to_munsell_colours(specification),
+            munsell_colour)
+
+
 class Test_xyY_fromRenotation(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.xyY_from_renotation` definition
@@ -1396,6 +1605,80 @@ class TestIsSpecificationInRenotation(unittest.TestCase):
         self.assertFalse(is_specification_in_renotation((25.0, 0.2, 2.0, 4)))
 
 
+class TestNearestSpecificationsFromRenotation(unittest.TestCase):
+    """
+    Defines
+    :func:`colour.notation.munsell.nearest_specifications_from_renotation`
+    definition unit tests methods.
+    """
+
+    def test_nearest_specifications_from_renotation(self):
+        """
+        Tests
+        :func:`colour.notation.munsell.nearest_specifications_from_renotation`
+        definition.
+        """
+
+        specification, distance = nearest_specifications_from_renotation(
+            np.array([0.38736945, 0.35751656, 0.59362000]))
+        np.testing.assert_array_equal(specification,
+                                      np.array([2.5, 8.0, 6.0, 6.0]))
+        self.assertAlmostEqual(distance, 0.019621555201770, places=7)
+
+        specification, distance = nearest_specifications_from_renotation(
+            np.array([0.38736945, 0.35751656, 0.59362000]), 3)
+        np.testing.assert_array_equal(
+            specification,
+            np.array([
+                [2.5, 8.0, 6.0, 6.0],
+                [10.0, 8.0, 6.0, 7.0],
+                [5.0, 8.0, 6.0, 6.0],
+            ]))
+        np.testing.assert_almost_equal(
+            distance,
+            np.array([0.01962156, 0.02220580, 0.02259186]),
+            decimal=7)
+
+        for specification in ((2.5, 4.0, 6.0, 6), (7.5, 9.0, 2.0, 1),
+                              (10.0, 2.0, 10.0, 9)):
+            x, y, Y = xyY_from_renotation(specification)
+            nearest, distance = nearest_specifications_from_renotation(
+                np.array([x, y, Y * 0.975 / 100]))
+            np.testing.assert_array_equal(nearest, np.array(specification))
+            self.assertEqual(distance, 0)
+
+    def test_n_dimensional_nearest_specifications_from_renotation(self):
+        """
+        Tests
+        :func:`colour.notation.munsell.nearest_specifications_from_renotation`
+        definition n-dimensional arrays support.
+        """
+
+        xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+        specification, distance = nearest_specifications_from_renotation(
+            xyY, 3)
+
+        xyY = np.tile(xyY, (6, 1))
+        specification = np.tile(specification, (6, 1, 1))
+        distance = np.tile(distance, (6, 1))
+        np.testing.assert_array_equal(
+            nearest_specifications_from_renotation(xyY, 3)[0], specification)
+        np.testing.assert_almost_equal(
+            nearest_specifications_from_renotation(xyY, 3)[1],
+            distance,
+            decimal=7)
+
+        xyY = np.reshape(xyY, (2, 3, 3))
+        specification = np.reshape(specification, (2, 3, 3, 4))
+        distance = np.reshape(distance, (2, 3, 3))
+        np.testing.assert_array_equal(
+            nearest_specifications_from_renotation(xyY, 3)[0], specification)
+        np.testing.assert_almost_equal(
+            nearest_specifications_from_renotation(xyY, 3)[1],
+            distance,
+            decimal=7)
+
+
 class TestBoundingHuesFromRenotation(unittest.TestCase):
     """
     Defines :func:`colour.notation.munsell.bounding_hues_from_renotation`
@@ -1574,5 +1857,378 @@ class TestMunsellSpecification_to_xy(unittest.TestCase):
                 decimal=7)
 
 
+class TestMunsellSpecificationArray_to_xyY(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.munsell_specification_array_to_xyY`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cache_path = munsell.MUNSELL_GRID_CACHE_PATH
+        munsell.MUNSELL_GRID_CACHE_PATH = None
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        munsell.MUNSELL_GRID_CACHE_PATH = self._cache_path
+
+    def test_munsell_specification_array_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_xyY` definition.
+        """
+
+        specifications = np.array(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS])
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+        np.testing.assert_almost_equal(
+            munsell_specification_array_to_xyY(specifications), xyY, decimal=7)
+
+        values = np.array([
+            specification[0]
+            for specification, _xyY in MUNSELL_GREYS_SPECIFICATIONS
+        ])
+        xyY = np.array(
+            [xyY for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        specifications = np.zeros((values.size, 4))
+        specifications[..., 0] = specifications[..., 2] = np.nan
+        specifications[..., 1] = values
+        np.testing.assert_almost_equal(
+            munsell_specification_array_to_xyY(specifications), xyY, decimal=7)
+
+        specifications[..., 0] = 5
+        specifications[..., 2] = 0
+        np.testing.assert_almost_equal(
+            munsell_specification_array_to_xyY(specifications), xyY, decimal=7)
+
+    def test_n_dimensional_munsell_specification_array_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_xyY` definition n-dimensional arrays support.
+        """
+
+        specification = np.array([2.1, 8.0, 17.9, 4])
+        xyY = munsell_specification_array_to_xyY(specification)
+        np.testing.assert_almost_equal(
+            xyY, munsell_specification_to_xyY(tuple(specification)), decimal=7)
+
+        specification = np.tile(specification, (6, 1))
+        xyY = np.tile(xyY, (6, 1))
+        np.testing.assert_almost_equal(
+            munsell_specification_array_to_xyY(specification), xyY, decimal=7)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        xyY = np.reshape(xyY, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            munsell_specification_array_to_xyY(specification), xyY, decimal=7)
+
+    def test_grid_munsell_specification_array_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_xyY` definition *Grid* method accuracy.
+        """
+
+        # The *Grid* method error with respect to *Centore 2014* method is
+        # introduced by the interpolation over hue: the *xy* chromaticity
+        # coordinates are within 1.5e-05 of the reference values.
+        specifications = np.array(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS])
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+        np.testing.assert_allclose(
+            munsell_specification_array_to_xyY(specifications, method='Grid'),
+            xyY,
+            rtol=0,
+            atol=0.000015)
+
+        values = np.array([
+            specification[0]
+            for specification, _xyY in MUNSELL_GREYS_SPECIFICATIONS
+        ])
+        xyY = np.array(
+            [xyY for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        specifications = np.zeros((values.size, 4))
+        specifications[..., 0] = specifications[..., 2] = np.nan
+        specifications[..., 1] = values
+        np.testing.assert_almost_equal(
+            munsell_specification_array_to_xyY(specifications, method='Grid'),
+            xyY,
+            decimal=7)
+
+        np.testing.assert_allclose(
+            munsell_colour_to_xyY('4.2YR 8.1/5.3', method='Grid'),
+            munsell_colour_to_xyY('4.2YR 8.1/5.3'),
+            rtol=0,
+            atol=0.000015)
+
+    def test_grid_persistence_munsell_specification_array_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_xyY` definition *Grid* method persistence.
+        """
+
+        cache = munsell._MUNSELL_GRID_CACHE
+        directory = tempfile.mkdtemp()
+        try:
+            munsell.MUNSELL_GRID_CACHE_PATH = os.path.join(
+                directory, 'munsell', 'munsell_grid.npz')
+            munsell._MUNSELL_GRID_CACHE = None
+
+            specification = np.array([2.1, 8.0, 17.9, 4])
+            xyY = munsell_specification_array_to_xyY(
+                specification, method='Grid')
+            self.assertTrue(os.path.exists(munsell.MUNSELL_GRID_CACHE_PATH))
+
+            munsell.MUNSELL_GRID_CACHE_PATH = None
+            munsell._MUNSELL_GRID_CACHE = None
+            munsell_specification_array_to_xyY(specification, method='Grid')
+            self.assertEqual(
+                os.listdir(os.path.join(directory, 'munsell')),
+                ['munsell_grid.npz'])
+            munsell.MUNSELL_GRID_CACHE_PATH = os.path.join(
+                directory, 'munsell', 'munsell_grid.npz')
+
+            munsell._MUNSELL_GRID_CACHE = None
+            np.testing.assert_equal(
+                munsell_specification_array_to_xyY(
+                    specification, method='Grid'), xyY)
+        finally:
+            munsell._MUNSELL_GRID_CACHE = cache
+            shutil.rmtree(directory)
+
+    def test_raise_exception_munsell_specification_array_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_xyY` definition raised exception.
+        """
+
+        specification = np.array([2.1, 8.0, 17.9, 4])
+        self.assertRaises(KeyError, munsell_specification_array_to_xyY,
+                          specification, 'Gird')
+        self.assertRaises(
+            KeyError, munsell_colour_to_xyY, '4.2YR 8.1/5.3', method='Gird')
+
+    @ignore_numpy_errors
+    def test_nan_munsell_specification_array_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+munsell_specification_array_to_xyY` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 4, r=4))))
+        munsell_specification_array_to_xyY(cases)
+        munsell_specification_array_to_xyY(cases, method='Grid')
+
+
+class TestxyY_to_munsell_specification_array(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.munsell.xyY_to_munsell_specification_array`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cache_path = munsell.MUNSELL_GRID_CACHE_PATH
+        munsell.MUNSELL_GRID_CACHE_PATH = None
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        munsell.MUNSELL_GRID_CACHE_PATH = self._cache_path
+
+    def test_xyY_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+xyY_to_munsell_specification_array` definition.
+        """
+
+        specifications = np.array(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS])
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification_array(xyY),
+            specifications,
+            rtol=0.00001,
+            atol=0.00001)
+
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification_array(xyY[0:10]),
+            np.array(
+                [xyY_to_munsell_specification(xyY_i) for xyY_i in xyY[0:10]]),
+            rtol=0.0000001,
+            atol=0.0000001)
+
+        values = np.array([
+            specification[0]
+            for specification, _xyY in MUNSELL_GREYS_SPECIFICATIONS
+        ])
+        xyY = np.array(
+            [xyY for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        specifications = xyY_to_munsell_specification_array(xyY)
+        np.testing.assert_allclose(
+            specifications[..., 1], values, rtol=0.00001, atol=0.00001)
+        self.assertTrue(np.all(np.isnan(specifications[..., 0])))
+        self.assertTrue(np.all(np.isnan(specifications[..., 2])))
+        self.assertTrue(np.all(np.isnan(specifications[..., 3])))
+
+    def test_n_dimensional_xyY_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+xyY_to_munsell_specification_array` definition n-dimensional arrays support.
+        """
+
+        xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+        specification = xyY_to_munsell_specification_array(xyY)
+        np.testing.assert_almost_equal(
+            specification, xyY_to_munsell_specification(xyY), decimal=7)
+
+        xyY = np.tile(xyY, (6, 1))
+        specification = np.tile(specification, (6, 1))
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification_array(xyY), specification, decimal=7)
+
+        xyY = np.reshape(xyY, (2, 3, 3))
+        specification = np.reshape(specification, (2, 3, 4))
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification_array(xyY), specification, decimal=7)
+
+    def test_grid_xyY_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+xyY_to_munsell_specification_array` definition *Grid* method accuracy.
+        """
+
+        # The *Grid* method hue and chroma are within 1e-03 of the
+        # *Centore 2014* method reference values, the value being computed
+        # identically. The maximum errors are respectively 1.6e-04 and
+        # 7.6e-04.
+        specifications = np.array(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS])
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification_array(xyY, method='Grid'),
+            specifications,
+            rtol=0,
+            atol=0.001)
+
+        values = np.array([
+            specification[0]
+            for specification, _xyY in MUNSELL_GREYS_SPECIFICATIONS
+        ])
+        xyY = np.array(
+            [xyY for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        specifications = xyY_to_munsell_specification_array(xyY, method='Grid')
+        np.testing.assert_allclose(
+            specifications[..., 1], values, rtol=0.00001, atol=0.00001)
+        self.assertTrue(np.all(np.isnan(specifications[..., 0])))
+
+        self.assertEqual(
+            xyY_to_munsell_colour(
+                np.array([0.38736945, 0.35751656, 0.59362000]),
+                method='Grid'), '4.2YR 8.1/5.3')
+
+    def test_grid_off_grid_xyY_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+xyY_to_munsell_specification_array` definition *Grid* method with
+        specifications off the grid entries.
+        """
+
+        prng = np.random.RandomState(4)
+        specifications = tstack((prng.uniform(0.5, 9.5, 1000),
+                                 prng.uniform(1, 9.5, 1000),
+                                 prng.uniform(0.5, 16, 1000),
+                                 prng.randint(1, 11, 1000)))
+        xyY = munsell_specification_array_to_xyY(specifications)
+        within = np.all(np.isfinite(xyY), axis=-1)
+        specifications, xyY = specifications[within], xyY[within]
+
+        # The *Grid* method must not fall back to the slower *Centore 2014*
+        # method for specifications within the renotation data domain.
+        centore2014 = munsell._xyY_to_munsell_specification_array_Centore2014
+        with mock.patch(
+                'colour.notation.munsell.'
+                '_xyY_to_munsell_specification_array_Centore2014',
+                side_effect=centore2014) as fallback:
+            specifications_g = xyY_to_munsell_specification_array(
+                xyY, method='Grid')
+
+        self.assertEqual(fallback.call_count, 0)
+        np.testing.assert_allclose(
+            specifications_g, specifications, rtol=0, atol=0.001)
+
+    def test_grid_fallback_xyY_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+xyY_to_munsell_specification_array` definition *Grid* method fallback to
+        *Centore 2014* method.
+        """
+
+        specifications = np.array(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS])
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+
+        # *Munsell Renotation System* extrapolated colours outside the
+        # *MacAdam* limits.
+        xyY_e = np.array([
+            [0.48200000, 0.57600000, 0.03126000],
+            [0.43400000, 0.59000000, 0.03126000],
+            [0.47600000, 0.71600000, 0.03126000],
+        ])
+
+        centore2014 = munsell._xyY_to_munsell_specification_array_Centore2014
+        with mock.patch(
+                'colour.notation.munsell.'
+                '_xyY_to_munsell_specification_array_Centore2014',
+                side_effect=centore2014) as fallback:
+            specifications_g = xyY_to_munsell_specification_array(
+                np.vstack([xyY, xyY_e]), method='Grid')
+
+        self.assertEqual(fallback.call_count, 1)
+        np.testing.assert_equal(fallback.call_args[0][0], xyY_e)
+
+        np.testing.assert_equal(specifications_g[100:],
+                                xyY_to_munsell_specification_array(xyY_e))
+        np.testing.assert_allclose(
+            specifications_g[:100], specifications, rtol=0, atol=0.001)
+
+    def test_raise_exception_xyY_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+xyY_to_munsell_specification_array` definition raised exception.
+        """
+
+        xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+        self.assertRaises(KeyError, xyY_to_munsell_specification_array, xyY,
+                          'Gird')
+        self.assertRaises(KeyError, xyY_to_munsell_colour, xyY, method='Gird')
+
+    @ignore_numpy_errors
+    def test_nan_xyY_to_munsell_specification_array(self):
+        """
+        Tests :func:`colour.notation.munsell.\
+xyY_to_munsell_specification_array` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        xyY_to_munsell_specification_array(cases)
+        xyY_to_munsell_specification_array(cases, method='Grid')
+
+        cases[..., 2] = 0.5
+        xyY_to_munsell_specification_array(cases, method='Grid')
+
+
 if __name__ == '__main__':
     unittest.main()
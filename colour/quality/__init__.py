@@ -4,10 +4,36 @@ from __future__ import absolute_import
 
 from .dataset import *  # noqa
 from . import dataset
-from .cri import CRI_Specification, colour_rendering_index
-from .cqs import CQS_Specification, colour_quality_scale
+from .cri import (CRI_Specification, colour_rendering_index,
+                  colour_rendering_index_array)
+from .cqs import (CQS_Specification, colour_quality_scale,
+                  colour_quality_scale_array)
+from .reference import (REFERENCE_ILLUMINANTS_BANK_MIRED_STEP,
+                        REFERENCE_ILLUMINANTS_BANK_CCT_RANGES,
+                        ReferenceIlluminantsColorimetry,
+                        reference_illuminants_bank,
+                        reference_illuminants_colorimetry)
+from .mixing import (SpectralMixingBasis, SpectralMixingMetrics,
+                     spectral_mixing_basis, spectral_mixing_spd,
+                     spectral_mixing_metrics, optimise_spectral_mixing)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['CRI_Specification', 'colour_rendering_index']
-__all__ += ['CQS_Specification', 'colour_quality_scale']
+__all__ += [
+    'CRI_Specification', 'colour_rendering_index',
+    'colour_rendering_index_array'
+]
+__all__ += [
+    'CQS_Specification', 'colour_quality_scale', 'colour_quality_scale_array'
+]
+__all__ += [
+    'REFERENCE_ILLUMINANTS_BANK_MIRED_STEP',
+    'REFERENCE_ILLUMINANTS_BANK_CCT_RANGES',
+    'ReferenceIlluminantsColorimetry', 'reference_illuminants_bank',
+    'reference_illuminants_colorimetry'
+]
+__all__ += [
+    'SpectralMixingBasis', 'SpectralMixingMetrics', 'spectral_mixing_basis',
+    'spectral_mixing_spd', 'spectral_mixing_metrics',
+    'optimise_spectral_mixing'
+]
@@ -7,6 +7,7 @@ Defines *Colour Quality Scale* (CQS) computation objects:
 
 -   :class:`colour.quality.CQS_Specification`
 -   :func:`colour.colour_quality_scale`
+-   :func:`colour.quality.colour_quality_scale_array`
 
 See Also
 --------
@@ -31,12 +32,15 @@ from collections import namedtuple
 from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd, ILLUMINANTS,
-    STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+    MultiSpectralPowerDistribution, STANDARD_OBSERVERS_CMFS, blackbody_spd,
+    spectral_to_XYZ)
+from colour.quality.cri import _reference_spds_values, _samples_XYZ_array
 from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
-from colour.adaptation import chromatic_adaptation_VonKries
+from colour.adaptation import (chromatic_adaptation_matrix_VonKries,
+                               chromatic_adaptation_VonKries)
 from colour.utilities import tsplit
 
 __author__ = 'Colour Developers'
@@ -50,7 +54,7 @@ __all__ = [
     'D65_GAMUT_AREA', 'VS_ColorimetryData', 'VS_ColourQualityScaleData',
     'CQS_Specification', 'colour_quality_scale', 'gamut_area',
     'vs_colorimetry_data', 'CCT_factor', 'scale_conversion', 'delta_E_RMS',
-    'colour_quality_scales'
+    'colour_quality_scales', 'colour_quality_scale_array'
 ]
 
 D65_GAMUT_AREA = 8210
@@ -207,11 +211,11 @@ def gamut_area(Lab):
     Parameters
     ----------
     Lab : array_like
-        *CIE L\*a\*b\** colourspace matrices.
+        *CIE L\*a\*b\** colourspace matrices of shape (..., m, 3).
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -238,18 +242,19 @@ def gamut_area(Lab):
     """
 
     Lab = np.asarray(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     _L, a, b = tsplit(Lab)
     _L_s, a_s, b_s = tsplit(Lab_s)
 
-    A = np.linalg.norm(Lab[..., 1:3], axis=-1)
-    B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack((a_s - a, b_s - b)), axis=-1)
+    A = np.hypot(a, b)
+    B = np.hypot(a_s, b_s)
+    C = np.hypot(a_s - a, b_s - b)
+
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(spd_test,
@@ -423,3 +428,266 @@ def colour_quality_scales(test_data, reference_data, CCT_f):
         Q_as[i + 1] = VS_ColourQualityScaleData(test_data[i].name, Q_a, D_C_ab,
                                                 D_E_ab, D_Ep_ab)
     return Q_as
+
+
+def _vs_Lab_array(S, XYZ_r, R, cmfs, chromatic_adaptation=False):
+    """
+    Returns the *VS test colour samples* *CIE L\\*a\\*b\\** colourspace arrays
+    for given test spectral power distributions values and reference
+    illuminants *CIE XYZ* tristimulus values arrays.
+
+    Parameters
+    ----------
+    S : ndarray, (n, bins)
+        Test spectral power distributions values.
+    XYZ_r : ndarray, (n, 3)
+        Reference illuminants *CIE XYZ* tristimulus values.
+    R : ndarray, (m, bins)
+        *VS test colour samples* spectral reflectance values.
+    cmfs : ndarray, (bins, 3)
+        Standard observer colour matching functions values.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    tuple
+        *VS test colour samples* *CIE XYZ* tristimulus values and
+        *CIE L\\*a\\*b\\** colourspace arrays of shape (n, m, 3).
+    """
+
+    return _XYZ_to_vs_Lab(
+        np.dot(S, cmfs), _samples_XYZ_array(S, R, cmfs), XYZ_r,
+        chromatic_adaptation)
+
+
+def _XYZ_to_vs_Lab(XYZ_t, XYZ_vs, XYZ_r, chromatic_adaptation=False):
+    """
+    Returns the *VS test colour samples* *CIE L\\*a\\*b\\** colourspace arrays
+    for given test spectral power distributions, un-normalised
+    *VS test colour samples* and reference illuminants *CIE XYZ* tristimulus
+    values arrays.
+
+    Parameters
+    ----------
+    XYZ_t : ndarray, (n, 3)
+        Test spectral power distributions *CIE XYZ* tristimulus values.
+    XYZ_vs : ndarray, (n, m, 3)
+        Un-normalised *VS test colour samples* *CIE XYZ* tristimulus values.
+    XYZ_r : ndarray, (n, 3)
+        Reference illuminants *CIE XYZ* tristimulus values.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    tuple
+        *VS test colour samples* *CIE XYZ* tristimulus values and
+        *CIE L\\*a\\*b\\** colourspace arrays of shape (n, m, 3).
+    """
+
+    XYZ_vs = XYZ_vs / XYZ_t[..., 1][:, np.newaxis, np.newaxis]
+
+    XYZ_t = XYZ_t / XYZ_t[..., 1:2]
+    XYZ_r = XYZ_r / XYZ_r[..., 1:2]
+    xy_r = XYZ_to_xy(XYZ_r)
+
+    if chromatic_adaptation:
+        M = chromatic_adaptation_matrix_VonKries(
+            XYZ_t, XYZ_r, transform='CMCCAT2000')
+        XYZ_vs = np.einsum('...ij,...kj->...ki', M, XYZ_vs)
+
+    Lab_vs = XYZ_to_Lab(XYZ_vs, illuminant=xy_r[:, np.newaxis, :])
+
+    return XYZ_vs, Lab_vs
+
+
+def _vs_differences_array(Lab_t, Lab_r):
+    """
+    Returns the *VS test colour samples* chroma, colour and saturation
+    corrected colour differences of given test and reference
+    *CIE L\\*a\\*b\\** colourspace arrays.
+
+    Parameters
+    ----------
+    Lab_t : ndarray, (n, m, 3)
+        Test *CIE L\\*a\\*b\\** colourspace arrays.
+    Lab_r : ndarray, (n, m, 3)
+        Reference *CIE L\\*a\\*b\\** colourspace arrays.
+
+    Returns
+    -------
+    tuple
+        :math:`\\Delta C_{ab}`, :math:`\\Delta E_{ab}` and
+        :math:`\\Delta E'_{ab}` arrays of shape (n, m).
+    """
+
+    D_C_ab = (np.hypot(Lab_t[..., 1], Lab_t[..., 2]) -
+              np.hypot(Lab_r[..., 1], Lab_r[..., 2]))
+    D_E_ab = np.linalg.norm(Lab_t - Lab_r, axis=-1)
+    with np.errstate(invalid='ignore'):
+        D_Ep_ab = np.where(D_C_ab > 0, np.sqrt(D_E_ab ** 2 - D_C_ab ** 2),
+                           D_E_ab)
+
+    return D_C_ab, D_E_ab, D_Ep_ab
+
+
+def _gamut_area_D65_array(XYZ_r, XYZ_vs):
+    """
+    Returns the gamut area :math:`G` of given *VS test colour samples*
+    *CIE XYZ* tristimulus values arrays adapted from given reference
+    illuminants to *CIE Illuminant D Series D65*.
+
+    Parameters
+    ----------
+    XYZ_r : ndarray, (n, 3)
+        Reference illuminants *CIE XYZ* tristimulus values.
+    XYZ_vs : ndarray, (n, m, 3)
+        *VS test colour samples* *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    ndarray, (n, )
+        Gamut area :math:`G`.
+    """
+
+    xy_D65 = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+    M = chromatic_adaptation_matrix_VonKries(
+        XYZ_r / XYZ_r[..., 1:2], xy_to_XYZ(xy_D65), transform='CMCCAT2000')
+
+    return gamut_area(
+        XYZ_to_Lab(
+            np.einsum('...ij,...kj->...ki', M, XYZ_vs), illuminant=xy_D65))
+
+
+def colour_quality_scale_array(spds_test,
+                               shape=ASTME30815_PRACTISE_SHAPE,
+                               additional_data=False,
+                               use_reference_bank=False):
+    """
+    Returns the *Colour Quality Scale* (CQS) of given spectral power
+    distributions.
+
+    Parameters
+    ----------
+    spds_test : MultiSpectralPowerDistribution or array_like
+        Test multi-spectral power distribution or test spectral power
+        distributions values array of shape (..., bins) sampled at given
+        spectral shape.
+    shape : SpectralShape, optional
+        Spectral shape of the test spectral power distributions values array,
+        ignored if a multi-spectral power distribution is given.
+    additional_data : bool, optional
+        Output additional data.
+    use_reference_bank : bool, optional
+        Whether to interpolate the reference illuminants colorimetry from the
+        bank returned by :func:`colour.quality.reference_illuminants_bank`
+        definition instead of computing it for each spectral power
+        distribution.
+
+    Returns
+    -------
+    ndarray or CQS_Specification
+        Color quality scale :math:`Q_a` of shape (...) or *Colour Quality
+        Scale* (CQS) specification whose :math:`Q_a`, :math:`Q_f`,
+        :math:`Q_p`, :math:`Q_g` and :math:`Q_d` attributes are arrays of
+        shape (...), whose :math:`Q_{as}` attribute is the array of shape
+        (..., 15) of the individual *VS test colour samples* scales and whose
+        colorimetry data are the test and reference *CIE L\\*a\\*b\\**
+        colourspace arrays of shape (..., 15, 3).
+
+    Notes
+    -----
+    -   The *VS test colour samples* reflectance matrix is computed once, the
+        correlated colour temperatures and reference illuminants are computed
+        as arrays and the samples are evaluated for all the spectral power
+        distributions with stacked matrix products.
+
+    References
+    ----------
+    -   :cite:`Davis2010a`
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> values = [
+    ...     ILLUMINANTS_SPDS[name].copy().align(ASTME30815_PRACTISE_SHAPE)
+    ...     .values for name in ('F2', 'A')
+    ... ]
+    >>> colour_quality_scale_array(values)  # doctest: +ELLIPSIS
+    array([ 64.6863391...,  ...])
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    if isinstance(spds_test, MultiSpectralPowerDistribution):
+        spds_test = spds_test.copy().align(cmfs.shape)
+        S = np.transpose(spds_test.values)
+    else:
+        S = np.asarray(spds_test)
+        if shape != cmfs.shape:
+            S = np.transpose(
+                MultiSpectralPowerDistribution(
+                    np.transpose(np.reshape(S, (-1, S.shape[-1]))),
+                    shape.range()).align(cmfs.shape).values)
+
+    prefix = S.shape[:-1] if S.ndim > 1 else ()
+    S = np.reshape(S, (-1, S.shape[-1]))
+
+    R = np.array([
+        VS_SPDS[name].copy().align(cmfs.shape).values
+        for _index, name in sorted(VS_INDEXES_TO_NAMES.items())
+    ])
+
+    CCT = uv_to_CCT_Ohno2013(
+        UCS_to_uv(XYZ_to_UCS(np.dot(S, cmfs.values))), cmfs)[..., 0]
+
+    if use_reference_bank:
+        from colour.quality.reference import reference_illuminants_colorimetry
+
+        colorimetry = reference_illuminants_colorimetry(CCT)
+        XYZ_r, Lab_r = colorimetry.XYZ, colorimetry.Lab_vs
+        G_D65 = colorimetry.G_D65
+    else:
+        S_r = _reference_spds_values(CCT, cmfs.shape)
+        XYZ_r = np.dot(S_r, cmfs.values)
+        XYZ_vs_r, Lab_r = _vs_Lab_array(S_r, XYZ_r, R, cmfs.values)
+        G_D65 = _gamut_area_D65_array(XYZ_r, XYZ_vs_r)
+
+    _XYZ_vs_t, Lab_t = _vs_Lab_array(
+        S, XYZ_r, R, cmfs.values, chromatic_adaptation=True)
+
+    CCT_f = np.minimum(G_D65 / D65_GAMUT_AREA, 1)
+
+    D_C_ab, D_E_ab, D_Ep_ab = _vs_differences_array(Lab_t, Lab_r)
+
+    D_E_RMS = np.sqrt(np.mean(D_E_ab ** 2, axis=-1))
+    D_Ep_RMS = np.sqrt(np.mean(D_Ep_ab ** 2, axis=-1))
+
+    Q_a = scale_conversion(D_Ep_RMS, CCT_f)
+
+    if not additional_data:
+        return np.reshape(Q_a, prefix)
+
+    Q_f = scale_conversion(D_E_RMS, CCT_f, 2.928)
+
+    p_delta_C = np.mean(np.maximum(D_C_ab, 0), axis=-1)
+    Q_p = 100 - 3.6 * (D_Ep_RMS - p_delta_C)
+
+    G_t = gamut_area(Lab_t)
+    G_r = gamut_area(Lab_r)
+
+    Q_g = G_t / D65_GAMUT_AREA * 100
+    Q_d = G_t / G_r * CCT_f * 100
+
+    Q_as = scale_conversion(D_Ep_ab, CCT_f[:, np.newaxis])
+
+    return CQS_Specification(
+        None, *[np.reshape(Q, prefix) for Q in (Q_a, Q_f, Q_p, Q_g, Q_d)] +
+        [
+            np.reshape(Q_as, prefix + (R.shape[0], )),
+            (np.reshape(Lab_t, prefix + Lab_t.shape[-2:]),
+             np.reshape(Lab_r, prefix + Lab_r.shape[-2:]))
+        ])
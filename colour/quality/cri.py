@@ -7,6 +7,7 @@ Defines *Colour Rendering Index* (CRI) computation objects:
 
 -   :class:`colour.quality.CRI_Specification`
 -   :func:`colour.colour_rendering_index`
+-   :func:`colour.quality.colour_rendering_index_array`
 
 See Also
 --------
@@ -28,11 +29,13 @@ from collections import namedtuple
 
 from colour.algebra import euclidean_distance
 from colour.colorimetry import (
-    ASTME30815_PRACTISE_SHAPE, D_illuminant_relative_spd,
-    STANDARD_OBSERVERS_CMFS, blackbody_spd, spectral_to_XYZ)
+    ASTME30815_PRACTISE_SHAPE, D_ILLUMINANTS_S_SPDS, D_illuminant_M1_M2,
+    D_illuminant_relative_spd, MultiSpectralPowerDistribution,
+    STANDARD_OBSERVERS_CMFS, blackbody_spd, planck_law, spectral_to_XYZ)
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -44,7 +47,7 @@ __status__ = 'Production'
 __all__ = [
     'TCS_ColorimetryData', 'TCS_ColourQualityScaleData', 'CRI_Specification',
     'colour_rendering_index', 'tcs_colorimetry_data',
-    'colour_rendering_indexes'
+    'colour_rendering_indexes', 'colour_rendering_index_array'
 ]
 
 
@@ -255,3 +258,278 @@ def colour_rendering_indexes(test_data, reference_data):
             test_data[i].name, 100 -
             4.6 * euclidean_distance(reference_data[i].UVW, test_data[i].UVW))
     return Q_as
+
+
+def _reference_spds_values(CCT, shape, planckian=None):
+    """
+    Returns the reference illuminants spectral power distributions values of
+    given correlated colour temperatures :math:`T_{cp}` array, i.e. the
+    *Planckian* radiators below 5000K and the
+    *CIE Standard Illuminant D Series* otherwise.
+
+    Parameters
+    ----------
+    CCT : ndarray, (n, )
+        Correlated colour temperatures :math:`T_{cp}`.
+    shape : SpectralShape
+        Spectral shape of the reference illuminants.
+    planckian : ndarray, (n, ), optional
+        Whether the reference illuminants are *Planckian* radiators, default
+        to the correlated colour temperatures below 5000K.
+
+    Returns
+    -------
+    ndarray, (n, bins)
+        Reference illuminants spectral power distributions values.
+    """
+
+    S_r = np.zeros([CCT.shape[0], len(shape.range())])
+
+    if planckian is None:
+        planckian = CCT < 5000
+
+    if np.any(planckian):
+        S_r[planckian] = planck_law(shape.range() * 1e-9,
+                                    CCT[planckian][:, np.newaxis])
+
+    daylight = ~planckian
+    if np.any(daylight):
+        M1_M2 = D_illuminant_M1_M2(CCT_to_xy_CIE_D(CCT[daylight]))
+        S_r[daylight] = np.dot(
+            np.hstack([np.ones([M1_M2.shape[0], 1]), M1_M2]),
+            np.array([
+                D_ILLUMINANTS_S_SPDS[name].copy().align(shape).values
+                for name in ('S0', 'S1', 'S2')
+            ]))
+
+    return S_r
+
+
+def _samples_XYZ_array(S, R, cmfs):
+    """
+    Returns the un-normalised *CIE XYZ* tristimulus values of given samples
+    spectral reflectance values under given spectral power distributions
+    values arrays.
+
+    Parameters
+    ----------
+    S : ndarray, (n, bins)
+        Spectral power distributions values.
+    R : ndarray, (m, bins)
+        Samples spectral reflectance values.
+    cmfs : ndarray, (bins, 3)
+        Standard observer colour matching functions values.
+
+    Returns
+    -------
+    ndarray, (n, m, 3)
+        Samples *CIE XYZ* tristimulus values.
+    """
+
+    # One matrix product per colour matching function.
+    return tstack(
+        [np.dot(S * cmfs[..., i], np.transpose(R)) for i in range(3)])
+
+
+def _tcs_UVW_array(S, XYZ_r, R, cmfs, chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* *CIE 1964 U\\*V\\*W\\** colourspace
+    arrays for given test spectral power distributions values and reference
+    illuminants *CIE XYZ* tristimulus values arrays.
+
+    Parameters
+    ----------
+    S : ndarray, (n, bins)
+        Test spectral power distributions values.
+    XYZ_r : ndarray, (n, 3)
+        Reference illuminants *CIE XYZ* tristimulus values.
+    R : ndarray, (m, bins)
+        *Test colour samples* spectral reflectance values.
+    cmfs : ndarray, (bins, 3)
+        Standard observer colour matching functions values.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    ndarray, (n, m, 3)
+        *Test colour samples* *CIE 1964 U\\*V\\*W\\** colourspace arrays.
+    """
+
+    return _XYZ_to_tcs_UVW(
+        np.dot(S, cmfs), _samples_XYZ_array(S, R, cmfs), XYZ_r,
+        chromatic_adaptation)
+
+
+def _XYZ_to_tcs_UVW(XYZ_t, XYZ_tcs, XYZ_r, chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* *CIE 1964 U\\*V\\*W\\** colourspace
+    arrays for given test spectral power distributions, un-normalised
+    *test colour samples* and reference illuminants *CIE XYZ* tristimulus
+    values arrays.
+
+    Parameters
+    ----------
+    XYZ_t : ndarray, (n, 3)
+        Test spectral power distributions *CIE XYZ* tristimulus values.
+    XYZ_tcs : ndarray, (n, m, 3)
+        Un-normalised *test colour samples* *CIE XYZ* tristimulus values.
+    XYZ_r : ndarray, (n, 3)
+        Reference illuminants *CIE XYZ* tristimulus values.
+    chromatic_adaptation : bool, optional
+        Perform chromatic adaptation.
+
+    Returns
+    -------
+    ndarray, (n, m, 3)
+        *Test colour samples* *CIE 1964 U\\*V\\*W\\** colourspace arrays.
+    """
+
+    def uv(XYZ):
+        """
+        Computes the *CIE UCS* colourspace *uv* chromaticity coordinates.
+        """
+
+        return tsplit(UCS_to_uv(XYZ_to_UCS(XYZ)))
+
+    u_t, v_t = [x[:, np.newaxis] for x in uv(XYZ_t)]
+    u_r, v_r = [x[:, np.newaxis] for x in uv(XYZ_r)]
+
+    XYZ_tcs = 100 * XYZ_tcs / XYZ_t[..., 1][:, np.newaxis, np.newaxis]
+
+    u_tcs, v_tcs = uv(XYZ_tcs)
+
+    if chromatic_adaptation:
+
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
+
+            return (4 - x - 10 * y) / y
+
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
+
+            return (1.708 * y + 0.404 - 1.481 * x) / y
+
+        c_t, d_t = c(u_t, v_t), d(u_t, v_t)
+        c_r, d_r = c(u_r, v_r), d(u_r, v_r)
+        tcs_c, tcs_d = c(u_tcs, v_tcs), d(u_tcs, v_tcs)
+        u_tcs = ((10.872 + 0.404 * c_r / c_t * tcs_c - 4 * d_r / d_t * tcs_d) /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+        v_tcs = (5.52 /
+                 (16.518 + 1.481 * c_r / c_t * tcs_c - d_r / d_t * tcs_d))
+
+    W_tcs = 25 * XYZ_to_xyY(XYZ_tcs)[..., -1] ** (1 / 3) - 17
+    U_tcs = 13 * W_tcs * (u_tcs - u_r)
+    V_tcs = 13 * W_tcs * (v_tcs - v_r)
+
+    return tstack((U_tcs, V_tcs, W_tcs))
+
+
+def colour_rendering_index_array(spds_test,
+                                 shape=ASTME30815_PRACTISE_SHAPE,
+                                 additional_data=False,
+                                 use_reference_bank=False):
+    """
+    Returns the *Colour Rendering Index* (CRI) :math:`Q_a` of given
+    spectral power distributions.
+
+    Parameters
+    ----------
+    spds_test : MultiSpectralPowerDistribution or array_like
+        Test multi-spectral power distribution or test spectral power
+        distributions values array of shape (..., bins) sampled at given
+        spectral shape.
+    shape : SpectralShape, optional
+        Spectral shape of the test spectral power distributions values array,
+        ignored if a multi-spectral power distribution is given.
+    additional_data : bool, optional
+        Output the individual *test colour samples* *colour rendering indexes*
+        :math:`Q_{as}`.
+    use_reference_bank : bool, optional
+        Whether to interpolate the reference illuminants colorimetry from the
+        bank returned by :func:`colour.quality.reference_illuminants_bank`
+        definition instead of computing it for each spectral power
+        distribution.
+
+    Returns
+    -------
+    ndarray or tuple
+        *Colour Rendering Index* (CRI) :math:`Q_a` of shape (...) or
+        :math:`Q_a` and the individual *test colour samples* *colour rendering
+        indexes* :math:`Q_{as}` of shape (..., 14).
+
+    Notes
+    -----
+    -   The test spectral power distributions are aligned once to the
+        *ASTM E308-15* practise shape, the *Planckian* and
+        *CIE Standard Illuminant D Series* reference illuminants are computed
+        as arrays from the correlated colour temperatures and the *test colour
+        samples* are evaluated for all the spectral power distributions with
+        stacked matrix products.
+
+    References
+    ----------
+    -   :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> values = [
+    ...     ILLUMINANTS_SPDS[name].copy().align(ASTME30815_PRACTISE_SHAPE)
+    ...     .values for name in ('F2', 'A')
+    ... ]
+    >>> colour_rendering_index_array(values)  # doctest: +ELLIPSIS
+    array([ 64.1515202...,  99.9967326...])
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    if isinstance(spds_test, MultiSpectralPowerDistribution):
+        spds_test = spds_test.copy().align(cmfs.shape)
+        S = np.transpose(spds_test.values)
+    else:
+        S = np.asarray(spds_test)
+        if shape != cmfs.shape:
+            S = np.transpose(
+                MultiSpectralPowerDistribution(
+                    np.transpose(np.reshape(S, (-1, S.shape[-1]))),
+                    shape.range()).align(cmfs.shape).values)
+
+    prefix = S.shape[:-1] if S.ndim > 1 else ()
+    S = np.reshape(S, (-1, S.shape[-1]))
+
+    R = np.array([
+        TCS_SPDS[name].copy().align(cmfs.shape).values
+        for _index, name in sorted(TCS_INDEXES_TO_NAMES.items())
+    ])
+
+    CCT = uv_to_CCT_Robertson1968(
+        UCS_to_uv(XYZ_to_UCS(np.dot(S, cmfs.values))))[..., 0]
+
+    if use_reference_bank:
+        from colour.quality.reference import reference_illuminants_colorimetry
+
+        colorimetry = reference_illuminants_colorimetry(CCT)
+        XYZ_r, UVW_r = colorimetry.XYZ, colorimetry.UVW_tcs
+    else:
+        S_r = _reference_spds_values(CCT, cmfs.shape)
+        XYZ_r = np.dot(S_r, cmfs.values)
+        UVW_r = _tcs_UVW_array(S_r, XYZ_r, R, cmfs.values)
+
+    UVW_t = _tcs_UVW_array(
+        S, XYZ_r, R, cmfs.values, chromatic_adaptation=True)
+
+    Q_as = 100 - 4.6 * np.linalg.norm(UVW_r - UVW_t, axis=-1)
+    Q_a = np.average(Q_as[..., :8], axis=-1)
+
+    Q_a = np.reshape(Q_a, prefix)
+    if additional_data:
+        return Q_a, np.reshape(Q_as, prefix + (R.shape[0], ))
+    else:
+        return Q_a
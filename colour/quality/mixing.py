@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+Spectral Mixing Optimisation
+============================
+
+Defines the objects optimising the mixing of the channels of multi-channel
+light sources, e.g. *LED* luminaires, with respect to their colour quality:
+
+-   :class:`colour.quality.SpectralMixingBasis`
+-   :class:`colour.quality.SpectralMixingMetrics`
+-   :func:`colour.quality.spectral_mixing_basis`
+-   :func:`colour.quality.spectral_mixing_spd`
+-   :func:`colour.quality.spectral_mixing_metrics`
+-   :func:`colour.quality.optimise_spectral_mixing`
+
+The spectral power distribution of a mixture is linear in the channels
+weights, so are its *CIE XYZ* tristimulus values, the tristimulus values of
+the *test colour samples* and *VS test colour samples* it illuminates, its
+luminous flux and its radiant power. Those quantities are computed once per
+channel by the :func:`colour.quality.spectral_mixing_basis` definition and an
+objective evaluation only combines them with a few small matrix products.
+
+References
+----------
+-   :cite:`Davis2010a` : Davis, W., & Ohno, Y. (2010). Color quality scale.
+    Optical Engineering, 49(3), 33602. doi:10.1117/1.3360335
+-   :cite:`Ohno2008a` : Ohno, Y., & Davis, W. (2008). NIST CQS simulation 7.4.
+    Retrieved from https://drive.google.com/file/d/\
+1PsuU6QjUJjCX6tQyCud6ul2Tbs8rYWW9/view?usp=sharing
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+from scipy.optimize import minimize, nnls
+
+from colour.colorimetry import (
+    ASTME30815_PRACTISE_SHAPE, MultiSpectralPowerDistribution, PHOTOPIC_LEFS,
+    STANDARD_OBSERVERS_CMFS, SpectralPowerDistribution)
+from colour.constants import K_M
+from colour.models import UCS_to_uv, XYZ_to_UCS
+from colour.quality.cri import _XYZ_to_tcs_UVW, _samples_XYZ_array
+from colour.quality.cqs import (D65_GAMUT_AREA, _XYZ_to_vs_Lab,
+                                _vs_differences_array, scale_conversion)
+from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
+from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
+from colour.quality.reference import (_reference_illuminants_colorimetry,
+                                      reference_illuminants_colorimetry)
+from colour.temperature import (CCT_to_uv_Ohno2013, uv_to_CCT_Ohno2013,
+                                uv_to_CCT_Robertson1968)
+from colour.utilities import tsplit
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'SpectralMixingBasis', 'SpectralMixingMetrics', 'spectral_mixing_basis',
+    'spectral_mixing_spd', 'spectral_mixing_metrics',
+    'optimise_spectral_mixing'
+]
+
+
+class SpectralMixingBasis(
+        namedtuple('SpectralMixingBasis',
+                   ('shape', 'S', 'XYZ', 'XYZ_tcs', 'XYZ_vs', 'flux',
+                    'power'))):
+    """
+    Defines the class storing the per channel colorimetry of a
+    multi-channel light source.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape of the channels spectral power distributions values.
+    S : ndarray, (c, bins)
+        Channels spectral power distributions values.
+    XYZ : ndarray, (c, 3)
+        Channels *CIE XYZ* tristimulus values.
+    XYZ_tcs : ndarray, (c, 14, 3)
+        Un-normalised *test colour samples* *CIE XYZ* tristimulus values under
+        the channels.
+    XYZ_vs : ndarray, (c, 15, 3)
+        Un-normalised *VS test colour samples* *CIE XYZ* tristimulus values
+        under the channels.
+    flux : ndarray, (c, )
+        Channels luminous flux.
+    power : ndarray, (c, )
+        Channels radiant power.
+    """
+
+
+class SpectralMixingMetrics(
+        namedtuple('SpectralMixingMetrics',
+                   ('XYZ', 'CCT', 'D_uv', 'CRI', 'CQS',
+                    'luminous_efficacy'))):
+    """
+    Defines the class storing the colour quality metrics of channels
+    mixtures.
+
+    Parameters
+    ----------
+    XYZ : ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+    CCT : ndarray, (...)
+        Correlated colour temperature :math:`T_{cp}` computed with
+        *Ohno (2013)* method.
+    D_uv : ndarray, (...)
+        :math:`\\Delta_{uv}` computed with *Ohno (2013)* method.
+    CRI : ndarray, (...)
+        *Colour Rendering Index* (CRI) :math:`Q_a`.
+    CQS : ndarray, (...)
+        *Colour Quality Scale* (CQS) :math:`Q_a`.
+    luminous_efficacy : ndarray, (...)
+        Luminous efficacy in :math:`lm\\cdot W^{-1}`.
+    """
+
+
+def spectral_mixing_basis(spds_channels,
+                          shape=ASTME30815_PRACTISE_SHAPE,
+                          lef=PHOTOPIC_LEFS[
+                              'CIE 1924 Photopic Standard Observer']):
+    """
+    Returns the per channel colorimetry of given multi-channel light source.
+
+    Parameters
+    ----------
+    spds_channels : MultiSpectralPowerDistribution or array_like
+        Channels multi-spectral power distribution or channels spectral power
+        distributions values array of shape (c, bins) sampled at given
+        spectral shape.
+    shape : SpectralShape, optional
+        Spectral shape of the channels spectral power distributions values
+        array, ignored if a multi-spectral power distribution is given.
+    lef : SpectralPowerDistribution, optional
+        :math:`V(\\lambda)` luminous efficiency function.
+
+    Returns
+    -------
+    SpectralMixingBasis
+        Per channel colorimetry.
+
+    Examples
+    --------
+    >>> wavelengths = ASTME30815_PRACTISE_SHAPE.range()
+    >>> values = np.exp(-((wavelengths - np.array(
+    ...     [[455], [530], [595], [630]])) / 15) ** 2)
+    >>> basis = spectral_mixing_basis(values)
+    >>> basis.XYZ  # doctest: +ELLIPSIS
+    array([[  7.8643027...e+00,   1.3988357...e+00,   4.3427790...e+01],
+           [  4.7847193...e+00,   2.2064853...e+01,   1.3906804...e+00],
+           [  2.6816917...e+01,   1.8357108...e+01,   2.6385278...e-02],
+           [  1.7186467...e+01,   7.3805883...e+00,   2.5391396...e-03]])
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    if isinstance(spds_channels, MultiSpectralPowerDistribution):
+        spds_channels = spds_channels.copy().align(cmfs.shape)
+        S = np.transpose(spds_channels.values)
+    else:
+        S = np.atleast_2d(spds_channels)
+        if shape != cmfs.shape:
+            S = np.transpose(
+                MultiSpectralPowerDistribution(
+                    np.transpose(S), shape.range()).align(cmfs.shape).values)
+
+    R_tcs = np.array([
+        TCS_SPDS[name].copy().align(cmfs.shape).values
+        for _index, name in sorted(TCS_INDEXES_TO_NAMES.items())
+    ])
+    R_vs = np.array([
+        VS_SPDS[name].copy().align(cmfs.shape).values
+        for _index, name in sorted(VS_INDEXES_TO_NAMES.items())
+    ])
+
+    lef = lef.copy().align(
+        cmfs.shape,
+        extrapolator_args={'method': 'Constant',
+                           'left': 0,
+                           'right': 0})
+    wavelengths = cmfs.wavelengths
+
+    return SpectralMixingBasis(
+        cmfs.shape, S, np.dot(S, cmfs.values),
+        _samples_XYZ_array(S, R_tcs, cmfs.values),
+        _samples_XYZ_array(S, R_vs, cmfs.values),
+        K_M * np.trapz(S * lef.values, wavelengths),
+        np.trapz(S, wavelengths))
+
+
+def spectral_mixing_spd(weights, basis):
+    """
+    Returns the spectral power distribution of the mixture of given channels
+    weights.
+
+    Parameters
+    ----------
+    weights : array_like, (c, )
+        Channels weights.
+    basis : SpectralMixingBasis
+        Per channel colorimetry.
+
+    Returns
+    -------
+    SpectralPowerDistribution
+        Mixture spectral power distribution.
+
+    Examples
+    --------
+    >>> wavelengths = ASTME30815_PRACTISE_SHAPE.range()
+    >>> values = np.exp(-((wavelengths - np.array(
+    ...     [[455], [530], [595], [630]])) / 15) ** 2)
+    >>> basis = spectral_mixing_basis(values)
+    >>> spectral_mixing_spd([0.5, 1, 1, 0.5], basis)[555]  # doctest: +ELLIPSIS
+    0.0629925...
+    """
+
+    return SpectralPowerDistribution(
+        np.dot(np.asarray(weights), basis.S),
+        basis.shape.range(),
+        name='Spectral Mixing - {0}'.format(weights))
+
+
+def spectral_mixing_metrics(weights, basis, use_reference_bank=True):
+    """
+    Returns the colour quality metrics of the mixtures of given channels
+    weights array.
+
+    Parameters
+    ----------
+    weights : array_like, (..., c)
+        Channels weights.
+    basis : SpectralMixingBasis
+        Per channel colorimetry.
+    use_reference_bank : bool, optional
+        Whether to interpolate the reference illuminants colorimetry from the
+        bank returned by :func:`colour.quality.reference_illuminants_bank`
+        definition instead of computing it for each mixture.
+
+    Returns
+    -------
+    SpectralMixingMetrics
+        Colour quality metrics whose arrays are of shape (...).
+
+    Notes
+    -----
+    -   The *Colour Rendering Index* (CRI) and *Colour Quality Scale* (CQS)
+        of a mixture equal those returned by the
+        :func:`colour.quality.colour_rendering_index_array` and
+        :func:`colour.quality.colour_quality_scale_array` definitions for its
+        spectral power distribution.
+
+    Examples
+    --------
+    >>> wavelengths = ASTME30815_PRACTISE_SHAPE.range()
+    >>> values = np.exp(-((wavelengths - np.array(
+    ...     [[455], [530], [595], [630]])) / 15) ** 2)
+    >>> basis = spectral_mixing_basis(values)
+    >>> metrics = spectral_mixing_metrics([0.5, 1, 1, 0.5], basis)
+    >>> metrics.CCT  # doctest: +ELLIPSIS
+    array(3832.4507280...)
+    >>> metrics.CRI  # doctest: +ELLIPSIS
+    array(87.0713949...)
+    """
+
+    weights = np.asarray(weights)
+    prefix = weights.shape[:-1]
+    weights = np.reshape(weights, (-1, weights.shape[-1]))
+
+    XYZ_t = np.dot(weights, basis.XYZ)
+    XYZ_tcs = np.tensordot(weights, basis.XYZ_tcs, axes=1)
+    XYZ_vs = np.tensordot(weights, basis.XYZ_vs, axes=1)
+
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ_t))
+
+    colorimetry = (reference_illuminants_colorimetry
+                   if use_reference_bank else
+                   _reference_illuminants_colorimetry)
+
+    reference_CRI = colorimetry(uv_to_CCT_Robertson1968(uv)[..., 0])
+    UVW_t = _XYZ_to_tcs_UVW(
+        XYZ_t, XYZ_tcs, reference_CRI.XYZ, chromatic_adaptation=True)
+    Q_as = 100 - 4.6 * np.linalg.norm(reference_CRI.UVW_tcs - UVW_t, axis=-1)
+    CRI = np.average(Q_as[..., :8], axis=-1)
+
+    CCT, D_uv = tsplit(
+        uv_to_CCT_Ohno2013(
+            uv,
+            STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']))
+    reference_CQS = colorimetry(CCT)
+    _XYZ_vs_t, Lab_t = _XYZ_to_vs_Lab(
+        XYZ_t, XYZ_vs, reference_CQS.XYZ, chromatic_adaptation=True)
+    _D_C_ab, _D_E_ab, D_Ep_ab = _vs_differences_array(Lab_t,
+                                                      reference_CQS.Lab_vs)
+    CQS = scale_conversion(
+        np.sqrt(np.mean(D_Ep_ab ** 2, axis=-1)),
+        np.minimum(reference_CQS.G_D65 / D65_GAMUT_AREA, 1))
+
+    luminous_efficacy = (
+        np.dot(weights, basis.flux) / np.dot(weights, basis.power))
+
+    return SpectralMixingMetrics(
+        np.reshape(XYZ_t, prefix + (3, )), *[
+            np.reshape(x, prefix)
+            for x in (CCT, D_uv, CRI, CQS, luminous_efficacy)
+        ])
+
+
+def optimise_spectral_mixing(basis,
+                             CCT,
+                             D_uv=0,
+                             metric='CRI',
+                             minimal_luminous_efficacy=None,
+                             x_0=None,
+                             use_reference_bank=True,
+                             tolerance=1e-8,
+                             maximum_iterations=200):
+    """
+    Returns the channels weights maximising given colour quality metric of
+    the mixture at given correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}`.
+
+    Parameters
+    ----------
+    basis : SpectralMixingBasis
+        Per channel colorimetry.
+    CCT : numeric
+        Target correlated colour temperature :math:`T_{cp}`.
+    D_uv : numeric, optional
+        Target :math:`\\Delta_{uv}`.
+    metric : unicode, optional
+        **{'CRI', 'CQS', 'luminous_efficacy'}**,
+        Colour quality metric to maximise.
+    minimal_luminous_efficacy : numeric, optional
+        Minimal luminous efficacy in :math:`lm\\cdot W^{-1}` of the mixture.
+    x_0 : array_like, (c, ), optional
+        Initial channels weights, default to the non-negative least squares
+        solution of the constraints.
+    use_reference_bank : bool, optional
+        Whether to interpolate the reference illuminants colorimetry from the
+        bank returned by :func:`colour.quality.reference_illuminants_bank`
+        definition.
+    tolerance : numeric, optional
+        Tolerance for termination.
+    maximum_iterations : int, optional
+        Maximum number of iterations.
+
+    Returns
+    -------
+    ndarray, (c, )
+        Channels weights normalised so that the largest weight is 1.
+
+    Raises
+    ------
+    RuntimeError
+        If the optimisation fails, e.g. if the target chromaticity is outside
+        the channels gamut.
+
+    Notes
+    -----
+    -   The target *CIE UCS* colourspace *uv* chromaticity coordinates are
+        computed with *Ohno (2013)* method and the *uv* chromaticity
+        coordinates of a mixture depend linearly on the channels weights once
+        multiplied by their denominator: the chromaticity and luminous
+        efficacy constraints are linear and the optimised variables are the
+        channels contributions to the luminance :math:`Y` of the mixture.
+
+    Examples
+    --------
+    >>> wavelengths = ASTME30815_PRACTISE_SHAPE.range()
+    >>> values = np.exp(-((wavelengths - np.array(
+    ...     [[455], [530], [595], [630]])) / 15) ** 2)
+    >>> basis = spectral_mixing_basis(values)
+    >>> weights = optimise_spectral_mixing(basis, 3000)
+    >>> weights  # doctest: +ELLIPSIS
+    array([ 0.342...,  0.778...,  1.        ,  0.619...])
+    >>> spectral_mixing_metrics(weights, basis).CRI  # doctest: +ELLIPSIS
+    array(86.34...)
+    """
+
+    if metric not in SpectralMixingMetrics._fields[3:]:
+        raise ValueError(
+            '"{0}" metric is invalid, it must be one of {1}!'.format(
+                metric, SpectralMixingMetrics._fields[3:]))
+
+    u, v = CCT_to_uv_Ohno2013(CCT, D_uv)
+
+    # Variables are the channels contributions to the luminance of the
+    # mixture, i.e. the weights are the variables divided by the channels
+    # luminance.
+    Y_c = basis.XYZ[..., 1]
+    X, Y, Z = tsplit(basis.XYZ / Y_c[:, np.newaxis])
+    D = X + 15 * Y + 3 * Z
+    A_eq = np.vstack([u * D - 4 * X, v * D - 6 * Y, np.ones(Y_c.shape)])
+    b_eq = np.array([0, 0, 1])
+
+    constraints = [{
+        'type': 'eq',
+        'fun': lambda x: np.dot(A_eq, x) - b_eq,
+        'jac': lambda x: A_eq
+    }]
+
+    if minimal_luminous_efficacy is not None:
+        A_ineq = ((basis.flux - minimal_luminous_efficacy * basis.power) /
+                  Y_c)[np.newaxis]
+        constraints.append({
+            'type': 'ineq',
+            'fun': lambda x: np.dot(A_ineq, x),
+            'jac': lambda x: A_ineq
+        })
+
+    if x_0 is None:
+        x_0 = nnls(A_eq, b_eq)[0]
+    else:
+        x_0 = np.asarray(x_0) * Y_c
+        x_0 = x_0 / np.sum(x_0)
+
+    def function_objective(x):
+        """
+        Objective function.
+        """
+
+        return -getattr(
+            spectral_mixing_metrics(x / Y_c, basis, use_reference_bank),
+            metric) / 100
+
+    result = minimize(
+        function_objective,
+        x_0,
+        method='SLSQP',
+        constraints=constraints,
+        bounds=np.tile(np.array([0, 1]), (Y_c.shape[0], 1)),
+        options={'ftol': tolerance,
+                 'maxiter': maximum_iterations})
+
+    if not result.success:
+        raise RuntimeError(
+            'Optimization failed for {0}K and {1} "Duv" after {2} iterations: '
+            '"{3}".'.format(CCT, D_uv, result.nit, result.message))
+
+    weights = np.clip(result.x, 0, None) / Y_c
+
+    return weights / np.max(weights)
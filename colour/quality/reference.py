@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Reference Illuminants Bank
+==========================
+
+Defines the bank of reference illuminants colorimetry used by the
+*Colour Rendering Index* (CRI) and *Colour Quality Scale* (CQS) array
+computation objects:
+
+-   :attr:`colour.quality.REFERENCE_ILLUMINANTS_BANK_MIRED_STEP`
+-   :class:`colour.quality.ReferenceIlluminantsColorimetry`
+-   :func:`colour.quality.reference_illuminants_bank`
+-   :func:`colour.quality.reference_illuminants_colorimetry`
+
+The reference illuminants, i.e. the *Planckian* radiators below 5000K and the
+*CIE Standard Illuminant D Series* otherwise, depend only on the correlated
+colour temperature :math:`T_{cp}` of the test spectral power distribution:
+their colorimetry is computed once over a grid uniform in mired and linearly
+interpolated in between the grid nodes.
+
+References
+----------
+-   :cite:`Ohno2008a` : Ohno, Y., & Davis, W. (2008). NIST CQS simulation 7.4.
+    Retrieved from https://drive.google.com/file/d/\
+1PsuU6QjUJjCX6tQyCud6ul2Tbs8rYWW9/view?usp=sharing
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
+                                STANDARD_OBSERVERS_CMFS)
+from colour.quality.cri import _reference_spds_values, _tcs_UVW_array
+from colour.quality.cqs import _gamut_area_D65_array, _vs_Lab_array
+from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
+from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'REFERENCE_ILLUMINANTS_BANK_MIRED_STEP',
+    'REFERENCE_ILLUMINANTS_BANK_CCT_RANGES',
+    'ReferenceIlluminantsColorimetry', 'reference_illuminants_bank',
+    'reference_illuminants_colorimetry'
+]
+
+REFERENCE_ILLUMINANTS_BANK_MIRED_STEP = 0.5
+"""
+Default mired step of the reference illuminants bank grid.
+
+REFERENCE_ILLUMINANTS_BANK_MIRED_STEP : numeric
+"""
+
+REFERENCE_ILLUMINANTS_BANK_CCT_RANGES = ((1000, 5000), (5000, 25000))
+"""
+Correlated colour temperature :math:`T_{cp}` ranges covered by the
+*Planckian* radiators and *CIE Standard Illuminant D Series* segments of the
+reference illuminants bank, the correlated colour temperatures outside them
+are computed exactly.
+
+REFERENCE_ILLUMINANTS_BANK_CCT_RANGES : tuple
+"""
+
+_REFERENCE_ILLUMINANTS_BANK_CACHE = {}
+
+
+class ReferenceIlluminantsColorimetry(
+        namedtuple('ReferenceIlluminantsColorimetry',
+                   ('CCT', 'XYZ', 'UVW_tcs', 'Lab_vs', 'G_D65'))):
+    """
+    Defines the class storing the colorimetry of reference illuminants.
+
+    Parameters
+    ----------
+    CCT : ndarray, (n, )
+        Correlated colour temperatures :math:`T_{cp}`.
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values normalised to :math:`Y = 1`.
+    UVW_tcs : ndarray, (n, 14, 3)
+        *Test colour samples* *CIE 1964 U\\*V\\*W\\** colourspace arrays.
+    Lab_vs : ndarray, (n, 15, 3)
+        *VS test colour samples* *CIE L\\*a\\*b\\** colourspace arrays.
+    G_D65 : ndarray, (n, )
+        Gamut area :math:`G` of the *VS test colour samples* adapted to
+        *CIE Illuminant D Series D65*.
+    """
+
+
+def _reference_illuminants_colorimetry(CCT, planckian=None):
+    """
+    Computes the colorimetry of the reference illuminants of given correlated
+    colour temperatures :math:`T_{cp}` array.
+
+    Parameters
+    ----------
+    CCT : ndarray, (n, )
+        Correlated colour temperatures :math:`T_{cp}`.
+    planckian : ndarray, (n, ), optional
+        Whether the reference illuminants are *Planckian* radiators, default
+        to the correlated colour temperatures below 5000K.
+
+    Returns
+    -------
+    ReferenceIlluminantsColorimetry
+        Reference illuminants colorimetry.
+    """
+
+    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
+    ).trim(ASTME30815_PRACTISE_SHAPE)
+
+    R_tcs = np.array([
+        TCS_SPDS[name].copy().align(cmfs.shape).values
+        for _index, name in sorted(TCS_INDEXES_TO_NAMES.items())
+    ])
+    R_vs = np.array([
+        VS_SPDS[name].copy().align(cmfs.shape).values
+        for _index, name in sorted(VS_INDEXES_TO_NAMES.items())
+    ])
+
+    S_r = _reference_spds_values(CCT, cmfs.shape, planckian)
+
+    XYZ = np.dot(S_r, cmfs.values)
+    XYZ /= XYZ[..., 1:2]
+
+    UVW_tcs = _tcs_UVW_array(S_r, XYZ, R_tcs, cmfs.values)
+    XYZ_vs, Lab_vs = _vs_Lab_array(S_r, XYZ, R_vs, cmfs.values)
+
+    return ReferenceIlluminantsColorimetry(
+        CCT, XYZ, UVW_tcs, Lab_vs, _gamut_area_D65_array(XYZ, XYZ_vs))
+
+
+def reference_illuminants_bank(
+        mired_step=REFERENCE_ILLUMINANTS_BANK_MIRED_STEP):
+    """
+    Returns the bank of reference illuminants colorimetry sampled uniformly in
+    mired with given step.
+
+    The bank is computed once per mired step and cached.
+
+    Parameters
+    ----------
+    mired_step : numeric, optional
+        Mired step of the bank grid.
+
+    Returns
+    -------
+    tuple
+        *Planckian* radiators and *CIE Standard Illuminant D Series*
+        :class:`ReferenceIlluminantsColorimetry` class instances whose
+        correlated colour temperatures :math:`T_{cp}` are sorted by increasing
+        mired.
+
+    Notes
+    -----
+    -   The *Planckian* radiators segment ends with a 5000K node computed as a
+        *Planckian* radiator so that the correlated colour temperatures just
+        below 5000K are interpolated without crossing the discontinuity of
+        the reference illuminants.
+
+    Examples
+    --------
+    >>> planckian, daylight = reference_illuminants_bank()
+    >>> planckian.CCT[0], planckian.CCT[-1]  # doctest: +ELLIPSIS
+    (5000.0..., 1000.0...)
+    >>> daylight.UVW_tcs.shape
+    (321, 14, 3)
+    """
+
+    bank = _REFERENCE_ILLUMINANTS_BANK_CACHE.get(mired_step)
+    if bank is not None:
+        return bank
+
+    bank = []
+    for (CCT_m, CCT_n), planckian in zip(REFERENCE_ILLUMINANTS_BANK_CCT_RANGES,
+                                         (True, False)):
+        mired_m, mired_n = 1e6 / CCT_n, 1e6 / CCT_m
+        count = int(np.ceil(np.around((mired_n - mired_m) / mired_step, 6)))
+        CCT = 1e6 / np.linspace(mired_m, mired_n, count + 1)
+        colorimetry = _reference_illuminants_colorimetry(
+            CCT, np.full(CCT.shape, planckian))
+        for array in colorimetry:
+            array.setflags(write=False)
+
+        bank.append(colorimetry)
+
+    bank = _REFERENCE_ILLUMINANTS_BANK_CACHE[mired_step] = tuple(bank)
+
+    return bank
+
+
+def reference_illuminants_colorimetry(
+        CCT, mired_step=REFERENCE_ILLUMINANTS_BANK_MIRED_STEP):
+    """
+    Returns the colorimetry of the reference illuminants of given correlated
+    colour temperatures :math:`T_{cp}` array, linearly interpolated in mired
+    from the reference illuminants bank.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperatures :math:`T_{cp}`.
+    mired_step : numeric, optional
+        Mired step of the reference illuminants bank grid.
+
+    Returns
+    -------
+    ReferenceIlluminantsColorimetry
+        Reference illuminants colorimetry whose arrays are of shape (n, ...).
+
+    Notes
+    -----
+    -   The correlated colour temperatures outside the
+        :attr:`colour.quality.REFERENCE_ILLUMINANTS_BANK_CCT_RANGES` attribute
+        ranges are computed exactly.
+
+    Examples
+    --------
+    >>> colorimetry = reference_illuminants_colorimetry([2856, 6504])
+    >>> colorimetry.XYZ  # doctest: +ELLIPSIS
+    array([[ 1.0984372...,  1.        ,  0.3559706...],
+           [ 0.9504584...,  1.        ,  1.0892841...]])
+    """
+
+    CCT = np.ravel(np.asarray(CCT, dtype=np.float_))
+
+    XYZ = np.zeros([CCT.shape[0], 3])
+    UVW_tcs = np.zeros([CCT.shape[0], len(TCS_INDEXES_TO_NAMES), 3])
+    Lab_vs = np.zeros([CCT.shape[0], len(VS_INDEXES_TO_NAMES), 3])
+    G_D65 = np.zeros(CCT.shape)
+    arrays = (XYZ, UVW_tcs, Lab_vs, G_D65)
+
+    mired = 1e6 / CCT
+    interpolated = np.zeros(CCT.shape, dtype=bool)
+    for (CCT_m, CCT_n), colorimetry in zip(
+            REFERENCE_ILLUMINANTS_BANK_CCT_RANGES,
+            reference_illuminants_bank(mired_step)):
+        if CCT_n == REFERENCE_ILLUMINANTS_BANK_CCT_RANGES[-1][-1]:
+            mask = np.logical_and(CCT >= CCT_m, CCT <= CCT_n)
+        else:
+            mask = np.logical_and(CCT >= CCT_m, CCT < CCT_n)
+
+        if not np.any(mask):
+            continue
+
+        interpolated |= mask
+
+        nodes = 1e6 / colorimetry.CCT
+        x = (mired[mask] - nodes[0]) / (nodes[1] - nodes[0])
+        i = np.clip(np.floor(x).astype(np.int_), 0, nodes.shape[0] - 2)
+        t = x - i
+        for array, values in zip(arrays, colorimetry[1:]):
+            t_e = np.reshape(t, t.shape + (1, ) * (values.ndim - 1))
+            array[mask] = (1 - t_e) * values[i] + t_e * values[i + 1]
+
+    exact = ~interpolated
+    if np.any(exact):
+        colorimetry = _reference_illuminants_colorimetry(CCT[exact])
+        for array, values in zip(arrays, colorimetry[1:]):
+            array[exact] = values
+
+    return ReferenceIlluminantsColorimetry(CCT, *arrays)
@@ -5,11 +5,14 @@ Defines unit tests for :mod:`colour.quality.cqs` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_quality_scale
-from colour.colorimetry import (ILLUMINANTS_SPDS,
-                                LIGHT_SOURCES_SPDS)
+from colour.quality import colour_quality_scale, colour_quality_scale_array
+from colour.quality.cqs import gamut_area
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE, ILLUMINANTS_SPDS,
+                                LIGHT_SOURCES_SPDS,
+                                MultiSpectralPowerDistribution, SpectralShape)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +21,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourQualityScale']
+__all__ = [
+    'TestColourQualityScale', 'TestGamutArea', 'TestColourQualityScaleArray'
+]
 
 
 class TestColourQualityScale(unittest.TestCase):
@@ -67,5 +72,124 @@ class TestColourQualityScale(unittest.TestCase):
             places=7)
 
 
+class TestGamutArea(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.gamut_area` definition unit tests
+    methods.
+    """
+
+    def test_n_dimensional_gamut_area(self):
+        """
+        Tests :func:`colour.quality.cqs.gamut_area` definition n-dimensional
+        arrays support.
+        """
+
+        Lab = np.array([
+            [39.94996006, 34.59018231, -19.86046321],
+            [38.88395498, 21.44348519, -34.87805301],
+            [36.60576301, 7.06742454, -43.21461177],
+            [46.60142558, -15.90481586, -34.64616865],
+            [56.50196523, -29.54655550, -20.50177194],
+            [55.73912101, -43.39520959, -5.08956953],
+            [56.20776870, -53.68997662, 20.21134410],
+            [66.16683122, -38.64600327, 42.77396631],
+            [76.72952110, -23.92148210, 61.04740432],
+            [82.85370708, -3.98679065, 75.43320144],
+            [69.26458861, 13.11066359, 68.83858372],
+            [69.63154351, 28.24532497, 59.45609803],
+            [61.26281449, 40.87950839, 44.97606172],
+            [41.62567821, 57.34129516, 27.46718170],
+            [40.52565174, 48.87449192, 3.45121680],
+        ])
+        G = gamut_area(Lab)
+        self.assertAlmostEqual(G, 8335.94820180, places=7)
+
+        Lab = np.tile(Lab, (6, 1, 1))
+        G = np.tile(G, 6)
+        np.testing.assert_almost_equal(gamut_area(Lab), G, decimal=7)
+
+        Lab = np.reshape(Lab, (2, 3, 15, 3))
+        G = np.reshape(G, (2, 3))
+        np.testing.assert_almost_equal(gamut_area(Lab), G, decimal=7)
+
+
+class TestColourQualityScaleArray(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.colour_quality_scale_array` definition
+    unit tests methods.
+    """
+
+    def test_colour_quality_scale_array(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale_array`
+        definition.
+        """
+
+        spds = [
+            ILLUMINANTS_SPDS['F1'], ILLUMINANTS_SPDS['F2'],
+            ILLUMINANTS_SPDS['A'],
+            LIGHT_SOURCES_SPDS['Neodimium Incandescent'],
+            LIGHT_SOURCES_SPDS['H38HT-100 (Mercury)'],
+            LIGHT_SOURCES_SPDS['Luxeon WW 2880']
+        ]
+        values = np.array([
+            spd.copy().align(ASTME30815_PRACTISE_SHAPE).values
+            for spd in spds
+        ])
+
+        specification = colour_quality_scale_array(
+            values, additional_data=True)
+        self.assertTupleEqual(specification.Q_as.shape, (6, 15))
+
+        for i, spd in enumerate(spds):
+            specification_i = colour_quality_scale(spd, additional_data=True)
+            for attribute in ('Q_a', 'Q_f', 'Q_p', 'Q_g', 'Q_d'):
+                self.assertAlmostEqual(
+                    getattr(specification, attribute)[i],
+                    getattr(specification_i, attribute),
+                    places=7)
+
+            np.testing.assert_almost_equal(
+                specification.Q_as[i],
+                np.array([
+                    Q_as_i.Q_a for _index, Q_as_i in sorted(
+                        specification_i.Q_as.items())
+                ]),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            colour_quality_scale_array(values), specification.Q_a, decimal=7)
+
+        shape = SpectralShape(360, 780, 5)
+        values = np.array([spd.copy().align(shape).values for spd in spds])
+        np.testing.assert_almost_equal(
+            colour_quality_scale_array(
+                MultiSpectralPowerDistribution(
+                    np.transpose(values), shape.range())),
+            colour_quality_scale_array(values, shape),
+            decimal=7)
+
+    def test_n_dimensional_colour_quality_scale_array(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale_array`
+        definition n-dimensional arrays support.
+        """
+
+        values = ILLUMINANTS_SPDS['F2'].copy().align(
+            ASTME30815_PRACTISE_SHAPE).values
+        Q_a = colour_quality_scale_array(values)
+        self.assertAlmostEqual(Q_a, 64.686339173112856, places=7)
+
+        values = np.tile(values, (6, 1))
+        Q_a = np.tile(Q_a, 6)
+        np.testing.assert_almost_equal(
+            colour_quality_scale_array(values), Q_a, decimal=7)
+
+        values = np.reshape(values, (2, 3, -1))
+        Q_a = np.reshape(Q_a, (2, 3))
+        np.testing.assert_almost_equal(
+            colour_quality_scale_array(values), Q_a, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
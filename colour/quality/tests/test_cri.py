@@ -5,11 +5,13 @@ Defines unit tests for :mod:`colour.quality.cri` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_rendering_index
-from colour.colorimetry import (ILLUMINANTS_SPDS,
-                                SpectralPowerDistribution)
+from colour.quality import colour_rendering_index, colour_rendering_index_array
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE, ILLUMINANTS_SPDS,
+                                MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution, SpectralShape)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +20,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourRenderingIndex']
+__all__ = ['TestColourRenderingIndex', 'TestColourRenderingIndexArray']
 
 SAMPLE_SPD_DATA = {
     380: 0.00588346,
@@ -132,5 +134,78 @@ class TestColourRenderingIndex(unittest.TestCase):
             places=7)
 
 
+class TestColourRenderingIndexArray(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cri.colour_rendering_index_array`
+    definition unit tests methods.
+    """
+
+    def test_colour_rendering_index_array(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index_array`
+        definition.
+        """
+
+        spds = [
+            ILLUMINANTS_SPDS['F2'], ILLUMINANTS_SPDS['A'],
+            ILLUMINANTS_SPDS['D65'], ILLUMINANTS_SPDS['FL3.15'],
+            SpectralPowerDistribution(SAMPLE_SPD_DATA)
+        ]
+        values = np.array([
+            spd.copy().align(ASTME30815_PRACTISE_SHAPE).values
+            for spd in spds
+        ])
+
+        Q_a, Q_as = colour_rendering_index_array(values, additional_data=True)
+        self.assertTupleEqual(Q_as.shape, (5, 14))
+
+        for i, spd in enumerate(spds):
+            specification = colour_rendering_index(spd, additional_data=True)
+            self.assertAlmostEqual(Q_a[i], specification.Q_a, places=7)
+            np.testing.assert_almost_equal(
+                Q_as[i],
+                np.array([
+                    Q_as_i.Q_a
+                    for _index, Q_as_i in sorted(specification.Q_as.items())
+                ]),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index_array(values * 10), Q_a, decimal=7)
+
+        shape = SpectralShape(360, 780, 5)
+        values = np.array([spd.copy().align(shape).values for spd in spds])
+        np.testing.assert_almost_equal(
+            colour_rendering_index_array(values, shape), Q_a, decimal=3)
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index_array(
+                MultiSpectralPowerDistribution(
+                    np.transpose(values), shape.range())),
+            Q_a,
+            decimal=3)
+
+    def test_n_dimensional_colour_rendering_index_array(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index_array`
+        definition n-dimensional arrays support.
+        """
+
+        values = ILLUMINANTS_SPDS['F2'].copy().align(
+            ASTME30815_PRACTISE_SHAPE).values
+        Q_a = colour_rendering_index_array(values)
+        self.assertAlmostEqual(Q_a, 64.151520202968015, places=7)
+
+        values = np.tile(values, (6, 1))
+        Q_a = np.tile(Q_a, 6)
+        np.testing.assert_almost_equal(
+            colour_rendering_index_array(values), Q_a, decimal=7)
+
+        values = np.reshape(values, (2, 3, -1))
+        Q_a = np.reshape(Q_a, (2, 3))
+        np.testing.assert_almost_equal(
+            colour_rendering_index_array(values), Q_a, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
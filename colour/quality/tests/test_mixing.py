@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.quality.mixing` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
+                                MultiSpectralPowerDistribution,
+                                luminous_efficacy)
+from colour.quality import (colour_quality_scale_array,
+                            colour_rendering_index_array,
+                            optimise_spectral_mixing, spectral_mixing_basis,
+                            spectral_mixing_metrics, spectral_mixing_spd)
+from colour.temperature import uv_to_CCT_Ohno2013
+from colour.models import UCS_to_uv, XYZ_to_UCS
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'CHANNELS_VALUES', 'TestSpectralMixingBasis', 'TestSpectralMixingMetrics',
+    'TestOptimiseSpectralMixing'
+]
+
+CHANNELS_VALUES = np.exp(-((ASTME30815_PRACTISE_SHAPE.range() - np.array(
+    [[455], [530], [595], [630]])) / 15) ** 2)
+
+
+class TestSpectralMixingBasis(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.mixing.spectral_mixing_basis` definition
+    unit tests methods.
+    """
+
+    def test_spectral_mixing_basis(self):
+        """
+        Tests :func:`colour.quality.mixing.spectral_mixing_basis` definition.
+        """
+
+        basis = spectral_mixing_basis(CHANNELS_VALUES)
+
+        self.assertTupleEqual(basis.XYZ_tcs.shape, (4, 14, 3))
+        self.assertTupleEqual(basis.XYZ_vs.shape, (4, 15, 3))
+
+        spds = MultiSpectralPowerDistribution(
+            np.transpose(CHANNELS_VALUES), ASTME30815_PRACTISE_SHAPE.range())
+        np.testing.assert_almost_equal(
+            spectral_mixing_basis(spds).XYZ, basis.XYZ, decimal=7)
+
+        spd = spectral_mixing_spd([0.5, 1, 1, 0.5], basis)
+        np.testing.assert_almost_equal(
+            spd.values,
+            np.dot([0.5, 1, 1, 0.5], CHANNELS_VALUES),
+            decimal=7)
+
+
+class TestSpectralMixingMetrics(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.mixing.spectral_mixing_metrics` definition
+    unit tests methods.
+    """
+
+    def test_spectral_mixing_metrics(self):
+        """
+        Tests :func:`colour.quality.mixing.spectral_mixing_metrics`
+        definition.
+        """
+
+        basis = spectral_mixing_basis(CHANNELS_VALUES)
+        weights = np.array([[0.5, 1, 1, 0.5], [0.5, 0.8, 0.6, 0.4],
+                            [0.1, 0.4, 1, 1]])
+        S = np.dot(weights, CHANNELS_VALUES)
+
+        metrics = spectral_mixing_metrics(weights, basis, False)
+        np.testing.assert_almost_equal(
+            metrics.CRI, colour_rendering_index_array(S), decimal=7)
+        np.testing.assert_almost_equal(
+            metrics.CQS, colour_quality_scale_array(S), decimal=7)
+        np.testing.assert_almost_equal(
+            metrics.luminous_efficacy,
+            [
+                luminous_efficacy(spectral_mixing_spd(w, basis))
+                for w in weights
+            ],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            np.hstack([metrics.CCT[:, np.newaxis],
+                       metrics.D_uv[:, np.newaxis]]),
+            [
+                uv_to_CCT_Ohno2013(UCS_to_uv(XYZ_to_UCS(XYZ)))
+                for XYZ in metrics.XYZ
+            ],
+            decimal=7)
+
+        metrics_bank = spectral_mixing_metrics(weights, basis)
+        np.testing.assert_allclose(metrics_bank.CRI, metrics.CRI, atol=0.01)
+        np.testing.assert_allclose(metrics_bank.CQS, metrics.CQS, atol=0.01)
+
+    def test_n_dimensional_spectral_mixing_metrics(self):
+        """
+        Tests :func:`colour.quality.mixing.spectral_mixing_metrics`
+        definition n-dimensional arrays support.
+        """
+
+        basis = spectral_mixing_basis(CHANNELS_VALUES)
+        weights = np.array([0.5, 1, 1, 0.5])
+        metrics = spectral_mixing_metrics(weights, basis)
+
+        weights = np.tile(weights, (2, 3, 1))
+        metrics_n = spectral_mixing_metrics(weights, basis)
+        self.assertTupleEqual(metrics_n.XYZ.shape, (2, 3, 3))
+        for value, values in zip(metrics, metrics_n):
+            np.testing.assert_almost_equal(
+                values, np.tile(value, (2, 3) + (1, ) * value.ndim), decimal=7)
+
+
+class TestOptimiseSpectralMixing(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.mixing.optimise_spectral_mixing` definition
+    unit tests methods.
+    """
+
+    def test_optimise_spectral_mixing(self):
+        """
+        Tests :func:`colour.quality.mixing.optimise_spectral_mixing`
+        definition.
+        """
+
+        basis = spectral_mixing_basis(CHANNELS_VALUES)
+
+        for CCT, D_uv in ((3000, 0), (4000, 0.002), (5500, -0.002)):
+            metrics = {}
+            for metric in ('CRI', 'CQS', 'luminous_efficacy'):
+                weights = optimise_spectral_mixing(
+                    basis, CCT, D_uv, metric=metric)
+                self.assertAlmostEqual(np.max(weights), 1, places=7)
+
+                metrics[metric] = spectral_mixing_metrics(weights, basis)
+                np.testing.assert_allclose(
+                    metrics[metric].CCT, CCT, rtol=0.001)
+                np.testing.assert_allclose(
+                    metrics[metric].D_uv, D_uv, atol=0.0001)
+
+            self.assertGreater(metrics['CRI'].CRI + 0.01,
+                               metrics['CQS'].CRI)
+            self.assertGreater(metrics['CQS'].CQS + 0.01,
+                               metrics['CRI'].CQS)
+            self.assertGreater(metrics['luminous_efficacy'].luminous_efficacy,
+                               metrics['CRI'].luminous_efficacy)
+
+        weights = optimise_spectral_mixing(
+            basis, 3000, minimal_luminous_efficacy=400)
+        self.assertGreater(
+            spectral_mixing_metrics(weights, basis).luminous_efficacy, 399.99)
+
+    def test_raise_exception_optimise_spectral_mixing(self):
+        """
+        Tests :func:`colour.quality.mixing.optimise_spectral_mixing`
+        definition raised exception.
+        """
+
+        basis = spectral_mixing_basis(CHANNELS_VALUES)
+
+        self.assertRaises(
+            ValueError, optimise_spectral_mixing, basis, 3000, metric='Ra')
+        self.assertRaises(
+            RuntimeError,
+            optimise_spectral_mixing,
+            basis,
+            3000,
+            minimal_luminous_efficacy=1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
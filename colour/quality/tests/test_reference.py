@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.quality.reference` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.quality import (colour_quality_scale_array,
+                            colour_rendering_index_array,
+                            reference_illuminants_bank,
+                            reference_illuminants_colorimetry)
+from colour.quality.reference import _reference_illuminants_colorimetry
+from colour.colorimetry import ASTME30815_PRACTISE_SHAPE, ILLUMINANTS_SPDS
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestReferenceIlluminantsBank', 'TestReferenceIlluminantsColorimetry'
+]
+
+
+class TestReferenceIlluminantsBank(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.reference.reference_illuminants_bank`
+    definition unit tests methods.
+    """
+
+    def test_reference_illuminants_bank(self):
+        """
+        Tests :func:`colour.quality.reference.reference_illuminants_bank`
+        definition.
+        """
+
+        planckian, daylight = reference_illuminants_bank(1)
+
+        np.testing.assert_almost_equal(
+            1e6 / planckian.CCT, np.linspace(200, 1000, 801), decimal=7)
+        np.testing.assert_almost_equal(
+            1e6 / daylight.CCT, np.linspace(40, 200, 161), decimal=7)
+
+        self.assertTupleEqual(planckian.UVW_tcs.shape, (801, 14, 3))
+        self.assertTupleEqual(daylight.Lab_vs.shape, (161, 15, 3))
+
+        self.assertIs(reference_illuminants_bank(1)[0], planckian)
+        self.assertFalse(daylight.XYZ.flags.writeable)
+
+        # The *Planckian* radiators segment ends with a *Planckian* 5000K node.
+        exact = _reference_illuminants_colorimetry(
+            np.array([5000, 5000]), np.array([True, False]))
+        np.testing.assert_almost_equal(
+            planckian.XYZ[0], exact.XYZ[0], decimal=7)
+        np.testing.assert_almost_equal(
+            daylight.XYZ[-1], exact.XYZ[1], decimal=7)
+
+
+class TestReferenceIlluminantsColorimetry(unittest.TestCase):
+    """
+    Defines
+    :func:`colour.quality.reference.reference_illuminants_colorimetry`
+    definition unit tests methods.
+    """
+
+    def test_reference_illuminants_colorimetry(self):
+        """
+        Tests
+        :func:`colour.quality.reference.reference_illuminants_colorimetry`
+        definition.
+        """
+
+        CCT = np.array([1500, 2856, 4999, 5000, 6504, 12000, 500, 50000])
+        colorimetry = reference_illuminants_colorimetry(CCT)
+        exact = _reference_illuminants_colorimetry(CCT)
+
+        for array, values in zip(colorimetry[1:], exact[1:]):
+            np.testing.assert_allclose(array, values, rtol=0.0001, atol=0.01)
+
+        # Correlated colour temperatures outside the bank are exact.
+        for array, values in zip(colorimetry[1:], exact[1:]):
+            np.testing.assert_almost_equal(array[-2:], values[-2:], decimal=7)
+
+    def test_use_reference_bank(self):
+        """
+        Tests the *use_reference_bank* argument of
+        :func:`colour.quality.cri.colour_rendering_index_array` and
+        :func:`colour.quality.cqs.colour_quality_scale_array` definitions.
+        """
+
+        values = np.array([
+            ILLUMINANTS_SPDS[name].copy().align(ASTME30815_PRACTISE_SHAPE)
+            .values for name in ('F2', 'A', 'E', 'F11', 'D65')
+        ])
+
+        np.testing.assert_allclose(
+            colour_rendering_index_array(values, use_reference_bank=True),
+            colour_rendering_index_array(values),
+            atol=0.01)
+        np.testing.assert_allclose(
+            colour_quality_scale_array(values, use_reference_bank=True),
+            colour_quality_scale_array(values),
+            atol=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,13 +18,19 @@ from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 
 from .dataset import *  # noqa
 from . import dataset
-from .meng2015 import XYZ_to_spectral_Meng2015
-from .smits1999 import RGB_to_spectral_Smits1999
+from .meng2015 import (XYZ_to_spectral_Meng2015,
+                       XYZ_to_spectral_array_Meng2015,
+                       XYZ_to_spectral_closed_form_Meng2015)
+from .smits1999 import (RGB_to_spectral_Smits1999,
+                        RGB_to_spectral_array_Smits1999)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['XYZ_to_spectral_Meng2015']
-__all__ += ['RGB_to_spectral_Smits1999']
+__all__ += [
+    'XYZ_to_spectral_Meng2015', 'XYZ_to_spectral_array_Meng2015',
+    'XYZ_to_spectral_closed_form_Meng2015'
+]
+__all__ += ['RGB_to_spectral_Smits1999', 'RGB_to_spectral_array_Smits1999']
 
 REFLECTANCE_RECOVERY_METHODS = CaseInsensitiveMapping({
     'Meng 2015': XYZ_to_spectral_Meng2015,
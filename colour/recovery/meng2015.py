@@ -7,6 +7,8 @@ Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
 -   :func:`colour.recovery.XYZ_to_spectral_Meng2015`
+-   :func:`colour.recovery.XYZ_to_spectral_array_Meng2015`
+-   :func:`colour.recovery.XYZ_to_spectral_closed_form_Meng2015`
 
 See Also
 --------
@@ -23,12 +25,15 @@ References
 
 from __future__ import division, unicode_literals
 
+import hashlib
+import multiprocessing
 import numpy as np
 from scipy.optimize import minimize
 
 from colour.colorimetry import (STANDARD_OBSERVERS_CMFS,
                                 SpectralPowerDistribution, SpectralShape,
                                 ones_spd, spectral_to_XYZ_integration)
+from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -37,7 +42,12 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XYZ_to_spectral_Meng2015']
+__all__ = [
+    'XYZ_to_spectral_Meng2015', 'XYZ_to_spectral_array_Meng2015',
+    'XYZ_to_spectral_closed_form_Meng2015'
+]
+
+_MENG2015_MATRICES_CACHE = {}
 
 
 def XYZ_to_spectral_Meng2015(
@@ -192,3 +202,376 @@ def XYZ_to_spectral_Meng2015(
     return SpectralPowerDistribution(
         dict(zip(wavelengths, result.x * 100)),
         name='Meng (2015) - {0}'.format(XYZ))
+
+
+def _XYZ_to_spectral_array_Meng2015(args):
+    """
+    Recovers the spectral values of given *CIE XYZ* tristimulus values
+    array using *Meng et alii (2015)* method, each solve being warm-started
+    from the solution of the nearest previously solved tristimulus values.
+
+    Parameters
+    ----------
+    args : tuple
+        *CIE XYZ* tristimulus values array, colour matching functions
+        matrix, tolerance, maximum iterations count and initial guesses
+        array, if *None* the initial guesses are taken from the nearest
+        previously solved tristimulus values.
+
+    Returns
+    -------
+    ndarray
+        Recovered spectral values.
+    """
+
+    XYZ, M, tolerance, maximum_iterations, x_0_a = args
+
+    bins = M.shape[-1]
+
+    def function_objective(a):
+        """
+        Objective function.
+        """
+
+        return np.sum(np.diff(a) ** 2)
+
+    def function_objective_jacobian(a):
+        """
+        Objective function jacobian.
+        """
+
+        d = 2 * np.diff(a)
+
+        return np.hstack([-d, 0]) + np.hstack([0, d])
+
+    def function_constraint_jacobian(a):
+        """
+        Function defining the constraint jacobian.
+        """
+
+        return M
+
+    bounds = np.tile(np.array([0, 1000]), (bins, 1))
+
+    values = np.zeros([XYZ.shape[0], bins])
+    for i, XYZ_i in enumerate(XYZ):
+        if x_0_a is not None:
+            x_0 = x_0_a[i]
+        elif i == 0:
+            x_0 = np.ones(bins)
+        else:
+            x_0 = values[np.argmin(np.sum((XYZ[:i] - XYZ_i) ** 2, axis=-1))]
+
+        constraints = {
+            'type': 'eq',
+            'fun': lambda a: np.dot(M, a) - XYZ_i,
+            'jac': function_constraint_jacobian
+        }
+
+        result = minimize(
+            function_objective,
+            x_0,
+            method='SLSQP',
+            jac=function_objective_jacobian,
+            constraints=constraints,
+            bounds=bounds,
+            options={'ftol': tolerance,
+                     'maxiter': maximum_iterations})
+
+        if not result.success:
+            raise RuntimeError(
+                'Optimization failed for {0} after {1} iterations: '
+                '"{2}".'.format(XYZ_i, result.nit, result.message))
+
+        values[i] = result.x
+
+    return values
+
+
+def _solve_Meng2015(XYZ, M, tolerance, maximum_iterations, x_0, processes,
+                    pool):
+    """
+    Solves the *Meng et alii (2015)* optimisation problem for given *CIE XYZ*
+    tristimulus values array, splitting it in chunks optionally solved in
+    parallel.
+
+    Parameters
+    ----------
+    XYZ : ndarray, (n, 3)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    M : ndarray, (3, bins)
+        Colour matching functions matrix.
+    tolerance : numeric
+        Tolerance for termination.
+    maximum_iterations : int
+        Maximum number of iterations to perform.
+    x_0 : ndarray, (n, bins)
+        Initial guesses array, if *None* the initial guesses are taken from
+        the nearest previously solved tristimulus values.
+    processes : integer
+        Processes count.
+    pool : object
+        Object implementing a compatible *map* method.
+
+    Returns
+    -------
+    ndarray, (n, bins)
+        Recovered spectral values.
+    """
+
+    indexes = [
+        chunk for chunk in np.array_split(
+            np.arange(XYZ.shape[0]), max(processes, 1)) if chunk.size
+    ]
+    arguments = [(XYZ[chunk], M, tolerance, maximum_iterations,
+                  None if x_0 is None else x_0[chunk]) for chunk in indexes]
+
+    if pool is not None:
+        results = list(pool.map(_XYZ_to_spectral_array_Meng2015, arguments))
+    elif processes > 1:
+        pool = multiprocessing.Pool(processes=processes)
+        try:
+            results = pool.map(_XYZ_to_spectral_array_Meng2015, arguments)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [
+            _XYZ_to_spectral_array_Meng2015(argument)
+            for argument in arguments
+        ]
+
+    return np.vstack(results) if results else np.zeros([0, M.shape[-1]])
+
+
+def _Meng2015_matrices(cmfs, interval):
+    """
+    Returns the colour matching functions matrix and the closed-form solution
+    matrix of the *Meng et alii (2015)* optimisation problem without bounds
+    for given colour matching functions and interval.
+
+    The matrices are cached on the colour matching functions wavelengths and
+    values hash.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric
+        Wavelength :math:`\\lambda_{i}` range interval in nm.
+
+    Returns
+    -------
+    tuple
+        Colour matching functions matrix :math:`M` of shape (3, bins) and
+        closed-form solution matrix :math:`K` of shape (bins, 3).
+
+    Notes
+    -----
+    -   Minimising :math:`a^T D a` where :math:`D = L^T L` and :math:`L` is
+        the first order difference matrix, subject to :math:`M a = XYZ`,
+        yields the *Karush-Kuhn-Tucker* linear system
+        :math:`[[2D, M^T], [M, 0]] [a, \\mu]^T = [0, XYZ]^T` whose solution
+        is linear in the *CIE XYZ* tristimulus values, i.e.
+        :math:`a = K XYZ`.
+    """
+
+    key = (interval, ) + tuple(
+        hashlib.sha1(np.ascontiguousarray(
+            a, dtype=DEFAULT_FLOAT_DTYPE).tobytes()).hexdigest()
+        for a in (cmfs.wavelengths, cmfs.values))
+
+    matrices = _MENG2015_MATRICES_CACHE.get(key)
+    if matrices is None:
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+        cmfs_a = cmfs.copy().align(shape)
+
+        M = 100 * np.transpose(cmfs_a.values) / np.sum(cmfs_a.values[..., 1])
+
+        bins = M.shape[-1]
+        L = np.diff(np.identity(bins), axis=0)
+        KKT = np.zeros([bins + 3, bins + 3])
+        KKT[:bins, :bins] = 2 * np.dot(np.transpose(L), L)
+        KKT[:bins, bins:] = np.transpose(M)
+        KKT[bins:, :bins] = M
+
+        b = np.zeros([bins + 3, 3])
+        b[bins:] = np.identity(3)
+
+        K = np.linalg.solve(KKT, b)[:bins]
+
+        M.setflags(write=False)
+        K.setflags(write=False)
+
+        _MENG2015_MATRICES_CACHE[key] = matrices = M, K
+
+    return matrices
+
+
+def XYZ_to_spectral_array_Meng2015(
+        XYZ,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5,
+        tolerance=1e-10,
+        maximum_iterations=2000,
+        processes=1,
+        pool=None):
+    """
+    Recovers the spectral values of given *CIE XYZ* tristimulus values array
+    using *Meng et alii (2015)* method.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\\lambda_{i}` range interval in nm. The smaller
+        ``interval`` is, the longer the computations will be.
+    tolerance : numeric, optional
+        Tolerance for termination. The lower ``tolerance`` is, the smoother
+        the recovered spectral values will be.
+    maximum_iterations : int, optional
+        Maximum number of iterations to perform.
+    processes : integer, optional
+        Processes count, the *CIE XYZ* tristimulus values being split in as
+        many chunks solved in parallel. A single process solves the chunk
+        without creating a pool.
+    pool : object, optional
+        :class:`multiprocessing.pool.Pool` or
+        :class:`concurrent.futures.Executor` class instance, or any object
+        implementing a compatible *map* method, used to solve the chunks. It
+        is not closed so that it can be reused across calls, if not given and
+        the processes count is greater than 1, a pool of given processes
+        count is created and closed once the chunks are solved.
+
+    Returns
+    -------
+    ndarray, (..., n)
+        Recovered spectral values at the wavelengths of the
+        ``SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)``
+        spectral shape.
+
+    Notes
+    -----
+    -   The colour matching functions are aligned once and the constraint,
+        being linear, is evaluated as a matrix product whose jacobian is the
+        colour matching functions matrix.
+    -   Each optimisation is warm-started from the solution of the nearest
+        previously solved *CIE XYZ* tristimulus values of the same chunk.
+
+    References
+    ----------
+    -   :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> XYZ = np.array([[0.07049534, 0.10080000, 0.09558313],
+    ...                 [0.17049534, 0.20080000, 0.19558313]])
+    >>> values = XYZ_to_spectral_array_Meng2015(XYZ, interval=10)
+    >>> values.shape
+    (2, 48)
+    >>> values[..., :4]  # doctest: +ELLIPSIS
+    array([[ 0.0787067...,  0.0787298...,  0.0786974...,  0.0786552...],
+           [ 0.1793948...,  0.1795120...,  0.1795352...,  0.1796523...]])
+    """
+
+    XYZ = np.asarray(XYZ)
+    M, _K = _Meng2015_matrices(cmfs, interval)
+
+    values = _solve_Meng2015(
+        np.reshape(XYZ, (-1, 3)), M, tolerance, maximum_iterations, None,
+        processes, pool)
+
+    return np.reshape(values * 100, XYZ.shape[:-1] + (M.shape[-1], ))
+
+
+def XYZ_to_spectral_closed_form_Meng2015(
+        XYZ,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5,
+        fallback=True,
+        tolerance=1e-10,
+        maximum_iterations=2000,
+        processes=1,
+        pool=None):
+    """
+    Recovers the spectral values of given *CIE XYZ* tristimulus values array
+    using the closed-form solution of *Meng et alii (2015)* method
+    optimisation problem.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\\lambda_{i}` range interval in nm.
+    fallback : bool, optional
+        Whether to solve the samples whose closed-form solution is not within
+        bounds with :func:`colour.recovery.XYZ_to_spectral_array_Meng2015`
+        definition, otherwise their solution is clipped to the bounds and
+        does not satisfy the *CIE XYZ* tristimulus values constraint anymore.
+    tolerance : numeric, optional
+        Tolerance for termination of the fallback optimisation.
+    maximum_iterations : int, optional
+        Maximum number of iterations of the fallback optimisation.
+    processes : integer, optional
+        Processes count of the fallback optimisation, see
+        :func:`colour.recovery.XYZ_to_spectral_array_Meng2015` definition.
+    pool : object, optional
+        Pool of the fallback optimisation, see
+        :func:`colour.recovery.XYZ_to_spectral_array_Meng2015` definition.
+
+    Returns
+    -------
+    ndarray, (..., n)
+        Recovered spectral values at the wavelengths of the
+        ``SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)``
+        spectral shape.
+
+    Notes
+    -----
+    -   The objective of *Meng et alii (2015)* method being quadratic and its
+        constraint linear, the solution without bounds is given by a matrix
+        computed once per colour matching functions and interval, thus the
+        spectral values of the whole array are recovered with a single
+        matrix product.
+    -   The solutions outside the :math:`[0, 1000]` bounds of *Meng et alii
+        (2015)* method are clipped to the bounds, the clipped solutions being
+        used as initial guesses of the fallback optimisation.
+
+    References
+    ----------
+    -   :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> XYZ = np.array([[0.07049534, 0.10080000, 0.09558313],
+    ...                 [0.17049534, 0.20080000, 0.19558313]])
+    >>> values = XYZ_to_spectral_closed_form_Meng2015(XYZ, interval=10)
+    >>> values.shape
+    (2, 48)
+    >>> values[..., :4]  # doctest: +ELLIPSIS
+    array([[ 0.0793194...,  0.0793202...,  0.0793237...,  0.0793358...],
+           [ 0.1793977...,  0.1793985...,  0.1794020...,  0.1794141...]])
+    """
+
+    XYZ = np.asarray(XYZ)
+    M, K = _Meng2015_matrices(cmfs, interval)
+
+    XYZ_r = np.reshape(XYZ, (-1, 3))
+    values = np.dot(XYZ_r, np.transpose(K))
+
+    outliers = np.any(np.logical_or(values < 0, values > 1000), axis=-1)
+    if np.any(outliers):
+        values[outliers] = np.clip(values[outliers], 0, 1000)
+
+        if fallback:
+            values[outliers] = _solve_Meng2015(
+                XYZ_r[outliers], M, tolerance, maximum_iterations,
+                values[outliers], processes, pool)
+
+    return np.reshape(values * 100, XYZ.shape[:-1] + (M.shape[-1], ))
@@ -26,6 +26,7 @@ from colour.colorimetry import ILLUMINANTS
 from colour.models import (XYZ_to_RGB, normalised_primary_matrix,
                            sRGB_COLOURSPACE)
 from colour.recovery import SMITS_1999_SPDS
+from colour.utilities import tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -37,7 +38,7 @@ __status__ = 'Production'
 __all__ = [
     'SMITS1999_PRIMARIES', 'SMITS1999_WHITEPOINT',
     'SMITS1999_XYZ_TO_RGB_MATRIX', 'XYZ_to_RGB_Smits1999',
-    'RGB_to_spectral_Smits1999'
+    'RGB_to_spectral_Smits1999', 'RGB_to_spectral_array_Smits1999'
 ]
 
 SMITS1999_PRIMARIES = sRGB_COLOURSPACE.primaries
@@ -180,3 +181,72 @@ def RGB_to_spectral_Smits1999(RGB):
             spd += red_spd * (R - G)
 
     return spd
+
+
+def RGB_to_spectral_array_Smits1999(RGB, shape=None):
+    """
+    Recovers the spectral values of given *RGB* colourspace array using
+    *Smits (1999)* method.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array to recover the spectral values from.
+    shape : SpectralShape, optional
+        Spectral shape the *Smits (1999)* basis spectral power distributions
+        are interpolated to, if not given, their own spectral shape is used.
+
+    Returns
+    -------
+    ndarray, (..., n)
+        Recovered spectral values.
+
+    Notes
+    -----
+    -   Each *RGB* colourspace array is decomposed into the white basis
+        weighted by its smallest component, the secondary basis complementary
+        to its smallest component weighted by the difference between its
+        middle and smallest components and the primary basis of its largest
+        component weighted by the difference between its largest and middle
+        components, the bases being selected with masks so that whole images
+        are recovered at once.
+
+    References
+    ----------
+    -   :cite:`Smits1999a`
+
+    Examples
+    --------
+    >>> RGB = np.array([[0.02144962, 0.13154603, 0.09287601],
+    ...                 [0.45293517, 0.31732158, 0.26414773]])
+    >>> values = RGB_to_spectral_array_Smits1999(RGB)
+    >>> values.shape
+    (2, 10)
+    >>> values[..., :4]  # doctest: +ELLIPSIS
+    array([[ 0.0908046...,  0.0887761...,  0.0939795...,  0.1236033...],
+           [ 0.2778771...,  0.2711318...,  0.2699066...,  0.2993287...]])
+    """
+
+    bases = []
+    for name in ('white', 'cyan', 'magenta', 'yellow', 'red', 'green',
+                 'blue'):
+        spd = SMITS_1999_SPDS[name]
+        if shape is not None:
+            spd = spd.copy().align(shape)
+        bases.append(spd.values)
+    white, cyan, magenta, yellow, red, green, blue = bases
+
+    R, G, B = [x[..., np.newaxis] for x in tsplit(RGB)]
+
+    minimum = np.minimum(np.minimum(R, G), B)
+    maximum = np.maximum(np.maximum(R, G), B)
+    middle = R + G + B - minimum - maximum
+
+    secondary = np.where(
+        np.logical_and(R <= G, R <= B), cyan,
+        np.where(G <= B, magenta, yellow))
+    primary = np.where(
+        np.logical_and(R >= G, R >= B), red, np.where(G >= B, green, blue))
+
+    return (white * minimum + secondary * (middle - minimum) +
+            primary * (maximum - middle))
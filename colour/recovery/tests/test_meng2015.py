@@ -5,12 +5,15 @@ Defines unit tests for :mod:`colour.recovery.meng2015` module.
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
 import unittest
 
 from colour.colorimetry import (STANDARD_OBSERVERS_CMFS, SpectralShape,
                                 spectral_to_XYZ_integration)
-from colour.recovery import XYZ_to_spectral_Meng2015
+from colour.recovery import (XYZ_to_spectral_Meng2015,
+                             XYZ_to_spectral_array_Meng2015,
+                             XYZ_to_spectral_closed_form_Meng2015)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +22,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_spectral_Meng2015']
+__all__ = [
+    'TestXYZ_to_spectral_Meng2015', 'TestXYZ_to_spectral_array_Meng2015',
+    'TestXYZ_to_spectral_closed_form_Meng2015'
+]
 
 
 class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
@@ -70,5 +76,172 @@ class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
             decimal=7)
 
 
+class TestXYZ_to_spectral_array_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_to_spectral_array_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+        definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 10)
+        cmfs_c = cmfs.copy().align(shape)
+
+        XYZ = np.array([
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.17049534, 0.20080000, 0.19558313],
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.47097710, 0.34950000, 0.11301649],
+        ])
+        values = XYZ_to_spectral_array_Meng2015(XYZ, interval=10)
+        self.assertTupleEqual(values.shape, (4, 48))
+
+        np.testing.assert_almost_equal(
+            np.dot(values, cmfs_c.values) / np.sum(cmfs_c.values[..., 1]),
+            XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(values[0], values[2], decimal=3)
+
+        np.testing.assert_almost_equal(
+            values[0],
+            XYZ_to_spectral_Meng2015(XYZ[0], interval=10).values,
+            decimal=2)
+
+        shape = SpectralShape(400, 700, 5)
+        cmfs_c = cmfs.copy().align(shape)
+        values = XYZ_to_spectral_array_Meng2015(XYZ, cmfs=cmfs_c)
+        self.assertTupleEqual(values.shape, (4, 61))
+        np.testing.assert_almost_equal(
+            np.dot(values, cmfs_c.values) / np.sum(cmfs_c.values[..., 1]),
+            XYZ,
+            decimal=7)
+
+    def test_n_dimensional_XYZ_to_spectral_array_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        values = XYZ_to_spectral_array_Meng2015(XYZ, interval=20)
+        self.assertTupleEqual(values.shape, (24, ))
+
+        XYZ = np.tile(XYZ, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Meng2015(XYZ, interval=20),
+            values,
+            decimal=3)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 24))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Meng2015(XYZ, interval=20),
+            values,
+            decimal=3)
+
+    def test_multiprocessing_XYZ_to_spectral_array_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_array_Meng2015`
+        definition multiprocessing support.
+        """
+
+        XYZ = np.array([
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.17049534, 0.20080000, 0.19558313],
+            [0.47097710, 0.34950000, 0.11301649],
+        ])
+        values = XYZ_to_spectral_array_Meng2015(XYZ, interval=20)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_array_Meng2015(XYZ, interval=20, processes=3),
+            values,
+            decimal=2)
+
+        pool = multiprocessing.Pool(processes=2)
+        try:
+            np.testing.assert_almost_equal(
+                XYZ_to_spectral_array_Meng2015(
+                    XYZ, interval=20, processes=3, pool=pool),
+                values,
+                decimal=2)
+        finally:
+            pool.close()
+            pool.join()
+
+
+class TestXYZ_to_spectral_closed_form_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.\
+XYZ_to_spectral_closed_form_Meng2015` definition unit tests methods.
+    """
+
+    def test_XYZ_to_spectral_closed_form_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.\
+XYZ_to_spectral_closed_form_Meng2015` definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 10)
+        cmfs_c = cmfs.copy().align(shape)
+
+        XYZ = np.array([
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.17049534, 0.20080000, 0.19558313],
+            [0.47097710, 0.34950000, 0.11301649],
+            [0.20000000, 0.40000000, 0.05000000],
+        ])
+        values = XYZ_to_spectral_closed_form_Meng2015(XYZ, interval=10)
+        self.assertTupleEqual(values.shape, (4, 48))
+        self.assertGreaterEqual(np.min(values), 0)
+
+        np.testing.assert_almost_equal(
+            np.dot(values, cmfs_c.values) / np.sum(cmfs_c.values[..., 1]),
+            XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            values,
+            XYZ_to_spectral_array_Meng2015(XYZ, interval=10),
+            decimal=2)
+
+        values = XYZ_to_spectral_closed_form_Meng2015(
+            XYZ, interval=10, fallback=False)
+        self.assertGreaterEqual(np.min(values), 0)
+        np.testing.assert_almost_equal(
+            np.dot(values[:3], cmfs_c.values) / np.sum(
+                cmfs_c.values[..., 1]),
+            XYZ[:3],
+            decimal=7)
+
+    def test_n_dimensional_XYZ_to_spectral_closed_form_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.\
+XYZ_to_spectral_closed_form_Meng2015` definition n-dimensional arrays
+        support.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        values = XYZ_to_spectral_closed_form_Meng2015(XYZ)
+        self.assertTupleEqual(values.shape, (95, ))
+
+        XYZ = np.tile(XYZ, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_closed_form_Meng2015(XYZ), values, decimal=7)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 95))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_closed_form_Meng2015(XYZ), values, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -8,7 +8,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.recovery import RGB_to_spectral_Smits1999
+from colour.colorimetry import SpectralShape
+from colour.recovery import (RGB_to_spectral_Smits1999,
+                             RGB_to_spectral_array_Smits1999)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +19,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_to_spectral_Smits1999']
+__all__ = [
+    'TestRGB_to_spectral_Smits1999', 'TestRGB_to_spectral_array_Smits1999'
+]
 
 
 class TestRGB_to_spectral_Smits1999(unittest.TestCase):
@@ -60,5 +64,69 @@ class TestRGB_to_spectral_Smits1999(unittest.TestCase):
             decimal=7)
 
 
+class TestRGB_to_spectral_array_Smits1999(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.RGB_to_spectral_array_Smits1999`
+    definition unit tests methods.
+    """
+
+    def test_RGB_to_spectral_array_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_spectral_array_Smits1999`
+        definition.
+        """
+
+        RGB = np.array([
+            [0.45293517, 0.31732158, 0.26414773],
+            [0.77875824, 0.57726450, 0.50453169],
+            [0.35505307, 0.47995567, 0.61088035],
+        ])
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Smits1999(RGB),
+            np.array([
+                RGB_to_spectral_Smits1999(RGB_i).values for RGB_i in RGB
+            ]),
+            decimal=7)
+
+        RGB = np.array(
+            [[R, G, B] for R in (0.0, 0.25, 0.5) for G in (0.0, 0.25, 0.5)
+             for B in (0.0, 0.25, 0.5)])
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Smits1999(RGB),
+            np.array([
+                RGB_to_spectral_Smits1999(RGB_i).values for RGB_i in RGB
+            ]),
+            decimal=7)
+
+        shape = SpectralShape(400, 700, 10)
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Smits1999(RGB[:3], shape),
+            np.array([
+                RGB_to_spectral_Smits1999(RGB_i).align(shape).values
+                for RGB_i in RGB[:3]
+            ]),
+            decimal=7)
+
+    def test_n_dimensional_RGB_to_spectral_array_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.RGB_to_spectral_array_Smits1999`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        values = RGB_to_spectral_array_Smits1999(RGB)
+        self.assertTupleEqual(values.shape, (10, ))
+
+        RGB = np.tile(RGB, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Smits1999(RGB), values, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 10))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_array_Smits1999(RGB), values, decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -91,7 +91,8 @@ from collections import namedtuple
 
 from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
                                 STANDARD_OBSERVERS_CMFS, blackbody_spd,
-                                spectral_to_XYZ)
+                                planck_law, spectral_to_XYZ)
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.utilities import (CaseInsensitiveMapping, as_numeric,
                               filter_kwargs, tsplit, tstack, warning)
@@ -322,6 +323,13 @@ def uv_to_CCT_Ohno2013(
     ndarray
         Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
 
+    Notes
+    -----
+    -   The planckian tables of all the *uv* chromaticity coordinates are
+        generated at once, the *CIE XYZ* tristimulus values of the planckian
+        radiators being integrated with a matrix product for colour matching
+        functions with 1nm or 5nm intervals.
+
     References
     ----------
     -   :cite:`Ohno2014a`
@@ -335,33 +343,60 @@ def uv_to_CCT_Ohno2013(
     array([  6.5074738...e+03,   3.2233461...e-03])
     """
 
-    # Ensuring we do at least one iteration to initialise variables.
-    iterations = max(iterations, 1)
+    uv = np.asarray(uv)
+    ux, vx = tsplit(np.reshape(uv, (-1, 2)))
 
-    # Planckian table creation through cascade expansion.
-    for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
-            warning(
-                ('Minimal distance index is on lowest planckian table bound, '
+    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+    wavelengths = cmfs.wavelengths * 1e-9
+
+    rows = np.arange(ux.shape[0])
+    start = np.full(ux.shape, start, dtype=DEFAULT_FLOAT_DTYPE)
+    end = np.full(ux.shape, end, dtype=DEFAULT_FLOAT_DTYPE)
+
+    # Planckian tables creation through cascade expansion, ensuring we do at
+    # least one iteration to initialise variables.
+    on_lowest_bound = on_highest_bound = False
+    for _i in range(max(iterations, 1)):
+        T_t = (start[:, np.newaxis] +
+               (end - start)[:, np.newaxis] * np.linspace(0, 1, count))
+
+        T_r = np.ravel(T_t)
+        if cmfs.shape.interval in (1, 5):
+            # *ASTM E308-15* method integrates spectral power distributions
+            # with 1nm and 5nm intervals, i.e. a matrix product.
+            XYZ = np.vstack([
+                np.dot(
+                    planck_law(wavelengths, T_r[k:k + 4096, np.newaxis]),
+                    cmfs.values) for k in range(0, T_r.shape[0], 4096)
+            ])
+        else:
+            XYZ = np.array([
+                spectral_to_XYZ(blackbody_spd(T_i, cmfs.shape), cmfs)
+                for T_i in T_r
+            ])
+
+        u_t, v_t = tsplit(
+            np.reshape(UCS_to_uv(XYZ_to_UCS(XYZ)), T_t.shape + (2, )))
+        d_t = np.hypot(ux[:, np.newaxis] - u_t, vx[:, np.newaxis] - v_t)
+
+        index = np.argmin(d_t, axis=-1)
+        on_lowest_bound = on_lowest_bound or np.any(index == 0)
+        on_highest_bound = on_highest_bound or np.any(index == count - 1)
+        index = np.clip(index, 1, count - 2)
+
+        start = T_t[rows, index - 1]
+        end = T_t[rows, index + 1]
+
+    if on_lowest_bound:
+        warning(('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
-            warning(
-                ('Minimal distance index is on highest planckian table bound, '
+    if on_highest_bound:
+        warning(('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
-
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
 
-    _ux, vx = uv
-
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    Tip, uip, vip, dip = [x[rows, index - 1] for x in (T_t, u_t, v_t, d_t)]
+    Ti, di = T_t[rows, index], d_t[rows, index]
+    Tin, uin, vin, din = [x[rows, index + 1] for x in (T_t, u_t, v_t, d_t)]
 
     # Triangular solution.
     l = np.hypot(uin - uip, vin - vip)  # noqa
@@ -369,11 +404,12 @@ def uv_to_CCT_Ohno2013(
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(vx - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
+    parabolic = np.abs(D_uv) >= 0.002
+    if np.any(parabolic):
         X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
         a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
         b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
@@ -382,11 +418,12 @@ def uv_to_CCT_Ohno2013(
                (Tip - Tin) * Tip * Tin + din *
                (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        T = -b / (2 * a)
+        T_p = -b / (2 * a)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+        T = np.where(parabolic, T_p, T)
+        D_uv = np.where(parabolic, sign * (a * T_p ** 2 + b * T_p + c), D_uv)
 
-    return np.array([T, D_uv])
+    return np.reshape(tstack((T, D_uv)), uv.shape)
 
 
 def CCT_to_uv_Ohno2013(
@@ -472,6 +509,11 @@ def uv_to_CCT_Robertson1968(uv):
     ndarray
         Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
 
+    Notes
+    -----
+    -   The isotemperature lines bracketing each *uv* chromaticity coordinates
+        are found at once for the whole array.
+
     References
     ----------
     -   :cite:`AdobeSystems2013`
@@ -484,57 +526,44 @@ def uv_to_CCT_Robertson1968(uv):
     array([  6.5000162...e+03,   8.3333289...e-03])
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
-
-        length = np.hypot(1, dv)
-
-        du /= length
-        dv /= length
-
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
-
-        dt = -uu * dv + vv * du
+    uv = np.asarray(uv)
+    u, v = tsplit(np.reshape(uv, (-1, 2)))
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    r_l, u_l, v_l, t_l = tsplit(np.array(ROBERTSON_ISOTEMPERATURE_LINES))
 
-            dt = -dt
+    length_l = np.hypot(1, t_l)
+    du_l = 1 / length_l
+    dv_l = t_l / length_l
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    # Signed distances to the isotemperature lines, the solution lies between
+    # the first line with a non-positive distance and its predecessor.
+    dt_l = (-(u[:, np.newaxis] - u_l[1:]) * dv_l[1:] +
+            (v[:, np.newaxis] - v_l[1:]) * du_l[1:])
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    mask = dt_l <= 0
+    mask[:, -1] = True
+    i = np.argmax(mask, axis=-1)
+    rows = np.arange(dt_l.shape[0])
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    dt = -np.minimum(dt_l[rows, i], 0)
+    last_dt = dt_l[rows, np.maximum(i - 1, 0)]
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.where(i == 0, 0, dt / (last_dt + dt))
 
-            length = np.hypot(du, dv)
+    T = 1.0e6 / (r_l[i] * f + r_l[i + 1] * (1 - f))
 
-            du /= length
-            dv /= length
+    uu = u - (u_l[i] * f + u_l[i + 1] * (1 - f))
+    vv = v - (v_l[i] * f + v_l[i + 1] * (1 - f))
 
-            D_uv = uu * du + vv * dv
+    du = du_l[i + 1] * (1 - f) + du_l[i] * f
+    dv = dv_l[i + 1] * (1 - f) + dv_l[i] * f
 
-            break
+    length = np.hypot(du, dv)
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+    D_uv = uu * du / length + vv * dv / length
 
-    return np.array([T, -D_uv])
+    return np.reshape(tstack((T, -D_uv)), uv.shape)
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
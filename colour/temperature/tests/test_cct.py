@@ -217,6 +217,33 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.15316417, -0.08437064]),
             decimal=7)
 
+    def test_n_dimensional_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        uv = np.array([0.1978, 0.3122])
+        CCT_D_uv = uv_to_CCT_Ohno2013(uv, cmfs)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, decimal=7)
+
+        uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv, cmfs),
+            np.array([[6507.47380460, 0.00322335],
+                      [1041.68315360, -0.06737802]]),
+            decimal=7)
+
 
 class TestCCT_to_uv_Ohno2013(unittest.TestCase):
     """
@@ -262,6 +289,31 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
             np.testing.assert_allclose(
                 uv_to_CCT_Robertson1968(value), key, atol=0.25)
 
+    def test_n_dimensional_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968`
+        definition n-dimensional arrays support.
+        """
+
+        uv = np.array([0.193741375998230, 0.315221043940594])
+        CCT_D_uv = uv_to_CCT_Robertson1968(uv)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv), CCT_D_uv, decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv), CCT_D_uv, decimal=7)
+
+        uv = np.array(list(TEMPERATURE_DUV_TO_UV.values()))
+        np.testing.assert_allclose(
+            uv_to_CCT_Robertson1968(uv),
+            np.array(list(TEMPERATURE_DUV_TO_UV.keys())),
+            atol=0.25)
+
 
 class TestCCT_to_uv_Robertson1968(unittest.TestCase):
     """
@@ -4,23 +4,37 @@ from __future__ import absolute_import
 
 from .dataset import *  # noqa
 from . import dataset
-from .macadam_limits import is_within_macadam_limits
-from .mesh import is_within_mesh_volume
+from .mesh import IS_WITHIN_MESH_VOLUME_METHODS, is_within_mesh_volume
+from .macadam_limits import (XYZ_optimal_colour_stimuli,
+                             is_within_macadam_limits)
 from .pointer_gamut import is_within_pointer_gamut
 from .spectrum import is_within_visible_spectrum
+from .coverage import (GamutCoverage, gamut_occupancy_grid,
+                       gamut_coverage_grid, gamut_chromaticity_occupancy_grid,
+                       gamut_chromaticity_coverage_grid)
 from .rgb import (RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+                  RGB_ColourspaceVolumeEstimate,
+                  RGB_colourspace_volume_streaming_MonteCarlo,
+                  RGB_colourspace_volume_mesh,
                   RGB_colourspace_volume_coverage_MonteCarlo,
                   RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
                   RGB_colourspace_visible_spectrum_coverage_MonteCarlo)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['is_within_macadam_limits']
-__all__ += ['is_within_mesh_volume']
+__all__ += ['IS_WITHIN_MESH_VOLUME_METHODS', 'is_within_mesh_volume']
+__all__ += ['XYZ_optimal_colour_stimuli', 'is_within_macadam_limits']
 __all__ += ['is_within_pointer_gamut']
 __all__ += ['is_within_visible_spectrum']
+__all__ += [
+    'GamutCoverage', 'gamut_occupancy_grid', 'gamut_coverage_grid',
+    'gamut_chromaticity_occupancy_grid', 'gamut_chromaticity_coverage_grid'
+]
 __all__ += [
     'RGB_colourspace_limits', 'RGB_colourspace_volume_MonteCarlo',
+    'RGB_ColourspaceVolumeEstimate',
+    'RGB_colourspace_volume_streaming_MonteCarlo',
+    'RGB_colourspace_volume_mesh',
     'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
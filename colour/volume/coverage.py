@@ -0,0 +1,480 @@
+# -*- coding: utf-8 -*-
+"""
+Gamut Coverage Computation
+==========================
+
+Defines various gamut coverage computation objects using occupancy grids:
+
+-   :func:`colour.volume.gamut_occupancy_grid`
+-   :func:`colour.volume.gamut_coverage_grid`
+-   :func:`colour.volume.gamut_chromaticity_occupancy_grid`
+-   :func:`colour.volume.gamut_chromaticity_coverage_grid`
+"""
+
+from __future__ import division, unicode_literals
+
+import hashlib
+import numpy as np
+from collections import OrderedDict, namedtuple
+
+from colour.colorimetry import ILLUMINANTS
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.models import Lab_to_XYZ, RGB_Colourspace, XYZ_to_RGB
+from colour.utilities import tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE', 'GamutCoverage',
+    'gamut_occupancy_grid', 'gamut_coverage_grid',
+    'gamut_chromaticity_occupancy_grid', 'gamut_chromaticity_coverage_grid'
+]
+
+GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE = 16
+"""
+Maximum count of gamut occupancy grids kept in cache.
+
+GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE : integer
+"""
+
+_GAMUT_OCCUPANCY_GRIDS_CACHE = OrderedDict()
+
+
+class GamutCoverage(
+        namedtuple('GamutCoverage', ('volume', 'reference_volume',
+                                     'intersection', 'union', 'coverage'))):
+    """
+    Defines the coverage of a reference gamut by a gamut.
+
+    Parameters
+    ----------
+    volume : numeric
+        Gamut volume, or area for chromaticity gamuts.
+    reference_volume : numeric
+        Reference gamut volume, or area for chromaticity gamuts.
+    intersection : numeric
+        Gamut and reference gamut intersection volume, or area for
+        chromaticity gamuts.
+    union : numeric
+        Gamut and reference gamut union volume, or area for chromaticity
+        gamuts.
+    coverage : numeric
+        Percentage of the reference gamut covered by the gamut.
+    """
+
+
+def _array_digest(a):
+    """
+    Returns the hash of given array.
+
+    Parameters
+    ----------
+    a : array_like
+        Array to hash.
+
+    Returns
+    -------
+    unicode
+        Array hash.
+    """
+
+    a = np.ascontiguousarray(a, dtype=DEFAULT_FLOAT_DTYPE)
+
+    return a.shape, hashlib.sha1(a.tobytes()).hexdigest()
+
+
+def _gamut_key(gamut):
+    """
+    Returns the cache key of given gamut.
+
+    Parameters
+    ----------
+    gamut : RGB_Colourspace or callable or array_like
+        Gamut.
+
+    Returns
+    -------
+    object
+        Gamut cache key.
+    """
+
+    if isinstance(gamut, RGB_Colourspace):
+        return (gamut.name, _array_digest(gamut.primaries),
+                _array_digest(gamut.whitepoint),
+                _array_digest(gamut.XYZ_to_RGB_matrix))
+    elif callable(gamut):
+        return gamut
+    else:
+        return _array_digest(gamut)
+
+
+def _cached_occupancy_grid(key, occupancy_grid_builder):
+    """
+    Returns the cached occupancy grid for given key, building it with given
+    builder and caching it if not existing.
+
+    Parameters
+    ----------
+    key : object
+        Occupancy grid cache key.
+    occupancy_grid_builder : callable
+        Callable building the occupancy grid.
+
+    Returns
+    -------
+    ndarray
+        Read-only occupancy grid.
+    """
+
+    occupancy_grid = _GAMUT_OCCUPANCY_GRIDS_CACHE.pop(key, None)
+    if occupancy_grid is None:
+        occupancy_grid = np.asarray(occupancy_grid_builder(), dtype=bool)
+        occupancy_grid.setflags(write=False)
+
+    _GAMUT_OCCUPANCY_GRIDS_CACHE[key] = occupancy_grid
+    while len(_GAMUT_OCCUPANCY_GRIDS_CACHE) > GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE:
+        _GAMUT_OCCUPANCY_GRIDS_CACHE.popitem(last=False)
+
+    return occupancy_grid
+
+
+def _grid_centres(limits, cell_size):
+    """
+    Returns the centres of the cells of given size tiling given limits.
+
+    Parameters
+    ----------
+    limits : array_like, (n, 2)
+        Grid limits on each axis.
+    cell_size : numeric
+        Cells edge length.
+
+    Returns
+    -------
+    ndarray
+        Cells centres.
+    """
+
+    limits = np.asarray(limits)
+
+    counts = np.ceil((limits[..., 1] - limits[..., 0]) / cell_size)
+    axes = [
+        limit[0] + (np.arange(count) + 0.5) * cell_size
+        for limit, count in zip(limits, counts)
+    ]
+
+    return tstack(np.meshgrid(*axes, indexing='ij'))
+
+
+def _is_within_polygon(points, polygon):
+    """
+    Returns if given points are within given polygon using the even-odd
+    rule.
+
+    Parameters
+    ----------
+    points : array_like
+        Points to check if they are within ``polygon``.
+    polygon : array_like
+        Polygon vertices.
+
+    Returns
+    -------
+    ndarray
+        Is within polygon.
+    """
+
+    x, y = tsplit(points)
+    x_1, y_1 = tsplit(polygon)
+    x_2, y_2 = np.roll(x_1, -1), np.roll(y_1, -1)
+
+    within = np.zeros(x.shape, dtype=bool)
+    for i in range(len(x_1)):
+        if y_1[i] == y_2[i]:
+            continue
+
+        crossing = (y_1[i] > y) != (y_2[i] > y)
+        x_c = x_1[i] + (y - y_1[i]) * (x_2[i] - x_1[i]) / (y_2[i] - y_1[i])
+        within ^= np.logical_and(crossing, x < x_c)
+
+    return within
+
+
+def gamut_occupancy_grid(
+        gamut,
+        voxel_size=2,
+        limits=np.array([[0, 100], [-150, 150], [-150, 150]]),
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02'):
+    """
+    Returns the occupancy grid of given gamut, i.e. the boolean array of the
+    voxels of given size within given *Lab* colourspace volume whose centre
+    is within the gamut.
+
+    Parameters
+    ----------
+    gamut : RGB_Colourspace or callable
+        *RGB* colourspace or callable returning if given *CIE XYZ* tristimulus
+        values are within the gamut, e.g.
+        :func:`colour.is_within_pointer_gamut` definition.
+    voxel_size : numeric, optional
+        Voxels edge length in *Lab* colourspace.
+    limits : array_like, optional
+        *Lab* colourspace volume.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    ndarray
+        Read-only gamut occupancy grid.
+
+    Notes
+    -----
+    -   The occupancy grids are cached, the
+        :attr:`colour.volume.coverage.GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE`
+        attribute defining the count of cached grids.
+    -   The voxels are tiling the *Lab* colourspace volume from its lower
+        limits, the last voxels on each axis may overflow the upper limits.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> occupancy_grid = gamut_occupancy_grid(sRGB)
+    >>> occupancy_grid.shape
+    (50, 150, 150)
+    >>> np.sum(occupancy_grid) * 2 ** 3
+    857144
+    """
+
+    key = ('Lab', _gamut_key(gamut), voxel_size, _array_digest(limits),
+           _array_digest(illuminant_Lab), chromatic_adaptation_method)
+
+    def occupancy_grid_builder():
+        """
+        Builds the occupancy grid.
+        """
+
+        XYZ = Lab_to_XYZ(_grid_centres(limits, voxel_size), illuminant_Lab)
+
+        if isinstance(gamut, RGB_Colourspace):
+            RGB = XYZ_to_RGB(
+                XYZ,
+                illuminant_Lab,
+                gamut.whitepoint,
+                gamut.XYZ_to_RGB_matrix,
+                chromatic_adaptation_transform=chromatic_adaptation_method)
+
+            return np.logical_and(
+                np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1)
+        else:
+            return gamut(XYZ)
+
+    return _cached_occupancy_grid(key, occupancy_grid_builder)
+
+
+def gamut_coverage_grid(
+        gamut,
+        reference_gamut,
+        voxel_size=2,
+        limits=np.array([[0, 100], [-150, 150], [-150, 150]]),
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02'):
+    """
+    Computes the coverage of given reference gamut by given gamut using their
+    *Lab* colourspace occupancy grids.
+
+    Parameters
+    ----------
+    gamut : RGB_Colourspace or callable
+        *RGB* colourspace or callable returning if given *CIE XYZ* tristimulus
+        values are within the gamut.
+    reference_gamut : RGB_Colourspace or callable
+        Reference *RGB* colourspace or callable returning if given *CIE XYZ*
+        tristimulus values are within the reference gamut, e.g.
+        :func:`colour.is_within_pointer_gamut` definition.
+    voxel_size : numeric, optional
+        Voxels edge length in *Lab* colourspace.
+    limits : array_like, optional
+        *Lab* colourspace volume.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    GamutCoverage
+        Gamuts volumes, intersection and union volumes and percentage of the
+        reference gamut covered by the gamut.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> from colour.volume import is_within_pointer_gamut
+    >>> gamut_coverage_grid(sRGB, is_within_pointer_gamut)
+    ... # doctest: +ELLIPSIS
+    GamutCoverage(volume=857144.0, reference_volume=955984.0, \
+intersection=709632.0, union=1103496.0, coverage=74.2305310...)
+    """
+
+    occupancy_grid = gamut_occupancy_grid(gamut, voxel_size, limits,
+                                          illuminant_Lab,
+                                          chromatic_adaptation_method)
+    reference_occupancy_grid = gamut_occupancy_grid(
+        reference_gamut, voxel_size, limits, illuminant_Lab,
+        chromatic_adaptation_method)
+
+    return _gamut_coverage(occupancy_grid, reference_occupancy_grid,
+                           voxel_size ** 3)
+
+
+def gamut_chromaticity_occupancy_grid(
+        gamut, pixel_size=0.002, limits=np.array([[0, 0.8], [0, 0.9]])):
+    """
+    Returns the chromaticity occupancy grid of given gamut, i.e. the boolean
+    array of the pixels of given size within given *CIE xy* chromaticity
+    coordinates area whose centre is within the gamut.
+
+    Parameters
+    ----------
+    gamut : RGB_Colourspace or array_like
+        *RGB* colourspace or gamut boundaries *CIE xy* chromaticity
+        coordinates, e.g. :attr:`colour.POINTER_GAMUT_BOUNDARIES` attribute.
+    pixel_size : numeric, optional
+        Pixels edge length in *CIE xy* chromaticity coordinates.
+    limits : array_like, optional
+        *CIE xy* chromaticity coordinates area.
+
+    Returns
+    -------
+    ndarray
+        Read-only gamut chromaticity occupancy grid.
+
+    Notes
+    -----
+    -   The chromaticity occupancy grids are cached along the occupancy grids.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> occupancy_grid = gamut_chromaticity_occupancy_grid(sRGB)
+    >>> occupancy_grid.shape
+    (400, 450)
+    >>> np.sum(occupancy_grid) * 0.002 ** 2  # doctest: +ELLIPSIS
+    0.1120...
+    """
+
+    key = ('xy', _gamut_key(gamut), pixel_size, _array_digest(limits))
+
+    def occupancy_grid_builder():
+        """
+        Builds the chromaticity occupancy grid.
+        """
+
+        boundaries = (gamut.primaries if isinstance(gamut, RGB_Colourspace)
+                      else gamut)
+
+        return _is_within_polygon(
+            _grid_centres(limits, pixel_size), boundaries)
+
+    return _cached_occupancy_grid(key, occupancy_grid_builder)
+
+
+def gamut_chromaticity_coverage_grid(gamut,
+                                     reference_gamut,
+                                     pixel_size=0.002,
+                                     limits=np.array([[0, 0.8], [0, 0.9]])):
+    """
+    Computes the coverage of given reference gamut by given gamut using their
+    *CIE xy* chromaticity coordinates occupancy grids.
+
+    Parameters
+    ----------
+    gamut : RGB_Colourspace or array_like
+        *RGB* colourspace or gamut boundaries *CIE xy* chromaticity
+        coordinates.
+    reference_gamut : RGB_Colourspace or array_like
+        Reference *RGB* colourspace or reference gamut boundaries *CIE xy*
+        chromaticity coordinates, e.g. :attr:`colour.POINTER_GAMUT_BOUNDARIES`
+        attribute.
+    pixel_size : numeric, optional
+        Pixels edge length in *CIE xy* chromaticity coordinates.
+    limits : array_like, optional
+        *CIE xy* chromaticity coordinates area.
+
+    Returns
+    -------
+    GamutCoverage
+        Gamuts areas, intersection and union areas and percentage of the
+        reference gamut covered by the gamut.
+
+    Examples
+    --------
+    >>> from colour.models import (
+    ...     BT2020_COLOURSPACE, POINTER_GAMUT_BOUNDARIES)
+    >>> gamut_chromaticity_coverage_grid(
+    ...     BT2020_COLOURSPACE, POINTER_GAMUT_BOUNDARIES)
+    ... # doctest: +ELLIPSIS
+    GamutCoverage(volume=0.2118519..., reference_volume=0.1606999..., \
+intersection=0.1605039..., union=0.2120479..., coverage=99.8780336...)
+    """
+
+    occupancy_grid = gamut_chromaticity_occupancy_grid(gamut, pixel_size,
+                                                       limits)
+    reference_occupancy_grid = gamut_chromaticity_occupancy_grid(
+        reference_gamut, pixel_size, limits)
+
+    return _gamut_coverage(occupancy_grid, reference_occupancy_grid,
+                           pixel_size ** 2)
+
+
+def _gamut_coverage(occupancy_grid, reference_occupancy_grid, cell_volume):
+    """
+    Computes the coverage of given reference occupancy grid by given
+    occupancy grid.
+
+    Parameters
+    ----------
+    occupancy_grid : array_like
+        Gamut occupancy grid.
+    reference_occupancy_grid : array_like
+        Reference gamut occupancy grid.
+    cell_volume : numeric
+        Occupancy grids cells volume.
+
+    Returns
+    -------
+    GamutCoverage
+        Gamuts volumes, intersection and union volumes and percentage of the
+        reference gamut covered by the gamut.
+    """
+
+    cell_volume = DEFAULT_FLOAT_DTYPE(cell_volume)
+
+    count = np.sum(occupancy_grid)
+    reference_count = np.sum(reference_occupancy_grid)
+    intersection_count = np.sum(
+        np.logical_and(occupancy_grid, reference_occupancy_grid))
+    union_count = np.sum(
+        np.logical_or(occupancy_grid, reference_occupancy_grid))
+
+    return GamutCoverage(count * cell_volume, reference_count * cell_volume,
+                         intersection_count * cell_volume,
+                         union_count * cell_volume,
+                         100 * intersection_count / reference_count)
@@ -5,6 +5,9 @@ Optimal Colour Stimuli - MacAdam Limits
 
 Defines objects related to *Optimal Colour Stimuli* computations.
 
+-   :func:`colour.volume.XYZ_optimal_colour_stimuli`
+-   :func:`colour.is_within_macadam_limits`
+
 See Also
 --------
 `Optimal Colour Stimuli - MacAdam Limits Jupyter Notebook
@@ -14,11 +17,16 @@ blob/master/notebooks/volume/macadam_limits.ipynb>`_
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
+from scipy.spatial import ConvexHull
 
+from colour.colorimetry import ILLUMINANTS_SPDS, STANDARD_OBSERVERS_CMFS
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import xyY_to_XYZ
-from colour.volume import ILLUMINANTS_OPTIMAL_COLOUR_STIMULI
+from colour.utilities import is_string
+from colour.volume import (ILLUMINANTS_OPTIMAL_COLOUR_STIMULI,
+                           is_within_mesh_volume)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -27,43 +35,161 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['is_within_macadam_limits']
+__all__ = ['XYZ_optimal_colour_stimuli', 'is_within_macadam_limits']
 
 _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE = {}
-_XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE = {}
 
 
-def _XYZ_optimal_colour_stimuli(illuminant):
+def _band_pass_reflectances(bins):
+    """
+    Returns all the band-pass reflectances of given bins count, i.e. the
+    reflectances equal to 1 on a contiguous, possibly wrapping around, range
+    of bins and 0 elsewhere, including the null and unit reflectances.
+
+    Parameters
+    ----------
+    bins : integer
+        Bins count.
+
+    Returns
+    -------
+    ndarray, (bins * (bins - 1) + 2, bins)
+        Band-pass reflectances.
+    """
+
+    indexes = np.arange(bins)
+    starts = indexes[:, np.newaxis, np.newaxis]
+    widths = indexes[np.newaxis, 1:, np.newaxis]
+
+    reflectances = ((indexes - starts) % bins < widths).reshape([-1, bins])
+
+    return np.vstack([np.zeros(bins), np.ones(bins), reflectances])
+
+
+def XYZ_optimal_colour_stimuli(
+        illuminant,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5):
+    """
+    Computes the *Optimal Colour Stimuli* of given illuminant relative
+    spectral power distribution and colour matching functions in *CIE XYZ*
+    tristimulus values.
+
+    Parameters
+    ----------
+    illuminant : SpectralPowerDistribution
+        Illuminant relative spectral power distribution.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\\lambda_{i}` range interval in nm of the bins
+        the band-pass reflectances are built upon.
+
+    Returns
+    -------
+    ndarray
+        *Optimal Colour Stimuli* in *CIE XYZ* tristimulus values.
+
+    Notes
+    -----
+    -   The *Optimal Colour Stimuli* are the stimuli of the reflectances
+        equal to 1 on a contiguous range of wavelengths and 0 elsewhere, or
+        their complement. The colour matching functions weighted by the
+        illuminant are summed into bins of given interval and the stimuli of
+        all the band-pass reflectances, i.e. all the start and width
+        combinations, are computed at once with a single matrix product.
+    -   Output *CIE XYZ* tristimulus values are normalised to range [0, 1],
+        the perfect reflecting diffuser having a luminance :math:`Y` of 1.
+
+    Examples
+    --------
+    >>> illuminant = ILLUMINANTS_SPDS['D65']
+    >>> XYZ_optimal_colour_stimuli(illuminant).shape
+    (8932, 3)
+    >>> XYZ_optimal_colour_stimuli(illuminant)[1]  # doctest: +ELLIPSIS
+    array([ 0.9504...,  1.        ,  1.0889...])
+    """
+
+    if illuminant.shape != cmfs.shape:
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    weights = cmfs.values * illuminant.values[..., np.newaxis]
+
+    wavelengths = cmfs.wavelengths
+    bins = np.floor((wavelengths - wavelengths[0]) / interval).astype(int)
+    weights = np.add.reduceat(weights, np.unique(bins, return_index=True)[1])
+
+    XYZ = np.dot(_band_pass_reflectances(len(weights)), weights)
+
+    return XYZ / np.sum(weights[..., 1])
+
+
+def _XYZ_optimal_colour_stimuli(illuminant, cmfs, interval):
     """
     Returns given illuminant *Optimal Colour Stimuli* in *CIE XYZ* tristimulus
     values and caches it if not existing.
 
     Parameters
     ----------
-    illuminant : unicode
-        Illuminant.
+    illuminant : unicode or SpectralPowerDistribution
+        Illuminant name or relative spectral power distribution, the
+        tabulated *Optimal Colour Stimuli* are used if existing for the given
+        illuminant name.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric
+        Wavelength :math:`\\lambda_{i}` range interval in nm of the bins
+        the band-pass reflectances are built upon.
 
     Returns
     -------
-    tuple
-        Illuminant *Optimal Colour Stimuli*.
+    ndarray
+        Illuminant *Optimal Colour Stimuli*, only the convex hull vertices
+        of the computed *Optimal Colour Stimuli* are returned.
     """
 
-    optimal_colour_stimuli = ILLUMINANTS_OPTIMAL_COLOUR_STIMULI.get(illuminant)
-    if optimal_colour_stimuli is None:
-        raise KeyError('"{0}" not found in factory '
-                       '"Optimal Colour Stimuli": "{1}".'.format(
-                           illuminant,
-                           sorted(ILLUMINANTS_OPTIMAL_COLOUR_STIMULI.keys())))
+    if is_string(illuminant):
+        optimal_colour_stimuli = ILLUMINANTS_OPTIMAL_COLOUR_STIMULI.get(
+            illuminant)
+        if optimal_colour_stimuli is not None:
+            cached_ocs = _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE.get(illuminant)
+            if cached_ocs is None:
+                _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE[illuminant] = cached_ocs = (
+                    xyY_to_XYZ(optimal_colour_stimuli) / 100)
+            return cached_ocs
 
-    cached_ocs = _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE.get(illuminant)
+        if illuminant not in ILLUMINANTS_SPDS:
+            raise KeyError(
+                '"{0}" not found in factories "Optimal Colour Stimuli": '
+                '"{1}" and "Illuminants Relative SPDs": "{2}".'.format(
+                    illuminant,
+                    sorted(ILLUMINANTS_OPTIMAL_COLOUR_STIMULI.keys()),
+                    sorted(ILLUMINANTS_SPDS.keys())))
+
+        illuminant = ILLUMINANTS_SPDS[illuminant]
+
+    key = (interval, ) + tuple(
+        hashlib.sha1(np.ascontiguousarray(
+            a, dtype=DEFAULT_FLOAT_DTYPE).tobytes()).hexdigest()
+        for a in (illuminant.wavelengths, illuminant.values, cmfs.wavelengths,
+                  cmfs.values))
+
+    cached_ocs = _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE.get(key)
     if cached_ocs is None:
-        _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE[illuminant] = cached_ocs = (
-            xyY_to_XYZ(optimal_colour_stimuli) / 100)
+        XYZ = XYZ_optimal_colour_stimuli(illuminant, cmfs, interval)
+        # Only the convex hull vertices are kept as the numerous coplanar
+        # stimuli are making the triangulation needlessly expensive.
+        _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE[key] = cached_ocs = (
+            XYZ[ConvexHull(XYZ).vertices])
     return cached_ocs
 
 
-def is_within_macadam_limits(xyY, illuminant, tolerance=None):
+def is_within_macadam_limits(
+        xyY,
+        illuminant,
+        tolerance=None,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5):
     """
     Returns if given *CIE xyY* colourspace array is within MacAdam limits of
     given illuminant.
@@ -72,10 +198,22 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     ----------
     xyY : array_like
         *CIE xyY* colourspace array.
-    illuminant : unicode
-        Illuminant.
+    illuminant : unicode or SpectralPowerDistribution
+        Illuminant name or relative spectral power distribution. The
+        tabulated *Optimal Colour Stimuli* are used if existing for the given
+        illuminant name, otherwise they are computed with
+        :func:`colour.volume.XYZ_optimal_colour_stimuli` definition.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance allowed in the inside-triangle check, with computed
+        *Optimal Colour Stimuli*, distance allowed outside their convex hull
+        facets.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions used to compute the
+        *Optimal Colour Stimuli*.
+    interval : numeric, optional
+        Wavelength :math:`\\lambda_{i}` range interval in nm of the bins
+        the band-pass reflectances used to compute the *Optimal Colour
+        Stimuli* are built upon.
 
     Returns
     -------
@@ -85,6 +223,10 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     Notes
     -----
     -   Input *CIE xyY* colourspace array is normalised to domain [0, 1].
+    -   The computed *Optimal Colour Stimuli* are cached, as well as their
+        convex hull by :func:`colour.is_within_mesh_volume` definition whose
+        *Convex Hull* method is used to test the points against its facets
+        half-spaces.
 
     Examples
     --------
@@ -94,16 +236,22 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     ...               [0.0005, 0.0031, 0.001]])
     >>> is_within_macadam_limits(a, 'A')
     array([ True, False], dtype=bool)
+    >>> is_within_macadam_limits(a, ILLUMINANTS_SPDS['F2'])
+    array([ True, False], dtype=bool)
     """
 
-    optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE.get(
-        illuminant)
-    if triangulation is None:
-        _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
+    optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(
+        illuminant, cmfs, interval)
 
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    # The Delaunay triangulation of the computed *Optimal Colour Stimuli*
+    # convex hull vertices has numerous sliver simplices making the simplices
+    # location slow, the points are rather tested against the convex hull
+    # half-spaces.
+    tabulated = (is_string(illuminant) and
+                 illuminant in ILLUMINANTS_OPTIMAL_COLOUR_STIMULI)
 
-    return simplex
+    return is_within_mesh_volume(
+        xyY_to_XYZ(xyY),
+        optimal_colour_stimuli,
+        tolerance,
+        method='Delaunay' if tabulated else 'Convex Hull')
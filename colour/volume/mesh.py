@@ -8,8 +8,13 @@ Defines helpers objects related to volume computations.
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
+from collections import OrderedDict
+from scipy.spatial import ConvexHull, Delaunay
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import CaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,13 +23,77 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = [
+    'MESH_VOLUME_CACHE_SIZE', 'IS_WITHIN_MESH_VOLUME_METHODS',
+    'is_within_mesh_volume'
+]
+
+MESH_VOLUME_CACHE_SIZE = 32
+"""
+Maximum count of mesh triangulations and convex hulls kept in cache.
+
+MESH_VOLUME_CACHE_SIZE : integer
+"""
+
+_MESH_VOLUME_CACHE = OrderedDict()
+
+_HALF_SPACE_CHUNK_SIZE = 2 ** 16
+"""
+Count of points tested at once by the *Convex Hull* method.
+
+_HALF_SPACE_CHUNK_SIZE : integer
+"""
+
+_HALF_SPACE_BLOCK_SIZE = 32
+"""
+Count of convex hull facets tested at once by the *Convex Hull* method, the
+points outside a block of facets half-spaces being discarded before testing
+the next block.
+
+_HALF_SPACE_BLOCK_SIZE : integer
+"""
 
 
-def is_within_mesh_volume(points, mesh, tolerance=None):
+def _mesh_volume(mesh, method):
     """
-    Returns if given points are within given mesh volume using Delaunay
-    triangulation.
+    Returns the cached :class:`scipy.spatial.Delaunay` or
+    :class:`scipy.spatial.ConvexHull` class instance of given mesh, keyed on
+    the mesh points hash.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume.
+    method : unicode
+        **{'Delaunay', 'Convex Hull'}**,
+        Mesh volume construction method.
+
+    Returns
+    -------
+    Delaunay or ConvexHull
+        Mesh volume triangulation or convex hull.
+    """
+
+    mesh = np.ascontiguousarray(mesh, dtype=DEFAULT_FLOAT_DTYPE)
+
+    key = (method, mesh.shape, hashlib.sha1(mesh.tobytes()).hexdigest())
+
+    volume = _MESH_VOLUME_CACHE.pop(key, None)
+    if volume is None:
+        volume = (ConvexHull(mesh)
+                  if method == 'Convex Hull' else Delaunay(mesh))
+
+    _MESH_VOLUME_CACHE[key] = volume
+    while len(_MESH_VOLUME_CACHE) > MESH_VOLUME_CACHE_SIZE:
+        _MESH_VOLUME_CACHE.popitem(last=False)
+
+    return volume
+
+
+def _is_within_mesh_volume_Delaunay(points, mesh, tolerance=None):
+    """
+    Returns if given points are within given mesh volume by locating them in
+    the mesh Delaunay triangulation simplices.
 
     Parameters
     ----------
@@ -39,6 +108,110 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     -------
     bool
         Is within mesh volume.
+    """
+
+    triangulation = _mesh_volume(mesh, 'Delaunay')
+
+    simplex = triangulation.find_simplex(points, tol=tolerance)
+    simplex = np.where(simplex >= 0, True, False)
+
+    return simplex
+
+
+def _is_within_mesh_volume_ConvexHull(points, mesh, tolerance=None):
+    """
+    Returns if given points are within given mesh volume by checking that they
+    are within all the mesh convex hull facets half-spaces.
+
+    Parameters
+    ----------
+    points : array_like
+        Points to check if they are within ``mesh`` volume.
+    mesh : array_like
+        Points of the volume used to generate the convex hull.
+    tolerance : numeric, optional
+        Distance allowed outside the convex hull facets.
+
+    Returns
+    -------
+    bool
+        Is within mesh volume.
+    """
+
+    equations = _mesh_volume(mesh, 'Convex Hull').equations
+    normals, offsets = equations[..., :-1], equations[..., -1]
+    tolerance = 0 if tolerance is None else tolerance
+
+    points = np.asarray(points)
+    shape = points.shape[:-1]
+    points = np.reshape(points, (-1, points.shape[-1]))
+
+    within = np.zeros(points.shape[0], dtype=bool)
+    for i in range(0, points.shape[0], _HALF_SPACE_CHUNK_SIZE):
+        indexes = np.arange(i, min(i + _HALF_SPACE_CHUNK_SIZE,
+                                   points.shape[0]))
+        for j in range(0, len(equations), _HALF_SPACE_BLOCK_SIZE):
+            block = slice(j, j + _HALF_SPACE_BLOCK_SIZE)
+            indexes = indexes[np.all(
+                np.dot(points[indexes], normals[block].T) + offsets[block] <=
+                tolerance,
+                axis=-1)]
+
+            if indexes.size == 0:
+                break
+
+        within[indexes] = True
+
+    return np.reshape(within, shape)
+
+
+IS_WITHIN_MESH_VOLUME_METHODS = CaseInsensitiveMapping({
+    'Delaunay': _is_within_mesh_volume_Delaunay,
+    'Convex Hull': _is_within_mesh_volume_ConvexHull
+})
+IS_WITHIN_MESH_VOLUME_METHODS.__doc__ = """
+Supported mesh volume inclusion computation methods.
+
+IS_WITHIN_MESH_VOLUME_METHODS : CaseInsensitiveMapping
+    **{'Delaunay', 'Convex Hull'}**
+"""
+
+
+def is_within_mesh_volume(points, mesh, tolerance=None, method='Delaunay'):
+    """
+    Returns if given points are within given mesh volume using Delaunay
+    triangulation or the mesh convex hull half-spaces.
+
+    Parameters
+    ----------
+    points : array_like
+        Points to check if they are within ``mesh`` volume.
+    mesh : array_like
+        Points of the volume used to generate the Delaunay triangulation.
+    tolerance : numeric, optional
+        Tolerance allowed in the inside-triangle check, with *Convex Hull*
+        method, distance allowed outside the convex hull facets.
+    method : unicode, optional
+        **{'Delaunay', 'Convex Hull'}**,
+        Computation method, *Delaunay* method locates the points in the mesh
+        Delaunay triangulation simplices while *Convex Hull* method checks
+        that the points are within all the mesh convex hull facets
+        half-spaces using matrix products.
+
+    Returns
+    -------
+    bool
+        Is within mesh volume.
+
+    Notes
+    -----
+    -   The mesh Delaunay triangulation and convex hull are cached, keyed on
+        the mesh points hash, the
+        :attr:`colour.volume.mesh.MESH_VOLUME_CACHE_SIZE` attribute defining
+        the count of cached meshes.
+    -   Both methods check that the points are within the convex hull of the
+        mesh points, *Convex Hull* method being faster on large points
+        arrays.
 
     Examples
     --------
@@ -55,11 +228,8 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     ...               [0.3205, 0.4131, 0.5100]])
     >>> is_within_mesh_volume(a, mesh)
     array([ True, False], dtype=bool)
+    >>> is_within_mesh_volume(a, mesh, method='Convex Hull')
+    array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
-
-    simplex = triangulation.find_simplex(points, tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
-
-    return simplex
+    return IS_WITHIN_MESH_VOLUME_METHODS[method](points, mesh, tolerance)
@@ -7,6 +7,8 @@ Defines various RGB colourspace volume computation objects:
 
 -   :func:`colour.RGB_colourspace_limits`
 -   :func:`colour.RGB_colourspace_volume_MonteCarlo`
+-   :func:`colour.volume.RGB_colourspace_volume_streaming_MonteCarlo`
+-   :func:`colour.volume.RGB_colourspace_volume_mesh`
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
@@ -23,10 +25,12 @@ from __future__ import division, unicode_literals
 import itertools
 import multiprocessing
 import numpy as np
+from collections import namedtuple
 
 from colour.algebra import random_triplet_generator
 from colour.colorimetry import ILLUMINANTS
 from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
+from colour.utilities import warning
 from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
 
 __author__ = 'Colour Developers'
@@ -38,12 +42,90 @@ __status__ = 'Production'
 
 __all__ = [
     'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
-    'RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_volume_MonteCarlo', 'RGB_ColourspaceVolumeEstimate',
+    'RGB_colourspace_volume_streaming_MonteCarlo',
+    'RGB_colourspace_volume_mesh',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
 ]
 
 
+class RGB_ColourspaceVolumeEstimate(
+        namedtuple('RGB_ColourspaceVolumeEstimate',
+                   ('volume', 'standard_error', 'samples'))):
+    """
+    Defines the *RGB* colourspace volume *Monte Carlo* estimate.
+
+    Parameters
+    ----------
+    volume : numeric
+        *RGB* colourspace volume estimate.
+    standard_error : numeric
+        *RGB* colourspace volume estimate standard error.
+    samples : integer
+        Samples count the estimate has been computed with.
+    """
+
+
+def _RGB_colourspace_volume_samples_count(colourspace, Lab, illuminant_Lab,
+                                          chromatic_adaptation_method):
+    """
+    Returns the count of given *Lab* colourspace samples within the given
+    *RGB* colourspace volume.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    Lab : array_like
+        *Lab* colourspace samples.
+    illuminant_Lab : array_like
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    integer
+        Within *RGB* colourspace volume samples count.
+    """
+
+    RGB = XYZ_to_RGB(
+        Lab_to_XYZ(Lab, illuminant_Lab),
+        illuminant_Lab,
+        colourspace.whitepoint,
+        colourspace.XYZ_to_RGB_matrix,
+        chromatic_adaptation_transform=(chromatic_adaptation_method))
+
+    return int(
+        np.sum(
+            np.logical_and(
+                np.min(RGB, axis=-1) >= 0,
+                np.max(RGB, axis=-1) <= 1)))
+
+
+def _random_samples(random_samples):
+    """
+    Returns given random samples, either a :class:`numpy.ndarray` class
+    instance or an iterable of triplets, as an array.
+
+    Parameters
+    ----------
+    random_samples : array_like or iterable
+        Random samples returned by a random triplet generator.
+
+    Returns
+    -------
+    ndarray
+        Random samples array.
+    """
+
+    if isinstance(random_samples, np.ndarray):
+        return random_samples
+
+    return np.asarray(list(random_samples))
+
+
 def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
     """
     Convenient wrapper to be able to call
@@ -53,7 +135,9 @@ def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
     Parameters
     ----------
     args : array_like, optional
-        Arguments.
+        Arguments, the last one being the seed of the
+        :class:`np.random.RandomState` class instance used to draw the
+        samples.
 
     Returns
     -------
@@ -61,7 +145,10 @@ def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
         Inside *RGB* colourspace volume samples count.
     """
 
-    return sample_RGB_colourspace_volume_MonteCarlo(*args)
+    args, seed = args[:-1], args[-1]
+
+    return sample_RGB_colourspace_volume_MonteCarlo(
+        *args, random_state=np.random.RandomState(seed))
 
 
 def sample_RGB_colourspace_volume_MonteCarlo(
@@ -92,9 +179,11 @@ def sample_RGB_colourspace_volume_MonteCarlo(
         'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
         'Bianco PC'}**,
         *Chromatic adaptation* method.
-    random_generator : generator, optional
+    random_generator : callable, optional
         Random triplet generator providing the random samples within the *Lab*
-        colourspace volume.
+        colourspace volume, either yielding the triplets or returning them as
+        an array, e.g. :func:`colour.algebra.quasi_random_triplets_Sobol`
+        definition.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
@@ -127,16 +216,10 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    Lab = np.asarray(list(random_generator(samples, limits, random_state)))
-    RGB = XYZ_to_RGB(
-        Lab_to_XYZ(Lab, illuminant_Lab),
-        illuminant_Lab,
-        colourspace.whitepoint,
-        colourspace.XYZ_to_RGB_matrix,
-        chromatic_adaptation_transform=(chromatic_adaptation_method))
-    RGB_w = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1)]
-    return len(RGB_w)
+    Lab = _random_samples(random_generator(samples, limits, random_state))
+
+    return _RGB_colourspace_volume_samples_count(
+        colourspace, Lab, illuminant_Lab, chromatic_adaptation_method)
 
 
 def RGB_colourspace_limits(
@@ -190,11 +273,22 @@ def RGB_colourspace_volume_MonteCarlo(
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
         random_state=None,
-        processes=None):
+        processes=None,
+        pool=None,
+        batch_size=10e4):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
     method and multiprocessing.
 
+    The samples are drawn in batches, each batch using its own
+    :class:`np.random.RandomState` class instance seeded with a seed sequence
+    made of a seed drawn from given random number generator and the batch
+    index: the batches samples are independent and the result only depends
+    on the given random number generator state, not on the processes count.
+    With a low-discrepancy random triplet generator, e.g.
+    :func:`colour.algebra.quasi_random_triplets_Sobol` definition, each batch
+    is a randomly shifted copy of the sequence.
+
     Parameters
     ----------
     colourspace : RGB_Colourspace
@@ -210,15 +304,27 @@ def RGB_colourspace_volume_MonteCarlo(
         'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
         'Bianco PC'}**,
         *Chromatic adaptation* method.
-    random_generator : generator, optional
+    random_generator : callable, optional
         Random triplet generator providing the random samples within the *Lab*
-        colourspace volume.
+        colourspace volume, either yielding the triplets or returning them as
+        an array, e.g. :func:`colour.algebra.quasi_random_triplets_Sobol`
+        definition.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
     processes : integer, optional
         Processes count, default to :func:`multiprocessing.cpu_count`
-        definition.
+        definition. A single process computes the volume without creating a
+        pool.
+    pool : object, optional
+        :class:`multiprocessing.pool.Pool` or
+        :class:`concurrent.futures.Executor` class instance, or any object
+        implementing a compatible *map* method, used to process the batches.
+        It is not closed so that it can be reused across calls, if not given,
+        a pool of given processes count is created and closed once the
+        volume is computed.
+    batch_size : numeric, optional
+        Samples count of each batch.
 
     Returns
     -------
@@ -243,24 +349,320 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     >>> processes = 1
     >>> RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng,
     ...                                   processes=processes)
-    ... # doctest: +ELLIPSIS
-    858...
+    838800.0
     """
 
-    cpu_count = processes if processes else multiprocessing.cpu_count()
-    pool = multiprocessing.Pool(processes=cpu_count)
+    random_state = (random_state
+                    if random_state is not None else np.random.RandomState())
+
+    samples = int(np.round(samples))
+    batch_size = int(batch_size)
+
+    seed = random_state.randint(np.iinfo(np.int32).max)
+
+    arguments = [(colourspace, min(batch_size, samples - i * batch_size),
+                  limits, illuminant_Lab, chromatic_adaptation_method,
+                  random_generator, (seed, i))
+                 for i in range(int(np.ceil(samples / batch_size)))]
+
+    if pool is not None:
+        results = list(
+            pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo, arguments))
+    else:
+        cpu_count = processes if processes else multiprocessing.cpu_count()
+        if cpu_count == 1:
+            results = [
+                _wrapper_RGB_colourspace_volume_MonteCarlo(argument)
+                for argument in arguments
+            ]
+        else:
+            pool = multiprocessing.Pool(processes=cpu_count)
+            try:
+                results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
+                                   arguments)
+            finally:
+                pool.close()
+                pool.join()
 
-    process_samples = int(np.round(samples / cpu_count))
+    Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
 
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
+    return Lab_volume * np.sum(results) / samples
 
-    results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                       [arguments for _ in range(cpu_count)])
 
-    Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
+def RGB_colourspace_volume_streaming_MonteCarlo(
+        colourspace,
+        tolerance=0.005,
+        batch_size=10e4,
+        samples=10e6,
+        limits=np.array([[0, 100], [-150, 150], [-150, 150]]),
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02',
+        random_generator=None,
+        random_state=None):
+    """
+    Performs given *RGB* colourspace volume computation using *Monte Carlo*
+    method by drawing batches of samples until the volume estimate relative
+    standard error is lower than given tolerance.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    tolerance : numeric, optional
+        Relative standard error of the volume estimate at which the sampling
+        stops.
+    batch_size : numeric, optional
+        Samples count of each batch.
+    samples : numeric, optional
+        Maximum samples count.
+    limits : array_like, optional
+        *Lab* colourspace volume.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    random_generator : callable, optional
+        Random triplet generator providing the random samples of each batch
+        within the *Lab* colourspace volume, either yielding the triplets or
+        returning them as an array, the samples are drawn uniformly with
+        given random number generator if not given.
+    random_state : RandomState, optional
+        Mersenne Twister pseudo-random number generator to use in the random
+        number generator.
+
+    Returns
+    -------
+    RGB_ColourspaceVolumeEstimate
+        *RGB* colourspace volume estimate, standard error and samples count.
+
+    Warning
+    -------
+    A warning is issued if the maximum samples count is reached before the
+    relative standard error is lower than the given tolerance.
+
+    Notes
+    -----
+    -   The within *RGB* colourspace volume samples count follows a binomial
+        distribution, thus given the ratio :math:`p` of within samples over
+        :math:`n` samples drawn in the :math:`V_{Lab}` *Lab* colourspace
+        volume, the volume estimate is :math:`V = V_{Lab}p` and its standard
+        error is :math:`V_{Lab}\\sqrt{p(1 - p) / n}`. With a randomly shifted
+        low-discrepancy random triplet generator, each batch is an
+        independent randomised *quasi-Monte Carlo* estimate and the standard
+        error is conservative.
+    -   The doctest is assuming that :func:`np.random.RandomState` definition
+        will return the same sequence no matter which *OS* or *Python*
+        version is used. There is however no formal promise about the *prng*
+        sequence reproducibility of either *Python* or *Numpy*
+        implementations: Laurent. (2012). Reproducibility of python
+        pseudo-random numbers across systems and versions? Retrieved January
+        20, 2015, from http://stackoverflow.com/questions/8786084/\
+reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE as sRGB
+    >>> prng = np.random.RandomState(2)
+    >>> RGB_colourspace_volume_streaming_MonteCarlo(
+    ...     sRGB, 0.01, 10e3, random_state=prng)  # doctest: +ELLIPSIS
+    RGB_ColourspaceVolumeEstimate(volume=8..., standard_error=..., \
+samples=...)
+    """
+
+    random_state = (random_state
+                    if random_state is not None else np.random.RandomState())
+
+    limits = np.asarray(limits)
+    batch_size = int(batch_size)
+    samples = int(samples)
+
+    Lab_volume = np.product(limits[..., 1] - limits[..., 0])
+
+    samples_within = samples_drawn = 0
+    volume = standard_error = np.nan
+    while samples_drawn < samples:
+        batch_samples = min(batch_size, samples - samples_drawn)
+
+        if random_generator is None:
+            Lab = random_state.uniform(limits[..., 0], limits[..., 1],
+                                       (batch_samples, 3))
+        else:
+            Lab = _random_samples(
+                random_generator(batch_samples, limits, random_state))
+        samples_within += _RGB_colourspace_volume_samples_count(
+            colourspace, Lab, illuminant_Lab, chromatic_adaptation_method)
+        samples_drawn += batch_samples
+
+        p = samples_within / samples_drawn
+        volume = Lab_volume * p
+        standard_error = Lab_volume * np.sqrt(p * (1 - p) / samples_drawn)
+
+        if samples_within > 0 and standard_error <= tolerance * volume:
+            break
+    else:
+        warning('Maximum samples count reached before the volume estimate '
+                'relative standard error is lower than "{0}" '
+                'tolerance!'.format(tolerance))
+
+    return RGB_ColourspaceVolumeEstimate(volume, standard_error,
+                                         samples_drawn)
+
+
+def _RGB_colourspace_volume_mesh(colourspace, segments, illuminant_Lab,
+                                 chromatic_adaptation_method):
+    """
+    Computes given *RGB* colourspace volume in *CIE L\\*a\\*b\\** colourspace
+    from its *RGB* cube surface tessellated with given segments count per
+    edge.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    segments : integer
+        Segments count per *RGB* cube edge.
+    illuminant_Lab : array_like
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+    """
+
+    nodes = np.linspace(0, 1, segments + 1) ** 2
+
+    volume = 0
+    for axis in range(3):
+        U, W = np.meshgrid(nodes, nodes, indexing='ij')
+        for value in (0, 1):
+            RGB = np.zeros(U.shape + (3, ))
+            RGB[..., axis] = value
+            RGB[..., (axis + 1) % 3] = U
+            RGB[..., (axis + 2) % 3] = W
+
+            Lab = XYZ_to_Lab(
+                RGB_to_XYZ(
+                    RGB,
+                    colourspace.whitepoint,
+                    illuminant_Lab,
+                    colourspace.RGB_to_XYZ_matrix,
+                    chromatic_adaptation_transform=(
+                        chromatic_adaptation_method)), illuminant_Lab)
+
+            p_00, p_10 = Lab[:-1, :-1], Lab[1:, :-1]
+            p_11, p_01 = Lab[1:, 1:], Lab[:-1, 1:]
+
+            # Signed volumes of the tetrahedra formed by the origin and the
+            # outward oriented triangles of each quad.
+            tetrahedra = (
+                np.sum(p_00 * np.cross(p_10, p_11), axis=-1) +
+                np.sum(p_00 * np.cross(p_11, p_01), axis=-1))
+
+            volume += np.sum(tetrahedra) * (1 if value else -1)
+
+    return volume / 6
+
+
+def RGB_colourspace_volume_mesh(
+        colourspace,
+        tolerance=0.0001,
+        segments=16,
+        maximum_segments=512,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02'):
+    """
+    Computes given *RGB* colourspace volume in *CIE L\\*a\\*b\\** colourspace
+    by tessellating its *RGB* cube surface and integrating the enclosed
+    volume with the divergence theorem.
+
+    The *RGB* cube faces are tessellated with triangles whose vertices are
+    converted to *CIE L\\*a\\*b\\** colourspace, the mesh is refined by
+    doubling the segments count until the estimated relative error is lower
+    than given tolerance.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    tolerance : numeric, optional
+        Estimated relative error of the volume at which the refinement stops.
+    segments : integer, optional
+        Initial segments count per *RGB* cube edge.
+    maximum_segments : integer, optional
+        Maximum segments count per *RGB* cube edge.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Warning
+    -------
+    A warning is issued if the maximum segments count is reached before the
+    estimated relative error is lower than the given tolerance.
+
+    Notes
+    -----
+    -   The enclosed volume is the sum of the signed volumes
+        :math:`\\cfrac{1}{6}v_0\\cdot(v_1\\times v_2)` of the tetrahedra
+        formed by the origin and each outward oriented triangle.
+    -   The *RGB* cube edges nodes are quadratically spaced so that the mesh
+        is finer toward black where the *CIE L\\*a\\*b\\** colourspace
+        non-linearity has the highest curvature, the faces sharing the same
+        nodes, the mesh is watertight.
+    -   The volume error of the piecewise planar surface decreases
+        quadratically with the segments length, thus given the volumes
+        :math:`V_n` and :math:`V_{2n}` computed with :math:`n` and :math:`2n`
+        segments, the error of :math:`V_{2n}` is estimated as
+        :math:`|V_{2n} - V_n| / 3` and the *Richardson* extrapolated volume
+        :math:`V_{2n} + (V_{2n} - V_n) / 3` is returned.
+    -   Contrary to :func:`colour.RGB_colourspace_volume_MonteCarlo`
+        definition, the volume is not limited to a *Lab* colourspace volume.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_volume_mesh(sRGB)  # doctest: +ELLIPSIS
+    857192.8...
+    """
+
+    segments = int(segments)
+
+    volume_p = _RGB_colourspace_volume_mesh(
+        colourspace, segments, illuminant_Lab, chromatic_adaptation_method)
+    while True:
+        segments *= 2
+
+        volume = _RGB_colourspace_volume_mesh(
+            colourspace, segments, illuminant_Lab, chromatic_adaptation_method)
+        error = (volume - volume_p) / 3
+        volume_p = volume
+
+        if np.abs(error) <= tolerance * np.abs(volume):
+            break
+
+        if segments * 2 > maximum_segments:
+            warning('Maximum segments count reached before the volume '
+                    'estimated relative error is lower than "{0}" '
+                    'tolerance!'.format(tolerance))
+            break
 
-    return Lab_volume * np.sum(results) / (process_samples * cpu_count)
+    return volume + error
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -280,8 +682,9 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         Python object responsible for checking the volume coverage.
     samples : numeric, optional
         Samples count.
-    random_generator : generator, optional
-        Random triplet generator providing the random samples.
+    random_generator : callable, optional
+        Random triplet generator providing the random samples, either yielding
+        the triplets or returning them as an array.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
@@ -304,9 +707,8 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    # TODO: Investigate for generator yielding directly a ndarray.
-    XYZ = np.asarray(
-        list(random_generator(samples, random_state=random_state)))
+    XYZ = _random_samples(
+        random_generator(samples, random_state=random_state))
     XYZ_vs = XYZ[coverage_sampler(XYZ)]
 
     RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint, colourspace.whitepoint,
@@ -333,8 +735,9 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         *RGB* colourspace to compute the *Pointer's Gamut* coverage percentage.
     samples : numeric, optional
         Samples count.
-    random_generator : generator, optional
-        Random triplet generator providing the random samples.
+    random_generator : callable, optional
+        Random triplet generator providing the random samples, either yielding
+        the triplets or returning them as an array.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
@@ -373,8 +776,9 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         *RGB* colourspace to compute the visible spectrum coverage percentage.
     samples : numeric, optional
         Samples count.
-    random_generator : generator, optional
-        Random triplet generator providing the random samples.
+    random_generator : callable, optional
+        Random triplet generator providing the random samples, either yielding
+        the triplets or returning them as an array.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
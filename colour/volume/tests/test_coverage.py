@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.volume.coverage` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models import (BT2020_COLOURSPACE, BT709_COLOURSPACE,
+                           POINTER_GAMUT_BOUNDARIES)
+from colour.volume import (
+    RGB_colourspace_volume_mesh, gamut_occupancy_grid, gamut_coverage_grid,
+    gamut_chromaticity_occupancy_grid, gamut_chromaticity_coverage_grid,
+    is_within_pointer_gamut)
+from colour.volume import coverage
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestGamutOccupancyGrid', 'TestGamutCoverageGrid',
+    'TestGamutChromaticityOccupancyGrid', 'TestGamutChromaticityCoverageGrid'
+]
+
+
+class TestGamutOccupancyGrid(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.coverage.gamut_occupancy_grid` definition
+    unit tests methods.
+    """
+
+    def test_gamut_occupancy_grid(self):
+        """
+        Tests :func:`colour.volume.coverage.gamut_occupancy_grid` definition.
+        """
+
+        occupancy_grid = gamut_occupancy_grid(BT709_COLOURSPACE)
+        self.assertTupleEqual(occupancy_grid.shape, (50, 150, 150))
+        self.assertEqual(np.sum(occupancy_grid), 107120)
+        self.assertAlmostEqual(
+            np.sum(occupancy_grid) * 8 /
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE),
+            1,
+            places=2)
+
+        self.assertTupleEqual(
+            gamut_occupancy_grid(BT709_COLOURSPACE, 5).shape, (20, 60, 60))
+
+        self.assertEqual(
+            np.sum(gamut_occupancy_grid(is_within_pointer_gamut)), 119498)
+
+    def test_cache_gamut_occupancy_grid(self):
+        """
+        Tests :func:`colour.volume.coverage.gamut_occupancy_grid` definition
+        occupancy grids caching.
+        """
+
+        coverage._GAMUT_OCCUPANCY_GRIDS_CACHE.clear()
+
+        occupancy_grid = gamut_occupancy_grid(BT709_COLOURSPACE, 10)
+        self.assertIs(
+            gamut_occupancy_grid(BT709_COLOURSPACE, 10), occupancy_grid)
+        self.assertFalse(occupancy_grid.flags.writeable)
+
+        gamut_occupancy_grid(BT2020_COLOURSPACE, 10)
+        gamut_chromaticity_occupancy_grid(BT709_COLOURSPACE, 0.01)
+        self.assertEqual(len(coverage._GAMUT_OCCUPANCY_GRIDS_CACHE), 3)
+
+        cache_size = coverage.GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE
+        try:
+            coverage.GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE = 2
+            gamut_occupancy_grid(BT709_COLOURSPACE, 20)
+            self.assertEqual(len(coverage._GAMUT_OCCUPANCY_GRIDS_CACHE), 2)
+        finally:
+            coverage.GAMUT_OCCUPANCY_GRIDS_CACHE_SIZE = cache_size
+
+
+class TestGamutCoverageGrid(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.coverage.gamut_coverage_grid` definition
+    unit tests methods.
+    """
+
+    def test_gamut_coverage_grid(self):
+        """
+        Tests :func:`colour.volume.coverage.gamut_coverage_grid` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            gamut_coverage_grid(BT709_COLOURSPACE, is_within_pointer_gamut),
+            np.array([856960.0, 955984.0, 709536.0, 1103408.0, 74.2204890]),
+            decimal=4)
+
+        volume, reference_volume, intersection, union, coverage_p = (
+            gamut_coverage_grid(BT2020_COLOURSPACE, BT709_COLOURSPACE))
+        self.assertEqual(intersection, reference_volume)
+        self.assertEqual(union, volume)
+        self.assertEqual(coverage_p, 100)
+
+        volume, reference_volume, intersection, union, coverage_p = (
+            gamut_coverage_grid(BT709_COLOURSPACE, BT2020_COLOURSPACE))
+        self.assertEqual(intersection, volume)
+        self.assertAlmostEqual(
+            coverage_p, 100 * volume / reference_volume, places=7)
+
+
+class TestGamutChromaticityOccupancyGrid(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.coverage.gamut_chromaticity_occupancy_grid`
+    definition unit tests methods.
+    """
+
+    def test_gamut_chromaticity_occupancy_grid(self):
+        """
+        Tests :func:`colour.volume.coverage.\
+gamut_chromaticity_occupancy_grid` definition.
+        """
+
+        occupancy_grid = gamut_chromaticity_occupancy_grid(BT709_COLOURSPACE)
+        self.assertTupleEqual(occupancy_grid.shape, (400, 450))
+
+        x, y = BT709_COLOURSPACE.primaries.T
+        area = np.abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1))) / 2
+        self.assertAlmostEqual(
+            np.sum(occupancy_grid) * 0.002 ** 2, area, places=4)
+
+        np.testing.assert_equal(
+            gamut_chromaticity_occupancy_grid(BT709_COLOURSPACE),
+            gamut_chromaticity_occupancy_grid(BT709_COLOURSPACE.primaries))
+
+
+class TestGamutChromaticityCoverageGrid(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.coverage.gamut_chromaticity_coverage_grid`
+    definition unit tests methods.
+    """
+
+    def test_gamut_chromaticity_coverage_grid(self):
+        """
+        Tests :func:`colour.volume.coverage.\
+gamut_chromaticity_coverage_grid` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            gamut_chromaticity_coverage_grid(BT709_COLOURSPACE,
+                                             POINTER_GAMUT_BOUNDARIES),
+            np.array([0.112044, 0.160700, 0.111048, 0.161696, 69.1026758]),
+            decimal=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,12 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.volume import is_within_macadam_limits
+from colour.colorimetry import (ILLUMINANTS_SPDS, STANDARD_OBSERVERS_CMFS,
+                                SpectralPowerDistribution,
+                                spectral_to_XYZ_integration)
+from colour.models import XYZ_to_xyY
+from colour.volume import (XYZ_optimal_colour_stimuli,
+                           is_within_macadam_limits)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -19,7 +24,46 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMacadamLimits']
+__all__ = ['TestXYZOptimalColourStimuli', 'TestIsWithinMacadamLimits']
+
+
+class TestXYZOptimalColourStimuli(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_optimal_colour_stimuli(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+        definition.
+        """
+
+        XYZ = XYZ_optimal_colour_stimuli(ILLUMINANTS_SPDS['D65'], interval=10)
+        self.assertTupleEqual(XYZ.shape, (2258, 3))
+        np.testing.assert_almost_equal(
+            XYZ[[0, 1, 2, 100, 1000]],
+            np.array([
+                [0.00000000, 0.00000000, 0.00000000],
+                [0.95046751, 1.00000000, 1.08896937],
+                [0.00001089, 0.00000033, 0.00005096],
+                [0.02676290, 0.00086353, 0.12891588],
+                [0.58617057, 0.36903439, 0.00046217],
+            ]),
+            decimal=7)
+
+        XYZ = XYZ_optimal_colour_stimuli(
+            ILLUMINANTS_SPDS['D65'],
+            STANDARD_OBSERVERS_CMFS['CIE 1964 10 Degree Standard Observer'],
+            20)
+        self.assertTupleEqual(XYZ.shape, (554, 3))
+        np.testing.assert_almost_equal(
+            XYZ[[1, 50]],
+            np.array([
+                [0.94811688, 1.00000000, 1.07324737],
+                [0.13406945, 0.02535461, 0.68992861],
+            ]),
+            decimal=7)
 
 
 class TestIsWithinMacadamLimits(unittest.TestCase):
@@ -46,6 +90,65 @@ class TestIsWithinMacadamLimits(unittest.TestCase):
         self.assertFalse(
             is_within_macadam_limits(np.array([0.0025, 0.0088, 0.0340]), 'C'))
 
+        self.assertTrue(
+            is_within_macadam_limits(
+                np.array([0.3205, 0.4131, 0.5100]), ILLUMINANTS_SPDS['A']))
+
+        self.assertFalse(
+            is_within_macadam_limits(
+                np.array([0.0005, 0.0031, 0.0010]), ILLUMINANTS_SPDS['A']))
+
+        self.assertTrue(
+            is_within_macadam_limits(np.array([0.3205, 0.4131, 0.5100]), 'F2'))
+
+        self.assertFalse(
+            is_within_macadam_limits(np.array([0.6500, 0.3000, 0.5000]), 'F2'))
+
+        self.assertRaises(KeyError, is_within_macadam_limits,
+                          np.array([0.3205, 0.4131, 0.5100]), 'Undefined')
+
+    def test_boundary_is_within_macadam_limits(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
+        definition with stimuli close to the computed *Optimal Colour
+        Stimuli* boundary.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        wavelengths = cmfs.wavelengths
+        ones = np.ones(wavelengths.shape)
+
+        # Band-pass and band-stop reflectances aligned on the 5nm bins are
+        # *Optimal Colour Stimuli*, i.e. on the boundary, they are moved by
+        # 1% toward and away from the middle grey.
+        reflectances = []
+        for start, end in ((450, 500), (500, 560), (560, 620), (600, 700),
+                           (420, 680)):
+            band = np.logical_and(wavelengths >= start, wavelengths < end)
+            reflectances += [band, ~band]
+
+        for name in ('D65', 'A', 'F2'):
+            illuminant = ILLUMINANTS_SPDS[name].copy().align(cmfs.shape)
+            XYZ = np.array([
+                spectral_to_XYZ_integration(
+                    SpectralPowerDistribution(reflectance * ones, wavelengths),
+                    cmfs, illuminant) / 100 for reflectance in reflectances
+            ])
+            XYZ_g = spectral_to_XYZ_integration(
+                SpectralPowerDistribution(ones, wavelengths), cmfs,
+                illuminant) / 200
+
+            self.assertTrue(
+                np.all(
+                    is_within_macadam_limits(
+                        XYZ_to_xyY(XYZ_g + 0.99 * (XYZ - XYZ_g)),
+                        ILLUMINANTS_SPDS[name])))
+            self.assertFalse(
+                np.any(
+                    is_within_macadam_limits(
+                        XYZ_to_xyY(XYZ_g + 1.01 * (XYZ - XYZ_g)),
+                        ILLUMINANTS_SPDS[name])))
+
     def test_n_dimensional_is_within_macadam_limits(self):
         """
         Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
@@ -10,6 +10,7 @@ import unittest
 from itertools import permutations
 
 from colour.volume import is_within_mesh_volume
+from colour.volume import mesh
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -62,6 +63,68 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(
                 np.array([0.4325, 0.3788, 0.1034]), self._mesh))
 
+        self.assertTrue(
+            is_within_mesh_volume(
+                np.array([0.0005, 0.0031, 0.0010]),
+                self._mesh,
+                method='Convex Hull'))
+
+        self.assertFalse(
+            is_within_mesh_volume(
+                np.array([0.3205, 0.4131, 0.5100]),
+                self._mesh,
+                method='Convex Hull'))
+
+        self.assertTrue(
+            is_within_mesh_volume(
+                np.array([0.0025, 0.0088, 0.0340]),
+                self._mesh,
+                method='Convex Hull'))
+
+        self.assertFalse(
+            is_within_mesh_volume(
+                np.array([0.4325, 0.3788, 0.1034]),
+                self._mesh,
+                method='Convex Hull'))
+
+        self.assertTrue(
+            is_within_mesh_volume(
+                np.array([0.0, 1.0001, 0.0]),
+                self._mesh,
+                tolerance=0.001,
+                method='Convex Hull'))
+
+        points = np.random.RandomState(4).uniform(-1.5, 1.5, (10000, 3))
+        np.testing.assert_equal(
+            is_within_mesh_volume(points, self._mesh, method='Convex Hull'),
+            is_within_mesh_volume(points, self._mesh))
+
+    def test_cache_is_within_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
+        mesh triangulations caching.
+        """
+
+        mesh._MESH_VOLUME_CACHE.clear()
+
+        is_within_mesh_volume(np.array([0.0, 0.0, 0.0]), self._mesh)
+        is_within_mesh_volume(np.array([0.0, 0.0, 0.0]), self._mesh)
+        self.assertEqual(len(mesh._MESH_VOLUME_CACHE), 1)
+
+        is_within_mesh_volume(
+            np.array([0.0, 0.0, 0.0]), self._mesh, method='Convex Hull')
+        is_within_mesh_volume(
+            np.array([0.0, 0.0, 0.0]), self._mesh * 2, method='Convex Hull')
+        self.assertEqual(len(mesh._MESH_VOLUME_CACHE), 3)
+
+        cache_size = mesh.MESH_VOLUME_CACHE_SIZE
+        try:
+            mesh.MESH_VOLUME_CACHE_SIZE = 2
+            is_within_mesh_volume(np.array([0.0, 0.0, 0.0]), self._mesh * 3)
+            self.assertEqual(len(mesh._MESH_VOLUME_CACHE), 2)
+        finally:
+            mesh.MESH_VOLUME_CACHE_SIZE = cache_size
+
     def test_n_dimensional_is_within_mesh_volume(self):
         """
         Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
@@ -80,6 +143,9 @@ class TestIsWithinMeshVolume(unittest.TestCase):
         b = np.reshape(b, (2, 3))
         np.testing.assert_almost_equal(is_within_mesh_volume(a, self._mesh), b)
 
+        np.testing.assert_almost_equal(
+            is_within_mesh_volume(a, self._mesh, method='Convex Hull'), b)
+
     @ignore_numpy_errors
     def test_nan_is_within_mesh_volume(self):
         """
@@ -91,6 +157,20 @@ class TestIsWithinMeshVolume(unittest.TestCase):
         cases = set(permutations(cases * 3, r=3))
         for case in cases:
             is_within_mesh_volume(case, self._mesh)
+            is_within_mesh_volume(case, self._mesh, method='Convex Hull')
+
+    def test_raise_exception_is_within_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
+        raised exception.
+        """
+
+        self.assertRaises(
+            KeyError,
+            is_within_mesh_volume,
+            np.array([0.0, 0.0, 0.0]),
+            self._mesh,
+            method='Convex Hul')
 
 
 if __name__ == '__main__':
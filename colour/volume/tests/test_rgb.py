@@ -20,13 +20,16 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
 import unittest
 
+from colour.algebra import quasi_random_triplets_Sobol
 from colour.models import (ACES_2065_1_COLOURSPACE, BT2020_COLOURSPACE,
                            BT709_COLOURSPACE)
 from colour.volume import (
     RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
+    RGB_colourspace_volume_streaming_MonteCarlo, RGB_colourspace_volume_mesh,
     RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
@@ -41,6 +44,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
+    'TestRGB_colourspaceVolumeStreamingMonteCarlo',
+    'TestRGB_colourspaceVolumeMesh',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
     'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
@@ -95,12 +100,177 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
         definition.
         """
 
-        self.assertEquals(
+        self.assertEqual(
             RGB_colourspace_volume_MonteCarlo(
                 BT709_COLOURSPACE,
                 10e3,
                 random_state=np.random.RandomState(2),
-                processes=1), 858600.0)
+                processes=1), 838800.0)
+
+    def test_multiprocessing_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition multiprocessing support.
+        """
+
+        volume = RGB_colourspace_volume_MonteCarlo(
+            BT709_COLOURSPACE,
+            10e3,
+            random_state=np.random.RandomState(2),
+            processes=1,
+            batch_size=10e2)
+
+        self.assertEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=2,
+                batch_size=10e2), volume)
+
+        pool = multiprocessing.Pool(processes=2)
+        try:
+            for _ in range(2):
+                self.assertEqual(
+                    RGB_colourspace_volume_MonteCarlo(
+                        BT709_COLOURSPACE,
+                        10e3,
+                        random_state=np.random.RandomState(2),
+                        pool=pool,
+                        batch_size=10e2), volume)
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertNotEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(4),
+                processes=1,
+                batch_size=10e2), volume)
+
+    def test_quasi_random_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition with a low-discrepancy random triplet generator.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                2 ** 14,
+                random_state=np.random.RandomState(2),
+                processes=1,
+                random_generator=quasi_random_triplets_Sobol,
+                batch_size=2 ** 12),
+            858032.2265625,
+            places=7)
+
+
+class TestRGB_colourspaceVolumeStreamingMonteCarlo(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspace_volume_streaming_MonteCarlo` definition unit tests methods.
+
+    References
+    ----------
+    -   :cite:`Laurent2012a`
+    """
+
+    def test_RGB_colourspace_volume_streaming_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_streaming_MonteCarlo` definition.
+        """
+
+        volume, standard_error, samples = (
+            RGB_colourspace_volume_streaming_MonteCarlo(
+                BT709_COLOURSPACE,
+                0.01,
+                10e3,
+                random_state=np.random.RandomState(2)))
+
+        self.assertAlmostEqual(volume, 830160.0, places=7)
+        self.assertAlmostEqual(standard_error, 8235.456498822637, places=7)
+        self.assertEqual(samples, 100000)
+        self.assertLessEqual(standard_error, volume * 0.01)
+
+        volume, standard_error, samples = (
+            RGB_colourspace_volume_streaming_MonteCarlo(
+                BT709_COLOURSPACE,
+                0.0001,
+                10e3,
+                25e3,
+                random_state=np.random.RandomState(2)))
+
+        self.assertEqual(samples, 25000)
+        self.assertGreater(standard_error, volume * 0.0001)
+
+        volume, standard_error, samples = (
+            RGB_colourspace_volume_streaming_MonteCarlo(
+                BT709_COLOURSPACE,
+                0.01,
+                10e3,
+                50e3,
+                limits=np.array([[0, 100], [-150, 150], [-150, 150]]) + 1000,
+                random_state=np.random.RandomState(2)))
+
+        self.assertEqual(volume, 0)
+        self.assertEqual(samples, 50000)
+
+        volume, standard_error, samples = (
+            RGB_colourspace_volume_streaming_MonteCarlo(
+                BT709_COLOURSPACE,
+                0.01,
+                2 ** 12,
+                random_generator=quasi_random_triplets_Sobol,
+                random_state=np.random.RandomState(2)))
+
+        self.assertAlmostEqual(volume, 855743.408203125, places=7)
+        self.assertEqual(samples, 98304)
+
+
+class TestRGB_colourspaceVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_mesh` definition
+    unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE),
+            857059.709353,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 0.000001),
+            857059.709353,
+            delta=2)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(ACES_2065_1_COLOURSPACE),
+            6053730.344712,
+            places=5)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 0.0001, 2, 8),
+            857108.991199,
+            places=5)
+
+        volume, standard_error, _samples = (
+            RGB_colourspace_volume_streaming_MonteCarlo(
+                BT709_COLOURSPACE,
+                0.001,
+                random_state=np.random.RandomState(2)))
+        self.assertLess(
+            np.abs(RGB_colourspace_volume_mesh(BT709_COLOURSPACE) - volume),
+            3 * standard_error)
 
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
@@ -128,6 +298,16 @@ RGB_colourspace_volume_coverage_MonteCarlo` definition.
             83.02013423,
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage_MonteCarlo(
+                BT709_COLOURSPACE,
+                is_within_pointer_gamut,
+                2 ** 14,
+                random_generator=quasi_random_triplets_Sobol,
+                random_state=np.random.RandomState(2)),
+            81.64871582,
+            decimal=7)
+
 
 class TestRGB_colourspacePointerGamutCoverageMonteCarlo(unittest.TestCase):
     """
@@ -153,6 +333,16 @@ RGB_colourspace_pointer_gamut_coverage_MonteCarlo` definition.
             83.02013423,
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage_MonteCarlo(
+                BT709_COLOURSPACE,
+                is_within_pointer_gamut,
+                2 ** 14,
+                random_generator=quasi_random_triplets_Sobol,
+                random_state=np.random.RandomState(2)),
+            81.64871582,
+            decimal=7)
+
 
 class TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo(unittest.TestCase):
     """
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Colour Appearance Models
+==================================
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import numpy as np
+from collections import OrderedDict
+from timeit import default_timer
+
+import colour
+from colour.utilities import filter_warnings
+
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'BENCHMARK_SHAPE', 'appearance_models_arguments',
+    'benchmark_appearance_models'
+]
+
+BENCHMARK_SHAPE = (1080, 1920)
+"""
+Default shape of the benchmark inputs, i.e. a *1080p* image.
+
+BENCHMARK_SHAPE : tuple
+"""
+
+
+def appearance_models_arguments(shape=BENCHMARK_SHAPE, per_pixel=False,
+                                seed=4):
+    """
+    Returns the colour appearance models definitions and their arguments for
+    given inputs shape.
+
+    Parameters
+    ----------
+    shape : tuple, optional
+        Shape of the inputs, excluding the last *CIE XYZ* tristimulus values
+        axis.
+    per_pixel : bool, optional
+        Whether the viewing conditions parameters are varying per pixel or
+        are shared by the whole input.
+    seed : int, optional
+        Random number generator seed.
+
+    Returns
+    -------
+    OrderedDict
+        Colour appearance models definitions and arguments.
+    """
+
+    prng = np.random.RandomState(seed)
+
+    XYZ = colour.sRGB_to_XYZ(prng.uniform(0.05, 1, shape + (3, ))) * 100
+
+    def parameter(value, spread=0.1):
+        """
+        Returns given viewing conditions parameter, randomly scaled per pixel
+        if required.
+        """
+
+        if not per_pixel:
+            return value
+
+        value = np.asarray(value, dtype=np.float_)
+
+        return value * prng.uniform(1 - spread, 1 + spread,
+                                    shape + value.shape)
+
+    XYZ_w = parameter([95.05, 100.00, 108.88])
+
+    return OrderedDict([
+        ('Hunt', (colour.XYZ_to_Hunt,
+                  (XYZ, XYZ_w, parameter([95.05, 20.00, 108.88]),
+                   parameter(318.31)), {'CCT_w': parameter(6504.0)})),
+        ('LLAB', (colour.XYZ_to_LLAB,
+                  (XYZ, XYZ_w, parameter(20.0), parameter(318.31)), {})),
+        ('RLAB', (colour.XYZ_to_RLAB,
+                  (XYZ, XYZ_w, parameter(318.31), parameter(1 / 2.3),
+                   parameter(1.0)), {})),
+        ('Nayatani95', (colour.XYZ_to_Nayatani95,
+                        (XYZ, XYZ_w, parameter(20.0), parameter(5000.0),
+                         parameter(1000.0)), {})),
+        ('ATD95', (colour.XYZ_to_ATD95,
+                   (XYZ, XYZ_w, parameter(318.31), parameter(0.0, 0),
+                    parameter(50.0)), {})),
+    ])
+
+
+def benchmark_appearance_models(shape=BENCHMARK_SHAPE, repeat=3):
+    """
+    Benchmarks the *Hunt*, *LLAB*, *RLAB*, *Nayatani (1995)* and
+    *ATD (1995)* colour appearance models on given inputs shape with shared
+    and per-pixel viewing conditions parameters and prints their throughput.
+
+    Parameters
+    ----------
+    shape : tuple, optional
+        Shape of the inputs, excluding the last *CIE XYZ* tristimulus values
+        axis.
+    repeat : int, optional
+        Repetitions count, the best timing is reported.
+
+    Returns
+    -------
+    dict
+        Best timings in seconds keyed by model name and per-pixel state.
+    """
+
+    pixels = np.prod(shape)
+
+    timings = {}
+    for per_pixel in (False, True):
+        arguments = appearance_models_arguments(shape, per_pixel)
+        for name, (definition, args, kwargs) in arguments.items():
+            timing = np.inf
+            for _ in range(repeat):
+                start = default_timer()
+                definition(*args, **kwargs)
+                timing = min(timing, default_timer() - start)
+
+            timings[(name, per_pixel)] = timing
+
+            print('{0:<12}{1:<12}{2:>8.3f}s{3:>10.2f} Mpx/s'.format(
+                name, 'per-pixel' if per_pixel else 'shared', timing,
+                pixels / timing / 1e6))
+
+    return timings
+
+
+if __name__ == '__main__':
+    filter_warnings()
+
+    benchmark_appearance_models()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Munsell Renotation System Conversions
+===============================================
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import numpy as np
+from collections import OrderedDict
+from timeit import default_timer
+
+from colour.notation import (XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS,
+                             munsell_specification_array_to_xyY)
+from colour.utilities import filter_warnings, tstack
+
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'BENCHMARK_SAMPLES', 'munsell_benchmark_samples',
+    'benchmark_xyY_to_munsell_specification_array'
+]
+
+BENCHMARK_SAMPLES = 20000
+"""
+Default count of random *Munsell* *Colorlab* specifications drawn for the
+benchmark.
+
+BENCHMARK_SAMPLES : int
+"""
+
+
+def munsell_benchmark_samples(samples=BENCHMARK_SAMPLES, seed=4):
+    """
+    Returns random *Munsell* *Colorlab* specifications off the
+    *Munsell Renotation System* grid entries and within its data domain, and
+    their *CIE xyY* colourspace values.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Count of random specifications to draw, the ones outside the
+        *Munsell Renotation System* data domain being discarded.
+    seed : int, optional
+        Random number generator seed.
+
+    Returns
+    -------
+    OrderedDict
+        Benchmark samples *Munsell* *Colorlab* specifications and *CIE xyY*
+        colourspace values.
+    """
+
+    prng = np.random.RandomState(seed)
+
+    specifications = tstack((prng.uniform(0, 10, samples),
+                             prng.uniform(1, 9.5, samples),
+                             prng.uniform(0.5, 16, samples),
+                             prng.randint(1, 11, samples)))
+    xyY = munsell_specification_array_to_xyY(specifications)
+    within = np.all(np.isfinite(xyY), axis=-1)
+
+    return OrderedDict([
+        ('Off-grid', (specifications[within], xyY[within])),
+    ])
+
+
+def benchmark_xyY_to_munsell_specification_array(samples=BENCHMARK_SAMPLES,
+                                                 repeat=3):
+    """
+    Benchmarks the :func:`colour.notation.xyY_to_munsell_specification_array`
+    definition methods on random specifications off the
+    *Munsell Renotation System* grid entries and prints their throughput and
+    maximum errors.
+
+    Parameters
+    ----------
+    samples : int, optional
+        Count of random specifications to draw.
+    repeat : int, optional
+        Repetitions count, the best timing is reported.
+
+    Returns
+    -------
+    dict
+        Best timings in seconds keyed by samples name and method.
+    """
+
+    timings = {}
+    for name, (specifications, xyY) in munsell_benchmark_samples(
+            samples).items():
+        for method, definition in sorted(
+                XYY_TO_MUNSELL_SPECIFICATION_ARRAY_METHODS.items()):
+            # Warming up, e.g. tabulating the *Grid* method grid.
+            definition(xyY[:1])
+
+            timing = np.inf
+            for _ in range(repeat):
+                start = default_timer()
+                specifications_m = definition(xyY)
+                timing = min(timing, default_timer() - start)
+
+            timings[(name, method)] = timing
+
+            errors = np.nanmax(
+                np.abs(specifications_m - specifications)[..., [0, 2]],
+                axis=0)
+
+            print('{0:<12}{1:<16}{2:>8.3f}s{3:>12.0f} samples/s'
+                  '{4:>12.2e}{5:>12.2e}'.format(
+                      name, method, timing, len(xyY) / timing, errors[0],
+                      errors[1]))
+
+    return timings
+
+
+if __name__ == '__main__':
+    filter_warnings()
+
+    with np.errstate(all='ignore'):
+        benchmark_xyY_to_munsell_specification_array()